@@ -0,0 +1,180 @@
+"""
+Benchmarks of the core framework hot paths.
+
+This module measures task and result construction, the overhead of
+TaskResolver.__call__ around resolve(), registry dispatch, and the per-hop
+cost of MasteryComposer executions.
+"""
+
+from typing import Any, Dict
+
+from boss.core.task_base import Task
+from boss.core.task_result import TaskResult
+from boss.core.task_status import TaskStatus
+from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
+from boss.core.registry import TaskResolverRegistry
+from boss.core.mastery_composer import MasteryComposer, MasteryNode
+from boss.core.instrumentation import InFlightGaugeHook, LatencyHistogramHook, ResolverHookRegistry
+
+from harness import benchmark
+
+
+INPUT_DATA: Dict[str, Any] = {"operation": "transform", "payload": {"values": list(range(10))}}
+
+# Number of resolvers registered for the dispatch benchmarks
+REGISTRY_SIZE = 50
+
+# Number of nodes of the mastery chains
+CHAIN_LENGTH = 8
+
+
+class NoopResolver(TaskResolver):
+    """Resolver returning its input unchanged, to isolate framework overhead."""
+    
+    def __init__(self, name: str = "noop") -> None:
+        super().__init__(TaskResolverMetadata(name=name, version="1.0.0", description="No-op resolver"))
+    
+    async def resolve(self, task: Task) -> TaskResult:
+        return TaskResult.construct_trusted(task_id=task.id, output_data=task.input_data)
+    
+    def can_handle(self, task: Task) -> bool:
+        return task.input_data.get("operation") == self.metadata.name
+
+
+@benchmark("core.task.construct_validated", memory=True)
+def task_construct_validated():
+    """Task built through full pydantic validation."""
+    return lambda: Task(id="task-id", name="node_task", description="Benchmark task", input_data=INPUT_DATA)
+
+
+@benchmark("core.task.construct_trusted", memory=True)
+def task_construct_trusted():
+    """Task built through the trusted fast path used for node hops."""
+    return lambda: Task.construct_trusted(
+        id="task-id", name="node_task", description="Benchmark task", input_data=INPUT_DATA
+    )
+
+
+@benchmark("core.result.construct_validated", memory=True)
+def result_construct_validated():
+    """TaskResult built through full pydantic validation."""
+    return lambda: TaskResult(task_id="task-id", status=TaskStatus.COMPLETED, output_data=INPUT_DATA)
+
+
+@benchmark("core.result.construct_trusted", memory=True)
+def result_construct_trusted():
+    """TaskResult built through the trusted fast path."""
+    return lambda: TaskResult.construct_trusted(task_id="task-id", output_data=INPUT_DATA)
+
+
+@benchmark("core.resolver.resolve_direct")
+def resolver_resolve_direct():
+    """Direct resolve() call on a fresh task, the baseline for __call__ overhead."""
+    resolver = NoopResolver()
+    
+    async def operation() -> TaskResult:
+        return await resolver.resolve(Task.construct_trusted(name="bench_task", input_data=INPUT_DATA))
+    return operation
+
+
+@benchmark("core.resolver.call")
+def resolver_call():
+    """TaskResolver.__call__ on a fresh task (deadline check, status updates, circuit breaker)."""
+    resolver = NoopResolver()
+    
+    # A fresh task per call, as reusing one would grow its history on every call
+    async def operation() -> TaskResult:
+        return await resolver(Task.construct_trusted(name="bench_task", input_data=INPUT_DATA))
+    return operation
+
+
+@benchmark("core.resolver.call_instrumented")
+def resolver_call_instrumented():
+    """TaskResolver.__call__ with latency histogram and in-flight gauge hooks."""
+    resolver = NoopResolver()
+    resolver.hook_registry = ResolverHookRegistry()
+    resolver.hook_registry.register(LatencyHistogramHook())
+    resolver.hook_registry.register(InFlightGaugeHook())
+    
+    async def operation() -> TaskResult:
+        return await resolver(Task.construct_trusted(name="bench_task", input_data=INPUT_DATA))
+    return operation
+
+
+def _build_registry() -> TaskResolverRegistry:
+    registry = TaskResolverRegistry()
+    for i in range(REGISTRY_SIZE):
+        name = f"resolver_{i}"
+        registry.register(NoopResolver(name), tags={f"tag_{i % 5}"}, operations={name})
+    return registry
+
+
+@benchmark("core.registry.dispatch_by_operation")
+def registry_dispatch_by_operation():
+    """find_resolver_for_task routed by the task's operation."""
+    registry = _build_registry()
+    task = Task(name="bench_task", input_data={"operation": f"resolver_{REGISTRY_SIZE - 1}"})
+    return lambda: registry.find_resolver_for_task(task)
+
+
+@benchmark("core.registry.dispatch_by_name")
+def registry_dispatch_by_name():
+    """find_resolver_for_task with an explicit resolver name."""
+    registry = _build_registry()
+    name = f"resolver_{REGISTRY_SIZE - 1}"
+    task = Task(name="bench_task", input_data={"operation": name, "resolver_name": name})
+    return lambda: registry.find_resolver_for_task(task)
+
+
+@benchmark("core.registry.get_resolver")
+def registry_get_resolver():
+    """get_resolver for the latest version of a name."""
+    registry = _build_registry()
+    return lambda: registry.get_resolver(f"resolver_{REGISTRY_SIZE - 1}")
+
+
+def _chain(execution_mode: str, handoff_mode: str) -> MasteryComposer:
+    """Build a linear mastery of CHAIN_LENGTH no-op nodes."""
+    nodes = {
+        f"node_{i}": MasteryNode(
+            NoopResolver(f"node_{i}"),
+            f"node_{i}",
+            next_nodes=[f"node_{i + 1}"] if i + 1 < CHAIN_LENGTH else []
+        )
+        for i in range(CHAIN_LENGTH)
+    }
+    return MasteryComposer(
+        metadata=TaskResolverMetadata(name="bench_chain", version="1.0.0", description="Benchmark chain"),
+        nodes=nodes,
+        entry_node="node_0",
+        execution_mode=execution_mode,
+        handoff_mode=handoff_mode,
+        max_depth=CHAIN_LENGTH + 1
+    )
+
+
+def _mastery_hops(execution_mode: str, handoff_mode: str):
+    composer = _chain(execution_mode, handoff_mode)
+    
+    # A fresh task per call, as reusing one would grow its history and errors
+    async def operation() -> TaskResult:
+        return await composer.resolve(Task.construct_trusted(name="bench_task", input_data=INPUT_DATA))
+    return operation
+
+
+@benchmark("mastery.hop.sequential_copy", ops_per_call=CHAIN_LENGTH)
+def mastery_hop_sequential_copy():
+    """Per-hop cost of a sequential mastery chain, copying payloads."""
+    return _mastery_hops(MasteryComposer.SEQUENTIAL_MODE, MasteryComposer.HANDOFF_COPY)
+
+
+@benchmark("mastery.hop.sequential_reference", ops_per_call=CHAIN_LENGTH)
+def mastery_hop_sequential_reference():
+    """Per-hop cost of a sequential mastery chain, sharing frozen payloads."""
+    return _mastery_hops(MasteryComposer.SEQUENTIAL_MODE, MasteryComposer.HANDOFF_REFERENCE)
+
+
+@benchmark("mastery.hop.dag_copy", ops_per_call=CHAIN_LENGTH)
+def mastery_hop_dag_copy():
+    """Per-hop cost of the same chain in DAG mode (fused into one segment)."""
+    return _mastery_hops(MasteryComposer.DAG_MODE, MasteryComposer.HANDOFF_COPY)
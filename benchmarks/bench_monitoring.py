@@ -0,0 +1,60 @@
+"""
+Benchmarks of monitoring storage.
+
+This module measures the MetricsStorage insert and query paths on a SQLite
+database in a temporary directory.
+"""
+
+import tempfile
+from itertools import count
+
+from boss.lighthouse.monitoring.metrics_storage import MetricsStorage
+
+from harness import benchmark
+
+
+# Number of records preloaded for the query benchmarks
+PRELOADED_RECORDS = 5000
+
+
+def _storage(temp_dir: str, preload: int = 0) -> MetricsStorage:
+    storage = MetricsStorage(temp_dir)
+    for i in range(preload):
+        storage.store_system_metric("cpu" if i % 2 else "memory", {"usage_percent": i % 100})
+        storage.store_performance_metric("bench_component", f"operation_{i % 10}", float(i % 50), i % 7 != 0)
+    return storage
+
+
+@benchmark("monitoring.storage.insert_system_metric")
+def storage_insert_system_metric():
+    """MetricsStorage.store_system_metric (one transaction per insert)."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = _storage(temp_dir)
+        yield lambda: storage.store_system_metric("cpu", {"usage_percent": 42.0, "cores": 8})
+
+
+@benchmark("monitoring.storage.insert_performance_metric")
+def storage_insert_performance_metric():
+    """MetricsStorage.store_performance_metric (one transaction per insert)."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = _storage(temp_dir)
+        counter = count()
+        yield lambda: storage.store_performance_metric(
+            "bench_component", f"operation_{next(counter) % 10}", 12.5, True, {"batch": 1}
+        )
+
+
+@benchmark("monitoring.storage.query_system_metrics")
+def storage_query_system_metrics():
+    """MetricsStorage.get_system_metrics for one type, newest 100 records."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = _storage(temp_dir, PRELOADED_RECORDS)
+        yield lambda: storage.get_system_metrics("cpu", limit=100)
+
+
+@benchmark("monitoring.storage.query_performance_metrics")
+def storage_query_performance_metrics():
+    """MetricsStorage.get_performance_metrics for one operation, newest 100 records."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = _storage(temp_dir, PRELOADED_RECORDS)
+        yield lambda: storage.get_performance_metrics("bench_component", "operation_3", limit=100)
@@ -0,0 +1,62 @@
+"""
+Benchmarks of the utility resolvers.
+
+This module measures CacheResolver get and set operations on the in-memory
+backend.
+"""
+
+import asyncio
+
+from boss.core.task_base import Task
+from boss.core.task_result import TaskResult
+from boss.core.task_resolver import TaskResolverMetadata
+from boss.utility.cache_resolver import CacheResolver
+
+from harness import benchmark
+
+
+# Number of entries preloaded in the cache
+CACHE_SIZE = 1000
+
+
+def _cache_resolver() -> CacheResolver:
+    return CacheResolver(
+        TaskResolverMetadata(name="bench_cache", version="1.0.0", description="Benchmark cache"),
+        max_cache_size=CACHE_SIZE * 2
+    )
+
+
+def _cache_operation(resolver: CacheResolver, input_data: dict):
+    task = Task(name="cache_task", input_data=input_data)
+    
+    async def operation() -> TaskResult:
+        return await resolver.resolve(task)
+    return operation
+
+
+@benchmark("utility.cache.set")
+def cache_set():
+    """CacheResolver set of a small dictionary value."""
+    resolver = _cache_resolver()
+    return _cache_operation(resolver, {"operation": "set", "key": "key_0", "value": {"answer": 42}})
+
+
+@benchmark("utility.cache.get_hit")
+def cache_get_hit():
+    """CacheResolver get of a present key, with CACHE_SIZE entries."""
+    resolver = _cache_resolver()
+    
+    async def preload() -> None:
+        for i in range(CACHE_SIZE):
+            await resolver.resolve(Task(name="cache_task", input_data={
+                "operation": "set", "key": f"key_{i}", "value": {"answer": i}
+            }))
+    asyncio.run(preload())
+    return _cache_operation(resolver, {"operation": "get", "key": f"key_{CACHE_SIZE // 2}"})
+
+
+@benchmark("utility.cache.get_miss")
+def cache_get_miss():
+    """CacheResolver get of an absent key."""
+    resolver = _cache_resolver()
+    return _cache_operation(resolver, {"operation": "get", "key": "missing"})
@@ -0,0 +1,41 @@
+"""
+Benchmarks of vector search.
+
+This module measures InMemoryVectorStore searches over random embeddings.
+It requires numpy.
+"""
+
+import numpy as np
+
+from boss.core.vector_search_resolver import InMemoryVectorStore
+
+from harness import benchmark
+
+
+EMBEDDING_DIMENSION = 384
+
+
+def _vector_store(size: int) -> InMemoryVectorStore:
+    rng = np.random.default_rng(0)
+    store = InMemoryVectorStore()
+    for i in range(size):
+        store.add(f"doc_{i}", rng.random(EMBEDDING_DIMENSION), f"Document {i}", {"index": i})
+    return store
+
+
+def _search(size: int):
+    store = _vector_store(size)
+    query = np.random.default_rng(1).random(EMBEDDING_DIMENSION)
+    return lambda: store.search(query, top_k=5)
+
+
+@benchmark("vector.in_memory.search_100")
+def vector_search_100():
+    """InMemoryVectorStore top-5 search over 100 documents."""
+    return _search(100)
+
+
+@benchmark("vector.in_memory.search_1000")
+def vector_search_1000():
+    """InMemoryVectorStore top-5 search over 1000 documents."""
+    return _search(1000)
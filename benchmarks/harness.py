@@ -0,0 +1,288 @@
+"""
+Micro-benchmark harness.
+
+This module provides the benchmark decorator used by the bench_* modules to
+register benchmarks, the timing loop that measures them, and the JSON
+result format used to compare runs across commits.
+
+A benchmark is a setup function returning the operation to time: a plain
+function, or a coroutine function for async code paths. The setup function
+may instead be a generator yielding the operation, in which case the code
+after the yield runs as cleanup once the benchmark has been measured.
+"""
+
+import asyncio
+import inspect
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Version of the JSON result format
+SCHEMA_VERSION = 1
+
+_REGISTRY: Dict[str, "Benchmark"] = {}
+
+
+class Benchmark:
+    """A registered benchmark."""
+    
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[[], Any],
+        description: str = "",
+        ops_per_call: int = 1,
+        memory: bool = False
+    ) -> None:
+        """
+        Initialize a Benchmark.
+        
+        Args:
+            name: Dotted name of the benchmark, starting with its group
+            setup: Function returning (or yielding) the operation to time
+            description: One-line description of what is measured
+            ops_per_call: Number of operations performed by one call of the
+                          operation (e.g. hops of a mastery run), used to
+                          report per-operation times
+            memory: Whether to also measure the memory retained by the
+                    objects the operation returns
+        """
+        self.name = name
+        self.group = name.split(".", 1)[0]
+        self.setup = setup
+        self.description = description
+        self.ops_per_call = ops_per_call
+        self.memory = memory
+
+
+def benchmark(
+    name: str,
+    ops_per_call: int = 1,
+    memory: bool = False
+) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+    """
+    Register a benchmark setup function.
+    
+    The first line of the function's docstring is used as the benchmark's
+    description.
+    
+    Args:
+        name: Dotted name of the benchmark, starting with its group
+        ops_per_call: Number of operations performed by one call
+        memory: Whether to measure retained memory per call
+        
+    Returns:
+        Decorator registering the function
+    """
+    def decorator(setup: Callable[[], Any]) -> Callable[[], Any]:
+        if name in _REGISTRY:
+            raise ValueError(f"Benchmark {name} is already registered")
+        description = (inspect.getdoc(setup) or "").split("\n", 1)[0]
+        _REGISTRY[name] = Benchmark(name, setup, description, ops_per_call, memory)
+        return setup
+    return decorator
+
+
+def get_benchmarks(patterns: Optional[List[str]] = None) -> List[Benchmark]:
+    """
+    Get the registered benchmarks, sorted by name.
+    
+    Args:
+        patterns: Optional substrings; only benchmarks whose name contains
+                  one of them are returned
+                  
+    Returns:
+        The matching benchmarks
+    """
+    return [
+        bench for name, bench in sorted(_REGISTRY.items())
+        if not patterns or any(pattern in name for pattern in patterns)
+    ]
+
+
+class _Runner:
+    """Calls an operation a number of times, on an event loop if it is async."""
+    
+    def __init__(self, operation: Callable[[], Any]) -> None:
+        self.operation = operation
+        self.is_async = inspect.iscoroutinefunction(operation)
+        self.loop = asyncio.new_event_loop() if self.is_async else None
+    
+    def timed(self, iterations: int) -> float:
+        """Call the operation `iterations` times and return the elapsed seconds."""
+        operation = self.operation
+        if self.loop is not None:
+            async def run() -> float:
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    await operation()
+                return time.perf_counter() - start
+            return self.loop.run_until_complete(run())
+        
+        start = time.perf_counter()
+        for _ in range(iterations):
+            operation()
+        return time.perf_counter() - start
+    
+    def retained_bytes(self, iterations: int) -> float:
+        """Measure the memory retained per call by the objects the operation returns."""
+        operation = self.operation
+        tracemalloc.start()
+        try:
+            baseline, _ = tracemalloc.get_traced_memory()
+            if self.loop is not None:
+                async def run() -> List[Any]:
+                    return [await operation() for _ in range(iterations)]
+                kept = self.loop.run_until_complete(run())
+            else:
+                kept = [operation() for _ in range(iterations)]
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del kept
+        return (current - baseline) / iterations
+    
+    def close(self) -> None:
+        if self.loop is not None:
+            self.loop.close()
+
+
+def _calibrate(runner: _Runner, min_time: float) -> int:
+    """Find a number of iterations taking at least min_time seconds."""
+    iterations = 1
+    while True:
+        elapsed = runner.timed(iterations)
+        if elapsed >= min_time or iterations >= 10_000_000:
+            return iterations
+        # Aim slightly above min_time, growing at most 10x per step
+        estimate = int(iterations * min_time * 1.2 / elapsed) if elapsed > 0 else iterations * 10
+        iterations = max(iterations + 1, min(estimate, iterations * 10))
+
+
+def run_benchmark(bench: Benchmark, rounds: int = 5, min_time: float = 0.05) -> Dict[str, Any]:
+    """
+    Measure a benchmark.
+    
+    The number of calls per round is calibrated so that a round takes at
+    least min_time seconds; each round's time per operation is one sample.
+    
+    Args:
+        bench: The benchmark to measure
+        rounds: Number of timed rounds
+        min_time: Minimum duration of a round in seconds
+        
+    Returns:
+        The benchmark's result, with times in microseconds per operation
+    """
+    setup = bench.setup()
+    operation = next(setup) if inspect.isgenerator(setup) else setup
+    runner = _Runner(operation)
+    try:
+        runner.timed(1)  # Warm up
+        iterations = _calibrate(runner, min_time)
+        samples = [
+            runner.timed(iterations) / (iterations * bench.ops_per_call) * 1e6
+            for _ in range(rounds)
+        ]
+        bytes_per_op = runner.retained_bytes(min(iterations, 5000)) / bench.ops_per_call if bench.memory else None
+    finally:
+        runner.close()
+        if inspect.isgenerator(setup):
+            setup.close()
+    
+    median = statistics.median(samples)
+    result: Dict[str, Any] = {
+        "group": bench.group,
+        "description": bench.description,
+        "iterations": iterations,
+        "rounds": rounds,
+        "ops_per_call": bench.ops_per_call,
+        "min_us": min(samples),
+        "median_us": median,
+        "mean_us": statistics.mean(samples),
+        "stdev_us": statistics.stdev(samples) if rounds > 1 else 0.0,
+        "ops_per_sec": 1e6 / median if median > 0 else None
+    }
+    if bytes_per_op is not None:
+        result["bytes_per_op"] = bytes_per_op
+    return result
+
+
+def _git_revision(root: str) -> Tuple[Optional[str], Optional[bool]]:
+    """Get the current commit and whether the working tree has changes."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=root, capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, bool(status.strip())
+
+
+def environment_info(root: str) -> Dict[str, Any]:
+    """
+    Describe the environment of a benchmark run.
+    
+    Args:
+        root: Root directory of the repository
+        
+    Returns:
+        Commit, interpreter, platform and timestamp of the run
+    """
+    commit, dirty = _git_revision(root)
+    return {
+        "commit": commit,
+        "dirty": dirty,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "argv": sys.argv[1:]
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.10
+) -> List[Dict[str, Any]]:
+    """
+    Compare two benchmark runs by median time per operation.
+    
+    Args:
+        baseline: Result document of the reference run
+        current: Result document of the new run
+        threshold: Relative slowdown above which a benchmark counts as a
+                   regression (0.10 = 10% slower)
+                   
+    Returns:
+        One entry per benchmark present in both runs, with the baseline and
+        current medians, their ratio, and whether it is a regression
+    """
+    comparisons = []
+    baseline_results = baseline.get("results", {})
+    for name, result in sorted(current.get("results", {}).items()):
+        reference = baseline_results.get(name)
+        if not reference or not reference.get("median_us"):
+            continue
+        ratio = result["median_us"] / reference["median_us"]
+        comparisons.append({
+            "name": name,
+            "baseline_us": reference["median_us"],
+            "current_us": result["median_us"],
+            "ratio": ratio,
+            "regression": ratio > 1.0 + threshold
+        })
+    return comparisons
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Run the BOSS micro-benchmarks.
+
+This script discovers the bench_*.py modules next to it, measures the
+benchmarks they register, prints a summary table, and optionally writes the
+results to a JSON file and compares them with a previous run.
+
+Examples:
+    python benchmarks/run.py --output results/HEAD.json
+    python benchmarks/run.py core.registry mastery.hop --quick
+    python benchmarks/run.py --compare results/main.json --threshold 0.15
+"""
+
+import argparse
+import glob
+import importlib
+import json
+import os
+import sys
+from typing import Any, Dict, List
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCHMARKS_DIR)
+
+sys.path.insert(0, BENCHMARKS_DIR)
+sys.path.insert(1, PROJECT_ROOT)
+
+from harness import (  # noqa: E402
+    SCHEMA_VERSION,
+    compare_results,
+    environment_info,
+    get_benchmarks,
+    run_benchmark
+)
+
+
+def load_modules() -> Dict[str, str]:
+    """
+    Import every bench_*.py module, registering its benchmarks.
+    
+    Returns:
+        Modules that could not be imported (e.g. for lack of an optional
+        dependency), mapped to the reason
+    """
+    skipped = {}
+    for path in sorted(glob.glob(os.path.join(BENCHMARKS_DIR, "bench_*.py"))):
+        module_name = os.path.splitext(os.path.basename(path))[0]
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            skipped[module_name] = str(e)
+    return skipped
+
+
+def format_time(microseconds: float) -> str:
+    """Format a duration given in microseconds with a suitable unit."""
+    if microseconds >= 1000:
+        return f"{microseconds / 1000:.2f} ms"
+    if microseconds >= 1:
+        return f"{microseconds:.2f} us"
+    return f"{microseconds * 1000:.1f} ns"
+
+
+def print_comparison(comparisons: List[Dict[str, Any]], threshold: float) -> None:
+    """Print how each benchmark changed relative to the baseline."""
+    print()
+    print(f"{'benchmark':<48} {'baseline':>12} {'current':>12} {'change':>9}")
+    for entry in comparisons:
+        marker = "  REGRESSION" if entry["regression"] else ""
+        change = (entry["ratio"] - 1.0) * 100
+        print(
+            f"{entry['name']:<48} {format_time(entry['baseline_us']):>12} "
+            f"{format_time(entry['current_us']):>12} {change:>+8.1f}%{marker}"
+        )
+    regressions = sum(1 for entry in comparisons if entry["regression"])
+    print(f"{regressions} regression(s) above {threshold:.0%}")
+
+
+def main() -> int:
+    """Run the benchmarks and return the process exit code."""
+    parser = argparse.ArgumentParser(description="Run the BOSS micro-benchmarks")
+    parser.add_argument("patterns", nargs="*", help="Only run benchmarks whose name contains one of these")
+    parser.add_argument("--rounds", type=int, default=7, help="Timed rounds per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.1, help="Minimum seconds per round")
+    parser.add_argument("--quick", action="store_true", help="Short run (3 rounds of 20ms) for smoke testing")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Compare with the results in this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative slowdown reported as a regression (default 0.10)")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit")
+    args = parser.parse_args()
+    
+    if args.quick:
+        args.rounds, args.min_time = 3, 0.02
+    
+    skipped = load_modules()
+    for module_name, reason in skipped.items():
+        print(f"skipping {module_name}: {reason}", file=sys.stderr)
+    
+    benchmarks = get_benchmarks(args.patterns)
+    if args.list:
+        for bench in benchmarks:
+            print(f"{bench.name:<48} {bench.description}")
+        return 0
+    if not benchmarks:
+        print("No benchmarks selected", file=sys.stderr)
+        return 1
+    
+    results: Dict[str, Any] = {}
+    print(f"{'benchmark':<48} {'median':>12} {'min':>12} {'stdev':>9} {'ops/s':>12}")
+    for bench in benchmarks:
+        result = run_benchmark(bench, rounds=args.rounds, min_time=args.min_time)
+        results[bench.name] = result
+        stdev_pct = result["stdev_us"] / result["mean_us"] * 100 if result["mean_us"] else 0.0
+        print(
+            f"{bench.name:<48} {format_time(result['median_us']):>12} {format_time(result['min_us']):>12} "
+            f"{stdev_pct:>8.1f}% {result['ops_per_sec']:>12,.0f}"
+        )
+    
+    document = {
+        "schema_version": SCHEMA_VERSION,
+        "environment": environment_info(PROJECT_ROOT),
+        "settings": {"rounds": args.rounds, "min_time": args.min_time},
+        "skipped_modules": skipped,
+        "results": results
+    }
+    
+    if args.output:
+        output_dir = os.path.dirname(os.path.abspath(args.output))
+        os.makedirs(output_dir, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+        print(f"Results written to {args.output}")
+    
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        comparisons = compare_results(baseline, document, args.threshold)
+        print_comparison(comparisons, args.threshold)
+        if any(entry["regression"] for entry in comparisons):
+            return 2
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
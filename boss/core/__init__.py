@@ -3,51 +3,145 @@ Core components of the BOSS system.
 
 This package contains the core components of the BOSS system, including
 task models, task resolvers, and related utilities.
-"""
 
-# Task models
-from boss.core.task_base import Task, TaskMetadata
-from boss.core.task_result import TaskResult
-from boss.core.task_error import TaskError
-from boss.core.task_status import TaskStatus
-from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
-from boss.core.task_retry import TaskRetryManager, BackoffStrategy
+Exports are imported lazily (PEP 562), on first attribute access, so that
+importing the package or a lightweight component such as Task does not pay
+for LLM SDKs, numpy or the mastery runtime.
+"""
+from typing import TYPE_CHECKING, Any
 
-# LLM components
-from boss.core.base_llm_resolver import BaseLLMTaskResolver, LLMResponse
-from boss.core.llm_factory import LLMTaskResolverFactory
+from boss.utils.lazy_imports import lazy_attributes
 
-# Mastery components
-from boss.core.mastery_composer import MasteryComposer, MasteryNode
-from boss.core.mastery_registry import MasteryRegistry, MasteryDefinition
-from boss.core.mastery_executor import MasteryExecutor, ExecutionState
+if TYPE_CHECKING:
+    # Task models
+    from boss.core.task_base import Task, TaskMetadata
+    from boss.core.task_result import TaskResult
+    from boss.core.task_error import TaskError
+    from boss.core.task_status import TaskStatus
+    from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
+    from boss.core.process_pool_resolver import ProcessPoolResolver
+    from boss.core.circuit_breaker import CircuitBreaker, CircuitState
+    from boss.core.task_retry import TaskRetryManager, BackoffStrategy, RetryBudget, get_retry_budget
+    from boss.core.payload import FrozenPayload
+    from boss.core.instrumentation import (
+        ResolverHook, ResolverHookRegistry, resolver_hooks,
+        LatencyHistogramHook, InFlightGaugeHook, PayloadSizeHook, ProfilingHook
+    )
+    
+    # LLM components
+    from boss.core.base_llm_resolver import BaseLLMTaskResolver, LLMResponse
+    from boss.core.llm_factory import LLMTaskResolverFactory
+    
+    # Mastery components
+    from boss.core.mastery_composer import MasteryComposer, MasteryNode
+    from boss.core.mastery_registry import MasteryRegistry, MasteryDefinition
+    from boss.core.mastery_executor import MasteryExecutor, ExecutionState
+    from boss.core.mastery_plan import ExecutionPlan
+    from boss.core.node_cache import NodeResultCache
+    
+    # Tracing components
+    from boss.core.tracing import (
+        Tracer, Span, SpanExporter, InMemorySpanExporter, JsonlFileSpanExporter, OTLPJsonSpanExporter
+    )
+    
+    # Registry components
+    from boss.core.registry import TaskResolverRegistry, RegistryEntry
+    
+    # Queue and runtime components
+    from boss.core.task_queue import TaskQueue, QueuedTask
+    from boss.core.worker_pool import WorkerPool
+    
+    # Health check components
+    from boss.core.health_check_resolver import HealthCheckResolver, HealthCheckResult
+    
+    # Vector search components
+    from boss.core.vector_search_resolver import VectorSearchResolver, VectorSearchResult
+    
+    # LLM resolvers
+    from boss.core.openai_resolver import OpenAITaskResolver
+    from boss.core.anthropic_resolver import AnthropicTaskResolver
+    from boss.core.together_ai_resolver import TogetherAITaskResolver
+    from boss.core.xai_resolver import XAITaskResolver
 
-# Registry components
-from boss.core.registry import TaskResolverRegistry, RegistryEntry
+# Names exported by each submodule, imported on first access
+_SUBMODULE_EXPORTS = {
+    # Task models
+    "boss.core.task_base": ["Task", "TaskMetadata"],
+    "boss.core.task_result": ["TaskResult"],
+    "boss.core.task_error": ["TaskError"],
+    "boss.core.task_status": ["TaskStatus"],
+    "boss.core.task_resolver": ["TaskResolver", "TaskResolverMetadata"],
+    "boss.core.process_pool_resolver": ["ProcessPoolResolver"],
+    "boss.core.circuit_breaker": ["CircuitBreaker", "CircuitState"],
+    "boss.core.task_retry": ["TaskRetryManager", "BackoffStrategy", "RetryBudget", "get_retry_budget"],
+    "boss.core.payload": ["FrozenPayload"],
+    "boss.core.instrumentation": [
+        "ResolverHook", "ResolverHookRegistry", "resolver_hooks",
+        "LatencyHistogramHook", "InFlightGaugeHook", "PayloadSizeHook", "ProfilingHook"
+    ],
+    
+    # LLM components
+    "boss.core.base_llm_resolver": ["BaseLLMTaskResolver", "LLMResponse"],
+    "boss.core.llm_factory": ["LLMTaskResolverFactory"],
+    
+    # Mastery components
+    "boss.core.mastery_composer": ["MasteryComposer", "MasteryNode"],
+    "boss.core.mastery_registry": ["MasteryRegistry", "MasteryDefinition"],
+    "boss.core.mastery_executor": ["MasteryExecutor", "ExecutionState"],
+    "boss.core.mastery_plan": ["ExecutionPlan"],
+    "boss.core.node_cache": ["NodeResultCache"],
+    
+    # Tracing components
+    "boss.core.tracing": [
+        "Tracer", "Span", "SpanExporter", "InMemorySpanExporter", "JsonlFileSpanExporter", "OTLPJsonSpanExporter"
+    ],
+    
+    # Registry components
+    "boss.core.registry": ["TaskResolverRegistry", "RegistryEntry"],
+    
+    # Queue and runtime components
+    "boss.core.task_queue": ["TaskQueue", "QueuedTask"],
+    "boss.core.worker_pool": ["WorkerPool"],
+    
+    # Health check components
+    "boss.core.health_check_resolver": ["HealthCheckResolver", "HealthCheckResult"],
+    
+    # Vector search components
+    "boss.core.vector_search_resolver": ["VectorSearchResolver", "VectorSearchResult"],
+    
+    # LLM resolvers
+    "boss.core.openai_resolver": ["OpenAITaskResolver"],
+    "boss.core.anthropic_resolver": ["AnthropicTaskResolver"],
+    "boss.core.together_ai_resolver": ["TogetherAITaskResolver"],
+    "boss.core.xai_resolver": ["XAITaskResolver"],
+}
 
-# Health check components
-from boss.core.health_check_resolver import HealthCheckResolver, HealthCheckResult
+# Optional resolvers and the flags telling whether their SDKs are installed
+_OPTIONAL_RESOLVERS = {
+    "HAS_TOGETHER_AI": "TogetherAITaskResolver",
+    "HAS_XAI": "XAITaskResolver",
+}
 
-# Vector search components
-from boss.core.vector_search_resolver import VectorSearchResolver, VectorSearchResult
+_getattr, __dir__ = lazy_attributes(__name__, {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+})
 
-# Import LLM resolvers
-from boss.core.openai_resolver import OpenAITaskResolver
-from boss.core.anthropic_resolver import AnthropicTaskResolver
 
-# Try to import optional resolvers
-try:
-    from boss.core.together_ai_resolver import TogetherAITaskResolver
-    HAS_TOGETHER_AI = True
-except ImportError:
-    HAS_TOGETHER_AI = False
+def __getattr__(name: str) -> Any:
+    optional_resolver = _OPTIONAL_RESOLVERS.get(name)
+    if optional_resolver is None:
+        return _getattr(name)
+    try:
+        _getattr(optional_resolver)
+        available = True
+    except ImportError:
+        available = False
+    globals()[name] = available
+    return available
 
-try:
-    from boss.core.xai_resolver import XAITaskResolver
-    HAS_XAI = True
-except ImportError:
-    HAS_XAI = False
 
+# Optional resolvers are not part of __all__, so that star imports do not
+# require their SDKs; import them by name after checking HAS_TOGETHER_AI/HAS_XAI.
 __all__ = [
     # Task models
     "Task",
@@ -58,6 +152,9 @@ __all__ = [
     # Task resolver
     "TaskResolver",
     "TaskResolverMetadata",
+    "ProcessPoolResolver",
+    "CircuitBreaker",
+    "CircuitState",
     
     # Task status
     "TaskStatus",
@@ -65,6 +162,20 @@ __all__ = [
     # Task retry
     "TaskRetryManager",
     "BackoffStrategy",
+    "RetryBudget",
+    "get_retry_budget",
+    
+    # Payloads
+    "FrozenPayload",
+    
+    # Instrumentation
+    "ResolverHook",
+    "ResolverHookRegistry",
+    "resolver_hooks",
+    "LatencyHistogramHook",
+    "InFlightGaugeHook",
+    "PayloadSizeHook",
+    "ProfilingHook",
     
     # LLM resolvers
     "BaseLLMTaskResolver",
@@ -80,11 +191,26 @@ __all__ = [
     "MasteryDefinition",
     "MasteryExecutor",
     "ExecutionState",
+    "ExecutionPlan",
+    "NodeResultCache",
+    
+    # Tracing components
+    "Tracer",
+    "Span",
+    "SpanExporter",
+    "InMemorySpanExporter",
+    "JsonlFileSpanExporter",
+    "OTLPJsonSpanExporter",
     
     # Registry components
     "TaskResolverRegistry",
     "RegistryEntry",
     
+    # Queue and runtime components
+    "TaskQueue",
+    "QueuedTask",
+    "WorkerPool",
+    
     # Health check components
     "HealthCheckResolver",
     "HealthCheckResult",
@@ -93,10 +219,3 @@ __all__ = [
     "VectorSearchResolver",
     "VectorSearchResult",
 ]
-
-# Add optional resolvers to __all__ if available
-if HAS_TOGETHER_AI:
-    __all__.append("TogetherAITaskResolver")
-
-if HAS_XAI:
-    __all__.append("XAITaskResolver")
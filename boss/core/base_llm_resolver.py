@@ -109,6 +109,9 @@ class BaseLLMTaskResolver(TaskResolver):
     such as prompt construction, response parsing, and error handling.
     """
     
+    # Failed completions (provider errors and timeouts) count as failures for the circuit breaker
+    breaker_failure_types = frozenset({"UnexpectedError", "llm_generation_error"})
+    
     def __init__(
         self,
         model_name: str,
@@ -0,0 +1,209 @@
+"""
+Circuit breaker for task resolvers.
+
+This module provides the CircuitBreaker class, which tracks the outcomes and
+latencies of calls to a resolver and stops calls to it while it is failing.
+"""
+
+import threading
+import time
+from enum import Enum
+from typing import Any, Dict, Optional
+
+
+class CircuitState(str, Enum):
+    """
+    State of a circuit breaker.
+    
+    - CLOSED: Calls are allowed and their outcomes are recorded
+    - OPEN: Calls are rejected until the recovery timeout has passed
+    - HALF_OPEN: A limited number of trial calls decide whether to close or reopen
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker.
+    
+    The breaker opens after failure_threshold consecutive failures. Calls slower
+    than slow_call_threshold_ms (if set) count as failures, even when they succeed.
+    Once open, calls are rejected until recovery_timeout seconds have passed; then
+    up to half_open_max_calls trial calls are let through. A successful trial
+    closes the breaker, a failed one opens it again.
+    
+    The breaker is thread-safe.
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        slow_call_threshold_ms: Optional[float] = None
+    ) -> None:
+        """
+        Initialize a new CircuitBreaker.
+        
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            recovery_timeout: Seconds to wait before allowing trial calls
+            half_open_max_calls: Maximum number of concurrent trial calls
+            slow_call_threshold_ms: Latency above which a call counts as a failure
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.slow_call_threshold_ms = slow_call_threshold_ms
+        
+        self._lock = threading.Lock()
+        self.reset()
+    
+    @property
+    def state(self) -> CircuitState:
+        """The current state, moving from OPEN to HALF_OPEN once the recovery timeout has passed."""
+        with self._lock:
+            self._check_recovery()
+            return self._state
+    
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may go through, reserving a trial slot when half-open.
+        
+        Every allowed call must be followed by record_success, record_failure
+        or release.
+        
+        Returns:
+            True if the call is allowed, False if it must fail fast
+        """
+        with self._lock:
+            self._check_recovery()
+            if self._state == CircuitState.CLOSED:
+                return True
+            if self._state == CircuitState.HALF_OPEN and self._trial_calls < self.half_open_max_calls:
+                self._trial_calls += 1
+                return True
+            self._stats["rejected"] += 1
+            return False
+    
+    def record_success(self, latency_ms: float = 0.0) -> None:
+        """
+        Record a successful call.
+        
+        Args:
+            latency_ms: Duration of the call in milliseconds
+        """
+        if self.slow_call_threshold_ms is not None and latency_ms > self.slow_call_threshold_ms:
+            self._record(False, latency_ms, slow=True)
+        else:
+            self._record(True, latency_ms)
+    
+    def record_failure(self, latency_ms: float = 0.0) -> None:
+        """
+        Record a failed call.
+        
+        Args:
+            latency_ms: Duration of the call in milliseconds
+        """
+        self._record(False, latency_ms)
+    
+    def release(self) -> None:
+        """Release an allowed call that finished without an outcome (e.g. it was cancelled)."""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN and self._trial_calls > 0:
+                self._trial_calls -= 1
+    
+    def reset(self) -> None:
+        """Close the breaker and clear its statistics."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._trial_calls = 0
+            self._opened_at: Optional[float] = None
+            self._stats: Dict[str, Any] = {
+                "calls": 0,
+                "failures": 0,
+                "slow_calls": 0,
+                "rejected": 0,
+                "times_opened": 0,
+                "avg_latency_ms": 0.0
+            }
+    
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Get the state and statistics of the breaker.
+        
+        Returns:
+            Dictionary with the state, the consecutive failure count, the seconds
+            left before trial calls are allowed, and call statistics
+        """
+        with self._lock:
+            self._check_recovery()
+            retry_after = None
+            if self._state == CircuitState.OPEN and self._opened_at is not None:
+                retry_after = max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+            return {
+                "state": self._state.value,
+                "consecutive_failures": self._consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "retry_after_seconds": retry_after,
+                **self._stats
+            }
+    
+    def _record(self, success: bool, latency_ms: float, slow: bool = False) -> None:
+        """Update statistics and state with the outcome of a call."""
+        with self._lock:
+            stats = self._stats
+            stats["calls"] += 1
+            stats["avg_latency_ms"] += (latency_ms - stats["avg_latency_ms"]) / stats["calls"]
+            if slow:
+                stats["slow_calls"] += 1
+            
+            if self._state == CircuitState.HALF_OPEN and self._trial_calls > 0:
+                self._trial_calls -= 1
+            
+            if success:
+                self._consecutive_failures = 0
+                if self._state == CircuitState.HALF_OPEN:
+                    self._state = CircuitState.CLOSED
+                    self._opened_at = None
+                return
+            
+            stats["failures"] += 1
+            self._consecutive_failures += 1
+            if self._state == CircuitState.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self._open()
+    
+    def _open(self) -> None:
+        """Open the breaker (caller holds the lock)."""
+        if self._state != CircuitState.OPEN:
+            self._stats["times_opened"] += 1
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._trial_calls = 0
+    
+    def _check_recovery(self) -> None:
+        """Move from OPEN to HALF_OPEN once the recovery timeout has passed (caller holds the lock)."""
+        if (
+            self._state == CircuitState.OPEN
+            and self._opened_at is not None
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_calls = 0
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -5,8 +5,10 @@ This module provides a health check resolver that can check the health of other
 """
 
 import json
+import time
 import asyncio
 import logging
+import traceback
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union, Set, Type, cast
 
@@ -18,6 +20,7 @@ from boss.core.task_status import TaskStatus
 from boss.core.task_error import TaskError
 from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
 from boss.core.registry import TaskResolverRegistry
+from boss.core.circuit_breaker import CircuitState
 
 
 # Error type constants
@@ -86,6 +89,7 @@ class HealthCheckResolver(TaskResolver):
     - Check health of all resolvers in the registry
     - Get detailed health information
     - Set up recurring health checks
+    - Report and reset the circuit breakers of registered resolvers
     """
     
     def __init__(
@@ -137,7 +141,10 @@ class HealthCheckResolver(TaskResolver):
             # Check if the task has an operation field and if it's supported
             if isinstance(task.input_data, dict):
                 operation = task.input_data.get("operation", "")
-                supported_ops = ["check_resolver", "check_all", "get_health_status", "get_health_history"]
+                supported_ops = [
+                    "check_resolver", "check_all", "get_health_status", "get_health_history",
+                    "get_circuit_states", "reset_circuit_breaker"
+                ]
                 return operation in supported_ops
             
         return False
@@ -288,6 +295,12 @@ class HealthCheckResolver(TaskResolver):
                     output_data=[h.to_dict() for h in history]
                 )
             
+            elif operation == "get_circuit_states":
+                return self._handle_get_circuit_states(task)
+            
+            elif operation == "reset_circuit_breaker":
+                return self._handle_reset_circuit_breaker(task)
+            
             else:
                 return TaskResult(
                     task=task,
@@ -311,6 +324,102 @@ class HealthCheckResolver(TaskResolver):
                 )
             )
     
+    def _handle_get_circuit_states(self, task: Task) -> TaskResult:
+        """
+        Handle a request for circuit breaker states.
+        
+        Args:
+            task: The task, optionally naming a resolver (and version)
+            
+        Returns:
+            The state of the named resolver's breaker, or of all breakers
+        """
+        resolver_name = task.input_data.get("resolver_name", "")
+        if not resolver_name:
+            return TaskResult(
+                task_id=task.id,
+                status=TaskStatus.COMPLETED,
+                output_data={"circuit_breakers": self.registry.get_circuit_states()}
+            )
+        
+        resolver_version = task.input_data.get("resolver_version")
+        breaker = self.registry.get_circuit_breaker(resolver_name, resolver_version)
+        if breaker is None:
+            return self._not_found_result(task, resolver_name, resolver_version)
+        
+        return TaskResult(
+            task_id=task.id,
+            status=TaskStatus.COMPLETED,
+            output_data=breaker.get_state()
+        )
+    
+    def _handle_reset_circuit_breaker(self, task: Task) -> TaskResult:
+        """
+        Handle a request to close a resolver's circuit breaker.
+        
+        Args:
+            task: The task naming the resolver (and optionally the version)
+            
+        Returns:
+            The state of the breaker after the reset
+        """
+        resolver_name = task.input_data.get("resolver_name", "")
+        if not resolver_name:
+            return TaskResult(
+                task_id=task.id,
+                status=TaskStatus.ERROR,
+                message="resolver_name is required",
+                error=TaskError(
+                    message="resolver_name is required",
+                    task=task,
+                    error_type=MISSING_PARAMETER
+                ).to_dict()
+            )
+        
+        resolver_version = task.input_data.get("resolver_version")
+        if not self.registry.reset_circuit_breaker(resolver_name, resolver_version):
+            return self._not_found_result(task, resolver_name, resolver_version)
+        
+        breaker = self.registry.get_circuit_breaker(resolver_name, resolver_version)
+        return TaskResult(
+            task_id=task.id,
+            status=TaskStatus.COMPLETED,
+            output_data=breaker.get_state() if breaker else {}
+        )
+    
+    def _not_found_result(self, task: Task, resolver_name: str, resolver_version: Optional[str]) -> TaskResult:
+        """
+        Create the result for a resolver without a circuit breaker.
+        
+        Args:
+            task: The task being resolved
+            resolver_name: Name of the resolver
+            resolver_version: Optional version of the resolver
+            
+        Returns:
+            An error TaskResult
+        """
+        message = f"No circuit breaker for resolver: {self._get_resolver_key(resolver_name, resolver_version)}"
+        return TaskResult(
+            task_id=task.id,
+            status=TaskStatus.ERROR,
+            message=message,
+            error=TaskError(message=message, task=task, error_type=NOT_FOUND).to_dict()
+        )
+    
+    def _get_circuit_details(self, resolver: TaskResolver) -> Dict[str, Any]:
+        """
+        Get the circuit breaker state of a resolver for health check details.
+        
+        Args:
+            resolver: The resolver
+            
+        Returns:
+            Dictionary with the breaker state, or an empty dictionary if it has no breaker
+        """
+        breaker = getattr(resolver, "circuit_breaker", None)
+        return {"circuit_breaker": breaker.get_state()} if breaker is not None else {}
+    
     async def _check_resolver_health(
         self,
         resolver_name: str,
@@ -348,13 +457,22 @@ class HealthCheckResolver(TaskResolver):
             is_healthy = await resolver.health_check()
             check_time = time.time() - start_time
             
+            # A resolver whose circuit breaker is open fails every call
+            details = self._get_circuit_details(resolver)
+            error_message = None
+            if details and details["circuit_breaker"]["state"] == CircuitState.OPEN.value:
+                is_healthy = False
+                error_message = "Circuit breaker open"
+            
             # Store result in history
             key = self._get_resolver_key(resolver_name, resolver_version)
             result = HealthCheckResult(
                 resolver_name=resolver_name,
                 resolver_version=resolver_version or "unknown",
                 is_healthy=is_healthy,
-                check_time=check_time
+                check_time=check_time,
+                error_message=error_message,
+                details=details
             )
             
             if key not in self.health_history:
@@ -367,6 +485,7 @@ class HealthCheckResolver(TaskResolver):
             check_time = time.time() - start_time
             error_message = str(e)
             details = {"traceback": traceback.format_exc()} if detailed else {}
+            details.update(self._get_circuit_details(resolver))
             
             # Store result in history
             key = self._get_resolver_key(resolver_name, resolver_version)
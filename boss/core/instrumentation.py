@@ -0,0 +1,755 @@
+"""
+Instrumentation hooks for task resolvers.
+
+This module provides the hooks that TaskResolver.__call__ runs around every
+resolution (before_resolve, after_resolve and on_error), the registry they
+are added to, and built-in hooks for latency histograms, in-flight gauges,
+payload size accounting and sampled cProfile profiling.
+"""
+import bisect
+import cProfile
+import io
+import logging
+import os
+import pstats
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, cast
+
+from boss.core.task_base import Task
+from boss.core.task_result import TaskResult
+from boss.core.task_status import TaskStatus
+from boss.core.tracing import payload_size
+
+if TYPE_CHECKING:
+    from boss.core.task_resolver import TaskResolver
+
+
+logger = logging.getLogger(__name__)
+
+# Result statuses reported through on_error
+ERROR_STATUSES = frozenset({TaskStatus.ERROR, TaskStatus.FAILED})
+
+# Default latency histogram bucket upper bounds, in milliseconds
+DEFAULT_LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000
+)
+
+
+def resolver_key(resolver: 'TaskResolver') -> Tuple[str, str]:
+    """Get the (name, version) a resolver's metrics are recorded under."""
+    metadata = resolver.metadata
+    return metadata.name, metadata.version
+
+
+class ResolverHook:
+    """
+    Base class for hooks run by TaskResolver.__call__.
+    
+    For every call, before_resolve runs first, then exactly one of
+    after_resolve (a result was returned and its status is not ERROR or
+    FAILED) and on_error (an error result was returned, or an exception
+    escaped __call__, e.g. on cancellation). The value returned by
+    before_resolve is passed back as state, so a hook can carry per-call
+    data without keeping it itself.
+    
+    Hooks run on the caller's event loop for every resolution and must be
+    cheap; an exception raised by a hook is logged and otherwise ignored.
+    """
+    
+    def before_resolve(self, resolver: 'TaskResolver', task: Task) -> Any:
+        """
+        Called before a task is resolved.
+        
+        Args:
+            resolver: The resolver called
+            task: The task to resolve
+            
+        Returns:
+            Per-call state passed to after_resolve or on_error
+        """
+        return None
+    
+    def after_resolve(
+        self,
+        resolver: 'TaskResolver',
+        task: Task,
+        result: TaskResult,
+        duration_ms: float,
+        state: Any
+    ) -> None:
+        """
+        Called after a task was resolved without error.
+        
+        Args:
+            resolver: The resolver called
+            task: The resolved task
+            result: The result returned
+            duration_ms: Duration of the call in milliseconds
+            state: Value returned by before_resolve
+        """
+    
+    def on_error(
+        self,
+        resolver: 'TaskResolver',
+        task: Task,
+        result: Optional[TaskResult],
+        error: Optional[BaseException],
+        duration_ms: float,
+        state: Any
+    ) -> None:
+        """
+        Called after a call returned an error result or raised.
+        
+        Args:
+            resolver: The resolver called
+            task: The task
+            result: The error result, or None if the call raised
+            error: The exception raised, or None if an error result was returned
+            duration_ms: Duration of the call in milliseconds
+            state: Value returned by before_resolve
+        """
+
+
+class ResolverHookRegistry:
+    """
+    Ordered set of resolver hooks.
+    
+    The hooks are kept in an immutable tuple that is replaced on every
+    change, so TaskResolver.__call__ reads them without locking and checking
+    for an empty registry costs a single attribute lookup.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty ResolverHookRegistry."""
+        self.hooks: Tuple[ResolverHook, ...] = ()
+        self._lock = threading.Lock()
+    
+    def register(self, hook: ResolverHook) -> ResolverHook:
+        """
+        Add a hook; registering a hook twice has no effect.
+        
+        Args:
+            hook: The hook to add
+            
+        Returns:
+            The hook, for chaining
+        """
+        with self._lock:
+            if hook not in self.hooks:
+                self.hooks = self.hooks + (hook,)
+        return hook
+    
+    def unregister(self, hook: ResolverHook) -> bool:
+        """
+        Remove a hook.
+        
+        Args:
+            hook: The hook to remove
+            
+        Returns:
+            True if the hook was registered, False otherwise
+        """
+        with self._lock:
+            if hook not in self.hooks:
+                return False
+            self.hooks = tuple(h for h in self.hooks if h is not hook)
+            return True
+    
+    def clear(self) -> None:
+        """Remove all hooks."""
+        with self._lock:
+            self.hooks = ()
+    
+    def __len__(self) -> int:
+        return len(self.hooks)
+
+
+# Hooks run for every resolver (TaskResolver.hook_registry)
+resolver_hooks = ResolverHookRegistry()
+
+
+def run_before_hooks(hooks: Sequence[ResolverHook], resolver: 'TaskResolver', task: Task) -> List[Any]:
+    """
+    Run the before_resolve hooks of a call.
+    
+    Args:
+        hooks: The registered hooks
+        resolver: The resolver called
+        task: The task to resolve
+        
+    Returns:
+        The state returned by each hook, in hook order
+    """
+    states = []
+    for hook in hooks:
+        try:
+            states.append(hook.before_resolve(resolver, task))
+        except Exception as e:
+            logger.error(f"Resolver hook {type(hook).__name__}.before_resolve failed: {str(e)}")
+            states.append(None)
+    return states
+
+
+def run_after_hooks(
+    hooks: Sequence[ResolverHook],
+    states: List[Any],
+    resolver: 'TaskResolver',
+    task: Task,
+    result: Optional[TaskResult],
+    error: Optional[BaseException],
+    duration_ms: float
+) -> None:
+    """
+    Run the after_resolve or on_error hooks of a call, in reverse hook order.
+    
+    Args:
+        hooks: The hooks whose before_resolve ran
+        states: The states they returned
+        resolver: The resolver called
+        task: The task
+        result: The result returned, or None if the call raised
+        error: The exception raised, or None
+        duration_ms: Duration of the call in milliseconds
+    """
+    failed = result is None or result.status in ERROR_STATUSES
+    for hook, state in zip(reversed(hooks), reversed(states)):
+        try:
+            if failed:
+                hook.on_error(resolver, task, result, error, duration_ms, state)
+            else:
+                hook.after_resolve(resolver, task, cast(TaskResult, result), duration_ms, state)
+        except Exception as e:
+            method = "on_error" if failed else "after_resolve"
+            logger.error(f"Resolver hook {type(hook).__name__}.{method} failed: {str(e)}")
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of call latencies."""
+    
+    __slots__ = ("bounds", "counts", "count", "errors", "total_ms", "min_ms", "max_ms")
+    
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        """
+        Initialize a LatencyHistogram.
+        
+        Args:
+            bounds: Sorted bucket upper bounds in milliseconds; one more
+                    bucket counts the latencies above the last bound
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms: Optional[float] = None
+    
+    def record(self, duration_ms: float, error: bool = False) -> None:
+        """Record the latency of one call."""
+        self.counts[bisect.bisect_left(self.bounds, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        if error:
+            self.errors += 1
+        if self.min_ms is None or duration_ms < self.min_ms:
+            self.min_ms = duration_ms
+        if self.max_ms is None or duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+    
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Estimate a latency percentile from the buckets.
+        
+        Args:
+            q: The percentile, between 0 and 100
+            
+        Returns:
+            The upper bound of the bucket holding the percentile (the maximum
+            latency for the overflow bucket), or None if nothing was recorded
+        """
+        if self.max_ms is None:
+            return None
+        rank = q / 100 * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts[:-1]):
+            cumulative += bucket_count
+            if bucket_count and cumulative >= rank:
+                return min(self.bounds[index], self.max_ms)
+        return self.max_ms
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the histogram to a dictionary.
+        
+        Returns:
+            Counts, latency summary and cumulative bucket counts keyed by
+            upper bound ("+Inf" for the overflow bucket)
+        """
+        buckets: Dict[str, int] = {}
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            bound = f"{self.bounds[index]:g}" if index < len(self.bounds) else "+Inf"
+            buckets[bound] = cumulative
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "sum_ms": self.total_ms,
+            "mean_ms": self.total_ms / self.count if self.count else None,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "buckets": buckets
+        }
+
+
+class LatencyHistogramHook(ResolverHook):
+    """Records a latency histogram per resolver name and version."""
+    
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS) -> None:
+        """
+        Initialize the LatencyHistogramHook.
+        
+        Args:
+            buckets_ms: Bucket upper bounds in milliseconds
+        """
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+    
+    def _record(self, resolver: 'TaskResolver', duration_ms: float, error: bool) -> None:
+        key = resolver_key(resolver)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram(self.buckets_ms)
+            histogram.record(duration_ms, error)
+    
+    def after_resolve(
+        self,
+        resolver: 'TaskResolver',
+        task: Task,
+        result: TaskResult,
+        duration_ms: float,
+        state: Any
+    ) -> None:
+        self._record(resolver, duration_ms, False)
+    
+    def on_error(
+        self,
+        resolver: 'TaskResolver',
+        task: Task,
+        result: Optional[TaskResult],
+        error: Optional[BaseException],
+        duration_ms: float,
+        state: Any
+    ) -> None:
+        self._record(resolver, duration_ms, True)
+    
+    def get_histogram(self, name: str, version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the histogram of a resolver.
+        
+        Args:
+            name: Name of the resolver
+            version: Version of the resolver (if None, all versions are merged)
+            
+        Returns:
+            The histogram as a dictionary, or None if no call was recorded
+        """
+        with self._lock:
+            histograms = [
+                histogram for (hist_name, hist_version), histogram in self._histograms.items()
+                if hist_name == name and (version is None or hist_version == version)
+            ]
+            if not histograms:
+                return None
+            if len(histograms) == 1:
+                return histograms[0].to_dict()
+            
+            merged = LatencyHistogram(self.buckets_ms)
+            for histogram in histograms:
+                merged.counts = [a + b for a, b in zip(merged.counts, histogram.counts)]
+                merged.count += histogram.count
+                merged.errors += histogram.errors
+                merged.total_ms += histogram.total_ms
+                merged.min_ms = min(m for m in (merged.min_ms, histogram.min_ms) if m is not None)
+                merged.max_ms = max(m for m in (merged.max_ms, histogram.max_ms) if m is not None)
+            return merged.to_dict()
+    
+    def get_histograms(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the histograms of all resolvers.
+        
+        Returns:
+            Dictionary mapping "name@version" to histogram dictionaries
+        """
+        with self._lock:
+            return {f"{name}@{version}": histogram.to_dict() for (name, version), histogram in self._histograms.items()}
+    
+    def reset(self) -> None:
+        """Drop all recorded latencies."""
+        with self._lock:
+            self._histograms.clear()
+
+
+class InFlightGaugeHook(ResolverHook):
+    """Tracks the number of calls in progress per resolver name and version."""
+    
+    def __init__(self) -> None:
+        """Initialize the InFlightGaugeHook."""
+        self._in_flight: Dict[Tuple[str, str], int] = {}
+        self._peak: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+    
+    def before_resolve(self, resolver: 'TaskResolver', task: Task) -> Any:
+        key = resolver_key(resolver)
+        with self._lock:
+            current = self._in_flight.get(key, 0) + 1
+            self._in_flight[key] = current
+            if current > self._peak.get(key, 0):
+                self._peak[key] = current
+        return key
+    
+    def _release(self, key: Tuple[str, str]) -> None:
+        with self._lock:
+            self._in_flight[key] -= 1
+    
+    def after_resolve(
+        self,
+        resolver: 'TaskResolver',
+        task: Task,
+        result: TaskResult,
+        duration_ms: float,
+        state: Any
+    ) -> None:
+        self._release(state)
+    
+    def on_error(
+        self,
+        resolver: 'TaskResolver',
+        task: Task,
+        result: Optional[TaskResult],
+        error: Optional[BaseException],
+        duration_ms: float,
+        state: Any
+    ) -> None:
+        self._release(state)
+    
+    def get_in_flight(self, name: str, version: Optional[str] = None) -> int:
+        """
+        Get the number of calls of a resolver in progress.
+        
+        Args:
+            name: Name of the resolver
+            version: Version of the resolver (if None, all versions are summed)
+            
+        Returns:
+            The number of calls in progress
+        """
+        with self._lock:
+            return sum(
+                count for (gauge_name, gauge_version), count in self._in_flight.items()
+                if gauge_name == name and (version is None or gauge_version == version)
+            )
+    
+    def get_gauges(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get the gauges of all resolvers.
+        
+        Returns:
+            Dictionary mapping "name@version" to the current and peak number
+            of calls in progress
+        """
+        with self._lock:
+            return {
+                f"{name}@{version}": {"in_flight": count, "peak": self._peak.get((name, version), 0)}
+                for (name, version), count in self._in_flight.items()
+            }
+
+
+class PayloadSizeHook(ResolverHook):
+    """
+    Accounts input and output payload sizes per resolver name and version.
+    
+    Sizes are the length of the payloads' JSON encoding, so measuring them
+    costs an encoding of every payload; use sample_every to measure only one
+    call in N.
+    """
+    
+    def __init__(self, sample_every: int = 1) -> None:
+        """
+        Initialize the PayloadSizeHook.
+        
+        Args:
+            sample_every: Measure one call in this many
+        """
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        
+        self.sample_every = sample_every
+        self._calls = 0
+        self._totals: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._lock = threading.Lock()
+    
+    def before_resolve(self, resolver: 'TaskResolver', task: Task) -> Any:
+        with self._lock:
+            self._calls += 1
+            if self._calls % self.sample_every:
+                return None
+        return payload_size(task.input_data)
+    
+    def _account(self, resolver: 'TaskResolver', input_bytes: int, result: Optional[TaskResult]) -> None:
+        output_bytes = payload_size(result.output_data) if result is not None and result.output_data else 0
+        key = resolver_key(resolver)
+        with self._lock:
+            totals = self._totals.get(key)
+            if totals is None:
+                totals = self._totals[key] = {
+                    "calls": 0, "input_bytes": 0, "output_bytes": 0, "max_input_bytes": 0, "max_output_bytes": 0
+                }
+            totals["calls"] += 1
+            totals["input_bytes"] += input_bytes
+            totals["output_bytes"] += output_bytes
+            totals["max_input_bytes"] = max(totals["max_input_bytes"], input_bytes)
+            totals["max_output_bytes"] = max(totals["max_output_bytes"], output_bytes)
+    
+    def after_resolve(
+        self,
+        resolver: 'TaskResolver',
+        task: Task,
+        result: TaskResult,
+        duration_ms: float,
+        state: Any
+    ) -> None:
+        if state is not None:
+            self._account(resolver, state, result)
+    
+    def on_error(
+        self,
+        resolver: 'TaskResolver',
+        task: Task,
+        result: Optional[TaskResult],
+        error: Optional[BaseException],
+        duration_ms: float,
+        state: Any
+    ) -> None:
+        if state is not None:
+            self._account(resolver, state, result)
+    
+    def get_totals(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get the payload totals of all resolvers.
+        
+        Returns:
+            Dictionary mapping "name@version" to the number of measured calls
+            and the total and maximum input and output sizes in bytes
+        """
+        with self._lock:
+            return {f"{name}@{version}": dict(totals) for (name, version), totals in self._totals.items()}
+
+
+class ProfilingHook(ResolverHook):
+    """
+    Profiles one call in N with cProfile and aggregates the stats per resolver.
+    
+    Only one call is profiled at a time. The profiler records the thread
+    running the event loop while the sampled call is in progress, so
+    coroutines interleaved with it on the same loop are included, and
+    synchronous resolvers offloaded to their thread pool are not.
+    
+    Finished profiles are buffered; merging them into the per-resolver stats
+    happens when the stats are read or written, not in the profiled call. If
+    output_dir is set, a background thread writes the aggregated stats of a
+    resolver to <output_dir>/<name>-<version>.prof after new samples, for use
+    with pstats or snakeviz; flush() waits for the files to be up to date.
+    """
+    
+    def __init__(self, sample_every: int = 100, output_dir: Optional[str] = None) -> None:
+        """
+        Initialize the ProfilingHook.
+        
+        Args:
+            sample_every: Profile one call in this many
+            output_dir: Optional directory to dump the aggregated stats to
+        """
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        
+        self.sample_every = sample_every
+        self.output_dir = output_dir
+        self._calls = 0
+        self._active = False
+        self._pending: List[Tuple[Tuple[str, str], cProfile.Profile]] = []
+        self._samples: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        
+        # Aggregated stats, guarded by their own lock so that merging and
+        # writing them never blocks the calls taking _lock
+        self._stats: Dict[Tuple[str, str], pstats.Stats] = {}
+        self._stats_lock = threading.Lock()
+        
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._write_scheduled = False
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="profile-writer")
+    
+    def before_resolve(self, resolver: 'TaskResolver', task: Task) -> Any:
+        with self._lock:
+            self._calls += 1
+            if self._active or self._calls % self.sample_every:
+                return None
+            self._active = True
+        
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is active on this thread
+            with self._lock:
+                self._active = False
+            return None
+        return profiler
+    
+    def _finish(self, resolver: 'TaskResolver', profiler: Optional[cProfile.Profile]) -> None:
+        if profiler is None:
+            return
+        profiler.disable()
+        key = resolver_key(resolver)
+        with self._lock:
+            self._active = False
+            self._pending.append((key, profiler))
+            self._samples[key] = self._samples.get(key, 0) + 1
+            schedule = self._writer is not None and not self._write_scheduled
+            if schedule:
+                self._write_scheduled = True
+        if schedule:
+            cast(ThreadPoolExecutor, self._writer).submit(self._write_profiles)
+    
+    def after_resolve(
+        self,
+        resolver: 'TaskResolver',
+        task: Task,
+        result: TaskResult,
+        duration_ms: float,
+        state: Any
+    ) -> None:
+        self._finish(resolver, state)
+    
+    def on_error(
+        self,
+        resolver: 'TaskResolver',
+        task: Task,
+        result: Optional[TaskResult],
+        error: Optional[BaseException],
+        duration_ms: float,
+        state: Any
+    ) -> None:
+        self._finish(resolver, state)
+    
+    def _merge_pending(self) -> List[Tuple[str, str]]:
+        """Merge buffered profiles into the stats (caller holds the stats lock)."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        
+        merged = []
+        for key, profiler in pending:
+            stats = self._stats.get(key)
+            if stats is None:
+                self._stats[key] = pstats.Stats(profiler)
+            else:
+                stats.add(profiler)
+            if key not in merged:
+                merged.append(key)
+        return merged
+    
+    def _write_profiles(self) -> None:
+        """Write the stats of resolvers with new samples to output_dir."""
+        with self._lock:
+            self._write_scheduled = False
+        with self._stats_lock:
+            for key in self._merge_pending():
+                self._dump(key)
+    
+    def flush(self) -> None:
+        """Write the stats of resolvers with new samples to output_dir now."""
+        if self.output_dir:
+            self._write_profiles()
+    
+    def close(self) -> None:
+        """Write pending stats and stop the background writer."""
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+        self.flush()
+    
+    def _dump(self, key: Tuple[str, str]) -> str:
+        """Write the stats of a resolver to output_dir (caller holds the stats lock)."""
+        name, version = key
+        path = os.path.join(self.output_dir or "", f"{name}-{version}.prof")
+        try:
+            self._stats[key].dump_stats(path)
+        except OSError as e:
+            logger.warning(f"Failed to write profile {path}: {str(e)}")
+        return path
+    
+    def dump_stats(self, output_dir: Optional[str] = None) -> List[str]:
+        """
+        Write the aggregated stats of every profiled resolver.
+        
+        Args:
+            output_dir: Directory to write to (defaults to the hook's output_dir)
+            
+        Returns:
+            Paths of the written files
+        """
+        directory = output_dir or self.output_dir
+        if not directory:
+            raise ValueError("No output directory given")
+        os.makedirs(directory, exist_ok=True)
+        
+        paths = []
+        with self._stats_lock:
+            self._merge_pending()
+            for (name, version), stats in self._stats.items():
+                path = os.path.join(directory, f"{name}-{version}.prof")
+                stats.dump_stats(path)
+                paths.append(path)
+        return paths
+    
+    def get_samples(self) -> Dict[str, int]:
+        """
+        Get the number of profiled calls per resolver.
+        
+        Returns:
+            Dictionary mapping "name@version" to the number of samples
+        """
+        with self._lock:
+            return {f"{name}@{version}": count for (name, version), count in self._samples.items()}
+    
+    def format_stats(self, name: str, version: str, sort_by: str = "cumulative", limit: int = 20) -> str:
+        """
+        Format the aggregated stats of a resolver as text.
+        
+        Args:
+            name: Name of the resolver
+            version: Version of the resolver
+            sort_by: pstats sort key
+            limit: Maximum number of functions listed
+            
+        Returns:
+            The pstats report, or an empty string if no call was profiled
+        """
+        with self._stats_lock:
+            self._merge_pending()
+            stats = self._stats.get((name, version))
+            if stats is None:
+                return ""
+            stream = io.StringIO()
+            stats.stream = stream  # type: ignore[attr-defined]
+            stats.sort_stats(sort_by).print_stats(limit)
+        return stream.getvalue()
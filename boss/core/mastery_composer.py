@@ -5,15 +5,22 @@ This is a key component in the Lanager framework, allowing for the creation of s
 by chaining multiple TaskResolvers together in configurable patterns.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union, Callable, Type, cast
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable, Type, cast
 
-from boss.core.task_base import Task, TaskMetadata
+from boss.core.task_base import Task
 from boss.core.task_result import TaskResult
 from boss.core.task_error import TaskError
 from boss.core.task_status import TaskStatus
 from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
 from boss.core.task_retry import TaskRetryManager
+from boss.core.payload import FrozenPayload, freeze
+from boss.core.mastery_plan import ExecutionPlan
+from boss.core.tracing import STATUS_ERROR, Tracer, get_current_span, payload_size
+from boss.core.node_cache import NodeResultCache
 
 
 class MasteryNode:
@@ -24,7 +31,9 @@ class MasteryNode:
         resolver: TaskResolver, 
         id: str,
         next_nodes: Optional[List[str]] = None,
-        condition: Optional[Callable[[TaskResult], bool]] = None
+        condition: Optional[Callable[[TaskResult], bool]] = None,
+        mutates_input: bool = False,
+        deterministic: bool = False
     ) -> None:
         """
         Initialize a mastery node.
@@ -35,11 +44,17 @@ class MasteryNode:
             next_nodes: List of node IDs to execute after this one
             condition: Optional condition function that determines if this node's output should 
                        be passed to the next nodes
+            mutates_input: Whether the resolver modifies task.input_data in place. Such
+                           nodes get a private copy of their input in "reference" handoff mode.
+            deterministic: Whether the resolver's output depends only on its input data,
+                           so successful results can be reused from the composer's result cache
         """
         self.resolver = resolver
         self.id = id
         self.next_nodes = next_nodes or []
         self.condition = condition
+        self.mutates_input = mutates_input
+        self.deterministic = deterministic
     
     def can_proceed(self, result: TaskResult) -> bool:
         """
@@ -65,8 +80,39 @@ class MasteryComposer(TaskResolver):
     
     This allows for complex task resolution patterns by chaining, branching,
     and conditionally executing different TaskResolvers.
+    
+    Two execution modes are supported:
+    - "sequential" (default): follows the first next node of each node, forming
+      a single chain through the graph.
+    - "dag": runs every ready successor concurrently and joins branches at merge
+      nodes, i.e. nodes with more than one predecessor.
+    
+    Both modes route through an ExecutionPlan compiled from the nodes on first
+    use (or provided by the MasteryRegistry). Call invalidate_plan() after
+    changing the nodes of a composer that has already run.
+    
+    Node outputs are handed to the next node in one of two ways:
+    - "copy" (default): each hop copies the output into new, validated objects.
+    - "reference": each output is frozen once into a read-only FrozenPayload and
+      passed by reference. Nodes marked with mutates_input receive a private
+      copy (copy-on-write), and the final result is returned as a plain dict.
+    
+    With a tracer, each resolution is recorded as a "mastery.resolve" span
+    containing a "mastery.node" span per executed node (with its depth,
+    queueing delay and payload sizes), which in turn contains a
+    "resolver.call" span for the node's resolver.
+    
+    With a result cache, successful results of nodes marked deterministic are
+    memoized under a hash of the resolver's name, version and input data, and
+    identical executions return the cached output without calling the resolver.
     """
     
+    SEQUENTIAL_MODE = "sequential"
+    DAG_MODE = "dag"
+    
+    HANDOFF_COPY = "copy"
+    HANDOFF_REFERENCE = "reference"
+    
     def __init__(
         self,
         metadata: TaskResolverMetadata,
@@ -75,6 +121,11 @@ class MasteryComposer(TaskResolver):
         exit_nodes: Optional[List[str]] = None,
         retry_manager: Optional[TaskRetryManager] = None,
         max_depth: int = 10,
+        execution_mode: str = SEQUENTIAL_MODE,
+        max_concurrency: Optional[int] = None,
+        handoff_mode: str = HANDOFF_COPY,
+        tracer: Optional[Tracer] = None,
+        result_cache: Optional[NodeResultCache] = None,
     ) -> None:
         """
         Initialize the MasteryComposer.
@@ -86,6 +137,13 @@ class MasteryComposer(TaskResolver):
             exit_nodes: List of exit node IDs where execution can end
             retry_manager: Optional TaskRetryManager for handling retries
             max_depth: Maximum depth of execution to prevent infinite loops
+            execution_mode: Either "sequential" or "dag"
+            max_concurrency: Maximum number of nodes running at once in "dag" mode
+                             (None means unbounded)
+            handoff_mode: Either "copy" or "reference"
+            tracer: Optional Tracer recording spans for the execution
+            result_cache: Optional NodeResultCache for the results of deterministic
+                          nodes (may be shared between composers)
         """
         super().__init__(metadata)
         self.nodes = nodes
@@ -93,6 +151,13 @@ class MasteryComposer(TaskResolver):
         self.exit_nodes = exit_nodes or []
         self.max_depth = max_depth
         self.retry_manager = retry_manager
+        self.execution_mode = execution_mode
+        self.max_concurrency = max_concurrency
+        self.handoff_mode = handoff_mode
+        self.tracer = tracer
+        self._plan: Optional[ExecutionPlan] = None
+        self.result_cache = result_cache
+        self.cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
         self.logger = logging.getLogger(__name__)
         
         # Validate the configuration
@@ -111,7 +176,41 @@ class MasteryComposer(TaskResolver):
         Returns:
             The final TaskResult
         """
-        return await self._resolve_task(task)
+        with self._span("mastery.resolve", {
+            "mastery.name": self.metadata.name,
+            "mastery.version": self.metadata.version,
+            "mastery.execution_mode": self.execution_mode,
+            "task.id": task.id
+        }) as span:
+            if self.execution_mode == self.DAG_MODE:
+                result = await self._resolve_task_dag(task)
+            else:
+                result = await self._resolve_task(task)
+            
+            if span is not None:
+                span.set_attribute("task.status", result.status.value)
+                if result.status != TaskStatus.COMPLETED:
+                    span.set_status(STATUS_ERROR, result.message)
+        
+        # Callers get a mutable result, whatever the handoff mode
+        if isinstance(result.output_data, FrozenPayload):
+            result.output_data = result.output_data.thaw()
+        return result
+    
+    def _span(self, name: str, attributes: Dict[str, Any]) -> Any:
+        """
+        Get a context manager running a block inside a span.
+        
+        Args:
+            name: Name of the span
+            attributes: Initial attributes of the span
+            
+        Returns:
+            The tracer's span context, or a context yielding None without a tracer
+        """
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name, attributes)
     
     def _validate_configuration(self) -> None:
         """Validate the mastery configuration."""
@@ -129,6 +228,59 @@ class MasteryComposer(TaskResolver):
             for next_node in node.next_nodes:
                 if next_node not in self.nodes:
                     raise ValueError(f"Node '{node_id}' references non-existent next node '{next_node}'")
+        
+        if self.execution_mode not in (self.SEQUENTIAL_MODE, self.DAG_MODE):
+            raise ValueError(f"Unknown execution mode '{self.execution_mode}'")
+        
+        if self.handoff_mode not in (self.HANDOFF_COPY, self.HANDOFF_REFERENCE):
+            raise ValueError(f"Unknown handoff mode '{self.handoff_mode}'")
+        
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        # DAG execution requires the reachable graph to be acyclic
+        if self.execution_mode == self.DAG_MODE:
+            self._check_acyclic()
+    
+    def _check_acyclic(self) -> None:
+        """Raise ValueError if the graph reachable from the entry node has a cycle."""
+        visiting: Set[str] = set()
+        visited: Set[str] = set()
+        
+        def visit(node_id: str) -> None:
+            if node_id in visited:
+                return
+            if node_id in visiting:
+                raise ValueError(f"Cycle detected at node '{node_id}'; DAG mode requires an acyclic graph")
+            visiting.add(node_id)
+            for next_node in self.nodes[node_id].next_nodes:
+                visit(next_node)
+            visiting.remove(node_id)
+            visited.add(node_id)
+        
+        visit(self.entry_node)
+    
+    @property
+    def plan(self) -> ExecutionPlan:
+        """The compiled execution plan of this composer."""
+        plan = self._plan
+        if plan is None:
+            plan = ExecutionPlan.compile(self.nodes, self.entry_node, self.exit_nodes)
+            self._plan = plan
+        return plan
+    
+    def set_plan(self, plan: ExecutionPlan) -> None:
+        """
+        Use a plan compiled elsewhere (e.g. cached by the MasteryRegistry).
+        
+        Args:
+            plan: A plan compiled from this composer's nodes
+        """
+        self._plan = plan
+    
+    def invalidate_plan(self) -> None:
+        """Drop the compiled plan, so the next execution recompiles it."""
+        self._plan = None
     
     async def health_check(self) -> bool:
         """
@@ -152,7 +304,13 @@ class MasteryComposer(TaskResolver):
             self.logger.error(f"Health check failed: {str(e)}")
             return False
     
-    async def _execute_node(self, node_id: str, task: Task, depth: int = 0) -> TaskResult:
+    async def _execute_node(
+        self,
+        node_id: str,
+        task: Task,
+        depth: int = 0,
+        queued_at: Optional[float] = None
+    ) -> TaskResult:
         """
         Execute a single node in the mastery.
         
@@ -160,6 +318,8 @@ class MasteryComposer(TaskResolver):
             node_id: ID of the node to execute
             task: Task to execute
             depth: Current execution depth
+            queued_at: Optional time.monotonic() value at which the node became
+                       ready, used to record its queueing delay
             
         Returns:
             The TaskResult from the node execution
@@ -173,9 +333,40 @@ class MasteryComposer(TaskResolver):
                 message=f"Node '{node_id}' not found"
             )
         
+        with self._span("mastery.node", {"node.id": node_id, "node.depth": depth}) as span:
+            if span is not None and span.sampled:
+                if queued_at is not None:
+                    span.set_attribute("node.queue_delay_ms", (time.monotonic() - queued_at) * 1000)
+                span.set_attribute("node.input_bytes", payload_size(task.input_data))
+            
+            result = await self._run_node(node, task)
+            
+            if span is not None and span.sampled:
+                span.set_attribute("node.output_bytes", payload_size(result.output_data))
+                span.set_attribute("task.status", result.status.value)
+                if result.status != TaskStatus.COMPLETED:
+                    span.set_status(STATUS_ERROR, result.message)
+            return result
+    
+    async def _run_node(self, node: MasteryNode, task: Task) -> TaskResult:
+        """
+        Run a node's resolver, turning exceptions into error results.
+        
+        Args:
+            node: The node to execute
+            task: Task to execute
+            
+        Returns:
+            The TaskResult from the node execution
+        """
+        node_id = node.id
+        
         # Execute the node's resolver
         try:
-            result = await node.resolver(task)
+            if self.handoff_mode == self.HANDOFF_REFERENCE:
+                return await self._execute_node_by_reference(node, task)
+            
+            result = await self._call_resolver(node, task)
             
             # Create a new result with the executed_node information
             output_data = result.output_data.copy() if hasattr(result, 'output_data') else {}
@@ -195,6 +386,117 @@ class MasteryComposer(TaskResolver):
                 message=f"Error executing node '{node_id}': {str(e)}"
             )
     
+    async def _call_resolver(self, node: MasteryNode, task: Task) -> TaskResult:
+        """
+        Call a node's resolver, going through the result cache for deterministic nodes.
+        
+        Resolvers without metadata have no name and version to key the cache
+        with, so their results are not cached.
+        
+        Args:
+            node: The node whose resolver is called
+            task: Task to execute
+            
+        Returns:
+            The resolver's TaskResult
+        """
+        if (
+            node.deterministic
+            and self.result_cache is not None
+            and getattr(node.resolver, "metadata", None) is not None
+        ):
+            return await self._call_resolver_cached(node, task)
+        return await self._invoke_resolver(node, task)
+    
+    async def _call_resolver_cached(self, node: MasteryNode, task: Task) -> TaskResult:
+        """
+        Get a deterministic node's result from the result cache, or call its resolver.
+        
+        Args:
+            node: The deterministic node
+            task: Task to execute
+            
+        Returns:
+            The cached or computed TaskResult
+        """
+        cache = cast(NodeResultCache, self.result_cache)
+        resolver_metadata = node.resolver.metadata
+        key = cache.make_key(resolver_metadata.name, resolver_metadata.version, task.input_data)
+        
+        cached = cache.get(key) if key is not None else None
+        span = get_current_span()
+        if span is not None:
+            span.set_attribute("node.cache_hit", cached is not None)
+        if cached is not None:
+            self.cache_stats["hits"] += 1
+            return TaskResult.construct_trusted(
+                task_id=task.id,
+                status=TaskStatus.COMPLETED,
+                output_data=cached["output_data"],
+                message=cached["message"]
+            )
+        
+        self.cache_stats["misses"] += 1
+        result = await self._invoke_resolver(node, task)
+        
+        if key is not None and result.status == TaskStatus.COMPLETED:
+            cache.put(key, result.output_data, result.message)
+        return result
+    
+    async def _invoke_resolver(self, node: MasteryNode, task: Task) -> TaskResult:
+        """
+        Invoke a node's resolver, inside a "resolver.call" span when tracing.
+        
+        Args:
+            node: The node whose resolver is invoked
+            task: Task to execute
+            
+        Returns:
+            The resolver's TaskResult
+        """
+        if self.tracer is None:
+            return await node.resolver(task)
+        
+        resolver_metadata = getattr(node.resolver, "metadata", None)
+        with self.tracer.span("resolver.call", {
+            "resolver.name": getattr(resolver_metadata, "name", type(node.resolver).__name__),
+            "resolver.version": getattr(resolver_metadata, "version", None)
+        }) as span:
+            result = await node.resolver(task)
+            status = getattr(result, "status", None)
+            if span is not None and isinstance(status, TaskStatus):
+                span.set_attribute("task.status", status.value)
+            return result
+    
+    async def _execute_node_by_reference(self, node: MasteryNode, task: Task) -> TaskResult:
+        """
+        Execute a node, handing its output on by reference.
+        
+        The output is frozen once (adding the executed_node information) and
+        the node result wraps it without further copying or validation.
+        
+        Args:
+            node: The node to execute
+            task: Task to execute
+            
+        Returns:
+            The TaskResult from the node execution
+        """
+        # Copy-on-write: only nodes that modify their input pay for a copy
+        if node.mutates_input and isinstance(task.input_data, FrozenPayload):
+            task.input_data = task.input_data.thaw()
+        
+        result = await self._call_resolver(node, task)
+        output_data = getattr(result, "output_data", None) or {}
+        
+        return TaskResult.construct_trusted(
+            task_id=task.id,
+            status=result.status,
+            output_data=freeze(output_data, executed_node=node.id),
+            message=getattr(result, "message", None),
+            error=getattr(result, "error", None)
+        )
+    
     async def _resolve_task(self, task: Task) -> TaskResult:
         """
         Resolve a task by executing the mastery composition.
@@ -205,6 +507,7 @@ class MasteryComposer(TaskResolver):
         Returns:
             The final TaskResult
         """
+        plan = self.plan
         depth = 0
         current_node_id = self.entry_node
         current_task = task
@@ -216,16 +519,10 @@ class MasteryComposer(TaskResolver):
             result = await self._execute_node(current_node_id, current_task, depth)
             
             # Update the task for the next node
-            current_task = Task(
-                id=task.id,
-                name=task.name,
-                description=task.description,
-                input_data=result.output_data,
-                metadata=TaskMetadata()  # Create a new empty metadata
-            )
+            current_task = self._create_node_task(task, result.output_data)
             
             # If we've reached an exit node, return the result
-            if current_node_id in self.exit_nodes:
+            if current_node_id in plan.exit_nodes:
                 self.logger.info(f"Reached exit node {current_node_id}. Execution path: {' -> '.join(execution_path)}")
                 return result
             
@@ -236,12 +533,13 @@ class MasteryComposer(TaskResolver):
                 return result
             
             # If there are no next nodes, we're done
-            if not node.next_nodes:
+            next_node = plan.first_successor[current_node_id]
+            if next_node is None:
                 self.logger.info(f"Node {current_node_id} has no next nodes, stopping execution")
                 return result
             
-            # Move to the next node
-            current_node_id = node.next_nodes[0]  # Simple implementation: just take the first next node
+            # Move to the next node (sequential mode follows the first next node)
+            current_node_id = next_node
             execution_path.append(current_node_id)
             depth += 1
         
@@ -252,6 +550,190 @@ class MasteryComposer(TaskResolver):
             message=f"Maximum execution depth ({self.max_depth}) exceeded"
         )
     
+    async def _resolve_task_dag(self, task: Task) -> TaskResult:
+        """
+        Resolve a task by executing the mastery composition as a DAG.
+        
+        Every successor whose predecessors have all settled is started
+        concurrently. A node runs once all of its predecessors have finished and
+        at least one of them allowed execution to proceed to it. Merge nodes
+        receive the output of every contributing predecessor. The first node
+        that fails without proceeding ends the execution and cancels the
+        remaining branches.
+        
+        Args:
+            task: The task to resolve
+            
+        Returns:
+            The final TaskResult
+        """
+        plan = self.plan
+        predecessors = plan.predecessors
+        semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        
+        results: Dict[str, TaskResult] = {}
+        activated: Dict[str, List[str]] = {node_id: [] for node_id in plan.nodes}
+        settled: Set[str] = set()
+        depths: Dict[str, int] = {self.entry_node: 0}
+        terminal_nodes: List[str] = []
+        execution_path: List[str] = []
+        # Nodes already executed as part of a fused segment, not to be scheduled again
+        prefetched: Set[str] = set()
+        
+        async def run_segment(
+            node_id: str,
+            node_task: Task,
+            queued_at: Optional[float]
+        ) -> List[Tuple[str, TaskResult, bool]]:
+            # Run a node and, as long as execution proceeds, the nodes fused after it
+            executed = []
+            while True:
+                result = await self._execute_node(node_id, node_task, depths[node_id], queued_at)
+                proceeds = (
+                    node_id not in plan.exit_nodes
+                    and bool(plan.successors[node_id])
+                    and self.nodes[node_id].can_proceed(result)
+                )
+                executed.append((node_id, result, proceeds))
+                
+                next_node = plan.fused_next[node_id]
+                if not proceeds or next_node is None or depths[node_id] + 1 >= self.max_depth:
+                    return executed
+                depths[next_node] = depths[node_id] + 1
+                node_task = self._create_node_task(task, result.output_data)
+                node_id, queued_at = next_node, None
+        
+        async def run_node(node_id: str, node_task: Task, queued_at: float) -> List[Tuple[str, TaskResult, bool]]:
+            if semaphore is None:
+                return await run_segment(node_id, node_task, queued_at)
+            async with semaphore:
+                return await run_segment(node_id, node_task, queued_at)
+        
+        running: Dict[asyncio.Future, str] = {}
+        
+        def schedule(node_id: str, node_task: Task) -> None:
+            running[asyncio.ensure_future(run_node(node_id, node_task, time.monotonic()))] = node_id
+        
+        def settle(node_id: str) -> Optional[TaskResult]:
+            # Mark a node as finished (executed or skipped) and start any successor that is now ready
+            settled.add(node_id)
+            for next_node in plan.successors[node_id]:
+                if not all(pred in settled for pred in predecessors[next_node]):
+                    continue
+                sources = activated[next_node]
+                if not sources:
+                    # No predecessor proceeded to this node, so it is skipped
+                    error = settle(next_node)
+                    if error:
+                        return error
+                    continue
+                depth = max(depths[source] for source in sources) + 1
+                if depth >= self.max_depth:
+                    return TaskResult(
+                        task_id=task.id,
+                        status=TaskStatus.ERROR,
+                        message=f"Maximum execution depth ({self.max_depth}) exceeded"
+                    )
+                depths[next_node] = depth
+                if next_node in prefetched:
+                    prefetched.discard(next_node)
+                    continue
+                input_data = self._merge_outputs([results[source] for source in sources])
+                schedule(next_node, self._create_node_task(task, input_data))
+            return None
+        
+        schedule(self.entry_node, task)
+        
+        try:
+            while running:
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+                    executed = future.result()
+                    prefetched.update(node_id for node_id, _, _ in executed[1:])
+                    
+                    for node_id, result, proceeds in executed:
+                        results[node_id] = result
+                        execution_path.append(node_id)
+                        
+                        if proceeds:
+                            for next_node in plan.successors[node_id]:
+                                activated[next_node].append(node_id)
+                        elif result.status != TaskStatus.COMPLETED:
+                            # Fail fast: the remaining branches are cancelled below
+                            self.logger.info(f"Node {node_id} failed, stopping execution")
+                            return result
+                        else:
+                            terminal_nodes.append(node_id)
+                        
+                        error = settle(node_id)
+                        if error:
+                            return error
+        finally:
+            for future in running:
+                future.cancel()
+        
+        self.logger.info(f"DAG execution finished. Execution order: {', '.join(execution_path)}")
+        
+        final_nodes = [node_id for node_id in terminal_nodes if node_id in plan.exit_nodes] or terminal_nodes
+        if len(final_nodes) == 1:
+            return results[final_nodes[0]]
+        
+        # Several branches ended independently; join them into a single result
+        final_results = [results[node_id] for node_id in final_nodes]
+        return TaskResult(
+            task_id=task.id,
+            status=TaskStatus.COMPLETED,
+            output_data=self._merge_outputs(final_results)
+        )
+    
+    def _merge_outputs(self, results: List[TaskResult]) -> Dict[str, Any]:
+        """
+        Merge the outputs of one or more node results into a single input dictionary.
+        
+        A single result is passed through unchanged. For several results, the
+        outputs are shallow-merged in order and the individual outputs are kept
+        under "branch_outputs", keyed by executed node.
+        
+        Args:
+            results: Results of the predecessor nodes
+            
+        Returns:
+            The merged output data
+        """
+        if len(results) == 1:
+            return results[0].output_data
+        
+        merged: Dict[str, Any] = {}
+        branch_outputs: Dict[str, Any] = {}
+        for result in results:
+            merged.update(result.output_data)
+            branch_outputs[result.output_data.get("executed_node", str(len(branch_outputs)))] = result.output_data
+        merged.pop("executed_node", None)
+        merged["branch_outputs"] = branch_outputs
+        return merged
+    
+    def _create_node_task(self, task: Task, input_data: Dict[str, Any]) -> Task:
+        """
+        Create the task handed to a node, carrying over the identity and the
+        deadline of the original task.
+        
+        Args:
+            task: The original task given to the mastery
+            input_data: Input data for the node
+            
+        Returns:
+            The task for the node
+        """
+        # Node tasks are built from already validated data, so skip validation
+        return Task.construct_trusted(
+            id=task.id,
+            name=task.name,
+            description=task.description,
+            input_data=input_data,
+            expires_at=task.metadata.expires_at
+        )
+    
     def can_handle(self, task: Task) -> bool:
         """
         Determine if this resolver can handle the given task.
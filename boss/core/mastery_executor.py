@@ -8,7 +8,9 @@ handling state management, error handling, and execution tracking.
 import logging
 import time
 import asyncio
-from typing import Any, Dict, List, Optional, Union, Set, Type, cast
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Union, Set, Type, cast
 from datetime import datetime
 
 from boss.core.task_base import Task
@@ -19,6 +21,7 @@ from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
 from boss.core.task_retry import TaskRetryManager
 from boss.core.mastery_registry import MasteryRegistry, MasteryDefinition
 from boss.core.mastery_composer import MasteryComposer
+from boss.core.tracing import STATUS_ERROR, Tracer, get_current_span
 
 
 class ExecutionState:
@@ -51,6 +54,7 @@ class ExecutionState:
         self.status = TaskStatus.IN_PROGRESS
         self.error: Optional[TaskError] = None
         self.final_result: Optional[TaskResult] = None
+        self.trace_id: Optional[str] = None
     
     def record_node_execution(self, node_id: str, result: TaskResult) -> None:
         """
@@ -104,7 +108,8 @@ class ExecutionState:
             "status": self.status.value,
             "error": self.error.to_dict() if self.error else None,
             "execution_time": self.get_execution_time(),
-            "nodes_executed": len(self.execution_path)
+            "nodes_executed": len(self.execution_path),
+            "trace_id": self.trace_id
         }
 
 
@@ -115,6 +120,11 @@ class MasteryExecutor(TaskResolver):
     This resolver handles the execution of masteries, including state management,
     error handling, and execution tracking. It can execute masteries by name,
     or find an appropriate mastery for a given task.
+    
+    Execution history is a ring buffer of the most recent execution states,
+    indexed by task ID, with success counters per mastery that are updated as
+    states enter and leave the buffer. State lookups and success rates take
+    constant time regardless of the history size.
     """
     
     def __init__(
@@ -122,7 +132,8 @@ class MasteryExecutor(TaskResolver):
         metadata: TaskResolverMetadata,
         registry: MasteryRegistry,
         record_statistics: bool = True,
-        execution_history_size: int = 100
+        execution_history_size: int = 100,
+        tracer: Optional[Tracer] = None
     ) -> None:
         """
         Initialize the MasteryExecutor.
@@ -132,12 +143,20 @@ class MasteryExecutor(TaskResolver):
             registry: MasteryRegistry to use for finding masteries
             record_statistics: Whether to record execution statistics in registry
             execution_history_size: Maximum number of execution states to keep in history
+            tracer: Optional Tracer recording a "mastery.execute" span per execution;
+                    masteries sharing the tracer record their spans inside it
         """
         super().__init__(metadata)
         self.registry = registry
         self.record_statistics = record_statistics
         self.execution_history_size = execution_history_size
-        self.execution_history: List[ExecutionState] = []
+        self.tracer = tracer
+        self.execution_history: Deque[ExecutionState] = deque(maxlen=execution_history_size)
+        # Whether each state in execution_history was counted as successful
+        self._history_successes: Deque[bool] = deque(maxlen=execution_history_size)
+        self._states_by_task_id: Dict[str, ExecutionState] = {}
+        self._mastery_counts: Dict[str, Dict[str, int]] = {}
+        self._successful_count = 0
         self.logger = logging.getLogger(__name__)
     
     async def health_check(self) -> bool:
@@ -279,6 +298,13 @@ class MasteryExecutor(TaskResolver):
             description=task.description
         )
         
+        # The mastery must finish within the deadline of the requesting task
+        parent_expires_at = task.metadata.expires_at
+        if parent_expires_at is not None:
+            child_expires_at = mastery_task.metadata.expires_at
+            if child_expires_at is None or parent_expires_at < child_expires_at:
+                mastery_task.metadata.expires_at = parent_expires_at
+        
         # Execute the mastery
         return await self._execute_mastery(mastery_name, mastery_version, mastery_task)
     
@@ -310,13 +336,13 @@ class MasteryExecutor(TaskResolver):
             )
         
         # Find execution state
-        for state in self.execution_history:
-            if state.task_id == task_id:
-                return TaskResult(
-                    task_id=task.id,
-                    status=TaskStatus.COMPLETED,
-                    output_data=state.to_dict()
-                )
+        state = self._states_by_task_id.get(task_id)
+        if state is not None:
+            return TaskResult(
+                task_id=task.id,
+                status=TaskStatus.COMPLETED,
+                output_data=state.to_dict()
+            )
         
         # If no state found, return error
         return TaskResult(
@@ -347,22 +373,10 @@ class MasteryExecutor(TaskResolver):
         limit = task.input_data.get("limit", self.execution_history_size)
         status = task.input_data.get("status")
         
-        # Filter history
-        filtered_history = self.execution_history
-        
-        if mastery_name:
-            filtered_history = [
-                state for state in filtered_history
-                if state.mastery_name == mastery_name
-            ]
-        
+        status_enum = None
         if status:
             try:
                 status_enum = TaskStatus(status)
-                filtered_history = [
-                    state for state in filtered_history
-                    if state.status == status_enum
-                ]
             except ValueError:
                 return TaskResult(
                     task_id=task.id,
@@ -370,8 +384,8 @@ class MasteryExecutor(TaskResolver):
                     message=f"Invalid status value: {status}"
                 )
         
-        # Limit results
-        filtered_history = filtered_history[-limit:]
+        # Filter history
+        filtered_history = self.get_execution_history(mastery_name, status_enum, limit)
         
         # Convert to dicts
         history_dicts = [state.to_dict() for state in filtered_history]
@@ -382,11 +396,75 @@ class MasteryExecutor(TaskResolver):
             output_data=history_dicts
         )
     
+    def get_execution_history(
+        self,
+        mastery_name: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        limit: Optional[int] = None
+    ) -> List[ExecutionState]:
+        """
+        Get the most recent execution states matching the filters.
+        
+        History is scanned from the newest state back and the scan stops once
+        limit states have matched.
+        
+        Args:
+            mastery_name: Optional mastery name to filter by
+            status: Optional status to filter by
+            limit: Maximum number of states to return (defaults to the history size)
+            
+        Returns:
+            Matching execution states, oldest first
+        """
+        if limit is None:
+            limit = self.execution_history_size
+        
+        matching = (
+            state for state in reversed(self.execution_history)
+            if (not mastery_name or state.mastery_name == mastery_name)
+            and (status is None or state.status == status)
+        )
+        states = list(islice(matching, max(limit, 0)))
+        states.reverse()
+        return states
+    
     async def _execute_mastery(
         self,
         mastery_name: str,
         mastery_version: Optional[str],
         task: Task
+    ) -> TaskResult:
+        """
+        Execute a mastery by name and version, inside a span when tracing.
+        
+        Args:
+            mastery_name: Name of the mastery to execute
+            mastery_version: Optional version of the mastery
+            task: Task to execute
+            
+        Returns:
+            The final TaskResult
+        """
+        if self.tracer is None:
+            return await self._run_mastery(mastery_name, mastery_version, task)
+        
+        with self.tracer.span("mastery.execute", {
+            "mastery.name": mastery_name,
+            "mastery.version": mastery_version or "latest",
+            "task.id": task.id
+        }) as span:
+            result = await self._run_mastery(mastery_name, mastery_version, task)
+            if span is not None:
+                span.set_attribute("task.status", result.status.value)
+                if result.status != TaskStatus.COMPLETED:
+                    span.set_status(STATUS_ERROR, result.message)
+            return result
+    
+    async def _run_mastery(
+        self,
+        mastery_name: str,
+        mastery_version: Optional[str],
+        task: Task
     ) -> TaskResult:
         """
         Execute a mastery by name and version.
@@ -420,6 +498,9 @@ class MasteryExecutor(TaskResolver):
             mastery_version=mastery_version,
             task_id=task.id
         )
+        current_span = get_current_span()
+        if current_span is not None and current_span.sampled:
+            state.trace_id = current_span.trace_id
         
         # Execute the mastery
         start_time = time.time()
@@ -444,73 +525,83 @@ class MasteryExecutor(TaskResolver):
                     status=TaskStatus.ERROR,
                     message=f"Mastery {mastery_name} is not callable"
                 )
-            
-            # Record result
-            state.complete(result)
-            
-            # Record statistics if enabled
-            if self.record_statistics:
-                execution_time = time.time() - start_time
-                success = result.status == TaskStatus.COMPLETED
-                self.registry.record_execution(
-                    name=mastery_name,
-                    version=mastery_version,
-                    success=success,
-                    execution_time=execution_time
-                )
-            
-            # Add to history
-            self._add_to_history(state)
-            
-            # Add execution information to result metadata
-            if not hasattr(result, 'metadata'):
-                result.metadata = {}
-            result.metadata["execution_state"] = state.to_dict()
-            
-            return result
-            
         except Exception as e:
             # Create error result
-            error_result = TaskResult(
+            result = TaskResult(
                 task_id=task.id,
                 status=TaskStatus.ERROR,
                 message=f"Error executing mastery: {str(e)}"
             )
-            
-            # Record failure
-            state.complete(error_result)
-            
-            # Record statistics if enabled
-            if self.record_statistics:
-                execution_time = time.time() - start_time
-                self.registry.record_execution(
-                    name=mastery_name,
-                    version=mastery_version,
-                    success=False,
-                    execution_time=execution_time
-                )
-            
-            # Add to history
-            self._add_to_history(state)
-            
-            return error_result
+        
+        # Record result
+        state.complete(result)
+        
+        # Record statistics if enabled
+        if self.record_statistics:
+            execution_time = time.time() - start_time
+            self.registry.record_execution(
+                name=mastery_name,
+                version=mastery_version,
+                success=result.status == TaskStatus.COMPLETED,
+                execution_time=execution_time
+            )
+        
+        # Add to history once the final status is known; the state is
+        # available through the get_execution_state operation
+        self._add_to_history(state)
+        
+        return result
     
     def _add_to_history(self, state: ExecutionState) -> None:
         """
-        Add an execution state to history, maintaining size limit.
+        Add an execution state to history, evicting the oldest state when full.
         
         Args:
             state: The execution state to add
         """
+        if not self.execution_history.maxlen:
+            # History is disabled (size 0)
+            return
+        if len(self.execution_history) == self.execution_history.maxlen:
+            self._forget_state(self.execution_history[0], self._history_successes[0])
+        
+        successful = state.status == TaskStatus.COMPLETED
         self.execution_history.append(state)
+        self._history_successes.append(successful)
+        self._states_by_task_id[state.task_id] = state
+        
+        counts = self._mastery_counts.setdefault(state.mastery_name, {"total": 0, "successful": 0})
+        counts["total"] += 1
+        if successful:
+            counts["successful"] += 1
+            self._successful_count += 1
+    
+    def _forget_state(self, state: ExecutionState, successful: bool) -> None:
+        """
+        Remove a state that is leaving the history from the index and counters.
         
-        # Trim history if needed
-        if len(self.execution_history) > self.execution_history_size:
-            self.execution_history = self.execution_history[-self.execution_history_size:]
+        Args:
+            state: The execution state being evicted
+            successful: Whether the state was counted as successful when added
+        """
+        if self._states_by_task_id.get(state.task_id) is state:
+            del self._states_by_task_id[state.task_id]
+        
+        counts = self._mastery_counts[state.mastery_name]
+        counts["total"] -= 1
+        if successful:
+            counts["successful"] -= 1
+            self._successful_count -= 1
+        if counts["total"] == 0:
+            del self._mastery_counts[state.mastery_name]
     
     def clear_history(self) -> None:
         """Clear the execution history."""
-        self.execution_history = []
+        self.execution_history.clear()
+        self._history_successes.clear()
+        self._states_by_task_id.clear()
+        self._mastery_counts.clear()
+        self._successful_count = 0
     
     def get_success_rate(self, mastery_name: Optional[str] = None) -> float:
         """
@@ -522,18 +613,15 @@ class MasteryExecutor(TaskResolver):
         Returns:
             Success rate between 0.0 and 1.0
         """
-        filtered_history = self.execution_history
-        
         if mastery_name:
-            filtered_history = [
-                state for state in filtered_history
-                if state.mastery_name == mastery_name
-            ]
-        
-        if not filtered_history:
+            counts = self._mastery_counts.get(mastery_name)
+            total = counts["total"] if counts else 0
+            successful = counts["successful"] if counts else 0
+        else:
+            total = len(self.execution_history)
+            successful = self._successful_count
+        
+        if not total:
             return 0.0
         
-        successful = sum(1 for state in filtered_history 
-                       if state.status == TaskStatus.COMPLETED)
-        
-        return successful / len(filtered_history) 
\ No newline at end of file
+        return successful / total
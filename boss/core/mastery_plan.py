@@ -0,0 +1,170 @@
+"""
+Compiled execution plans for masteries.
+
+This module provides ExecutionPlan, an immutable, precomputed view of a
+mastery's node graph (routing tables, merge points, topological order and
+fused linear segments), so executions do not have to re-walk the graph.
+"""
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+
+class ExecutionPlan:
+    """
+    Immutable execution plan compiled from a mastery's node graph.
+    
+    Only nodes reachable from the entry node are part of the plan. For each
+    of them the plan holds:
+    - successors and predecessors, as tuples in declaration order
+    - first_successor: the node followed in sequential mode (or None)
+    - fused_next: the successor a node is fused with, if any
+    
+    A node is fused with its successor when it is not an exit node, has a
+    single successor, and that successor has no other predecessor. Fused
+    nodes form linear segments that DAG execution runs back to back in a
+    single asyncio task, without scheduling or join bookkeeping in between.
+    Conditions (MasteryNode.can_proceed) are still evaluated for every node.
+    
+    Plans are snapshots: a change to the nodes of a mastery requires
+    compiling a new plan.
+    """
+    
+    __slots__ = (
+        "entry_node", "exit_nodes", "nodes", "order", "successors", "predecessors",
+        "first_successor", "merge_points", "fused_next", "segments"
+    )
+    
+    def __init__(
+        self,
+        entry_node: str,
+        exit_nodes: FrozenSet[str],
+        successors: Dict[str, Tuple[str, ...]],
+        order: Optional[Tuple[str, ...]]
+    ) -> None:
+        """
+        Initialize an ExecutionPlan from a reachable successor table.
+        
+        Use compile() to build a plan from MasteryNode instances.
+        
+        Args:
+            entry_node: ID of the entry node
+            exit_nodes: IDs of the exit nodes
+            successors: Successors of every reachable node, in discovery order
+            order: Topological order of the reachable nodes, or None if the
+                   graph has a cycle
+        """
+        predecessors: Dict[str, List[str]] = {node_id: [] for node_id in successors}
+        for node_id, next_nodes in successors.items():
+            for next_node in next_nodes:
+                if node_id not in predecessors[next_node]:
+                    predecessors[next_node].append(node_id)
+        
+        fused_next: Dict[str, Optional[str]] = {}
+        for node_id, next_nodes in successors.items():
+            fused = (
+                node_id not in exit_nodes
+                and len(next_nodes) == 1
+                and len(predecessors[next_nodes[0]]) == 1
+                and next_nodes[0] != entry_node
+            )
+            fused_next[node_id] = next_nodes[0] if fused else None
+        
+        # A segment starts at every node that no other node is fused into
+        fused_targets = {next_node for next_node in fused_next.values() if next_node is not None}
+        segments: List[Tuple[str, ...]] = []
+        for node_id in (order or tuple(successors)):
+            if node_id in fused_targets:
+                continue
+            segment = [node_id]
+            while fused_next[segment[-1]] is not None and fused_next[segment[-1]] not in segment:
+                segment.append(fused_next[segment[-1]])
+            segments.append(tuple(segment))
+        
+        self.entry_node = entry_node
+        self.exit_nodes = exit_nodes
+        self.nodes = frozenset(successors)
+        self.order = order
+        self.successors: Mapping[str, Tuple[str, ...]] = MappingProxyType(dict(successors))
+        self.predecessors: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+            {node_id: tuple(preds) for node_id, preds in predecessors.items()}
+        )
+        self.first_successor: Mapping[str, Optional[str]] = MappingProxyType(
+            {node_id: (next_nodes[0] if next_nodes else None) for node_id, next_nodes in successors.items()}
+        )
+        self.merge_points = frozenset(node_id for node_id, preds in predecessors.items() if len(preds) > 1)
+        self.fused_next: Mapping[str, Optional[str]] = MappingProxyType(fused_next)
+        self.segments: Tuple[Tuple[str, ...], ...] = tuple(segments)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if hasattr(self, name):
+            raise AttributeError("ExecutionPlan is immutable")
+        object.__setattr__(self, name, value)
+    
+    @property
+    def is_acyclic(self) -> bool:
+        """Whether the reachable graph has no cycle."""
+        return self.order is not None
+    
+    @classmethod
+    def compile(cls, nodes: Mapping[str, Any], entry_node: str, exit_nodes: List[str]) -> "ExecutionPlan":
+        """
+        Compile the plan for a node graph.
+        
+        Args:
+            nodes: Dictionary mapping node IDs to nodes with a next_nodes list
+                   (MasteryNode instances, or node definitions as dictionaries)
+            entry_node: ID of the entry node
+            exit_nodes: IDs of the exit nodes
+            
+        Returns:
+            The compiled ExecutionPlan
+            
+        Raises:
+            ValueError: If a reachable node references an unknown node
+        """
+        successors: Dict[str, Tuple[str, ...]] = {}
+        stack = [entry_node]
+        while stack:
+            node_id = stack.pop()
+            if node_id in successors:
+                continue
+            if node_id not in nodes:
+                raise ValueError(f"Node '{node_id}' not found in nodes")
+            node = nodes[node_id]
+            next_nodes = node.get("next_nodes", []) if isinstance(node, dict) else node.next_nodes
+            # Duplicate successor entries have no effect on routing
+            successors[node_id] = tuple(dict.fromkeys(next_nodes))
+            stack.extend(reversed(successors[node_id]))
+        
+        return cls(entry_node, frozenset(exit_nodes), successors, cls._topological_order(entry_node, successors))
+    
+    @staticmethod
+    def _topological_order(entry_node: str, successors: Dict[str, Tuple[str, ...]]) -> Optional[Tuple[str, ...]]:
+        """
+        Order the reachable nodes so that every node comes after its predecessors.
+        
+        Args:
+            entry_node: ID of the entry node
+            successors: Successors of every reachable node
+            
+        Returns:
+            The nodes in topological order, or None if the graph has a cycle
+        """
+        in_degree: Dict[str, int] = {node_id: 0 for node_id in successors}
+        for next_nodes in successors.values():
+            for next_node in next_nodes:
+                in_degree[next_node] += 1
+        
+        order: List[str] = []
+        ready = [node_id for node_id in successors if in_degree[node_id] == 0]
+        while ready:
+            node_id = ready.pop()
+            order.append(node_id)
+            for next_node in reversed(successors[node_id]):
+                in_degree[next_node] -= 1
+                if in_degree[next_node] == 0:
+                    ready.append(next_node)
+        
+        if len(order) != len(successors) or (order and order[0] != entry_node):
+            return None
+        return tuple(order)
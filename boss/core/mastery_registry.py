@@ -6,16 +6,17 @@ allowing registration, discovery, and versioning of masteries available in the s
 """
 
 import logging
-import re
 import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union, Set, Type, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, Set, Type, cast
 from collections import defaultdict
 import uuid
 
 from boss.core.task_models import Task, TaskResult
 from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
 from boss.core.mastery_composer import MasteryComposer
+from boss.core.mastery_plan import ExecutionPlan
+from boss.core.registry import RegistryIndex
 
 
 class MasteryDefinition:
@@ -204,12 +205,21 @@ class MasteryRegistry:
     
     Provides mechanisms for registering, discovering, and versioning
     masteries available in the system.
+    
+    Each registered mastery is compiled into an ExecutionPlan once, at
+    registration. Plans are cached by name and version, handed to the
+    composer, and replaced when the same name and version is registered again.
     """
     
     def __init__(self) -> None:
         """Initialize the MasteryRegistry."""
         self.masteries: Dict[str, Dict[str, MasteryRegistryEntry]] = defaultdict(dict)
         self.logger = logging.getLogger(__name__)
+        
+        # Latest entry per name and tag index, maintained on register/unregister
+        self._latest: Dict[str, MasteryRegistryEntry] = {}
+        self._search_index = RegistryIndex(("tags",))
+        self._plans: Dict[Tuple[str, str], ExecutionPlan] = {}
     
     def register(
         self,
@@ -232,8 +242,14 @@ class MasteryRegistry:
             definition=definition
         )
         
+        # Compile the execution plan, replacing any plan of a previous registration
+        plan = ExecutionPlan.compile(composer.nodes, composer.entry_node, composer.exit_nodes)
+        self._plans[(name, version)] = plan
+        composer.set_plan(plan)
+        
         # Add to registry
         self.masteries[name][version] = entry
+        self._refresh_latest(name)
         self.logger.info(f"Registered Mastery: {name} v{version}")
     
     def unregister(self, name: str, version: Optional[str] = None) -> bool:
@@ -255,19 +271,24 @@ class MasteryRegistry:
             # Unregister specific version
             if version in self.masteries[name]:
                 del self.masteries[name][version]
+                self._plans.pop((name, version), None)
                 self.logger.info(f"Unregistered: {name} v{version}")
                 
                 # Remove name key if no versions left
                 if not self.masteries[name]:
                     del self.masteries[name]
                 
+                self._refresh_latest(name)
                 return True
             else:
                 self.logger.warning(f"Cannot unregister: {name} v{version} not found")
                 return False
         else:
             # Unregister all versions
+            for registered_version in self.masteries[name]:
+                self._plans.pop((name, registered_version), None)
             del self.masteries[name]
+            self._refresh_latest(name)
             self.logger.info(f"Unregistered all versions of: {name}")
             return True
     
@@ -293,12 +314,8 @@ class MasteryRegistry:
                 return None
         else:
             # Get latest version (highest version number)
-            if not self.masteries[name]:
-                return None
-                
-            # Sort versions using semver comparison
-            latest_version = max(self.masteries[name].keys(), key=self._version_key)
-            return self.masteries[name][latest_version].composer
+            entry = self._latest.get(name)
+            return entry.composer if entry else None
     
     def get_definition(self, name: str, version: Optional[str] = None) -> Optional[MasteryDefinition]:
         """
@@ -322,12 +339,26 @@ class MasteryRegistry:
                 return None
         else:
             # Get latest version (highest version number)
-            if not self.masteries[name]:
+            entry = self._latest.get(name)
+            return entry.definition if entry else None
+    
+    def get_plan(self, name: str, version: Optional[str] = None) -> Optional[ExecutionPlan]:
+        """
+        Get the compiled execution plan of a mastery.
+        
+        Args:
+            name: Name of the mastery
+            version: Optional version (if None, gets the latest version)
+            
+        Returns:
+            The ExecutionPlan if the mastery is registered, None otherwise
+        """
+        if version is None:
+            entry = self._latest.get(name)
+            if entry is None:
                 return None
-                
-            # Sort versions using semver comparison
-            latest_version = max(self.masteries[name].keys(), key=self._version_key)
-            return self.masteries[name][latest_version].definition
+            version = entry.definition.version
+        return self._plans.get((name, version))
     
     def search(
         self,
@@ -344,32 +375,8 @@ class MasteryRegistry:
         Returns:
             List of matching MasteryComposer instances (latest version of each)
         """
-        results = []
-        
-        # Compile name pattern if provided
-        name_regex = re.compile(name_pattern) if name_pattern else None
-        
-        # Search through masteries
-        for name, versions in self.masteries.items():
-            # Check name pattern
-            if name_regex and not name_regex.match(name):
-                continue
-                
-            # Get latest version
-            if not versions:
-                continue
-                
-            latest_version = max(versions.keys(), key=self._version_key)
-            entry = versions[latest_version]
-            
-            # Check tags
-            if tags and not entry.matches_tags(tags):
-                continue
-                
-            # Add to results
-            results.append(entry.composer)
-        
-        return results
+        names = self._search_index.query(name_pattern, tags=tags)
+        return [self._latest[name].composer for name in names]
     
     def get_all_masteries(self) -> List[MasteryComposer]:
         """
@@ -448,7 +455,8 @@ class MasteryRegistry:
                 "success_count": entry.success_count,
                 "error_count": entry.error_count,
                 "average_execution_time": entry.average_execution_time,
-                "success_rate": entry.success_count / entry.execution_count if entry.execution_count > 0 else 0
+                "success_rate": entry.success_count / entry.execution_count if entry.execution_count > 0 else 0,
+                **self._cache_statistics([entry])
             }
         else:
             # Get aggregated statistics for all versions
@@ -472,9 +480,29 @@ class MasteryRegistry:
                 "success_count": total_successes,
                 "error_count": total_errors,
                 "average_execution_time": avg_time,
-                "success_rate": total_successes / total_executions if total_executions > 0 else 0
+                "success_rate": total_successes / total_executions if total_executions > 0 else 0,
+                **self._cache_statistics(self.masteries[name].values())
             }
     
+    def _cache_statistics(self, entries: Iterable[MasteryRegistryEntry]) -> Dict[str, Any]:
+        """
+        Sum the result cache hits and misses of deterministic nodes.
+        
+        Args:
+            entries: Registry entries of the masteries to include
+            
+        Returns:
+            Dictionary with cache_hits, cache_misses and cache_hit_rate
+        """
+        entries = list(entries)
+        hits = sum(entry.composer.cache_stats["hits"] for entry in entries)
+        misses = sum(entry.composer.cache_stats["misses"] for entry in entries)
+        return {
+            "cache_hits": hits,
+            "cache_misses": misses,
+            "cache_hit_rate": hits / (hits + misses) if hits + misses > 0 else 0
+        }
+    
     def find_mastery_for_task(self, task: Task) -> Optional[MasteryComposer]:
         """
         Find a mastery that can handle the given task.
@@ -486,7 +514,7 @@ class MasteryRegistry:
             A MasteryComposer that can handle the task, or None if none found
         """
         # First, check if task has a specific mastery requested
-        mastery_name = task.metadata.get("mastery", "") if task.metadata else ""
+        mastery_name = task.input_data.get("mastery", "") if isinstance(task.input_data, dict) else ""
         if mastery_name:
             mastery = self.get_mastery(mastery_name)
             if mastery and mastery.can_handle(task):
@@ -499,6 +527,23 @@ class MasteryRegistry:
         
         return None
     
+    def _refresh_latest(self, name: str) -> None:
+        """
+        Recompute the latest version of a mastery and update the search index.
+        
+        Args:
+            name: Name of the mastery that changed
+        """
+        versions = self.masteries.get(name)
+        if versions:
+            latest_version = max(versions.keys(), key=self._version_key)
+            entry = versions[latest_version]
+            self._latest[name] = entry
+            self._search_index.update(name, tags=entry.definition.tags)
+        else:
+            self._latest.pop(name, None)
+            self._search_index.remove(name)
+    
     def _version_key(self, version: str) -> tuple:
         """
         Convert version string to a tuple for comparison.
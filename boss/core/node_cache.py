@@ -0,0 +1,278 @@
+"""
+Content-addressed cache of deterministic node results.
+
+This module provides NodeResultCache, which memoizes the results of mastery
+nodes whose output depends only on their input, keyed by a stable hash of the
+resolver's name and version and the canonicalized input data.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Set
+
+
+def _canonicalize(value: Any, active: Optional[Set[int]] = None) -> Any:
+    """
+    Convert a value to plain JSON values that identify it unambiguously.
+    
+    Values that JSON does not support natively are tagged with their type
+    ({"$date": ...}, {"$bytes": ...}, ...), and dict keys starting with "$" are
+    escaped by doubling the "$", so no two distinct values share an encoding.
+    active holds the ids of the containers being converted, to detect cycles.
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, (dict, list, tuple, set, frozenset)):
+        active = set() if active is None else active
+        if id(value) in active:
+            raise ValueError("Circular reference detected")
+        active.add(id(value))
+        try:
+            if isinstance(value, dict):
+                canonical = {}
+                for key, item in value.items():
+                    if not isinstance(key, str):
+                        raise TypeError(f"Cannot canonicalize dict key of type {type(key).__name__}")
+                    canonical["$" + key if key.startswith("$") else key] = _canonicalize(item, active)
+                return canonical
+            items = [_canonicalize(item, active) for item in value]
+            if isinstance(value, (set, frozenset)):
+                return {"$set": sorted(items, key=_dumps)}
+            return items
+        finally:
+            active.discard(id(value))
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, bytes):
+        return {"$bytes": value.hex()}
+    if hasattr(value, "model_dump"):
+        return {"$model": [type(value).__qualname__, _canonicalize(value.model_dump(mode="json"))]}
+    raise TypeError(f"Cannot canonicalize value of type {type(value).__name__}")
+
+
+def _dumps(data: Any) -> str:
+    """Encode plain JSON values with sorted keys and no whitespace."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+
+def canonical_json(data: Any) -> str:
+    """
+    Encode data as canonical JSON (sorted keys, no whitespace).
+    
+    Sets, dates, bytes and pydantic models are encoded as type-tagged objects,
+    so they never share an encoding with strings or plain containers.
+    
+    Args:
+        data: The data to encode
+        
+    Returns:
+        The canonical JSON encoding
+        
+    Raises:
+        TypeError: If the data contains values without a stable encoding or non-string dict keys
+        ValueError: If the data contains circular references or NaN
+    """
+    return _dumps(_canonicalize(data))
+
+
+class NodeResultCache:
+    """
+    Bounded LRU cache of node outputs with optional disk spill.
+    
+    Entries are stored as JSON, so every hit returns a fresh copy that
+    callers may modify. When the in-memory cache is full, the least recently
+    used entry is evicted, or moved to spill_dir if one is configured. Spilled
+    entries are found again on lookup and promoted back into memory; at most
+    max_disk_entries are kept on disk, the least recently written are removed
+    first.
+    
+    Only successful results are cached. Keys accept sets, dates, bytes and
+    pydantic models in the input data (dict keys must be strings), but outputs must consist of plain JSON
+    values (tuples come back as lists); other inputs and outputs are not
+    cached and count as uncacheable.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        spill_dir: Optional[str] = None,
+        max_disk_entries: int = 100000
+    ) -> None:
+        """
+        Initialize the NodeResultCache.
+        
+        Args:
+            max_entries: Maximum number of entries kept in memory
+            spill_dir: Optional directory for entries evicted from memory
+            max_disk_entries: Maximum number of entries kept in spill_dir
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        
+        self.max_entries = max_entries
+        self.spill_dir = spill_dir
+        self.max_disk_entries = max_disk_entries
+        self.logger = logging.getLogger(__name__)
+        
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._disk_keys: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            "hits": 0, "disk_hits": 0, "misses": 0, "stores": 0,
+            "evictions": 0, "spills": 0, "uncacheable": 0
+        }
+        
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+            spilled = [name for name in os.listdir(spill_dir) if name.endswith(".json")]
+            spilled.sort(key=lambda name: os.path.getmtime(os.path.join(spill_dir, name)))
+            for name in spilled:
+                self._disk_keys[name[:-len(".json")]] = None
+    
+    def make_key(self, resolver_name: str, resolver_version: str, input_data: Any) -> Optional[str]:
+        """
+        Compute the cache key of a node execution.
+        
+        Args:
+            resolver_name: Name of the node's resolver
+            resolver_version: Version of the node's resolver
+            input_data: Input data of the node's task
+            
+        Returns:
+            SHA-256 hex digest of the canonicalized inputs, or None if the
+            input data cannot be canonicalized
+        """
+        try:
+            encoded = canonical_json([resolver_name, resolver_version, input_data])
+        except (TypeError, ValueError):
+            with self._lock:
+                self.stats["uncacheable"] += 1
+            return None
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+        
+        Args:
+            key: Cache key from make_key()
+            
+        Returns:
+            The cached result ({"output_data": ..., "message": ...}), or None
+        """
+        with self._lock:
+            encoded = self._entries.get(key)
+            if encoded is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return json.loads(encoded)
+            
+            if key in self._disk_keys:
+                encoded = self._read_spilled(key)
+                if encoded is not None:
+                    self.stats["hits"] += 1
+                    self.stats["disk_hits"] += 1
+                    self._insert(key, encoded)
+                    return json.loads(encoded)
+            
+            self.stats["misses"] += 1
+            return None
+    
+    def put(self, key: str, output_data: Any, message: Optional[str] = None) -> bool:
+        """
+        Store a successful result.
+        
+        Args:
+            key: Cache key from make_key()
+            output_data: Output data of the result
+            message: Optional message of the result
+            
+        Returns:
+            True if the result was stored, False if it cannot be encoded
+        """
+        try:
+            encoded = json.dumps({"output_data": output_data, "message": message}, allow_nan=False)
+        except (TypeError, ValueError):
+            with self._lock:
+                self.stats["uncacheable"] += 1
+            return False
+        
+        with self._lock:
+            self._insert(key, encoded)
+            self.stats["stores"] += 1
+        return True
+    
+    def _insert(self, key: str, encoded: str) -> None:
+        """Insert an entry in memory, evicting or spilling the LRU entry (caller holds the lock)."""
+        self._entries[key] = encoded
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+            if self.spill_dir:
+                self._spill(evicted_key, evicted)
+    
+    def _spill_path(self, key: str) -> str:
+        return os.path.join(self.spill_dir or "", f"{key}.json")
+    
+    def _spill(self, key: str, encoded: str) -> None:
+        """Write an evicted entry to disk (caller holds the lock)."""
+        try:
+            with open(self._spill_path(key), "w", encoding="utf-8") as f:
+                f.write(encoded)
+        except OSError as e:
+            self.logger.warning(f"Failed to spill cache entry {key}: {str(e)}")
+            return
+        
+        self._disk_keys[key] = None
+        self._disk_keys.move_to_end(key)
+        self.stats["spills"] += 1
+        while len(self._disk_keys) > self.max_disk_entries:
+            oldest, _ = self._disk_keys.popitem(last=False)
+            self._remove_spilled(oldest)
+    
+    def _read_spilled(self, key: str) -> Optional[str]:
+        """Read a spilled entry (caller holds the lock)."""
+        try:
+            with open(self._spill_path(key), "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            del self._disk_keys[key]
+            return None
+    
+    def _remove_spilled(self, key: str) -> None:
+        try:
+            os.remove(self._spill_path(key))
+        except OSError:
+            pass
+    
+    def clear(self) -> None:
+        """Remove all entries, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            for key in self._disk_keys:
+                self._remove_spilled(key)
+            self._disk_keys.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the cache.
+        
+        Returns:
+            Dictionary with entry counts, hit rate, and counts of hits, disk
+            hits, misses, stores, evictions, spills and uncacheable values
+        """
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                "entries": len(self._entries),
+                "disk_entries": len(self._disk_keys),
+                "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+                **self.stats
+            }
@@ -0,0 +1,68 @@
+"""
+Read-only payloads for the BOSS system.
+
+This module defines FrozenPayload, a read-only dictionary used to hand node
+outputs from one resolver to the next by reference instead of copying them.
+"""
+from typing import Any, Dict, NoReturn, Tuple
+
+
+class FrozenPayload(dict):
+    """
+    A read-only dictionary.
+    
+    FrozenPayload is a real dict, so reads, iteration, serialization and
+    validation work as for any dictionary, but every mutating method raises
+    TypeError. Freezing is shallow: nested values are shared with the producer
+    and must be treated as read-only as well. Use thaw() to get a mutable copy.
+    """
+    
+    __slots__ = ()
+    
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("FrozenPayload is read-only; call thaw() to get a mutable copy")
+    
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+    
+    def thaw(self) -> Dict[str, Any]:
+        """
+        Get a mutable shallow copy of the payload.
+        
+        Returns:
+            A plain dictionary with the same items.
+        """
+        return dict(self)
+    
+    def __copy__(self) -> 'FrozenPayload':
+        return self
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (FrozenPayload, (dict(self),))
+    
+    def __repr__(self) -> str:
+        return f"FrozenPayload({dict.__repr__(self)})"
+
+
+def freeze(data: Dict[str, Any], **extra: Any) -> FrozenPayload:
+    """
+    Freeze a dictionary, optionally adding extra items.
+    
+    Already frozen payloads without extra items are returned as is.
+    
+    Args:
+        data: The dictionary to freeze.
+        **extra: Additional items to include in the payload.
+        
+    Returns:
+        FrozenPayload: The frozen payload.
+    """
+    if not extra and isinstance(data, FrozenPayload):
+        return data
+    return FrozenPayload(data, **extra)
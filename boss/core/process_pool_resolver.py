@@ -0,0 +1,212 @@
+"""
+Process pool execution for CPU-bound task resolvers.
+
+This module provides ProcessPoolResolver, a TaskResolver that wraps another
+resolver and runs its resolve method in a ProcessPoolExecutor, so that
+pure-Python CPU work does not block the event loop and can use several cores.
+"""
+
+import asyncio
+import logging
+import pickle
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Tuple, Union
+
+from boss.core.task_base import Task
+from boss.core.task_result import TaskResult
+from boss.core.task_error import TaskError
+from boss.core.task_status import TaskStatus
+from boss.core.task_resolver import TaskResolver
+
+
+# Resolvers loaded in the current worker process, keyed by pool key
+_worker_resolvers: Dict[str, TaskResolver] = {}
+
+
+def _init_worker(pool_key: str, resolver_bytes: bytes) -> None:
+    """
+    Load the wrapped resolver once per worker process.
+    
+    Args:
+        pool_key: Key identifying the pool the worker belongs to
+        resolver_bytes: The pickled resolver
+    """
+    _worker_resolvers[pool_key] = pickle.loads(resolver_bytes)
+
+
+def _resolve_in_worker(pool_key: str, task: Task) -> Tuple[Any, Task]:
+    """
+    Resolve a task with the resolver loaded in this worker process.
+    
+    Args:
+        pool_key: Key identifying the resolver to use
+        task: The task to resolve
+        
+    Returns:
+        The resolve result and the task, so that changes made to the task in
+        the worker can be applied in the parent process
+    """
+    resolver = _worker_resolvers[pool_key]
+    result = resolver.resolve(task)
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
+    return result, task
+
+
+class ProcessPoolResolver(TaskResolver):
+    """
+    TaskResolver that runs another resolver's resolve method in a process pool.
+    
+    The wrapped resolver is pickled once and loaded in every worker process when
+    the pool starts; only tasks and results cross the process boundary for each
+    call. The wrapper shares the metadata and routing behaviour (can_handle) of
+    the wrapped resolver, so it can be registered in its place.
+    
+    Only resolvers whose state is picklable and that do not depend on shared
+    in-process state between calls are suitable.
+    
+    If a worker process dies, the pool breaks: the tasks running in it get a
+    WorkerCrashed error result and the pool is replaced by a new one. After
+    max_pool_restarts replacements without a successful call in between, the
+    pool is left broken and calls keep failing until shutdown() is called.
+    """
+    
+    # Crashed worker processes count as failures for the circuit breaker
+    breaker_failure_types = frozenset({"UnexpectedError", "WorkerCrashed"})
+    
+    def __init__(
+        self,
+        resolver: TaskResolver,
+        max_workers: Optional[int] = None,
+        mp_context: Optional[Any] = None,
+        max_pool_restarts: int = 3
+    ) -> None:
+        """
+        Initialize the ProcessPoolResolver.
+        
+        Args:
+            resolver: The resolver to run in worker processes
+            max_workers: Number of worker processes (defaults to the number of CPUs)
+            mp_context: Optional multiprocessing context (e.g. multiprocessing.get_context("spawn"))
+            max_pool_restarts: Maximum number of consecutive pool replacements after worker crashes
+        """
+        super().__init__(resolver.metadata)
+        self.resolver = resolver
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+        self.max_pool_restarts = max_pool_restarts
+        self.logger = logging.getLogger(f"{__name__}.{resolver.metadata.name}")
+        
+        try:
+            self._resolver_bytes = pickle.dumps(resolver)
+        except Exception as e:
+            raise ValueError(
+                f"Resolver {resolver.metadata.name} cannot be pickled for process pool execution: {str(e)}"
+            ) from e
+        
+        self._pool_key = str(uuid.uuid4())
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pool_restarts = 0
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the process pool on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self.mp_context,
+                initializer=_init_worker,
+                initargs=(self._pool_key, self._resolver_bytes)
+            )
+        return self._executor
+    
+    async def resolve(self, task: Task) -> Union[Dict[str, Any], TaskResult]:
+        """
+        Resolve a task in a worker process.
+        
+        Args:
+            task: The task to resolve
+            
+        Returns:
+            The result produced by the wrapped resolver
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        try:
+            result, worker_task = await loop.run_in_executor(
+                executor, _resolve_in_worker, self._pool_key, task
+            )
+        except BrokenProcessPool as e:
+            self._replace_broken_pool(executor)
+            error_msg = f"Worker process crashed while resolving task {task.id}: {str(e)}"
+            self.logger.error(error_msg)
+            task.add_error("WorkerCrashed", {"resolver": self.metadata.name})
+            return TaskResult(
+                task_id=task.id,
+                status=TaskStatus.ERROR,
+                message=error_msg,
+                error=TaskError(task=task, message=error_msg, error_type="WorkerCrashed").to_dict()
+            )
+        self._pool_restarts = 0
+        
+        # Carry over errors and results the resolver recorded on its copy of the task
+        task.errors.extend(worker_task.errors[len(task.errors):])
+        task.results.extend(worker_task.results[len(task.results):])
+        return result
+    
+    def _replace_broken_pool(self, executor: ProcessPoolExecutor) -> None:
+        """
+        Drop a broken pool so that the next call creates a new one.
+        
+        Args:
+            executor: The pool a call found broken
+        """
+        if self._executor is not executor:
+            # Already replaced after another call running in it failed
+            return
+        if self._pool_restarts >= self.max_pool_restarts:
+            self.logger.error(
+                f"Process pool broken after {self._pool_restarts} restarts; not restarting it again"
+            )
+            return
+        
+        self._pool_restarts += 1
+        self.logger.warning(f"Restarting broken process pool (restart {self._pool_restarts})")
+        executor.shutdown(wait=False)
+        self._executor = None
+    
+    async def health_check(self) -> bool:
+        """
+        Check the health of the wrapped resolver.
+        
+        Returns:
+            True if the wrapped resolver is healthy, False otherwise
+        """
+        return await self.resolver.health_check()
+    
+    def can_handle(self, task: Task) -> bool:
+        """
+        Determine if the wrapped resolver can handle the given task.
+        
+        Args:
+            task: The task to check
+            
+        Returns:
+            True if the wrapped resolver can handle the task, False otherwise
+        """
+        return self.resolver.can_handle(task)
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down the worker processes.
+        
+        The pool is recreated if the resolver is used again.
+        
+        Args:
+            wait: Whether to wait for running tasks to finish
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+        self._pool_restarts = 0
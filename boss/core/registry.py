@@ -5,14 +5,150 @@ This module provides a registry system for TaskResolvers, allowing registration,
 discovery, and versioning of resolvers available in the system.
 """
 
+import functools
+import itertools
 import logging
 import re
-from typing import Any, Dict, List, Optional, Union, Callable, Type, Set, cast
-from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple, Union, Callable, Type, Set, cast
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 
 from boss.core.task_base import Task
 from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
+from boss.core.process_pool_resolver import ProcessPoolResolver
+from boss.core.circuit_breaker import CircuitBreaker, CircuitState
+
+
+# Number of name patterns whose compiled regex (and matches in each index) are cached
+NAME_PATTERN_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=NAME_PATTERN_CACHE_SIZE)
+def compile_name_pattern(pattern: str) -> Pattern[str]:
+    """
+    Compile a registry name pattern, caching the compiled regex.
+    
+    Args:
+        pattern: Regex pattern to match names against
+        
+    Returns:
+        The compiled pattern
+    """
+    return re.compile(pattern)
+
+
+class RegistryIndex:
+    """
+    Inverted indexes over the names in a registry.
+    
+    Maps each value of the indexed fields (e.g. tags, capabilities) to the
+    names that carry it, so that searches only touch matching names. Names
+    keep their insertion order, and the matches of the most recently used
+    name patterns are cached until the index changes.
+    """
+    
+    def __init__(self, fields: Iterable[str]) -> None:
+        """
+        Initialize the index.
+        
+        Args:
+            fields: Names of the set-valued fields to index
+        """
+        self._order: Dict[str, int] = {}
+        self._counter = itertools.count()
+        self._indexes: Dict[str, Dict[str, Set[str]]] = {field: defaultdict(set) for field in fields}
+        self._values: Dict[str, Dict[str, Set[str]]] = {}
+        self._name_matches: "OrderedDict[str, List[str]]" = OrderedDict()
+    
+    def update(self, name: str, **values: Set[str]) -> None:
+        """
+        Add or replace the indexed values for a name.
+        
+        Args:
+            name: The name to index
+            **values: Set of values for each indexed field
+        """
+        if name in self._order:
+            self._remove_values(name)
+        else:
+            self._order[name] = next(self._counter)
+            self._name_matches.clear()
+        
+        self._values[name] = {field: set(values.get(field) or ()) for field in self._indexes}
+        for field, field_values in self._values[name].items():
+            for value in field_values:
+                self._indexes[field][value].add(name)
+    
+    def remove(self, name: str) -> None:
+        """
+        Remove a name from the index.
+        
+        Args:
+            name: The name to remove
+        """
+        if name not in self._order:
+            return
+        self._remove_values(name)
+        del self._values[name]
+        del self._order[name]
+        self._name_matches.clear()
+    
+    def query(self, name_pattern: Optional[str] = None, **criteria: Optional[Set[str]]) -> List[str]:
+        """
+        Find the names matching a name pattern and containing all given field values.
+        
+        Args:
+            name_pattern: Optional regex pattern the name must match
+            **criteria: Set of required values for each indexed field
+            
+        Returns:
+            List of matching names, in insertion order
+        """
+        candidates: Optional[Set[str]] = None
+        for field, required in criteria.items():
+            if not required:
+                continue
+            index = self._indexes[field]
+            # Intersect the smallest posting sets first
+            for value in sorted(required, key=lambda v: len(index.get(v, ()))):
+                names = index.get(value)
+                if not names:
+                    return []
+                candidates = set(names) if candidates is None else candidates & names
+                if not candidates:
+                    return []
+        
+        if candidates is None:
+            return self._match_names(name_pattern) if name_pattern else list(self._order)
+        
+        if name_pattern:
+            regex = compile_name_pattern(name_pattern)
+            candidates = {name for name in candidates if regex.match(name)}
+        return sorted(candidates, key=self._order.__getitem__)
+    
+    def _match_names(self, name_pattern: str) -> List[str]:
+        """Return the names matching a pattern, caching the result (LRU)."""
+        matches = self._name_matches.get(name_pattern)
+        if matches is not None:
+            self._name_matches.move_to_end(name_pattern)
+            return matches
+        
+        regex = compile_name_pattern(name_pattern)
+        matches = [name for name in self._order if regex.match(name)]
+        self._name_matches[name_pattern] = matches
+        if len(self._name_matches) > NAME_PATTERN_CACHE_SIZE:
+            self._name_matches.popitem(last=False)
+        return matches
+    
+    def _remove_values(self, name: str) -> None:
+        """Remove the indexed values of a name from the posting sets."""
+        for field, field_values in self._values[name].items():
+            index = self._indexes[field]
+            for value in field_values:
+                names = index[value]
+                names.discard(name)
+                if not names:
+                    del index[value]
 
 
 class RegistryEntry:
@@ -23,7 +159,8 @@ class RegistryEntry:
         resolver: TaskResolver,
         metadata: TaskResolverMetadata,
         capabilities: Optional[Set[str]] = None,
-        tags: Optional[Set[str]] = None
+        tags: Optional[Set[str]] = None,
+        operations: Optional[Set[str]] = None
     ) -> None:
         """
         Initialize a registry entry.
@@ -33,11 +170,14 @@ class RegistryEntry:
             metadata: Metadata about the resolver
             capabilities: Set of capabilities this resolver provides
             tags: Set of tags for categorizing the resolver
+            operations: Set of task operations this resolver handles, used for
+                        routing (an empty set means the resolver may handle any task)
         """
         self.resolver = resolver
         self.metadata = metadata
         self.capabilities = capabilities or set()
         self.tags = tags or set()
+        self.operations = operations or set()
         self.registration_time = None  # Will be set when registered
     
     def matches_tags(self, tags: Set[str]) -> bool:
@@ -71,18 +211,48 @@ class TaskResolverRegistry:
     
     Provides mechanisms for registering, discovering, and versioning
     resolvers available in the system.
+    
+    Each registered resolver version gets a circuit breaker, fed by the
+    resolver's __call__ outcomes. Resolvers whose breaker is open fail fast
+    and are skipped when finding a resolver for a task.
     """
     
-    def __init__(self) -> None:
-        """Initialize the TaskResolverRegistry."""
+    def __init__(
+        self,
+        enable_circuit_breakers: bool = True,
+        circuit_breaker_options: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Initialize the TaskResolverRegistry.
+        
+        Args:
+            enable_circuit_breakers: Whether to attach circuit breakers to registered resolvers
+            circuit_breaker_options: Keyword arguments for each CircuitBreaker
+                                     (failure_threshold, recovery_timeout, ...)
+        """
         self.resolvers: Dict[str, Dict[str, RegistryEntry]] = defaultdict(dict)
         self.logger = logging.getLogger(__name__)
+        self.enable_circuit_breakers = enable_circuit_breakers
+        self.circuit_breaker_options = circuit_breaker_options or {}
+        
+        # Circuit breakers per (name, version), kept when a version is re-registered
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        
+        # Routing index, maintained on register/unregister: latest entry per
+        # name, the operations they declare, and dispatch candidates per
+        # declared operation (undeclared operations share the None entry)
+        self._latest: Dict[str, RegistryEntry] = {}
+        self._declared_operations: Set[str] = set()
+        self._dispatch_cache: Dict[Optional[str], List[RegistryEntry]] = {}
+        self._search_index = RegistryIndex(("tags", "capabilities"))
     
     def register(
         self,
         resolver: TaskResolver,
         capabilities: Optional[Set[str]] = None,
-        tags: Optional[Set[str]] = None
+        tags: Optional[Set[str]] = None,
+        operations: Optional[Set[str]] = None,
+        process_workers: Optional[int] = None
     ) -> None:
         """
         Register a TaskResolver in the registry.
@@ -91,10 +261,18 @@ class TaskResolverRegistry:
             resolver: The TaskResolver to register
             capabilities: Set of capabilities this resolver provides
             tags: Set of tags for categorizing the resolver
+            operations: Set of task operations (input_data["operation"]) this
+                        resolver handles. Resolvers that declare operations are
+                        only considered for tasks with one of those operations.
+            process_workers: If set, the resolver is wrapped in a ProcessPoolResolver
+                             with this many worker processes (for CPU-bound resolvers)
         """
         if not resolver.metadata:
             raise ValueError("TaskResolver must have metadata to be registered")
         
+        if process_workers is not None:
+            resolver = ProcessPoolResolver(resolver, max_workers=process_workers)
+        
         name = resolver.metadata.name
         version = resolver.metadata.version
         
@@ -103,11 +281,23 @@ class TaskResolverRegistry:
             resolver=resolver,
             metadata=resolver.metadata,
             capabilities=capabilities,
-            tags=tags
+            tags=tags,
+            operations=operations
         )
         
-        # Add to registry
+        if self.enable_circuit_breakers:
+            breaker = self._breakers.get((name, version))
+            if breaker is None:
+                breaker = resolver.circuit_breaker or CircuitBreaker(**self.circuit_breaker_options)
+                self._breakers[(name, version)] = breaker
+            resolver.circuit_breaker = breaker
+        
+        # Add to registry, releasing any entry this one replaces
+        previous = self.resolvers[name].get(version)
+        if previous is not None and previous.resolver is not resolver:
+            self._release(previous)
         self.resolvers[name][version] = entry
+        self._refresh_latest(name)
         self.logger.info(f"Registered TaskResolver: {name} v{version}")
     
     def unregister(self, name: str, version: Optional[str] = None) -> bool:
@@ -128,20 +318,25 @@ class TaskResolverRegistry:
         if version:
             # Unregister specific version
             if version in self.resolvers[name]:
-                del self.resolvers[name][version]
+                self._release(self.resolvers[name].pop(version))
+                self._breakers.pop((name, version), None)
                 self.logger.info(f"Unregistered: {name} v{version}")
                 
                 # Remove name key if no versions left
                 if not self.resolvers[name]:
                     del self.resolvers[name]
                 
+                self._refresh_latest(name)
                 return True
             else:
                 self.logger.warning(f"Cannot unregister: {name} v{version} not found")
                 return False
         else:
             # Unregister all versions
-            del self.resolvers[name]
+            for version, entry in self.resolvers.pop(name).items():
+                self._release(entry)
+                self._breakers.pop((name, version), None)
+            self._refresh_latest(name)
             self.logger.info(f"Unregistered all versions of: {name}")
             return True
     
@@ -167,12 +362,8 @@ class TaskResolverRegistry:
                 return None
         else:
             # Get latest version (highest version number)
-            if not self.resolvers[name]:
-                return None
-                
-            # Sort versions using semver comparison
-            latest_version = max(self.resolvers[name].keys(), key=self._version_key)
-            return self.resolvers[name][latest_version].resolver
+            entry = self._latest.get(name)
+            return entry.resolver if entry else None
     
     def search(
         self,
@@ -191,35 +382,8 @@ class TaskResolverRegistry:
         Returns:
             List of matching TaskResolvers (latest version of each)
         """
-        results = []
-        
-        # Compile name pattern if provided
-        name_regex = re.compile(name_pattern) if name_pattern else None
-        
-        # Search through resolvers
-        for name, versions in self.resolvers.items():
-            # Check name pattern
-            if name_regex and not name_regex.match(name):
-                continue
-                
-            # Get latest version
-            if not versions:
-                continue
-                
-            latest_version = max(versions.keys(), key=self._version_key)
-            entry = versions[latest_version]
-            
-            # Check tags and capabilities
-            if tags and not entry.matches_tags(tags):
-                continue
-                
-            if capabilities and not entry.matches_capabilities(capabilities):
-                continue
-                
-            # Add to results
-            results.append(entry.resolver)
-        
-        return results
+        names = self._search_index.query(name_pattern, tags=tags, capabilities=capabilities)
+        return [self._latest[name].resolver for name in names]
     
     def get_all_resolvers(self) -> List[TaskResolver]:
         """
@@ -256,20 +420,145 @@ class TaskResolverRegistry:
         Returns:
             A TaskResolver that can handle the task, or None if none found
         """
+        input_data = task.input_data if isinstance(task.input_data, dict) else {}
+        
         # First, check if task has a specific resolver requested
-        resolver_name = task.metadata.get("resolver", "") if task.metadata else ""
-        if resolver_name:
-            resolver = self.get_resolver(resolver_name)
-            if resolver and resolver.can_handle(task):
-                return resolver
+        resolver_name = input_data.get("resolver_name") or input_data.get("resolver")
+        if isinstance(resolver_name, str) and resolver_name:
+            entry = self._latest.get(resolver_name)
+            if entry and entry.resolver.can_handle(task):
+                return entry.resolver
         
-        # Otherwise, check all resolvers
-        for resolver in self.get_all_resolvers():
-            if resolver.can_handle(task):
-                return resolver
+        # Otherwise, only check the resolvers routed to the task's operation
+        operation = input_data.get("operation")
+        if not isinstance(operation, str):
+            operation = None
+        
+        for entry in self._get_dispatch_candidates(operation):
+            if self._is_circuit_open(entry):
+                continue
+            if entry.resolver.can_handle(task):
+                return entry.resolver
         
         return None
     
+    def get_circuit_breaker(self, name: str, version: Optional[str] = None) -> Optional[CircuitBreaker]:
+        """
+        Get the circuit breaker of a resolver.
+        
+        Args:
+            name: Name of the resolver
+            version: Optional version (if None, uses the latest version)
+            
+        Returns:
+            The CircuitBreaker if the resolver is registered with one, None otherwise
+        """
+        if version is None:
+            entry = self._latest.get(name)
+            if entry is None:
+                return None
+            version = entry.metadata.version
+        return self._breakers.get((name, version))
+    
+    def get_circuit_states(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the circuit breaker state of every registered resolver version.
+        
+        Returns:
+            Dictionary mapping "name@version" to the breaker state and statistics
+        """
+        return {
+            f"{name}@{version}": breaker.get_state()
+            for (name, version), breaker in sorted(self._breakers.items())
+        }
+    
+    def reset_circuit_breaker(self, name: str, version: Optional[str] = None) -> bool:
+        """
+        Close the circuit breaker of a resolver and clear its statistics.
+        
+        Args:
+            name: Name of the resolver
+            version: Optional version (if None, uses the latest version)
+            
+        Returns:
+            True if the breaker was reset, False if the resolver has none
+        """
+        breaker = self.get_circuit_breaker(name, version)
+        if breaker is None:
+            return False
+        breaker.reset()
+        return True
+    
+    def _is_circuit_open(self, entry: RegistryEntry) -> bool:
+        """
+        Check whether an entry's circuit breaker is rejecting calls.
+        
+        Args:
+            entry: The registry entry
+            
+        Returns:
+            True if the entry has an open breaker, False otherwise
+        """
+        breaker = self._breakers.get((entry.metadata.name, entry.metadata.version))
+        return breaker is not None and breaker.state == CircuitState.OPEN
+    
+    def _get_dispatch_candidates(self, operation: Optional[str]) -> List[RegistryEntry]:
+        """
+        Get the entries that may handle a task with the given operation.
+        
+        Entries that declare the operation come first, followed by entries that
+        declare no operations at all. Results are cached until the registry
+        changes; only declared operations get their own cache entry, all other
+        operations share the candidates of tasks without an operation.
+        
+        Args:
+            operation: The task operation, or None if the task has none
+            
+        Returns:
+            List of candidate entries (latest version of each resolver)
+        """
+        if operation not in self._declared_operations:
+            operation = None
+        candidates = self._dispatch_cache.get(operation)
+        if candidates is None:
+            declared = [
+                entry for entry in self._latest.values()
+                if operation is not None and operation in entry.operations
+            ]
+            undeclared = [entry for entry in self._latest.values() if not entry.operations]
+            candidates = declared + undeclared
+            self._dispatch_cache[operation] = candidates
+        return candidates
+    
+    def _release(self, entry: RegistryEntry) -> None:
+        """
+        Release resources held by an unregistered entry.
+        
+        Args:
+            entry: The entry that was removed
+        """
+        if isinstance(entry.resolver, ProcessPoolResolver):
+            entry.resolver.shutdown(wait=False)
+    
+    def _refresh_latest(self, name: str) -> None:
+        """
+        Recompute the latest version of a resolver and update the routing and search indexes.
+        
+        Args:
+            name: Name of the resolver that changed
+        """
+        versions = self.resolvers.get(name)
+        if versions:
+            latest_version = max(versions.keys(), key=self._version_key)
+            entry = versions[latest_version]
+            self._latest[name] = entry
+            self._search_index.update(name, tags=entry.tags, capabilities=entry.capabilities)
+        else:
+            self._latest.pop(name, None)
+            self._search_index.remove(name)
+        self._declared_operations = set().union(*(entry.operations for entry in self._latest.values()))
+        self._dispatch_cache.clear()
+    
     def _version_key(self, version: str) -> tuple:
         """
         Convert version string to a tuple for comparison.
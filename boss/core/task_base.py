@@ -6,7 +6,7 @@ foundation of the BOSS system's data structures.
 """
 import uuid
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union, TYPE_CHECKING
 from pydantic import BaseModel, Field, model_validator
 
 from boss.core.task_status import TaskStatus
@@ -17,6 +17,37 @@ if TYPE_CHECKING:
     from boss.core.task_result import TaskResult
 
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+def _construct_model(model_cls: Type[_ModelT], values: Dict[str, Any]) -> _ModelT:
+    """
+    Build a pydantic model instance from a complete set of trusted field values.
+    
+    This does what BaseModel.model_construct does for models without aliases,
+    extras or private attributes, without its per-field default resolution,
+    which dominates the cost for small models. Models that use extras or
+    private attributes go through model_construct; tests check that both
+    paths build equal instances.
+    
+    Args:
+        model_cls: The model class to instantiate.
+        values: A value for every field of the model.
+        
+    Returns:
+        The model instance.
+    """
+    if model_cls.__private_attributes__ or model_cls.model_config.get("extra") == "allow":
+        return model_cls.model_construct(**values)
+    
+    instance = model_cls.__new__(model_cls)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
 class TaskMetadata(BaseModel):
     """
     Metadata about a task, including creation time, owner, and other properties.
@@ -44,6 +75,21 @@ class TaskMetadata(BaseModel):
         return self
 
 
+# Defaults of the TaskMetadata fields, for building metadata without validation.
+# Factory defaults are called per instance; the timestamps share a single now().
+_METADATA_TIMESTAMP_FIELDS = ("created_at", "updated_at")
+_METADATA_DEFAULTS: Dict[str, Any] = {
+    name: field.default
+    for name, field in TaskMetadata.model_fields.items()
+    if field.default_factory is None
+}
+_METADATA_DEFAULT_FACTORIES: Dict[str, Any] = {
+    name: field.default_factory
+    for name, field in TaskMetadata.model_fields.items()
+    if field.default_factory is not None and name not in _METADATA_TIMESTAMP_FIELDS
+}
+
+
 class Task(BaseModel):
     """
     Represents a task to be performed by a TaskResolver.
@@ -70,6 +116,63 @@ class Task(BaseModel):
                 "from_status": None
             }]
     
+    @classmethod
+    def construct_trusted(
+        cls,
+        name: str,
+        input_data: Optional[Dict[str, Any]] = None,
+        id: Optional[str] = None,
+        description: str = "",
+        metadata: Optional[TaskMetadata] = None,
+        context: Optional[Dict[str, Any]] = None,
+        status: TaskStatus = TaskStatus.PENDING,
+        expires_at: Optional[datetime] = None
+    ) -> 'Task':
+        """
+        Create a task without validation, for internally created tasks.
+        
+        This skips pydantic validation and builds the metadata with a single
+        timestamp. The history, errors and results start as empty lists; the
+        initial history entry is recorded on the first status change instead
+        of on construction. Arguments are used as given, so callers must only
+        pass already valid values.
+        
+        Args:
+            name: The name of the task.
+            input_data: The input data of the task (used by reference).
+            id: The task ID (a new ID is generated if not provided).
+            description: The description of the task.
+            metadata: The task metadata (a fresh TaskMetadata if not provided).
+            context: The task context.
+            status: The initial status of the task.
+            expires_at: The deadline of the task (ignored if metadata is given).
+            
+        Returns:
+            Task: A new Task object.
+        """
+        if metadata is None:
+            now = datetime.now()
+            values = dict(_METADATA_DEFAULTS)
+            for field_name, factory in _METADATA_DEFAULT_FACTORIES.items():
+                values[field_name] = factory()
+            for field_name in _METADATA_TIMESTAMP_FIELDS:
+                values[field_name] = now
+            values["expires_at"] = expires_at
+            metadata = _construct_model(TaskMetadata, values)
+        
+        return _construct_model(cls, {
+            "id": id or str(uuid.uuid4()),
+            "name": name,
+            "description": description,
+            "status": status,
+            "input_data": input_data if input_data is not None else {},
+            "metadata": metadata,
+            "context": context if context is not None else {},
+            "history": [],
+            "errors": [],
+            "results": []
+        })
+    
     def update_status(self, new_status: TaskStatus) -> bool:
         """
         Update the status of the task if the transition is valid.
@@ -82,12 +185,21 @@ class Task(BaseModel):
         """
         if self.status.can_transition_to(new_status):
             old_status = self.status
+            now = datetime.now()
             self.status = new_status
-            self.metadata.updated_at = datetime.now()
+            self.metadata.updated_at = now
+            
+            # Seed the history of tasks created through construct_trusted
+            if not self.history:
+                self.history.append({
+                    "timestamp": self.metadata.created_at.isoformat(),
+                    "to_status": old_status.name,
+                    "from_status": None
+                })
             
             # Add to history
             self.history.append({
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "from_status": old_status.name,
                 "to_status": new_status.name
             })
@@ -153,6 +265,19 @@ class Task(BaseModel):
         
         return datetime.now() > self.metadata.expires_at
     
+    def get_remaining_time(self) -> Optional[float]:
+        """
+        Get the time left before the task expires.
+        
+        Returns:
+            Optional[float]: The remaining time in seconds (zero or negative once
+                expired), or None if the task has no expiration time.
+        """
+        if self.metadata.expires_at is None:
+            return None
+        
+        return (self.metadata.expires_at - datetime.now()).total_seconds()
+    
     def can_retry(self) -> bool:
         """
         Check if the task can be retried based on retry count.
@@ -14,10 +14,14 @@ from boss.core.task_result import TaskResult
 # Re-export TaskError from task_error
 from boss.core.task_error import TaskError
 
+# Re-export TaskStatus from task_status
+from boss.core.task_status import TaskStatus
+
 # Deprecated - will be removed in a future version
 __all__ = [
     "Task",
     "TaskMetadata",
     "TaskResult",
-    "TaskError"
+    "TaskError",
+    "TaskStatus"
 ] 
\ No newline at end of file
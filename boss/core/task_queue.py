@@ -0,0 +1,515 @@
+"""
+Durable task queue for the BOSS system.
+
+This module provides TaskQueue, a persistent queue of tasks stored in SQLite
+(in WAL mode), and QueuedTask, a task leased from the queue. Leased tasks are
+invisible to other consumers until their lease expires, so tasks held by a
+crashed worker are delivered again after the visibility timeout.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from boss.core.task_base import Task
+from boss.core.task_result import TaskResult
+from boss.core.task_status import TaskStatus
+
+
+# Queue entry states
+QUEUED = "queued"
+LEASED = "leased"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values json does not handle natively."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, TaskStatus):
+        return value.name
+    return str(value)
+
+
+def _dump_result(result: TaskResult) -> str:
+    """Serialize a TaskResult to JSON."""
+    return json.dumps(result.model_dump(), default=_json_default)
+
+
+def _load_result(data: str) -> TaskResult:
+    """Deserialize a TaskResult from JSON."""
+    values = json.loads(data)
+    values["status"] = TaskStatus[values["status"]]
+    return TaskResult(**values)
+
+
+class QueuedTask:
+    """A task leased from a TaskQueue."""
+    
+    def __init__(
+        self,
+        task: Task,
+        lease_id: str,
+        resolver_name: Optional[str],
+        attempts: int,
+        max_attempts: int,
+        lease_expires_at: float
+    ) -> None:
+        """
+        Initialize a QueuedTask.
+        
+        Args:
+            task: The task
+            lease_id: Identifier of the lease, required to complete, fail or extend it
+            resolver_name: Name of the resolver to use (None to route through the registry)
+            attempts: Number of times the task has been leased, including this lease
+            max_attempts: Maximum number of leases before the task fails permanently
+            lease_expires_at: Time (time.time()) at which the lease expires
+        """
+        self.task = task
+        self.lease_id = lease_id
+        self.resolver_name = resolver_name
+        self.attempts = attempts
+        self.max_attempts = max_attempts
+        self.lease_expires_at = lease_expires_at
+
+
+class TaskQueue:
+    """
+    Persistent task queue backed by SQLite.
+    
+    Tasks are delivered by priority (highest first), then in enqueue order.
+    A consumer leases tasks for visibility_timeout seconds and must complete,
+    fail or extend the lease before it expires; otherwise the task is delivered
+    again. Each lease counts as an attempt, and tasks that exhaust max_attempts
+    are marked as failed.
+    
+    The queue is safe to use from several threads, and several processes can
+    share the same database file.
+    """
+    
+    def __init__(
+        self,
+        db_path: str,
+        visibility_timeout: float = 60.0,
+        max_attempts: int = 3,
+        retry_delay_seconds: float = 1.0
+    ) -> None:
+        """
+        Initialize the TaskQueue.
+        
+        Args:
+            db_path: Path to the SQLite database file (":memory:" for a non-durable queue)
+            visibility_timeout: Default lease duration in seconds
+            max_attempts: Default maximum number of attempts per task
+            retry_delay_seconds: Base delay before a failed task is delivered again
+                                 (doubled on every attempt)
+        """
+        self.db_path = db_path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self.logger = logging.getLogger(__name__)
+        
+        if db_path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(db_path))
+            os.makedirs(directory, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False, timeout=30.0)
+        self._initialize_db()
+    
+    def _initialize_db(self) -> None:
+        """Configure the connection and create the schema if it doesn't exist."""
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS task_queue (
+                id TEXT PRIMARY KEY,
+                resolver_name TEXT,
+                priority INTEGER NOT NULL,
+                state TEXT NOT NULL,
+                task TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                available_at REAL NOT NULL,
+                enqueued_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                lease_id TEXT,
+                lease_expires_at REAL,
+                result TEXT
+            )
+            ''')
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_task_queue_ready '
+                'ON task_queue (state, priority DESC, enqueued_at)'
+            )
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_task_queue_lease '
+                'ON task_queue (state, lease_expires_at)'
+            )
+    
+    def _transaction(self, statements: Any) -> Any:
+        """
+        Run a function in an immediate (write-locked) transaction.
+        
+        Args:
+            statements: Function taking the connection and returning a value
+            
+        Returns:
+            The function's return value
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                value = statements(self._conn)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return value
+    
+    def enqueue(
+        self,
+        task: Task,
+        resolver_name: Optional[str] = None,
+        priority: Optional[int] = None,
+        delay_seconds: float = 0.0,
+        max_attempts: Optional[int] = None
+    ) -> str:
+        """
+        Add a task to the queue (unless a task with its ID is already queued).
+        
+        Args:
+            task: The task to enqueue
+            resolver_name: Resolver to use (None to route through the registry)
+            priority: Priority of the task (defaults to task.metadata.priority)
+            delay_seconds: Seconds before the task becomes available
+            max_attempts: Maximum number of attempts (defaults to the queue's max_attempts)
+            
+        Returns:
+            The ID of the task
+        """
+        self.enqueue_many([task], resolver_name, priority, delay_seconds, max_attempts)
+        return task.id
+    
+    def enqueue_many(
+        self,
+        tasks: Iterable[Task],
+        resolver_name: Optional[str] = None,
+        priority: Optional[int] = None,
+        delay_seconds: float = 0.0,
+        max_attempts: Optional[int] = None
+    ) -> List[str]:
+        """
+        Add several tasks to the queue in a single transaction.
+        
+        A task whose ID is already in the queue is left as it is, whatever its
+        state, so re-enqueueing a task never resets its attempts or takes it
+        away from the worker holding its lease. Finished tasks can be enqueued
+        again once they are purged.
+        
+        Args:
+            tasks: The tasks to enqueue
+            resolver_name: Resolver to use (None to route through the registry)
+            priority: Priority of the tasks (defaults to each task's metadata.priority)
+            delay_seconds: Seconds before the tasks become available
+            max_attempts: Maximum number of attempts (defaults to the queue's max_attempts)
+            
+        Returns:
+            The IDs of the tasks
+        """
+        now = time.time()
+        rows = [
+            (
+                task.id,
+                resolver_name,
+                priority if priority is not None else task.metadata.priority,
+                QUEUED,
+                json.dumps(task.to_dict(), default=_json_default),
+                max_attempts or self.max_attempts,
+                now + delay_seconds,
+                now,
+                now
+            )
+            for task in tasks
+        ]
+        
+        def insert(conn: sqlite3.Connection) -> None:
+            conn.executemany(
+                'INSERT INTO task_queue '
+                '(id, resolver_name, priority, state, task, max_attempts, available_at, enqueued_at, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (id) DO NOTHING',
+                rows
+            )
+        
+        self._transaction(insert)
+        return [row[0] for row in rows]
+    
+    def lease(
+        self,
+        limit: int = 1,
+        visibility_timeout: Optional[float] = None,
+        exclude_resolvers: Optional[Iterable[str]] = None
+    ) -> List[QueuedTask]:
+        """
+        Lease available tasks, including tasks whose previous lease expired.
+        
+        Args:
+            limit: Maximum number of tasks to lease
+            visibility_timeout: Lease duration (defaults to the queue's visibility_timeout)
+            exclude_resolvers: Resolver names whose tasks should not be leased
+            
+        Returns:
+            The leased tasks, in delivery order
+        """
+        timeout = visibility_timeout if visibility_timeout is not None else self.visibility_timeout
+        excluded = list(exclude_resolvers or ())
+        
+        def take(conn: sqlite3.Connection) -> List[Tuple[Any, ...]]:
+            now = time.time()
+            
+            # Tasks whose last lease expired without attempts left have failed
+            conn.execute(
+                'UPDATE task_queue SET state = ?, updated_at = ?, lease_id = NULL '
+                'WHERE state = ? AND lease_expires_at <= ? AND attempts >= max_attempts',
+                (FAILED, now, LEASED, now)
+            )
+            
+            query = (
+                'SELECT id, resolver_name, task, attempts, max_attempts FROM task_queue '
+                'WHERE ((state = ? AND available_at <= ?) OR (state = ? AND lease_expires_at <= ?))'
+            )
+            params: List[Any] = [QUEUED, now, LEASED, now]
+            if excluded:
+                query += f' AND (resolver_name IS NULL OR resolver_name NOT IN ({", ".join("?" * len(excluded))}))'
+                params.extend(excluded)
+            query += ' ORDER BY priority DESC, enqueued_at LIMIT ?'
+            params.append(limit)
+            
+            rows = conn.execute(query, params).fetchall()
+            leased = []
+            for task_id, resolver_name, task_json, attempts, max_attempts in rows:
+                lease_id = str(uuid.uuid4())
+                conn.execute(
+                    'UPDATE task_queue SET state = ?, attempts = attempts + 1, lease_id = ?, '
+                    'lease_expires_at = ?, updated_at = ? WHERE id = ?',
+                    (LEASED, lease_id, now + timeout, now, task_id)
+                )
+                leased.append((task_json, lease_id, resolver_name, attempts + 1, max_attempts, now + timeout))
+            return leased
+        
+        return [
+            QueuedTask(Task.from_dict(json.loads(task_json)), lease_id, resolver_name, attempts, max_attempts, expires_at)
+            for task_json, lease_id, resolver_name, attempts, max_attempts, expires_at in self._transaction(take)
+        ]
+    
+    def extend_lease(self, queued: QueuedTask, visibility_timeout: Optional[float] = None) -> bool:
+        """
+        Extend the lease of a task that is still being processed.
+        
+        Args:
+            queued: The leased task
+            visibility_timeout: New lease duration from now (defaults to the queue's visibility_timeout)
+            
+        Returns:
+            True if the lease was extended, False if it was lost
+        """
+        timeout = visibility_timeout if visibility_timeout is not None else self.visibility_timeout
+        expires_at = time.time() + timeout
+        
+        def extend(conn: sqlite3.Connection) -> bool:
+            cursor = conn.execute(
+                'UPDATE task_queue SET lease_expires_at = ? WHERE id = ? AND state = ? AND lease_id = ?',
+                (expires_at, queued.task.id, LEASED, queued.lease_id)
+            )
+            return cursor.rowcount == 1
+        
+        extended = self._transaction(extend)
+        if extended:
+            queued.lease_expires_at = expires_at
+        return extended
+    
+    def complete(self, queued: QueuedTask, result: TaskResult) -> bool:
+        """
+        Record the result of a task and remove it from delivery.
+        
+        Args:
+            queued: The leased task
+            result: The result of the task
+            
+        Returns:
+            True if the result was recorded, False if the lease was lost
+        """
+        return self._finish(queued, COMPLETED, result)
+    
+    def fail(self, queued: QueuedTask, result: Optional[TaskResult] = None, retry: bool = True) -> bool:
+        """
+        Record a failed attempt.
+        
+        The task is delivered again after a backoff delay if it has attempts
+        left and retry is True; otherwise it is marked as failed.
+        
+        Args:
+            queued: The leased task
+            result: The result of the failed attempt
+            retry: Whether the task may be retried
+            
+        Returns:
+            True if the failure was recorded, False if the lease was lost
+        """
+        if not retry or queued.attempts >= queued.max_attempts:
+            return self._finish(queued, FAILED, result)
+        
+        available_at = time.time() + self.retry_delay_seconds * (2 ** (queued.attempts - 1))
+        return self._finish(queued, QUEUED, result, available_at)
+    
+    def release(self, queued: QueuedTask) -> bool:
+        """
+        Return a leased task to the queue without counting the attempt.
+        
+        Args:
+            queued: The leased task
+            
+        Returns:
+            True if the task was released, False if the lease was lost
+        """
+        def give_back(conn: sqlite3.Connection) -> bool:
+            cursor = conn.execute(
+                'UPDATE task_queue SET state = ?, attempts = MAX(attempts - 1, 0), lease_id = NULL, '
+                'lease_expires_at = NULL, available_at = ?, updated_at = ? '
+                'WHERE id = ? AND state = ? AND lease_id = ?',
+                (QUEUED, time.time(), time.time(), queued.task.id, LEASED, queued.lease_id)
+            )
+            return cursor.rowcount == 1
+        
+        return self._transaction(give_back)
+    
+    def _finish(
+        self,
+        queued: QueuedTask,
+        state: str,
+        result: Optional[TaskResult],
+        available_at: Optional[float] = None
+    ) -> bool:
+        """
+        Move a leased task to a new state, if the lease is still held.
+        
+        Args:
+            queued: The leased task
+            state: The new state
+            result: The result to store
+            available_at: When the task becomes available again (for QUEUED)
+            
+        Returns:
+            True if the task was updated, False if the lease was lost
+        """
+        now = time.time()
+        result_json = _dump_result(result) if result is not None else None
+        task_json = json.dumps(queued.task.to_dict(), default=_json_default)
+        
+        def update(conn: sqlite3.Connection) -> bool:
+            cursor = conn.execute(
+                'UPDATE task_queue SET state = ?, result = ?, task = ?, lease_id = NULL, lease_expires_at = NULL, '
+                'available_at = COALESCE(?, available_at), updated_at = ? '
+                'WHERE id = ? AND state = ? AND lease_id = ?',
+                (state, result_json, task_json, available_at, now, queued.task.id, LEASED, queued.lease_id)
+            )
+            return cursor.rowcount == 1
+        
+        updated = self._transaction(update)
+        if not updated:
+            self.logger.warning(f"Lease lost for task {queued.task.id}; result discarded")
+        return updated
+    
+    def get_state(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the queue state of a task.
+        
+        Args:
+            task_id: The ID of the task
+            
+        Returns:
+            Dictionary with the state, attempts and resolver of the task, or None if unknown
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT state, attempts, max_attempts, resolver_name, priority, lease_expires_at '
+                'FROM task_queue WHERE id = ?',
+                (task_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        state, attempts, max_attempts, resolver_name, priority, lease_expires_at = row
+        if state == LEASED and lease_expires_at is not None and lease_expires_at <= time.time():
+            state = QUEUED if attempts < max_attempts else FAILED
+        return {
+            "state": state,
+            "attempts": attempts,
+            "max_attempts": max_attempts,
+            "resolver_name": resolver_name,
+            "priority": priority
+        }
+    
+    def get_result(self, task_id: str) -> Optional[TaskResult]:
+        """
+        Get the last recorded result of a task.
+        
+        Args:
+            task_id: The ID of the task
+            
+        Returns:
+            The TaskResult, or None if no result was recorded
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT result FROM task_queue WHERE id = ?', (task_id,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return _load_result(row[0])
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get the number of tasks in each state.
+        
+        Returns:
+            Dictionary mapping states to task counts
+        """
+        with self._lock:
+            rows = self._conn.execute('SELECT state, COUNT(*) FROM task_queue GROUP BY state').fetchall()
+        stats = {QUEUED: 0, LEASED: 0, COMPLETED: 0, FAILED: 0}
+        stats.update(dict(rows))
+        return stats
+    
+    def purge(self, older_than_seconds: float = 0.0) -> int:
+        """
+        Delete completed and failed tasks.
+        
+        Args:
+            older_than_seconds: Only delete tasks finished at least this long ago
+            
+        Returns:
+            The number of deleted tasks
+        """
+        cutoff = time.time() - older_than_seconds
+        
+        def delete(conn: sqlite3.Connection) -> int:
+            cursor = conn.execute(
+                'DELETE FROM task_queue WHERE state IN (?, ?) AND updated_at <= ?',
+                (COMPLETED, FAILED, cutoff)
+            )
+            return cursor.rowcount
+        
+        return self._transaction(delete)
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
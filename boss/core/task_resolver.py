@@ -9,8 +9,15 @@ import abc
 import time
 import asyncio
 import logging
+import threading
+import traceback
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar, Union, Callable, cast
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Dict, FrozenSet, Generic, Iterable, List,
+    Optional, Tuple, TypeVar, Union, Callable, cast
+)
 
 from pydantic import BaseModel, Field
 
@@ -18,6 +25,8 @@ from boss.core.task_base import Task
 from boss.core.task_result import TaskResult
 from boss.core.task_error import TaskError
 from boss.core.task_status import TaskStatus
+from boss.core.circuit_breaker import CircuitBreaker
+from boss.core.instrumentation import ResolverHook, ResolverHookRegistry, resolver_hooks, run_after_hooks, run_before_hooks
 
 # Type variable for the return type of the resolve method
 T = TypeVar('T', bound=Dict[str, Any])
@@ -25,6 +34,10 @@ T = TypeVar('T', bound=Dict[str, Any])
 logger = logging.getLogger(__name__)
 
 
+class _DeadlineExceeded(Exception):
+    """Raised when a task's deadline passes while it is being resolved."""
+
+
 class TaskResolverMetadata:
     """
     Metadata about a TaskResolver.
@@ -88,6 +101,89 @@ class TaskResolverMetadata:
         )
 
 
+class _ThreadOffloader:
+    """
+    Bounded thread pool for running a resolver's synchronous code off the event loop.
+    
+    Keeps queue-depth metrics: calls waiting for a thread, calls running and
+    calls completed. The pool is created on first use and is not pickled.
+    """
+    
+    def __init__(self, max_workers: int, name: str) -> None:
+        self.max_workers = max_workers
+        self.name = name
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.max_queued = 0
+    
+    def _run(self, func: Callable[..., Any], args: tuple) -> Any:
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.completed += 1
+    
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a synchronous function in the pool and await its result."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"resolver-{self.name}"
+            )
+        with self._lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._run, func, args)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get the queue-depth metrics of the pool."""
+        with self._lock:
+            return {
+                "pool_size": self.max_workers,
+                "queued": self.queued,
+                "active": self.active,
+                "completed": self.completed,
+                "max_queued": self.max_queued
+            }
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the pool; it is recreated on next use."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+    
+    def __reduce__(self) -> tuple:
+        return (_ThreadOffloader, (self.max_workers, self.name))
+
+
+def _offload_sync_resolve(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a synchronous resolve implementation so it runs in the resolver's thread pool."""
+    @functools.wraps(func)
+    async def resolve(self: 'TaskResolver', task: Task) -> Any:
+        return await self.run_in_thread(func, self, task)
+    return resolve
+
+
+async def _resolve_via_resolve_task(self: 'TaskResolver', task: Task) -> Any:
+    """
+    Default resolve for resolvers that only implement _resolve_task.
+    
+    Synchronous implementations run in the resolver's thread pool.
+    """
+    resolve_task = getattr(type(self), "_resolve_task")
+    if asyncio.iscoroutinefunction(resolve_task):
+        return await resolve_task(self, task)
+    return await self.run_in_thread(resolve_task, self, task)
+
+
 class TaskResolver(Generic[T], abc.ABC):
     """
     Abstract base class for all task resolvers.
@@ -95,8 +191,42 @@ class TaskResolver(Generic[T], abc.ABC):
     A TaskResolver is responsible for resolving a specific type of task. It
     receives a task object and returns a task result. TaskResolvers can be
     chained together to form complex workflows.
+    
+    Subclasses that implement resolve as a regular (synchronous) method, or
+    that only implement _resolve_task, are adapted automatically: the
+    synchronous code runs in a per-resolver thread pool of thread_pool_size
+    threads instead of blocking the event loop.
+    
+    If a circuit breaker is attached (TaskResolverRegistry attaches one on
+    registration), calls record their outcome and latency in it and fail fast
+    while it is open.
+    
+    Every call runs the hooks of hook_registry (by default the global
+    boss.core.instrumentation.resolver_hooks) around the resolution; with no
+    hooks registered, calls skip instrumentation entirely.
     """
     
+    # Number of threads used to run synchronous resolve implementations
+    thread_pool_size: int = 4
+    
+    # Circuit breaker fed by __call__ outcomes, if any
+    circuit_breaker: Optional[CircuitBreaker] = None
+    
+    # error_type values of error results that count as circuit breaker failures
+    breaker_failure_types: FrozenSet[str] = frozenset({"UnexpectedError"})
+    
+    # Instrumentation hooks run by __call__
+    hook_registry: ResolverHookRegistry = resolver_hooks
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        resolve = cls.__dict__.get("resolve")
+        if resolve is not None:
+            if not asyncio.iscoroutinefunction(resolve) and not getattr(resolve, "__isabstractmethod__", False):
+                cls.resolve = _offload_sync_resolve(resolve)  # type: ignore[method-assign]
+        elif getattr(cls.resolve, "__isabstractmethod__", False) and callable(getattr(cls, "_resolve_task", None)):
+            cls.resolve = _resolve_via_resolve_task  # type: ignore[method-assign]
+    
     def __init__(self, metadata: TaskResolverMetadata):
         """
         Initialize a new TaskResolver.
@@ -122,6 +252,36 @@ class TaskResolver(Generic[T], abc.ABC):
         """
         pass
     
+    async def run_in_thread(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a synchronous function in this resolver's thread pool.
+        
+        Args:
+            func: The function to run.
+            *args: Positional arguments to pass to the function.
+            
+        Returns:
+            The return value of the function.
+        """
+        offloader = self.__dict__.get("_thread_offloader")
+        if offloader is None:
+            name = self.metadata.name if getattr(self, "metadata", None) else type(self).__name__
+            offloader = _ThreadOffloader(self.thread_pool_size, name)
+            self._thread_offloader = offloader
+        return await offloader.run(func, *args)
+    
+    def get_thread_pool_stats(self) -> Dict[str, int]:
+        """
+        Get the queue-depth metrics of this resolver's thread pool.
+        
+        Returns:
+            Pool size and the number of queued, active and completed calls.
+        """
+        offloader = self.__dict__.get("_thread_offloader")
+        if offloader is None:
+            return {"pool_size": self.thread_pool_size, "queued": 0, "active": 0, "completed": 0, "max_queued": 0}
+        return offloader.get_stats()
+    
     async def health_check(self) -> bool:
         """
         Check if this resolver is healthy.
@@ -188,6 +348,44 @@ class TaskResolver(Generic[T], abc.ABC):
         
         This method delegates to the resolve method but ensures that
         the result is always a TaskResult, and handles logging and errors.
+        Tasks that have already expired are not resolved, and resolution is
+        cancelled when the task's deadline (metadata.expires_at) passes.
+        
+        Args:
+            task: The task to resolve.
+            
+        Returns:
+            The task result.
+        """
+        hooks = self.hook_registry.hooks
+        if hooks:
+            return await self._call_with_hooks(task, hooks)
+        return await self._call(task)
+    
+    async def _call_with_hooks(self, task: Task, hooks: Tuple[ResolverHook, ...]) -> TaskResult:
+        """
+        Resolve a task through _call, running instrumentation hooks around it.
+        
+        Args:
+            task: The task to resolve.
+            hooks: The hooks to run.
+            
+        Returns:
+            The task result.
+        """
+        states = run_before_hooks(hooks, self, task)
+        start_time = time.perf_counter()
+        try:
+            result = await self._call(task)
+        except BaseException as e:
+            run_after_hooks(hooks, states, self, task, None, e, (time.perf_counter() - start_time) * 1000)
+            raise
+        run_after_hooks(hooks, states, self, task, result, None, (time.perf_counter() - start_time) * 1000)
+        return result
+    
+    async def _call(self, task: Task) -> TaskResult:
+        """
+        Resolve a task with deadline handling and circuit breaking (the body of __call__).
         
         Args:
             task: The task to resolve.
@@ -197,12 +395,89 @@ class TaskResolver(Generic[T], abc.ABC):
         """
         self.logger.info(f"Resolving task: {task.name} (ID: {task.id})")
         
+        remaining = task.get_remaining_time()
+        if remaining is not None and remaining <= 0:
+            self.logger.warning(f"Skipping expired task: {task.name} (ID: {task.id})")
+            task.update_status(TaskStatus.CANCELLED)
+            return TaskResult(
+                task_id=task.id,
+                status=TaskStatus.CANCELLED,
+                message="Task expired before execution"
+            )
+        
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return await self._resolve_to_result(task, remaining)
+        
+        if not breaker.allow_request():
+            error_msg = f"Circuit breaker open for resolver {self.metadata.name}"
+            self.logger.warning(error_msg)
+            task.add_error("CircuitOpen", {"resolver": self.metadata.name})
+            return TaskResult(
+                task_id=task.id,
+                status=TaskStatus.ERROR,
+                message=error_msg,
+                error={"type": "CircuitOpen", "message": error_msg, "details": breaker.get_state()}
+            )
+        
+        start_time = time.perf_counter()
+        try:
+            result = await self._resolve_to_result(task, remaining)
+        except BaseException:
+            breaker.release()
+            raise
+        
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        if self.is_breaker_failure(result):
+            breaker.record_failure(latency_ms)
+        else:
+            breaker.record_success(latency_ms)
+        return result
+    
+    def is_breaker_failure(self, result: TaskResult) -> bool:
+        """
+        Decide whether a result counts as a failure of the resolver for its circuit breaker.
+        
+        Error results whose error_type is in breaker_failure_types count; by
+        default these are only unexpected exceptions (including timeouts
+        raised by the resolver itself). Error results caused by the caller,
+        such as invalid input, a TaskError or an exceeded task deadline, do
+        not; slow calls are counted by the breaker itself. Resolvers that turn
+        failures of their dependencies into error results add those error
+        types to breaker_failure_types.
+        
+        Args:
+            result: The result of the call.
+            
+        Returns:
+            True if the call should be recorded as a failure.
+        """
+        return (
+            result.status in (TaskStatus.ERROR, TaskStatus.FAILED)
+            and isinstance(result.error, dict)
+            and result.error.get("error_type") in self.breaker_failure_types
+        )
+    
+    async def _resolve_to_result(self, task: Task, remaining: Optional[float]) -> TaskResult:
+        """
+        Resolve a task and wrap the outcome, including errors, in a TaskResult.
+        
+        Args:
+            task: The task to resolve.
+            remaining: Seconds left before the task's deadline, or None.
+            
+        Returns:
+            The task result.
+        """
         # Update task status
         task.update_status(TaskStatus.IN_PROGRESS)
         
         try:
-            # Resolve the task
-            result = await self.resolve(task)
+            # Resolve the task, within the task's deadline if it has one
+            if remaining is None:
+                result = await self.resolve(task)
+            else:
+                result = await self._resolve_before_deadline(task, remaining)
             
             # If the result is already a TaskResult, return it
             if isinstance(result, TaskResult):
@@ -214,6 +489,18 @@ class TaskResolver(Generic[T], abc.ABC):
                 output_data=result,
                 status=TaskStatus.COMPLETED
             )
+        except _DeadlineExceeded:
+            error_msg = f"Task deadline exceeded after {remaining:.3f}s"
+            self.logger.error(error_msg)
+            task.update_status(TaskStatus.CANCELLED)
+            task.add_error("DeadlineExceeded", {"timeout_seconds": remaining})
+            
+            return TaskResult(
+                task_id=task.id,
+                status=TaskStatus.ERROR,
+                message=error_msg,
+                error={"type": "DeadlineExceeded", "message": error_msg, "details": {"timeout_seconds": remaining}}
+            )
         except TaskError as e:
             # Task errors are expected and include task information
             self.logger.error(f"Task error: {str(e)}")
@@ -223,28 +510,145 @@ class TaskResolver(Generic[T], abc.ABC):
             return TaskResult(
                 task_id=task.id,
                 status=TaskStatus.ERROR,
-                error=e
+                message=str(e),
+                error=e.to_dict()
             )
         except Exception as e:
-            # Unexpected errors need to be wrapped
-            error_msg = f"Unexpected error: {str(e)}"
-            self.logger.error(error_msg)
-            self.logger.error(traceback.format_exc())
+            return self._unexpected_error_result(task, e)
+    
+    async def _resolve_before_deadline(self, task: Task, remaining: float) -> Union[T, TaskResult]:
+        """
+        Resolve a task, cancelling the resolution when its deadline passes.
+        
+        Unlike asyncio.wait_for, a timeout raised by the resolver itself is
+        propagated as is and not mistaken for the deadline.
+        
+        Args:
+            task: The task to resolve.
+            remaining: Seconds left before the task's deadline.
             
-            task_error = TaskError(
-                task=task,
-                message=error_msg,
-                error_type="UnexpectedError",
-                details={"traceback": traceback.format_exc()}
-            )
-            task.update_status(TaskStatus.ERROR)
-            task.add_error("UnexpectedError", error_msg)
+        Returns:
+            The result of resolve.
             
-            return TaskResult(
-                task_id=task.id,
-                status=TaskStatus.ERROR,
-                error=task_error
-            )
+        Raises:
+            _DeadlineExceeded: If the deadline passed first.
+        """
+        resolution = asyncio.ensure_future(self.resolve(task))
+        try:
+            done, _ = await asyncio.wait((resolution,), timeout=remaining)
+        except asyncio.CancelledError:
+            resolution.cancel()
+            raise
+        
+        if not done:
+            resolution.cancel()
+            await asyncio.gather(resolution, return_exceptions=True)
+            raise _DeadlineExceeded()
+        return resolution.result()
+    
+    def _unexpected_error_result(self, task: Task, e: Exception) -> TaskResult:
+        """
+        Wrap an unexpected exception raised while resolving a task.
+        
+        Args:
+            task: The task being resolved.
+            e: The exception.
+            
+        Returns:
+            An error TaskResult.
+        """
+        error_msg = f"Unexpected error: {str(e)}"
+        self.logger.error(error_msg)
+        self.logger.error(traceback.format_exc())
+        
+        task_error = TaskError(
+            task=task,
+            message=error_msg,
+            error_type="UnexpectedError",
+            details={"traceback": traceback.format_exc()}
+        )
+        task.update_status(TaskStatus.ERROR)
+        task.add_error("UnexpectedError", error_msg)
+        
+        return TaskResult(
+            task_id=task.id,
+            status=TaskStatus.ERROR,
+            message=error_msg,
+            error=task_error.to_dict()
+        )
+    
+    async def resolve_many(
+        self,
+        tasks: Union[Iterable[Task], AsyncIterable[Task]],
+        max_concurrency: int = 10,
+        ordered: bool = False
+    ) -> AsyncIterator[TaskResult]:
+        """
+        Resolve many tasks with bounded concurrency.
+        
+        Tasks are pulled from the source only when a slot is free, so at most
+        max_concurrency tasks are in flight (or, in ordered mode, in flight or
+        waiting to be yielded) at any time. This applies backpressure to the
+        producer instead of materializing the whole batch.
+        
+        Args:
+            tasks: An iterable or async iterable of tasks.
+            max_concurrency: Maximum number of tasks resolved at the same time.
+            ordered: If True, results are yielded in input order; otherwise they
+                     are yielded as soon as they complete.
+            
+        Yields:
+            The TaskResult of each task.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        async_iterator: Optional[AsyncIterator[Task]] = None
+        sync_iterator = None
+        if isinstance(tasks, AsyncIterable):
+            async_iterator = tasks.__aiter__()
+        else:
+            sync_iterator = iter(tasks)
+        
+        pending: Dict[asyncio.Future, int] = {}
+        completed: Dict[int, TaskResult] = {}
+        next_index = 0
+        next_to_yield = 0
+        exhausted = False
+        
+        try:
+            while True:
+                # Fill free slots from the source
+                while not exhausted and len(pending) + len(completed) < max_concurrency:
+                    try:
+                        if async_iterator is not None:
+                            task = await async_iterator.__anext__()
+                        else:
+                            task = next(sync_iterator)
+                    except (StopIteration, StopAsyncIteration):
+                        exhausted = True
+                        break
+                    pending[asyncio.ensure_future(self(task))] = next_index
+                    next_index += 1
+                
+                if not pending:
+                    break
+                
+                done, _ = await asyncio.wait(pending.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    if ordered:
+                        completed[index] = future.result()
+                    else:
+                        yield future.result()
+                
+                # Release results that are next in input order
+                while next_to_yield in completed:
+                    yield completed.pop(next_to_yield)
+                    next_to_yield += 1
+        finally:
+            for future in pending:
+                future.cancel()
     
     def can_handle(self, task: Task) -> bool:
         """
@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Optional, Union
 from pydantic import BaseModel, Field, model_serializer, ConfigDict
 
 from boss.core.task_status import TaskStatus
-from boss.core.task_base import Task
+from boss.core.task_base import Task, _construct_model
 
 
 class TaskResult(BaseModel):
@@ -43,6 +43,44 @@ class TaskResult(BaseModel):
         }
         return result
     
+    @classmethod
+    def construct_trusted(
+        cls,
+        task_id: str,
+        status: TaskStatus = TaskStatus.COMPLETED,
+        output_data: Optional[Dict[str, Any]] = None,
+        message: Optional[str] = None,
+        error: Optional[Dict[str, Any]] = None,
+        execution_time_ms: Optional[float] = None
+    ) -> 'TaskResult':
+        """
+        Create a task result without validation, for internally created results.
+        
+        The output data is stored by reference. Callers must only pass already
+        valid values.
+        
+        Args:
+            task_id: The ID of the task.
+            status: The status of the result.
+            output_data: The output data.
+            message: An optional message about the result.
+            error: Optional error information.
+            execution_time_ms: The execution time in milliseconds.
+            
+        Returns:
+            TaskResult: A new TaskResult object.
+        """
+        return _construct_model(cls, {
+            "task_id": task_id,
+            "status": status,
+            "output_data": output_data if output_data is not None else {},
+            "execution_time_ms": execution_time_ms,
+            "created_at": datetime.now(),
+            "message": message,
+            "subtasks": [],
+            "error": error
+        })
+    
     @classmethod
     def success(cls, task: Task, output_data: Optional[Dict[str, Any]] = None, 
                 message: Optional[str] = None, execution_time_ms: Optional[float] = None) -> 'TaskResult':
@@ -6,6 +6,8 @@ This module provides functionality for handling task retries with different back
 import asyncio
 import math
 import random
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from enum import Enum, auto
 from typing import Any, Callable, Dict, Optional, TypeVar, Union, List
@@ -25,12 +27,157 @@ class BackoffStrategy(Enum):
     FIBONACCI = auto()     # Wait time follows Fibonacci sequence
     RANDOM = auto()        # Wait a random time between min and max
     JITTERED = auto()      # Exponential backoff with jitter
+    DECORRELATED_JITTER = auto()  # Random wait between base and 3x the previous wait
 
 
 # Type variable for the resolver function
 T = TypeVar('T')
 
 
+def decorrelated_jitter_delay(
+    base_delay: float,
+    max_delay: float,
+    previous_delay: Optional[float] = None
+) -> float:
+    """
+    Calculate a decorrelated jitter delay.
+    
+    Each delay is drawn uniformly between the base delay and three times the
+    previous delay, so that clients retrying after a shared failure spread out
+    instead of retrying in synchronized waves.
+    
+    Args:
+        base_delay: The minimum delay in seconds.
+        max_delay: The maximum delay in seconds.
+        previous_delay: The previous delay (the base delay if not provided).
+        
+    Returns:
+        float: The delay in seconds.
+    """
+    previous = previous_delay if previous_delay is not None else base_delay
+    return min(max_delay, random.uniform(base_delay, max(base_delay, previous * 3)))
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of successful calls.
+    
+    Every successful call deposits `ratio` tokens and every retry withdraws one,
+    so during an outage retries stop once the saved tokens are spent instead of
+    multiplying the load on the failing dependency. The bucket starts full and
+    holds at most `max_tokens`. The budget is thread-safe and meant to be shared
+    by every caller of the same dependency (see get_retry_budget).
+    """
+    
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10.0):
+        """
+        Initialize a new RetryBudget.
+        
+        Args:
+            ratio: Tokens deposited per successful call (the allowed retry/success ratio).
+            max_tokens: Maximum number of saved tokens (the largest allowed burst of retries).
+        """
+        if ratio < 0:
+            raise ValueError("ratio must be non-negative")
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+        self._stats = {"successes": 0, "retries_allowed": 0, "retries_rejected": 0}
+    
+    @property
+    def tokens(self) -> float:
+        """The number of tokens currently available."""
+        return self._tokens
+    
+    def record_success(self) -> None:
+        """Record a successful call, depositing tokens into the budget."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+            self._stats["successes"] += 1
+    
+    def try_acquire(self) -> bool:
+        """
+        Withdraw a token for a retry.
+        
+        Returns:
+            bool: True if the retry is allowed, False if the budget is exhausted.
+        """
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self._stats["retries_allowed"] += 1
+                return True
+            self._stats["retries_rejected"] += 1
+            return False
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the budget.
+        
+        Returns:
+            Dict[str, Any]: The available tokens and the success and retry counts.
+        """
+        with self._lock:
+            return {
+                "tokens": self._tokens,
+                "ratio": self.ratio,
+                "max_tokens": self.max_tokens,
+                **self._stats
+            }
+
+
+# Maximum number of dependencies whose shared retry budget is kept
+RETRY_BUDGET_CACHE_SIZE = 1024
+
+# Process-wide retry budgets, keyed by dependency name, least recently used first
+_retry_budgets: "OrderedDict[str, RetryBudget]" = OrderedDict()
+_retry_budgets_lock = threading.Lock()
+
+
+def get_retry_budget(
+    dependency: str = "default",
+    ratio: float = 0.1,
+    max_tokens: float = 10.0
+) -> RetryBudget:
+    """
+    Get the shared retry budget of a dependency, creating it if needed.
+    
+    All callers of the same dependency share one budget, so the total number of
+    retries against it is bounded no matter how many tasks are failing. Only
+    the RETRY_BUDGET_CACHE_SIZE most recently used budgets are kept; holders of
+    an evicted budget keep using it, and later callers get a new one.
+    
+    Args:
+        dependency: Name of the dependency (e.g. a provider or host name).
+        ratio: Tokens per success, used only when the budget is created.
+        max_tokens: Maximum saved tokens, used only when the budget is created.
+        
+    Returns:
+        RetryBudget: The shared budget.
+    """
+    with _retry_budgets_lock:
+        budget = _retry_budgets.get(dependency)
+        if budget is not None:
+            _retry_budgets.move_to_end(dependency)
+            return budget
+        
+        budget = RetryBudget(ratio=ratio, max_tokens=max_tokens)
+        _retry_budgets[dependency] = budget
+        if len(_retry_budgets) > RETRY_BUDGET_CACHE_SIZE:
+            _retry_budgets.popitem(last=False)
+        return budget
+
+
+def reset_retry_budgets() -> None:
+    """Discard all shared retry budgets."""
+    with _retry_budgets_lock:
+        _retry_budgets.clear()
+
+
 class TaskRetryManager:
     """
     Manages retries for tasks with configurable backoff strategies.
@@ -41,7 +188,8 @@ class TaskRetryManager:
         strategy: BackoffStrategy = BackoffStrategy.EXPONENTIAL,
         base_delay_seconds: float = 1.0,
         max_delay_seconds: float = 60.0,
-        jitter_factor: float = 0.1
+        jitter_factor: float = 0.1,
+        retry_budget: Optional[RetryBudget] = None
     ):
         """
         Initialize a new TaskRetryManager.
@@ -52,22 +200,25 @@ class TaskRetryManager:
             base_delay_seconds: Base delay between retries in seconds.
             max_delay_seconds: Maximum delay between retries in seconds.
             jitter_factor: Random jitter factor (0-1) to add to calculated delay.
+            retry_budget: Optional shared budget limiting retries across tasks.
         """
         self.max_retries = max_retries
         self.strategy = strategy
         self.base_delay = base_delay_seconds
         self.max_delay = max_delay_seconds
         self.jitter_factor = jitter_factor
+        self.retry_budget = retry_budget
         
         # Fibonacci sequence cache
         self.fibonacci_cache = {0: 0, 1: 1}
     
-    def _calculate_delay(self, attempt: int) -> float:
+    def _calculate_delay(self, attempt: int, previous_delay: Optional[float] = None) -> float:
         """
         Calculate the delay for a given retry attempt based on the strategy.
         
         Args:
             attempt: The current retry attempt (0-indexed).
+            previous_delay: The previous delay, used by DECORRELATED_JITTER.
             
         Returns:
             float: The delay in seconds.
@@ -97,6 +248,9 @@ class TaskRetryManager:
             jitter = random.uniform(-self.jitter_factor, self.jitter_factor) * temp_delay
             delay = temp_delay + jitter
         
+        elif self.strategy == BackoffStrategy.DECORRELATED_JITTER:
+            delay = decorrelated_jitter_delay(self.base_delay, self.max_delay, previous_delay)
+        
         else:
             # Default to exponential
             delay = self.base_delay * (2 ** (attempt - 1))
@@ -158,21 +312,29 @@ class TaskRetryManager:
         self,
         task: Task,
         resolver_func: Callable[[Task], T],
-        error_handler: Optional[Callable[[Task, Exception, int], None]] = None
+        error_handler: Optional[Callable[[Task, Exception, int], None]] = None,
+        retry_budget: Optional[RetryBudget] = None
     ) -> Union[T, TaskResult]:
         """
         Execute a resolver function with automatic retries.
         
+        If a retry budget is used, successes are recorded in it and every retry
+        must acquire a token from it; retrying stops once it is exhausted.
+        
         Args:
             task: The task to execute.
             resolver_func: The function to execute the task.
             error_handler: Optional function to call on each error.
+            retry_budget: Budget to use instead of the manager's retry_budget.
             
         Returns:
             Union[T, TaskResult]: The result of the resolver function or a failure TaskResult.
         """
+        budget = retry_budget or self.retry_budget
         attempt = 0
         last_exception = None
+        delay = None
+        budget_exhausted = False
         
         while attempt <= self.max_retries:
             try:
@@ -186,7 +348,10 @@ class TaskRetryManager:
                         task.update_status(TaskStatus.RETRYING)
                 
                 # Execute the resolver function
-                return await resolver_func(task)
+                result = await resolver_func(task)
+                if budget is not None:
+                    budget.record_success()
+                return result
                 
             except Exception as e:
                 last_exception = e
@@ -200,7 +365,17 @@ class TaskRetryManager:
                     break
                 
                 # Calculate delay for next retry
-                delay = self._calculate_delay(attempt + 1)
+                delay = self._calculate_delay(attempt + 1, delay)
+                
+                # Don't retry if the task's deadline passes before the next attempt
+                remaining = task.get_remaining_time()
+                if remaining is not None and remaining <= delay:
+                    break
+                
+                # Don't retry if the shared retry budget is spent
+                if budget is not None and not budget.try_acquire():
+                    budget_exhausted = True
+                    break
                 
                 # Wait before retrying
                 await asyncio.sleep(delay)
@@ -209,7 +384,10 @@ class TaskRetryManager:
         
         # If we get here, all retries failed
         # Add the error to the task
-        error_message = f"Failed after {attempt} attempts: {str(last_exception)}"
+        if budget_exhausted:
+            error_message = f"Retry budget exhausted after {attempt + 1} attempts: {str(last_exception)}"
+        else:
+            error_message = f"Failed after {attempt} attempts: {str(last_exception)}"
         task.add_error("max_retries_exceeded", error_message)
         task.update_status(TaskStatus.FAILED)
         
@@ -217,5 +395,9 @@ class TaskRetryManager:
         return TaskResult.failure(
             task=task,
             error_message=error_message,
-            error_details={"max_retries": self.max_retries, "attempts": attempt}
-        ) 
\ No newline at end of file
+            error_details={
+                "max_retries": self.max_retries,
+                "attempts": attempt,
+                "retry_budget_exhausted": budget_exhausted
+            }
+        )
@@ -0,0 +1,519 @@
+"""
+Lightweight span tracing for the BOSS system.
+
+This module provides a Tracer that records timed spans with parent/child
+relationships and attributes, sampling decisions made once per trace, and
+pluggable exporters that write finished spans to memory, to a JSON lines
+file, or to a file of OTLP-compatible JSON documents.
+"""
+import abc
+import json
+import logging
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+
+# Span status codes (matching the OTLP status codes)
+STATUS_UNSET = "unset"
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+
+_OTLP_STATUS_CODES = {STATUS_UNSET: 0, STATUS_OK: 1, STATUS_ERROR: 2}
+_OTLP_SPAN_KIND_INTERNAL = 1
+
+_current_span: ContextVar[Optional['Span']] = ContextVar("boss_current_span", default=None)
+
+
+def _new_id(bits: int) -> str:
+    """Generate a random lowercase hex ID with the given number of bits."""
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+def payload_size(data: Any) -> int:
+    """
+    Get the approximate serialized size of a payload.
+    
+    Args:
+        data: The payload, typically a task's input or output data
+        
+    Returns:
+        Length in bytes of the payload's JSON encoding
+    """
+    try:
+        return len(json.dumps(data, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return len(str(data).encode("utf-8"))
+
+
+class Span:
+    """
+    A timed operation within a trace.
+    
+    Spans that were not sampled are still created, so that their children
+    share the sampling decision, but they ignore attributes and are never
+    exported.
+    """
+    
+    __slots__ = (
+        "tracer", "name", "trace_id", "span_id", "parent_id", "sampled",
+        "start_time_ns", "end_time_ns", "attributes", "status", "status_message"
+    )
+    
+    def __init__(
+        self,
+        tracer: 'Tracer',
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        sampled: bool,
+        attributes: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Initialize a Span.
+        
+        Args:
+            tracer: The tracer that exports the span when it ends
+            name: Name of the operation
+            trace_id: ID of the trace the span belongs to
+            parent_id: ID of the parent span, or None for a root span
+            sampled: Whether the span is recorded and exported
+            attributes: Initial attributes of the span
+        """
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = _new_id(64)
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = dict(attributes) if sampled and attributes else {}
+        self.status = STATUS_UNSET
+        self.status_message: Optional[str] = None
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute of the span."""
+        if self.sampled:
+            self.attributes[key] = value
+    
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        """Set several attributes of the span."""
+        if self.sampled:
+            self.attributes.update(attributes)
+    
+    def set_status(self, status: str, message: Optional[str] = None) -> None:
+        """
+        Set the status of the span.
+        
+        Args:
+            status: One of STATUS_UNSET, STATUS_OK or STATUS_ERROR
+            message: Optional description, typically of an error
+        """
+        self.status = status
+        self.status_message = message
+    
+    def end(self) -> None:
+        """End the span and hand it to the tracer's exporters (once)."""
+        if self.end_time_ns is not None:
+            return
+        self.end_time_ns = time.time_ns()
+        if self.sampled:
+            self.tracer._export(self)
+    
+    @property
+    def duration_ms(self) -> Optional[float]:
+        """Duration of the span in milliseconds, or None while it is running."""
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1e6
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the span to a dictionary.
+        
+        Returns:
+            Dictionary representation of the span
+        """
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time_ns": self.start_time_ns,
+            "end_time_ns": self.end_time_ns,
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "status_message": self.status_message,
+            "attributes": self.attributes
+        }
+
+
+class SpanExporter(abc.ABC):
+    """
+    Base class for destinations of finished spans.
+    
+    Subclasses implement export(); force_flush() and shutdown() are only
+    needed by exporters that buffer spans.
+    """
+    
+    @abc.abstractmethod
+    def export(self, spans: List[Span]) -> None:
+        """
+        Export finished spans.
+        
+        Args:
+            spans: The spans to export
+        """
+        pass
+    
+    def force_flush(self) -> None:
+        """Write out any buffered spans."""
+    
+    def shutdown(self) -> None:
+        """Flush buffered spans and release resources."""
+        self.force_flush()
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Exporter keeping the most recent spans in a ring buffer."""
+    
+    def __init__(self, max_spans: int = 10000) -> None:
+        """
+        Initialize the InMemorySpanExporter.
+        
+        Args:
+            max_spans: Maximum number of spans kept; the oldest are dropped first
+        """
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+    
+    def export(self, spans: List[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+    
+    def get_spans(self, trace_id: Optional[str] = None, name: Optional[str] = None) -> List[Span]:
+        """
+        Get the kept spans, in the order they ended.
+        
+        Args:
+            trace_id: Optional trace ID to filter by
+            name: Optional span name to filter by
+            
+        Returns:
+            The matching spans
+        """
+        with self._lock:
+            spans = list(self._spans)
+        return [
+            span for span in spans
+            if (trace_id is None or span.trace_id == trace_id)
+            and (name is None or span.name == name)
+        ]
+    
+    def clear(self) -> None:
+        """Drop all kept spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+class JsonlFileSpanExporter(SpanExporter):
+    """Exporter appending one JSON object per span to a file."""
+    
+    def __init__(self, path: str, flush_every: int = 100) -> None:
+        """
+        Initialize the JsonlFileSpanExporter.
+        
+        Args:
+            path: Path of the file to append to
+            flush_every: Number of spans written between flushes
+        """
+        self.path = path
+        self.flush_every = flush_every
+        self._file = open(path, "a", encoding="utf-8")
+        self._unflushed = 0
+        self._lock = threading.Lock()
+    
+    def export(self, spans: List[Span]) -> None:
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(lines)
+            self._unflushed += len(spans)
+            if self._unflushed >= self.flush_every:
+                self._flush_locked()
+    
+    def force_flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+    
+    def _flush_locked(self) -> None:
+        """Flush the file (caller holds the lock)."""
+        if not self._file.closed:
+            self._file.flush()
+        self._unflushed = 0
+    
+    def shutdown(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._file.close()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Encode an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # 64-bit integers are encoded as strings in OTLP/JSON
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(v) for v in value]}}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans: List[Span], service_name: str = "boss") -> Dict[str, Any]:
+    """
+    Encode spans as an OTLP/JSON trace export request.
+    
+    The result can be posted to an OTLP/HTTP collector endpoint
+    (/v1/traces) or written out for a collector's file receiver.
+    
+    Args:
+        spans: The spans to encode
+        service_name: Value of the service.name resource attribute
+        
+    Returns:
+        The ExportTraceServiceRequest as a JSON-compatible dictionary
+    """
+    encoded = []
+    for span in spans:
+        otlp_span: Dict[str, Any] = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": _OTLP_SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(span.start_time_ns),
+            "endTimeUnixNano": str(span.end_time_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in span.attributes.items()],
+            "status": {"code": _OTLP_STATUS_CODES.get(span.status, 0)}
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+        if span.status_message:
+            otlp_span["status"]["message"] = span.status_message
+        encoded.append(otlp_span)
+    
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+            "scopeSpans": [{"scope": {"name": "boss.core.tracing"}, "spans": encoded}]
+        }]
+    }
+
+
+class OTLPJsonSpanExporter(SpanExporter):
+    """
+    Exporter writing batches of spans as OTLP/JSON export requests.
+    
+    Spans are buffered and written as one ExportTraceServiceRequest per line,
+    the format read by the OpenTelemetry collector's file receiver. Pass a
+    callable instead of a path to send the requests elsewhere (for example
+    to post them to a collector).
+    """
+    
+    def __init__(
+        self,
+        destination: Any,
+        service_name: str = "boss",
+        batch_size: int = 512
+    ) -> None:
+        """
+        Initialize the OTLPJsonSpanExporter.
+        
+        Args:
+            destination: Path of the file to append to, or a callable receiving
+                         each export request as a dictionary
+            service_name: Value of the service.name resource attribute
+            batch_size: Number of spans per export request
+        """
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.logger = logging.getLogger(__name__)
+        if callable(destination):
+            self._send: Callable[[Dict[str, Any]], None] = destination
+            self._file = None
+        else:
+            self._file = open(destination, "a", encoding="utf-8")
+            self._send = self._write
+        self._buffer: List[Span] = []
+        self._lock = threading.Lock()
+    
+    def export(self, spans: List[Span]) -> None:
+        with self._lock:
+            self._buffer.extend(spans)
+            if len(self._buffer) >= self.batch_size:
+                self._flush_locked()
+    
+    def force_flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+    
+    def _flush_locked(self) -> None:
+        """Send the buffered spans (caller holds the lock)."""
+        while self._buffer:
+            batch = self._buffer[:self.batch_size]
+            del self._buffer[:self.batch_size]
+            try:
+                self._send(to_otlp(batch, self.service_name))
+            except Exception as e:
+                self.logger.error(f"Failed to export {len(batch)} spans: {str(e)}")
+    
+    def _write(self, request: Dict[str, Any]) -> None:
+        """Append an export request to the file."""
+        if self._file is not None and not self._file.closed:
+            self._file.write(json.dumps(request) + "\n")
+            self._file.flush()
+    
+    def shutdown(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            if self._file is not None:
+                self._file.close()
+
+
+class Tracer:
+    """
+    Creates spans and hands finished, sampled spans to exporters.
+    
+    The current span is tracked in a context variable, so spans started
+    while another span is active become its children, including across
+    asyncio tasks created inside it. Sampling is decided once per trace, when
+    its root span starts: a trace is kept with probability sample_rate, or as
+    decided by a custom sampler, and all its spans share the decision.
+    """
+    
+    def __init__(
+        self,
+        exporters: Optional[List[SpanExporter]] = None,
+        sample_rate: float = 1.0,
+        sampler: Optional[Callable[[str, Dict[str, Any]], bool]] = None,
+        enabled: bool = True
+    ) -> None:
+        """
+        Initialize the Tracer.
+        
+        Args:
+            exporters: Destinations of finished spans
+            sample_rate: Fraction of traces to record, between 0.0 and 1.0
+            sampler: Optional function of a root span's name and attributes
+                     deciding whether its trace is recorded; overrides sample_rate
+            enabled: Whether spans are created at all
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0.0 and 1.0")
+        
+        self.exporters = list(exporters or [])
+        self.sample_rate = sample_rate
+        self.sampler = sampler
+        self.enabled = enabled
+        self.logger = logging.getLogger(__name__)
+        self.stats: Dict[str, int] = {"started": 0, "sampled_traces": 0, "dropped_traces": 0, "exported": 0}
+    
+    def add_exporter(self, exporter: SpanExporter) -> None:
+        """Add a destination for finished spans."""
+        self.exporters.append(exporter)
+    
+    def _should_sample(self, name: str, attributes: Optional[Dict[str, Any]]) -> bool:
+        """Decide whether a new trace is recorded."""
+        if self.sampler is not None:
+            return bool(self.sampler(name, attributes or {}))
+        if self.sample_rate >= 1.0:
+            return True
+        return random.random() < self.sample_rate
+    
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Span:
+        """
+        Start a span as a child of the current span (or as a new trace).
+        
+        The span does not become the current span; use span() for that.
+        
+        Args:
+            name: Name of the operation
+            attributes: Initial attributes of the span
+            
+        Returns:
+            The started span, which the caller must end()
+        """
+        parent = _current_span.get()
+        self.stats["started"] += 1
+        if parent is None:
+            sampled = self._should_sample(name, attributes)
+            self.stats["sampled_traces" if sampled else "dropped_traces"] += 1
+            return Span(self, name, _new_id(128), None, sampled, attributes)
+        return Span(self, name, parent.trace_id, parent.span_id, parent.sampled, attributes)
+    
+    @contextmanager
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Optional[Span]]:
+        """
+        Run a block inside a new span, which is the current span for the block.
+        
+        An exception leaving the block sets the span's status to error. The
+        block receives None when the tracer is disabled.
+        
+        Args:
+            name: Name of the operation
+            attributes: Initial attributes of the span
+            
+        Yields:
+            The active span, or None
+        """
+        if not self.enabled:
+            yield None
+            return
+        
+        span = self.start_span(name, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_status(STATUS_ERROR, f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+    
+    def _export(self, span: Span) -> None:
+        """Hand a finished span to every exporter."""
+        self.stats["exported"] += 1
+        for exporter in self.exporters:
+            try:
+                exporter.export([span])
+            except Exception as e:
+                self.logger.error(f"Span exporter {type(exporter).__name__} failed: {str(e)}")
+    
+    def force_flush(self) -> None:
+        """Write out spans buffered by the exporters."""
+        for exporter in self.exporters:
+            exporter.force_flush()
+    
+    def shutdown(self) -> None:
+        """Flush and close every exporter."""
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+
+def get_current_span() -> Optional[Span]:
+    """
+    Get the span active in the current context.
+    
+    Returns:
+        The current span, or None outside of any span
+    """
+    return _current_span.get()
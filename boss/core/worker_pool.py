@@ -0,0 +1,256 @@
+"""
+Worker pool runtime for the BOSS system.
+
+This module provides WorkerPool, which leases tasks from a TaskQueue,
+dispatches them to resolvers found through a TaskResolverRegistry, and
+records their results in the queue.
+"""
+
+import asyncio
+import logging
+import uuid
+from typing import Any, Dict, Optional, Set
+
+from boss.core.task_result import TaskResult
+from boss.core.task_status import TaskStatus
+from boss.core.task_resolver import TaskResolver
+from boss.core.registry import TaskResolverRegistry
+from boss.core.task_queue import QueuedTask, TaskQueue
+
+
+class WorkerPool:
+    """
+    Pool of asyncio workers processing tasks from a TaskQueue.
+    
+    At most `concurrency` tasks run at once, and at most
+    `resolver_concurrency[name]` tasks per resolver. Tasks enqueued for a
+    resolver that is at its limit are left in the queue for later; tasks
+    routed to it through the registry wait for a free slot. Leases of
+    running tasks are extended periodically, so only tasks held by a crashed
+    or stopped process are delivered again.
+    
+    Task results with status COMPLETED are recorded as completed; other results
+    and exceptions are recorded as failed attempts, which the queue retries
+    until the task's attempts are exhausted. Tasks that cannot succeed on a
+    retry (no resolver found, cancelled or expired) are marked as failed at once.
+    """
+    
+    def __init__(
+        self,
+        queue: TaskQueue,
+        registry: TaskResolverRegistry,
+        concurrency: int = 10,
+        resolver_concurrency: Optional[Dict[str, int]] = None,
+        poll_interval: float = 0.1,
+        worker_id: Optional[str] = None
+    ) -> None:
+        """
+        Initialize the WorkerPool.
+        
+        Args:
+            queue: The queue to take tasks from
+            registry: The registry used to find resolvers for tasks
+            concurrency: Maximum number of tasks processed at once
+            resolver_concurrency: Maximum number of concurrent tasks per resolver name
+            poll_interval: Seconds to wait before polling an empty queue again
+            worker_id: Identifier of this pool, used in logs
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        
+        self.queue = queue
+        self.registry = registry
+        self.concurrency = concurrency
+        self.resolver_concurrency = dict(resolver_concurrency or {})
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or str(uuid.uuid4())
+        self.logger = logging.getLogger(f"{__name__}.{self.worker_id}")
+        
+        self._in_flight: Dict[str, QueuedTask] = {}
+        self._running: Set[asyncio.Task] = set()
+        self._resolver_active: Dict[str, int] = {}
+        self._resolver_slots: Dict[str, asyncio.Semaphore] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+        self._runner: Optional[asyncio.Task] = None
+        self.stats: Dict[str, int] = {"completed": 0, "failed": 0, "lost": 0}
+    
+    @property
+    def is_running(self) -> bool:
+        """Whether the pool is processing tasks."""
+        return self._runner is not None and not self._runner.done()
+    
+    def start(self) -> None:
+        """Start processing tasks in the background (must be called from a running event loop)."""
+        if self.is_running:
+            return
+        self._stopping = False
+        self._runner = asyncio.ensure_future(self._run(stop_when_empty=False))
+    
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stop processing tasks.
+        
+        Args:
+            drain: Whether to let running tasks finish; otherwise they are
+                   cancelled and returned to the queue
+        """
+        self._stopping = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+        
+        if not drain:
+            for running in list(self._running):
+                running.cancel()
+        if self._runner is not None:
+            await asyncio.gather(self._runner, return_exceptions=True)
+            self._runner = None
+    
+    async def run_until_empty(self) -> None:
+        """Process tasks until no task is available or running."""
+        self._stopping = False
+        await self._run(stop_when_empty=True)
+    
+    async def _run(self, stop_when_empty: bool) -> None:
+        """
+        Lease and dispatch tasks until stopped.
+        
+        Args:
+            stop_when_empty: Whether to return once the queue has no available tasks
+        """
+        self._wakeup = asyncio.Event()
+        heartbeat = asyncio.ensure_future(self._extend_leases())
+        try:
+            while not self._stopping:
+                free = self.concurrency - len(self._running)
+                leased = []
+                if free > 0:
+                    saturated = [
+                        name for name, limit in self.resolver_concurrency.items()
+                        if self._resolver_active.get(name, 0) >= limit
+                    ]
+                    leased = await asyncio.to_thread(self.queue.lease, free, None, saturated)
+                
+                for queued in leased:
+                    self._dispatch(queued)
+                
+                if not leased:
+                    if stop_when_empty and not self._running:
+                        break
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+            
+            if self._running:
+                await asyncio.gather(*self._running, return_exceptions=True)
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+    
+    def _dispatch(self, queued: QueuedTask) -> None:
+        """Start processing a leased task."""
+        resolver = self._find_resolver(queued)
+        if resolver is not None:
+            name = resolver.metadata.name
+            self._resolver_active[name] = self._resolver_active.get(name, 0) + 1
+        
+        self._in_flight[queued.task.id] = queued
+        running = asyncio.ensure_future(self._process(queued, resolver))
+        self._running.add(running)
+        running.add_done_callback(self._on_done)
+    
+    def _on_done(self, running: asyncio.Task) -> None:
+        """Forget a finished task and wake up the lease loop."""
+        self._running.discard(running)
+        if self._wakeup is not None:
+            self._wakeup.set()
+    
+    async def _process(self, queued: QueuedTask, resolver: Optional[TaskResolver]) -> None:
+        """
+        Resolve a leased task and record the outcome in the queue.
+        
+        Args:
+            queued: The leased task
+            resolver: The resolver for the task, or None if none was found
+        """
+        task = queued.task
+        name = resolver.metadata.name if resolver is not None else None
+        
+        try:
+            if resolver is None:
+                result = TaskResult(
+                    task_id=task.id,
+                    status=TaskStatus.ERROR,
+                    message=f"No resolver found for task: {task.name}"
+                )
+            elif name in self.resolver_concurrency:
+                slots = self._resolver_slots.get(name)
+                if slots is None:
+                    slots = asyncio.Semaphore(self.resolver_concurrency[name])
+                    self._resolver_slots[name] = slots
+                async with slots:
+                    result = await resolver(task)
+            else:
+                result = await resolver(task)
+            
+            if result.status == TaskStatus.COMPLETED:
+                recorded = await asyncio.to_thread(self.queue.complete, queued, result)
+                self.stats["completed" if recorded else "lost"] += 1
+            else:
+                # Tasks without a resolver, cancelled or expired tasks fail for good
+                retry = resolver is not None and result.status != TaskStatus.CANCELLED and not task.is_expired()
+                recorded = await asyncio.to_thread(self.queue.fail, queued, result, retry)
+                self.stats["failed" if recorded else "lost"] += 1
+        except asyncio.CancelledError:
+            await asyncio.shield(asyncio.to_thread(self.queue.release, queued))
+            raise
+        except Exception as e:
+            self.logger.error(f"Error processing task {task.id}: {str(e)}")
+            result = TaskResult(task_id=task.id, status=TaskStatus.ERROR, message=str(e))
+            recorded = await asyncio.to_thread(self.queue.fail, queued, result)
+            self.stats["failed" if recorded else "lost"] += 1
+        finally:
+            self._in_flight.pop(task.id, None)
+            if name is not None:
+                self._resolver_active[name] -= 1
+    
+    def _find_resolver(self, queued: QueuedTask) -> Optional[TaskResolver]:
+        """
+        Find the resolver for a leased task.
+        
+        Args:
+            queued: The leased task
+            
+        Returns:
+            The resolver named when the task was enqueued, or one found through
+            the registry, or None
+        """
+        if queued.resolver_name:
+            return self.registry.get_resolver(queued.resolver_name)
+        return self.registry.find_resolver_for_task(queued.task)
+    
+    async def _extend_leases(self) -> None:
+        """Periodically extend the leases of running tasks."""
+        interval = max(self.queue.visibility_timeout / 3, 0.01)
+        while True:
+            await asyncio.sleep(interval)
+            for queued in list(self._in_flight.values()):
+                if not await asyncio.to_thread(self.queue.extend_lease, queued):
+                    self.logger.warning(f"Lease lost for running task {queued.task.id}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the pool.
+        
+        Returns:
+            Dictionary with the number of running tasks, per-resolver activity,
+            and counts of completed, failed and lost tasks
+        """
+        return {
+            "worker_id": self.worker_id,
+            "running": len(self._running),
+            "resolver_active": {name: count for name, count in self._resolver_active.items() if count},
+            **self.stats
+        }
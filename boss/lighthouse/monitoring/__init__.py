@@ -2,13 +2,29 @@
 
 This package contains specialized components for system monitoring, health checking,
 performance tracking, and alert management.
+
+Components are imported lazily (PEP 562), on first attribute access, so that
+using one of them does not require the dependencies of the others (e.g. the
+charting libraries used by the DashboardGenerator).
 """
+from typing import TYPE_CHECKING
+
+from boss.utils.lazy_imports import lazy_attributes
+
+if TYPE_CHECKING:
+    from boss.lighthouse.monitoring.system_metrics_collector import SystemMetricsCollector
+    from boss.lighthouse.monitoring.component_health_checker import ComponentHealthChecker
+    from boss.lighthouse.monitoring.performance_metrics_tracker import PerformanceMetricsTracker
+    from boss.lighthouse.monitoring.alert_manager import AlertManager
+    from boss.lighthouse.monitoring.dashboard_generator import DashboardGenerator
 
-from boss.lighthouse.monitoring.system_metrics_collector import SystemMetricsCollector
-from boss.lighthouse.monitoring.component_health_checker import ComponentHealthChecker
-from boss.lighthouse.monitoring.performance_metrics_tracker import PerformanceMetricsTracker
-from boss.lighthouse.monitoring.alert_manager import AlertManager
-from boss.lighthouse.monitoring.dashboard_generator import DashboardGenerator
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "SystemMetricsCollector": "boss.lighthouse.monitoring.system_metrics_collector",
+    "ComponentHealthChecker": "boss.lighthouse.monitoring.component_health_checker",
+    "PerformanceMetricsTracker": "boss.lighthouse.monitoring.performance_metrics_tracker",
+    "AlertManager": "boss.lighthouse.monitoring.alert_manager",
+    "DashboardGenerator": "boss.lighthouse.monitoring.dashboard_generator",
+})
 
 __all__ = [
     "SystemMetricsCollector",
@@ -16,4 +32,4 @@ __all__ = [
     "PerformanceMetricsTracker",
     "AlertManager",
     "DashboardGenerator"
-] 
\ No newline at end of file
+]
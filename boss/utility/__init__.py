@@ -0,0 +1,66 @@
+"""
+Utility components of the BOSS system.
+
+This package contains general-purpose task resolvers (data mapping, logic,
+validation, caching, file and database operations, worklists, ...) used as
+building blocks for masteries.
+
+Exports are imported lazily (PEP 562), on first attribute access, so that
+using one resolver does not import the dependencies of all the others.
+Submodules can still be imported directly.
+"""
+from typing import TYPE_CHECKING
+
+from boss.utils.lazy_imports import lazy_attributes
+
+if TYPE_CHECKING:
+    from boss.utility.api_wrapper_resolver import APIWrapperResolver
+    from boss.utility.boss_replication_resolver import BOSSReplicationResolver
+    from boss.utility.cache_resolver import CacheResolver, CacheBackend, CacheInvalidationStrategy
+    from boss.utility.context_provider_resolver import ContextProviderResolver
+    from boss.utility.data_mapper_resolver import DataMapperResolver
+    from boss.utility.database_task_resolver import DatabaseTaskResolver, DatabaseOperation
+    from boss.utility.error_storage_resolver import ErrorStorageResolver
+    from boss.utility.file_operations_resolver import FileOperationsResolver, FileOperation, FileFormat
+    from boss.utility.historical_data_resolver import HistoricalDataResolver, HistoryOperation
+    from boss.utility.language_resolver import LanguageTaskResolver, LanguageOperation
+    from boss.utility.logic_resolver import LogicResolver
+    from boss.utility.organization_setup_resolver import OrganizationSetupResolver
+    from boss.utility.organization_values_resolver import OrganizationValuesResolver, ValueOperation
+    from boss.utility.retry_resolver import RetryResolver, RetryCondition
+    from boss.utility.task_dependency_graph import TaskDependencyGraph
+    from boss.utility.task_prioritization_resolver import TaskPrioritizationResolver, PriorityFactor
+    from boss.utility.validation_resolver import ValidationResolver, ValidationFormat
+    from boss.utility.worklist_journal import WorklistJournal
+    from boss.utility.worklist_manager_resolver import WorklistManagerResolver, WorklistOperation, WorkItemStatus
+
+# Names exported by each submodule, imported on first access. The retry
+# resolver's BackoffStrategy is not exported, as it would shadow
+# boss.core.BackoffStrategy in star imports.
+_SUBMODULE_EXPORTS = {
+    "boss.utility.api_wrapper_resolver": ["APIWrapperResolver"],
+    "boss.utility.boss_replication_resolver": ["BOSSReplicationResolver"],
+    "boss.utility.cache_resolver": ["CacheResolver", "CacheBackend", "CacheInvalidationStrategy"],
+    "boss.utility.context_provider_resolver": ["ContextProviderResolver"],
+    "boss.utility.data_mapper_resolver": ["DataMapperResolver"],
+    "boss.utility.database_task_resolver": ["DatabaseTaskResolver", "DatabaseOperation"],
+    "boss.utility.error_storage_resolver": ["ErrorStorageResolver"],
+    "boss.utility.file_operations_resolver": ["FileOperationsResolver", "FileOperation", "FileFormat"],
+    "boss.utility.historical_data_resolver": ["HistoricalDataResolver", "HistoryOperation"],
+    "boss.utility.language_resolver": ["LanguageTaskResolver", "LanguageOperation"],
+    "boss.utility.logic_resolver": ["LogicResolver"],
+    "boss.utility.organization_setup_resolver": ["OrganizationSetupResolver"],
+    "boss.utility.organization_values_resolver": ["OrganizationValuesResolver", "ValueOperation"],
+    "boss.utility.retry_resolver": ["RetryResolver", "RetryCondition"],
+    "boss.utility.task_dependency_graph": ["TaskDependencyGraph"],
+    "boss.utility.task_prioritization_resolver": ["TaskPrioritizationResolver", "PriorityFactor"],
+    "boss.utility.validation_resolver": ["ValidationResolver", "ValidationFormat"],
+    "boss.utility.worklist_journal": ["WorklistJournal"],
+    "boss.utility.worklist_manager_resolver": ["WorklistManagerResolver", "WorklistOperation", "WorkItemStatus"],
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+})
+
+__all__ = [name for names in _SUBMODULE_EXPORTS.values() for name in names]
@@ -10,6 +10,7 @@ import json
 import time
 import asyncio
 import traceback
+from urllib.parse import urlparse
 from typing import Any, Dict, List, Optional, Union, Callable, Type, Mapping, cast
 
 # Import requests conditionally to handle environments where it's not installed
@@ -24,7 +25,7 @@ import hashlib
 
 from boss.core.task_models import Task, TaskResult, TaskStatus, TaskError
 from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
-from boss.core.task_retry import TaskRetryManager
+from boss.core.task_retry import RetryBudget, TaskRetryManager, get_retry_budget
 
 
 class APIWrapperResolver(TaskResolver):
@@ -37,8 +38,15 @@ class APIWrapperResolver(TaskResolver):
     - Process responses in multiple formats (JSON, XML, text)
     - Support for rate limiting and retry logic
     - Request/response caching
+    
+    Failed requests (connection errors, timeouts and HTTP errors, after any
+    retries) are reported as APIRequestError results and count as failures
+    for the resolver's circuit breaker.
     """
     
+    # Failed requests count as failures of the API for the circuit breaker
+    breaker_failure_types = frozenset({"UnexpectedError", "APIRequestError"})
+    
     def __init__(
         self,
         metadata: TaskResolverMetadata,
@@ -50,7 +58,8 @@ class APIWrapperResolver(TaskResolver):
         max_rate_limit: Optional[int] = None,
         cache_enabled: bool = False,
         cache_ttl: int = 300,  # 5 minutes in seconds
-        retry_manager: Optional[TaskRetryManager] = None
+        retry_manager: Optional[TaskRetryManager] = None,
+        retry_budget: Optional[RetryBudget] = None
     ) -> None:
         """
         Initialize the APIWrapperResolver.
@@ -66,6 +75,8 @@ class APIWrapperResolver(TaskResolver):
             cache_enabled: Whether to cache API responses
             cache_ttl: Cache time-to-live in seconds
             retry_manager: Optional TaskRetryManager for handling retries
+            retry_budget: Retry budget for the API (defaults to the shared budget
+                of the base URL's host when a retry manager is given)
         """
         super().__init__(metadata)
         self.base_url = base_url
@@ -77,6 +88,10 @@ class APIWrapperResolver(TaskResolver):
         self.cache_enabled = cache_enabled
         self.cache_ttl = cache_ttl
         self.retry_manager = retry_manager
+        self.retry_budget = retry_budget
+        if retry_budget is None and retry_manager is not None:
+            dependency = urlparse(base_url).netloc if base_url else ""
+            self.retry_budget = get_retry_budget(dependency or metadata.name)
         
         self.logger = logging.getLogger(__name__)
         self.request_timestamps: List[float] = []
@@ -430,9 +445,8 @@ class APIWrapperResolver(TaskResolver):
         timeout = input_data.get("timeout")
         use_cache = input_data.get("cache")
         
-        try:
-            # Make the API request
-            response = self.request(
+        async def make_request(_: Task) -> Dict[str, Any]:
+            return self.request(
                 method=method,
                 endpoint=endpoint,
                 params=params,
@@ -442,6 +456,19 @@ class APIWrapperResolver(TaskResolver):
                 timeout=timeout,
                 cache=use_cache
             )
+        
+        try:
+            # Make the API request, retrying within the API's retry budget
+            if self.retry_manager is not None:
+                response = await self.retry_manager.execute_with_retry(
+                    task, make_request, retry_budget=self.retry_budget
+                )
+                if isinstance(response, TaskResult):
+                    # Retries are exhausted; report it like a single failed request
+                    response.error = {**(response.error or {}), "error_type": "APIRequestError"}
+                    return response
+            else:
+                response = await make_request(task)
             
             # Check for custom response handling instructions
             extract_keys = input_data.get("extract_keys")
@@ -479,5 +506,6 @@ class APIWrapperResolver(TaskResolver):
                 task_id=task.id,
                 status=TaskStatus.ERROR,
                 message=error_msg,
-                output_data={"error": str(e)}
+                output_data={"error": str(e)},
+                error=error.to_dict()
             ) 
\ No newline at end of file
@@ -17,6 +17,7 @@ from typing import Any, Dict, List, Optional, Set, Union, Callable, Type, cast
 from boss.core.task_models import Task, TaskResult, TaskError
 from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
 from boss.core.task_status import TaskStatus
+from boss.core.task_retry import RetryBudget, decorrelated_jitter_delay, get_retry_budget
 
 
 class BackoffStrategy(str, Enum):
@@ -27,6 +28,7 @@ class BackoffStrategy(str, Enum):
     EXPONENTIAL = "exponential"  # Wait time increases exponentially (base * 2^attempt)
     FIBONACCI = "fibonacci"  # Wait time follows Fibonacci sequence
     JITTER = "jitter"      # Random wait time within a range
+    DECORRELATED_JITTER = "decorrelated_jitter"  # Random wait between base and 3x the previous wait
 
 
 class RetryCondition(str, Enum):
@@ -48,6 +50,7 @@ class RetryResolver(TaskResolver):
     - Conditional retries based on error types
     - Retry statistics tracking
     - Dynamic adjustment of retry parameters
+    - Shared retry budgets, per dependency, that cap retries during outages
     
     Attributes:
         metadata: Resolver metadata
@@ -56,6 +59,7 @@ class RetryResolver(TaskResolver):
         default_base_delay: Default base delay between retries (seconds)
         default_max_delay: Default maximum delay between retries (seconds)
         default_retry_condition: Default condition for when to retry
+        retry_budget: Budget used when a retry request names no dependency
         retry_stats: Statistics about retry attempts and outcomes
     """
     
@@ -66,7 +70,8 @@ class RetryResolver(TaskResolver):
         default_backoff_strategy: str = BackoffStrategy.EXPONENTIAL,
         default_base_delay: float = 1.0,
         default_max_delay: float = 60.0,
-        default_retry_condition: str = RetryCondition.ALWAYS
+        default_retry_condition: str = RetryCondition.ALWAYS,
+        retry_budget: Optional[RetryBudget] = None
     ) -> None:
         """
         Initialize the RetryResolver.
@@ -78,6 +83,7 @@ class RetryResolver(TaskResolver):
             default_base_delay: Default base delay between retries (seconds)
             default_max_delay: Default maximum delay between retries (seconds)
             default_retry_condition: Default condition for when to retry
+            retry_budget: Optional retry budget for requests that name no dependency
         """
         super().__init__(metadata)
         self.logger = logging.getLogger(__name__)
@@ -87,6 +93,7 @@ class RetryResolver(TaskResolver):
         self.default_base_delay = default_base_delay
         self.default_max_delay = default_max_delay
         self.default_retry_condition = default_retry_condition
+        self.retry_budget = retry_budget
         
         # List of error patterns that are considered retriable for different categories
         self.retriable_errors = {
@@ -107,6 +114,7 @@ class RetryResolver(TaskResolver):
             "total_attempts": 0,
             "successful_retries": 0,
             "failed_retries": 0,
+            "budget_exhausted": 0,
             "by_strategy": {s: 0 for s in BackoffStrategy},
             "by_condition": {c: 0 for c in RetryCondition},
             "avg_attempts_until_success": 0.0
@@ -279,10 +287,15 @@ class RetryResolver(TaskResolver):
         args = input_data.get("args", [])
         kwargs = input_data.get("kwargs", {})
         
+        # Requests naming a dependency share its process-wide budget
+        dependency = input_data.get("dependency")
+        budget = get_retry_budget(dependency) if dependency else self.retry_budget
+        
         # Initialize retry counter and result
         attempts = 0
         result = None
         last_error = None
+        delay = None
         
         # Increment the total attempts counter
         self.retry_stats["by_strategy"][backoff_strategy] = self.retry_stats["by_strategy"].get(backoff_strategy, 0) + 1
@@ -297,6 +310,9 @@ class RetryResolver(TaskResolver):
                 else:
                     result = func(*args, **kwargs)
                 
+                if budget is not None:
+                    budget.record_success()
+                
                 # Success! Return the result
                 if attempts > 0:
                     self.retry_stats["successful_retries"] += 1
@@ -324,8 +340,15 @@ class RetryResolver(TaskResolver):
                     self.retry_stats["failed_retries"] += 1
                     break
                 
+                # Stop retrying once the shared budget is spent
+                if budget is not None and not budget.try_acquire():
+                    self.retry_stats["failed_retries"] += 1
+                    self.retry_stats["budget_exhausted"] += 1
+                    last_error = f"Retry budget exhausted: {last_error}"
+                    break
+                
                 # Calculate delay based on strategy
-                delay = self._calculate_delay(attempts, backoff_strategy, base_delay, max_delay)
+                delay = self._calculate_delay(attempts, backoff_strategy, base_delay, max_delay, delay)
                 
                 # Log the retry attempt
                 self.logger.info(f"Retry attempt {attempts}/{max_retries} for operation '{operation}'. "
@@ -344,7 +367,14 @@ class RetryResolver(TaskResolver):
             "message": f"Operation failed after {attempts} attempts: {last_error}"
         }
     
-    def _calculate_delay(self, attempt: int, strategy: str, base_delay: float, max_delay: float) -> float:
+    def _calculate_delay(
+        self,
+        attempt: int,
+        strategy: str,
+        base_delay: float,
+        max_delay: float,
+        previous_delay: Optional[float] = None
+    ) -> float:
         """
         Calculate the delay for the next retry attempt.
         
@@ -353,6 +383,7 @@ class RetryResolver(TaskResolver):
             strategy: The backoff strategy to use
             base_delay: The base delay time in seconds
             max_delay: The maximum delay time in seconds
+            previous_delay: The previous delay, used by the decorrelated jitter strategy
             
         Returns:
             The delay time in seconds
@@ -378,6 +409,9 @@ class RetryResolver(TaskResolver):
             max_jitter = base_delay * attempt
             delay = base_delay + random.uniform(0, max_jitter)
         
+        elif strategy == BackoffStrategy.DECORRELATED_JITTER:
+            delay = decorrelated_jitter_delay(base_delay, max_delay, previous_delay)
+        
         else:
             # Default to exponential backoff
             delay = base_delay * (2 ** (attempt - 1))
@@ -428,6 +462,7 @@ class RetryResolver(TaskResolver):
             "stats": self.retry_stats,
             "success_rate": success_rate,
             "total_retries": total_retries,
+            "retry_budget": self.retry_budget.get_stats() if self.retry_budget else None,
             "config": {
                 "max_retries": self.default_max_retries,
                 "backoff_strategy": self.default_backoff_strategy,
@@ -450,6 +485,7 @@ class RetryResolver(TaskResolver):
             "total_attempts": 0,
             "successful_retries": 0,
             "failed_retries": 0,
+            "budget_exhausted": 0,
             "by_strategy": {s: 0 for s in BackoffStrategy},
             "by_condition": {c: 0 for c in RetryCondition},
             "avg_attempts_until_success": 0.0
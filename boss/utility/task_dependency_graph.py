@@ -0,0 +1,218 @@
+"""
+Dependency graph of tasks for dependency-aware prioritization.
+
+This module provides TaskDependencyGraph, a DAG of tasks and the tasks they
+depend on, which tracks how much downstream work each task blocks.
+"""
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class TaskDependencyGraph:
+    """
+    DAG of task dependencies with cached downstream metrics.
+    
+    For every task the graph provides:
+    - critical_path_length: the number of tasks on the longest chain of
+      dependents starting at the task (1 for a task nothing depends on)
+    - downstream_count: the number of distinct tasks that transitively
+      depend on the task (its downstream fan-out)
+      
+    Both metrics are cached. A change to a task's dependencies only
+    invalidates the task and its ancestors (the tasks it transitively
+    depends on), which are recomputed on the next lookup.
+    
+    Dependencies on tasks that have not been added yet are kept, so the
+    graph links up when those tasks are added later.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty TaskDependencyGraph."""
+        self._dependencies: Dict[str, Set[str]] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._tasks: Dict[str, None] = {}  # insertion-ordered set
+        self._critical_path: Dict[str, int] = {}
+        self._downstream: Dict[str, int] = {}
+    
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._tasks
+    
+    def __len__(self) -> int:
+        return len(self._tasks)
+    
+    def set_dependencies(self, task_id: str, dependencies: Iterable[str]) -> Set[str]:
+        """
+        Add a task or replace its dependencies.
+        
+        Args:
+            task_id: The ID of the task
+            dependencies: IDs of the tasks it depends on
+            
+        Returns:
+            IDs of the tasks whose metrics may have changed
+            
+        Raises:
+            ValueError: If the dependencies would create a cycle
+        """
+        new_dependencies = set(dependencies) - {task_id}
+        old_dependencies = self._dependencies.get(task_id, set())
+        
+        added = new_dependencies - old_dependencies
+        if added:
+            descendants = self._descendants(task_id)
+            cyclic = added & descendants
+            if cyclic:
+                raise ValueError(
+                    f"Dependencies of task {task_id} would create a cycle through {sorted(cyclic)}"
+                )
+        
+        affected = self._ancestors(old_dependencies | new_dependencies)
+        affected.add(task_id)
+        
+        for dependency in old_dependencies - new_dependencies:
+            self._unlink(task_id, dependency)
+        for dependency in added:
+            self._dependents.setdefault(dependency, set()).add(task_id)
+        self._dependencies[task_id] = new_dependencies
+        self._tasks[task_id] = None
+        
+        self._invalidate(affected)
+        return affected
+    
+    def remove_task(self, task_id: str) -> Set[str]:
+        """
+        Remove a task (e.g. once it has completed), together with its edges.
+        
+        Tasks that depended on it no longer do.
+        
+        Args:
+            task_id: The ID of the task
+            
+        Returns:
+            IDs of the remaining tasks whose metrics may have changed
+        """
+        if task_id not in self._tasks and task_id not in self._dependents:
+            return set()
+        
+        dependencies = self._dependencies.pop(task_id, set())
+        affected = self._ancestors(dependencies)
+        affected.update(self._dependents.get(task_id, ()))
+        
+        for dependency in dependencies:
+            self._unlink(task_id, dependency)
+        for dependent in self._dependents.pop(task_id, set()):
+            self._dependencies.get(dependent, set()).discard(task_id)
+        self._tasks.pop(task_id, None)
+        
+        self._invalidate(affected | {task_id})
+        affected.discard(task_id)
+        return affected
+    
+    def get_dependencies(self, task_id: str) -> Set[str]:
+        """Get the IDs of the tasks a task depends on."""
+        return set(self._dependencies.get(task_id, ()))
+    
+    def get_dependents(self, task_id: str) -> Set[str]:
+        """Get the IDs of the tasks that directly depend on a task."""
+        return set(self._dependents.get(task_id, ()))
+    
+    def critical_path_length(self, task_id: str) -> int:
+        """
+        Get the length of the longest chain of dependents starting at a task.
+        
+        Args:
+            task_id: The ID of the task
+            
+        Returns:
+            The number of tasks on the chain, including the task itself
+        """
+        cached = self._critical_path.get(task_id)
+        if cached is not None:
+            return cached
+        
+        # Iterative post-order traversal, so long chains don't hit the recursion limit
+        stack: List[str] = [task_id]
+        while stack:
+            current = stack[-1]
+            if current in self._critical_path:
+                stack.pop()
+                continue
+            pending = [d for d in self._dependents.get(current, ()) if d not in self._critical_path]
+            if pending:
+                stack.extend(pending)
+                continue
+            self._critical_path[current] = 1 + max(
+                (self._critical_path[d] for d in self._dependents.get(current, ())), default=0
+            )
+            stack.pop()
+        return self._critical_path[task_id]
+    
+    def downstream_count(self, task_id: str) -> int:
+        """
+        Get the number of distinct tasks that transitively depend on a task.
+        
+        Args:
+            task_id: The ID of the task
+            
+        Returns:
+            The downstream fan-out of the task
+        """
+        cached = self._downstream.get(task_id)
+        if cached is None:
+            cached = len(self._descendants(task_id))
+            self._downstream[task_id] = cached
+        return cached
+    
+    def get_blockers(self, limit: Optional[int] = None) -> List[str]:
+        """
+        Get the tasks with no pending dependencies, most blocking first.
+        
+        Args:
+            limit: Optional maximum number of tasks to return
+            
+        Returns:
+            IDs of ready tasks ordered by critical path length, then downstream
+            fan-out, then the order in which they were added
+        """
+        ready = [
+            task_id for task_id in self._tasks
+            if not any(d in self._tasks for d in self._dependencies.get(task_id, ()))
+        ]
+        ready.sort(key=lambda t: (self.critical_path_length(t), self.downstream_count(t)), reverse=True)
+        return ready[:limit] if limit is not None else ready
+    
+    def _unlink(self, task_id: str, dependency: str) -> None:
+        """Remove the edge from a task to one of its dependencies."""
+        dependents = self._dependents.get(dependency)
+        if dependents is None:
+            return
+        dependents.discard(task_id)
+        if not dependents:
+            del self._dependents[dependency]
+    
+    def _descendants(self, task_id: str) -> Set[str]:
+        """Get the tasks that transitively depend on a task."""
+        seen: Set[str] = set()
+        stack = list(self._dependents.get(task_id, ()))
+        while stack:
+            current = stack.pop()
+            if current not in seen:
+                seen.add(current)
+                stack.extend(self._dependents.get(current, ()))
+        return seen
+    
+    def _ancestors(self, task_ids: Iterable[str]) -> Set[str]:
+        """Get the given tasks and the tasks they transitively depend on."""
+        seen: Set[str] = set()
+        stack = list(task_ids)
+        while stack:
+            current = stack.pop()
+            if current not in seen:
+                seen.add(current)
+                stack.extend(self._dependencies.get(current, ()))
+        return seen
+    
+    def _invalidate(self, task_ids: Iterable[str]) -> None:
+        """Drop the cached metrics of tasks."""
+        for task_id in task_ids:
+            self._critical_path.pop(task_id, None)
+            self._downstream.pop(task_id, None)
@@ -5,18 +5,172 @@ This resolver assigns priority scores to tasks based on various factors,
 allowing for more efficient processing of task queues and better resource allocation.
 """
 
+import heapq
+import itertools
 import logging
 import time
+import uuid
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union, Callable, Type, cast, TypeVar, SupportsFloat
+from typing import Any, Dict, List, Optional, Tuple, Union, Callable, Type, cast, TypeVar, SupportsFloat
 
-from boss.core.task_models import Task, TaskResult, TaskStatus
+import numpy as np
+
+from boss.core.task_models import Task, TaskMetadata, TaskResult, TaskStatus
 from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
 from boss.core.task_retry import TaskRetryManager
+from boss.utility.task_dependency_graph import TaskDependencyGraph
 
 # Type for sortable objects
 T = TypeVar('T')
 
+# Time horizons of the time-based default factors
+MAX_AGE_SECONDS = 24 * 60 * 60
+MAX_LEAD_TIME_SECONDS = 7 * 24 * 60 * 60
+
+# Critical path length and downstream fan-out at which the dependency-graph factors saturate
+MAX_CRITICAL_PATH = 10
+MAX_DOWNSTREAM_COUNT = 20
+
+
+def _timestamp(value: Any) -> float:
+    """Convert a datetime (or ISO string) to a POSIX timestamp, or NaN if it isn't one."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return float("nan")
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float("nan")
+
+
+def _get_field(obj: Any, name: str, default: Any = None) -> Any:
+    """Get a field from a dict or an object."""
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def _check_task_dict(task: Dict[str, Any]) -> None:
+    """Check the required fields and field types of a task dict, raising ValueError if invalid."""
+    if not isinstance(task.get("name"), str):
+        raise ValueError("Task dict requires a string field 'name'")
+    if task.get("metadata") is not None and not isinstance(task["metadata"], (dict, TaskMetadata)):
+        raise ValueError("Task dict field 'metadata' must be a mapping")
+    for name in ("input_data", "context"):
+        if task.get(name) is not None and not isinstance(task[name], dict):
+            raise ValueError(f"Task dict field '{name}' must be a mapping")
+
+
+def extract_priority_features(
+    tasks: List[Union[Task, Dict[str, Any]]],
+    now: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Extract the inputs of the default priority factors into NumPy arrays.
+    
+    Tasks can be Task objects or dicts in the Task schema; dicts are read
+    directly, without building Task objects, after a check of their required
+    fields and field types. Invalid tasks and tasks whose fields cannot be
+    read are reported in the "errors" entry and get neutral inputs.
+    
+    Args:
+        tasks: The tasks to extract features from.
+        now: The time to evaluate time-based factors at (defaults to the current time).
+        
+    Returns:
+        Dict[str, Any]: Arrays keyed by feature name ("priority", "created_at",
+        "deadline", "retry_count", "dependency_count", "dependencies", "owner",
+        "priority_override"), plus "task_ids", "errors" (index to message)
+        and "now" (the extraction time as a POSIX timestamp).
+    """
+    n = len(tasks)
+    now = time.time() if now is None else now
+    priority = np.zeros(n)
+    created_at = np.full(n, now)
+    deadline = np.full(n, np.nan)
+    retry_count = np.zeros(n)
+    dependency_count = np.zeros(n)
+    dependencies: List[Tuple[str, ...]] = [()] * n
+    priority_override = np.full(n, np.nan)
+    owners: List[str] = [""] * n
+    task_ids: List[Optional[str]] = [None] * n
+    errors: Dict[int, str] = {}
+    
+    for i, task in enumerate(tasks):
+        try:
+            if isinstance(task, dict):
+                _check_task_dict(task)
+            metadata = _get_field(task, "metadata") or {}
+            task_context = _get_field(task, "context") or {}
+            
+            task_id = _get_field(task, "id")
+            task_ids[i] = task_id if task_id is not None else str(uuid.uuid4())
+            priority[i] = float(_get_field(metadata, "priority", 0))
+            retry_count[i] = float(_get_field(metadata, "retry_count", 0))
+            owners[i] = str(_get_field(metadata, "owner", ""))
+            
+            value = _get_field(metadata, "created_at")
+            if value is not None:
+                created_at[i] = _timestamp(value)
+            value = _get_field(metadata, "deadline") or _get_field(metadata, "expires_at")
+            if value is not None:
+                deadline[i] = _timestamp(value)
+            value = _get_field(metadata, "priority_override")
+            if value is not None:
+                priority_override[i] = float(value)
+            
+            dependencies[i] = tuple(str(d) for d in task_context.get("dependencies", None) or [])
+            dependency_count[i] = len(dependencies[i])
+        except Exception as e:
+            errors[i] = str(e)
+            priority[i] = retry_count[i] = dependency_count[i] = 0.0
+            dependencies[i] = ()
+            created_at[i] = now
+            deadline[i] = priority_override[i] = np.nan
+    
+    return {
+        "task_ids": task_ids,
+        "errors": errors,
+        "now": now,
+        "priority": priority,
+        "created_at": created_at,
+        "deadline": deadline,
+        "retry_count": retry_count,
+        "dependency_count": dependency_count,
+        "dependencies": dependencies,
+        "owner": np.array(owners, dtype=object),
+        "priority_override": priority_override
+    }
+
+
+def _vector_task_age(features: Dict[str, Any], context: Dict[str, Any]) -> np.ndarray:
+    """Vectorized task_age factor."""
+    age = features["now"] - features["created_at"]
+    return np.where(np.isnan(age), 0.5, np.minimum(1.0, age / MAX_AGE_SECONDS))
+
+
+def _vector_deadline_proximity(features: Dict[str, Any], context: Dict[str, Any]) -> np.ndarray:
+    """Vectorized deadline_proximity factor."""
+    time_left = features["deadline"] - features["now"]
+    with np.errstate(invalid="ignore"):
+        score = np.where(time_left < 0, 1.0, np.where(time_left > MAX_LEAD_TIME_SECONDS, 0.0,
+                                                      1.0 - time_left / MAX_LEAD_TIME_SECONDS))
+    return np.where(np.isnan(time_left), 0.5, score)
+
+
+def _vector_requester_importance(features: Dict[str, Any], context: Dict[str, Any]) -> np.ndarray:
+    """Vectorized requester_importance factor."""
+    owners = features["owner"]
+    score = np.full(len(owners), 0.5)
+    high_priority_users = list(context.get("high_priority_users", set()))
+    vip_users = list(context.get("vip_users", set()))
+    if high_priority_users:
+        score[np.isin(owners, np.array(high_priority_users, dtype=object))] = 0.75
+    if vip_users:
+        score[np.isin(owners, np.array(vip_users, dtype=object))] = 1.0
+    return score
+
 
 class PriorityFactor:
     """
@@ -31,7 +185,9 @@ class PriorityFactor:
         name: str,
         weight: float,
         evaluation_fn: Callable[[Task, Dict[str, Any]], float],
-        description: str = ""
+        description: str = "",
+        vector_fn: Optional[Callable[[Dict[str, Any], Dict[str, Any]], np.ndarray]] = None,
+        applies_fn: Optional[Callable[[Optional[str]], bool]] = None
     ):
         """
         Initialize a new PriorityFactor.
@@ -41,11 +197,31 @@ class PriorityFactor:
             weight: Weight of the factor in the overall priority score (0-1).
             evaluation_fn: Function that evaluates the factor for a task and returns a score.
             description: Description of what this factor evaluates.
+            vector_fn: Optional function that evaluates the factor for a batch of tasks
+                from the arrays returned by extract_priority_features, returning raw scores.
+                Factors without one are evaluated task by task in batch mode.
+            applies_fn: Optional predicate on a task ID deciding whether the factor
+                applies to the task. Tasks it does not apply to are scored without
+                it, i.e. its weight is left out of their normalization.
         """
         self.name = name
         self.weight = max(0.0, min(1.0, weight))  # Clamp weight between 0 and 1
         self.evaluation_fn = evaluation_fn
         self.description = description
+        self.vector_fn = vector_fn
+        self.applies_fn = applies_fn
+
+    def applies_to(self, task_id: Optional[str]) -> bool:
+        """
+        Check whether this factor applies to a task.
+
+        Args:
+            task_id: The ID of the task.
+
+        Returns:
+            bool: True if the factor contributes to the task's score.
+        """
+        return self.applies_fn is None or self.applies_fn(task_id)
 
     def evaluate(self, task: Task, context: Dict[str, Any]) -> float:
         """
@@ -88,7 +264,8 @@ class TaskPrioritizationResolver(TaskResolver):
         priority_factors: Optional[List[PriorityFactor]] = None,
         default_priority: float = 0.5,
         priority_scale: int = 10,  # 0-10 scale by default
-        retry_manager: Optional[TaskRetryManager] = None
+        retry_manager: Optional[TaskRetryManager] = None,
+        score_resolution: float = 0.01
     ) -> None:
         """
         Initialize the TaskPrioritizationResolver.
@@ -99,13 +276,29 @@ class TaskPrioritizationResolver(TaskResolver):
             default_priority: Default priority to assign if no factors match.
             priority_scale: The scale to use for the final priority score (e.g., 10 for 0-10).
             retry_manager: Optional TaskRetryManager for handling retries.
+            score_resolution: Change of a tracked task's score (on the priority scale)
+                due to time-based factors that triggers re-scoring.
         """
         super().__init__(metadata)
+        self.dependency_graph = TaskDependencyGraph()
         self.priority_factors = priority_factors or self._default_priority_factors()
         self.default_priority = default_priority
         self.priority_scale = priority_scale
         self.retry_manager = retry_manager
+        self.score_resolution = score_resolution
         self.logger = logging.getLogger(__name__)
+        
+        # Tracked tasks with cached scores, and a heap of (rescore_at, task_id)
+        # entries that are only valid while they match _rescore_at
+        self.tracking_context: Dict[str, Any] = {}
+        self._tracked: Dict[str, Union[Task, Dict[str, Any]]] = {}
+        self._scores: Dict[str, float] = {}
+        self._fingerprints: Dict[str, tuple] = {}
+        self._rescore_at: Dict[str, float] = {}
+        self._rescore_heap: List[Tuple[float, str]] = []
+        self._track_sequence: Dict[str, int] = {}
+        self._sequence = itertools.count()
+        self.tracking_stats: Dict[str, int] = {"scored": 0, "skipped_unchanged": 0, "time_rescores": 0}
 
     def _default_priority_factors(self) -> List[PriorityFactor]:
         """
@@ -120,7 +313,8 @@ class TaskPrioritizationResolver(TaskResolver):
                 name="explicit_priority",
                 weight=0.4,
                 evaluation_fn=lambda task, _: task.metadata.priority / 10 if hasattr(task.metadata, "priority") else 0.5,
-                description="Priority explicitly set in task metadata"
+                description="Priority explicitly set in task metadata",
+                vector_fn=lambda features, _: features["priority"] / 10
             ),
             
             # Task age (older tasks get higher priority)
@@ -128,7 +322,8 @@ class TaskPrioritizationResolver(TaskResolver):
                 name="task_age",
                 weight=0.1,
                 evaluation_fn=self._evaluate_task_age,
-                description="Priority based on the age of the task"
+                description="Priority based on the age of the task",
+                vector_fn=_vector_task_age
             ),
             
             # Deadline proximity
@@ -136,7 +331,8 @@ class TaskPrioritizationResolver(TaskResolver):
                 name="deadline_proximity",
                 weight=0.25,
                 evaluation_fn=self._evaluate_deadline_proximity,
-                description="Priority based on how close the task is to its deadline"
+                description="Priority based on how close the task is to its deadline",
+                vector_fn=_vector_deadline_proximity
             ),
             
             # Retry count (tasks that have been retried more get lower priority)
@@ -144,7 +340,8 @@ class TaskPrioritizationResolver(TaskResolver):
                 name="retry_count",
                 weight=0.05,
                 evaluation_fn=lambda task, _: 1.0 - min(1.0, task.metadata.retry_count / 5) if hasattr(task.metadata, "retry_count") else 1.0,
-                description="Priority based on how many times the task has been retried"
+                description="Priority based on how many times the task has been retried",
+                vector_fn=lambda features, _: 1.0 - np.minimum(1.0, features["retry_count"] / 5)
             ),
             
             # Dependency count (tasks with fewer dependencies get higher priority)
@@ -152,7 +349,8 @@ class TaskPrioritizationResolver(TaskResolver):
                 name="dependency_count",
                 weight=0.1,
                 evaluation_fn=self._evaluate_dependency_count,
-                description="Priority based on the number of dependencies the task has"
+                description="Priority based on the number of dependencies the task has",
+                vector_fn=lambda features, _: np.maximum(0.0, 1.0 - features["dependency_count"] / 10)
             ),
             
             # User/requester importance
@@ -160,7 +358,32 @@ class TaskPrioritizationResolver(TaskResolver):
                 name="requester_importance",
                 weight=0.1,
                 evaluation_fn=self._evaluate_requester_importance,
-                description="Priority based on the importance of the task requester"
+                description="Priority based on the importance of the task requester",
+                vector_fn=_vector_requester_importance
+            ),
+            
+            # Critical path (tasks heading long chains of dependents get higher priority)
+            PriorityFactor(
+                name="critical_path",
+                weight=0.15,
+                evaluation_fn=self._evaluate_critical_path,
+                description="Priority based on the longest chain of tasks waiting on the task",
+                vector_fn=lambda features, _: np.array(
+                    [self._critical_path_score(task_id) for task_id in features["task_ids"]]
+                ),
+                applies_fn=self._in_dependency_graph
+            ),
+            
+            # Downstream fan-out (tasks blocking many others get higher priority)
+            PriorityFactor(
+                name="downstream_fan_out",
+                weight=0.1,
+                evaluation_fn=self._evaluate_downstream_fan_out,
+                description="Priority based on the number of tasks transitively waiting on the task",
+                vector_fn=lambda features, _: np.array(
+                    [self._downstream_score(task_id) for task_id in features["task_ids"]]
+                ),
+                applies_fn=self._in_dependency_graph
             )
         ]
 
@@ -185,16 +408,16 @@ class TaskPrioritizationResolver(TaskResolver):
             return 0.5
             
         age_seconds = (datetime.now() - created_at).total_seconds()
-        max_age_seconds = 24 * 60 * 60  # 24 hours
         
         # Normalize to 0-1 range
-        return min(1.0, age_seconds / max_age_seconds)
+        return min(1.0, age_seconds / MAX_AGE_SECONDS)
 
     def _evaluate_deadline_proximity(self, task: Task, context: Dict[str, Any]) -> float:
         """
         Evaluate priority based on proximity to deadline.
         
-        Tasks closer to their deadline get higher priority.
+        Tasks closer to their deadline get higher priority. The deadline is
+        read from metadata.deadline if set, otherwise from metadata.expires_at.
         
         Args:
             task: The task to evaluate.
@@ -204,10 +427,7 @@ class TaskPrioritizationResolver(TaskResolver):
             float: Score between 0 and 1.
         """
         # Check if task has a deadline
-        if not hasattr(task.metadata, "deadline"):
-            return 0.5
-            
-        deadline = task.metadata.deadline
+        deadline = getattr(task.metadata, "deadline", None) or getattr(task.metadata, "expires_at", None)
         if not isinstance(deadline, datetime):
             return 0.5
             
@@ -218,7 +438,7 @@ class TaskPrioritizationResolver(TaskResolver):
             return 1.0
             
         # If deadline is more than 7 days away, return min priority
-        max_lead_time = timedelta(days=7)
+        max_lead_time = timedelta(seconds=MAX_LEAD_TIME_SECONDS)
         if (deadline - now) > max_lead_time:
             return 0.0
             
@@ -254,6 +474,53 @@ class TaskPrioritizationResolver(TaskResolver):
         
         return max(0.0, 1.0 - (dependency_count / max_dependencies))
 
+    def _in_dependency_graph(self, task_id: Optional[str]) -> bool:
+        """Whether a task is in the dependency graph (the dependency-graph factors only apply to those)."""
+        return task_id is not None and task_id in self.dependency_graph
+
+    def _critical_path_score(self, task_id: Optional[str]) -> float:
+        """Normalized critical path length of a task in the dependency graph."""
+        if task_id is None or task_id not in self.dependency_graph:
+            return 0.0
+        return min(1.0, (self.dependency_graph.critical_path_length(task_id) - 1) / (MAX_CRITICAL_PATH - 1))
+
+    def _downstream_score(self, task_id: Optional[str]) -> float:
+        """Normalized downstream fan-out of a task in the dependency graph."""
+        if task_id is None or task_id not in self.dependency_graph:
+            return 0.0
+        return min(1.0, self.dependency_graph.downstream_count(task_id) / MAX_DOWNSTREAM_COUNT)
+
+    def _evaluate_critical_path(self, task: Task, context: Dict[str, Any]) -> float:
+        """
+        Evaluate priority based on the task's critical path.
+        
+        Tasks at the head of longer chains of tracked dependents get higher
+        priority, so blockers of multi-step workflows run first.
+        
+        Args:
+            task: The task to evaluate.
+            context: Additional context.
+            
+        Returns:
+            float: Score between 0 and 1.
+        """
+        return self._critical_path_score(task.id)
+
+    def _evaluate_downstream_fan_out(self, task: Task, context: Dict[str, Any]) -> float:
+        """
+        Evaluate priority based on the task's downstream fan-out.
+        
+        Tasks that more tracked tasks transitively depend on get higher priority.
+        
+        Args:
+            task: The task to evaluate.
+            context: Additional context.
+            
+        Returns:
+            float: Score between 0 and 1.
+        """
+        return self._downstream_score(task.id)
+
     def _evaluate_requester_importance(self, task: Task, context: Dict[str, Any]) -> float:
         """
         Evaluate priority based on requester importance.
@@ -304,9 +571,10 @@ class TaskPrioritizationResolver(TaskResolver):
         if hasattr(task.metadata, "priority_override") and task.metadata.priority_override is not None:
             return float(task.metadata.priority_override)
         
-        # Calculate normalized priority score (0-1)
-        total_weight = sum(factor.weight for factor in self.priority_factors)
-        total_score = sum(factor.evaluate(task, ctx) for factor in self.priority_factors)
+        # Calculate normalized priority score (0-1) over the factors that apply to the task
+        factors = [factor for factor in self.priority_factors if factor.applies_to(task.id)]
+        total_weight = sum(factor.weight for factor in factors)
+        total_score = sum(factor.evaluate(task, ctx) for factor in factors)
         
         if total_weight > 0:
             normalized_score = total_score / total_weight
@@ -330,9 +598,10 @@ class TaskPrioritizationResolver(TaskResolver):
         ctx = context or {}
         
         factor_scores: List[Dict[str, Any]] = []
-        total_weight = sum(factor.weight for factor in self.priority_factors)
+        factors = [factor for factor in self.priority_factors if factor.applies_to(task.id)]
+        total_weight = sum(factor.weight for factor in factors)
         
-        for factor in self.priority_factors:
+        for factor in factors:
             raw_score = factor.evaluation_fn(task, ctx)
             normalized_score = max(0.0, min(1.0, raw_score))
             weighted_score = factor.weight * normalized_score
@@ -365,6 +634,387 @@ class TaskPrioritizationResolver(TaskResolver):
             "context_used": ctx
         }
 
+    def calculate_priorities(
+        self,
+        tasks: List[Union[Task, Dict[str, Any]]],
+        context: Optional[Dict[str, Any]] = None,
+        now: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Calculate the priority scores of a batch of tasks in one vectorized pass.
+        
+        Factors with a vector_fn are evaluated on arrays of task features; other
+        factors are evaluated task by task.
+        
+        Args:
+            tasks: The tasks to prioritize, as Task objects or dicts in the Task schema.
+            context: Additional context for priority calculation.
+            now: The time to evaluate time-based factors at (defaults to the current time).
+            
+        Returns:
+            Dict[str, Any]: "scores" (array of priority scores on the configured
+            scale), "task_ids", "errors" (index to message for tasks that
+            could not be read; their score is 0) and the extracted "features".
+        """
+        ctx = context or {}
+        features = extract_priority_features(tasks, now)
+        errors = features["errors"]
+        n = len(tasks)
+        
+        total_weight = np.zeros(n)
+        total_score = np.zeros(n)
+        for factor in self.priority_factors:
+            if factor.weight == 0:
+                continue
+            weight = factor.weight * self._factor_mask(factor, features["task_ids"])
+            if not weight.any():
+                continue
+            raw_score = self._evaluate_factor_batch(factor, tasks, features, ctx)
+            total_weight += weight
+            total_score += weight * np.clip(np.nan_to_num(raw_score, nan=0.0), 0.0, 1.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scores = np.where(
+                total_weight > 0,
+                total_score / total_weight * self.priority_scale,
+                self.default_priority * self.priority_scale
+            )
+        
+        overrides = features["priority_override"]
+        scores = np.where(np.isnan(overrides), scores, overrides)
+        if errors:
+            scores[list(errors)] = 0.0
+        
+        return {"scores": scores, "task_ids": features["task_ids"], "errors": errors, "features": features}
+
+    @staticmethod
+    def _factor_mask(factor: PriorityFactor, task_ids: List[Optional[str]]) -> np.ndarray:
+        """Get a 0/1 array marking the tasks a factor applies to."""
+        if factor.applies_fn is None:
+            return np.ones(len(task_ids))
+        return np.array([1.0 if factor.applies_fn(task_id) else 0.0 for task_id in task_ids])
+
+    def _evaluate_factor_batch(
+        self,
+        factor: PriorityFactor,
+        tasks: List[Union[Task, Dict[str, Any]]],
+        features: Dict[str, Any],
+        context: Dict[str, Any]
+    ) -> np.ndarray:
+        """
+        Evaluate a factor for a batch of tasks, returning raw (unweighted) scores.
+        
+        Args:
+            factor: The factor to evaluate.
+            tasks: The tasks being prioritized.
+            features: Arrays returned by extract_priority_features for the tasks.
+            context: Additional context.
+            
+        Returns:
+            np.ndarray: Raw scores, one per task.
+        """
+        if factor.vector_fn is not None:
+            try:
+                return np.asarray(factor.vector_fn(features, context), dtype=float)
+            except Exception as e:
+                self.logger.warning(
+                    f"Vectorized evaluation of priority factor '{factor.name}' failed, "
+                    f"evaluating task by task: {str(e)}"
+                )
+        
+        raw_scores = np.zeros(len(tasks))
+        for i, task in enumerate(tasks):
+            if i in features["errors"]:
+                continue
+            try:
+                target_task = Task(**task) if isinstance(task, dict) else task
+                raw_scores[i] = factor.evaluation_fn(target_task, context)
+            except Exception as e:
+                logging.error(f"Error evaluating priority factor '{factor.name}': {str(e)}")
+        return raw_scores
+
+    def prioritize_batch(
+        self,
+        tasks: List[Union[Task, Dict[str, Any]]],
+        context: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Score a batch of tasks and return them ordered by priority.
+        
+        Ties keep the input order. With top_k, only the k highest priority
+        tasks are selected (with argpartition) and sorted.
+        
+        Args:
+            tasks: The tasks to prioritize, as Task objects or dicts in the Task schema.
+            context: Additional context for priority calculation.
+            top_k: Optional number of highest priority tasks to return.
+            
+        Returns:
+            List[Dict[str, Any]]: Entries with "task_id" and "priority", highest
+            priority first, followed by entries with "index", "error" and a None
+            priority for tasks that could not be read.
+        """
+        batch = self.calculate_priorities(tasks, context)
+        scores = batch["scores"]
+        task_ids = batch["task_ids"]
+        errors = batch["errors"]
+        
+        valid = np.ones(len(tasks), dtype=bool)
+        if errors:
+            valid[list(errors)] = False
+        candidates = np.flatnonzero(valid)
+        
+        if top_k is not None and top_k < len(candidates):
+            if top_k <= 0:
+                candidates = candidates[:0]
+            else:
+                candidates = candidates[np.argpartition(-scores[candidates], top_k - 1)[:top_k]]
+        order = candidates[np.lexsort((candidates, -scores[candidates]))]
+        
+        results: List[Dict[str, Any]] = [
+            {"task_id": task_ids[i], "priority": float(scores[i])}
+            for i in order
+        ]
+        if top_k is None:
+            results.extend(
+                {"index": i, "error": f"Could not read task: {message}", "priority": None}
+                for i, message in sorted(errors.items())
+            )
+        return results
+
+    def track_tasks(self, tasks: List[Union[Task, Dict[str, Any]]], now: Optional[float] = None) -> List[str]:
+        """
+        Add tasks to the tracked set, or update tracked tasks.
+        
+        Tracked tasks form a dependency graph through their "dependencies"
+        context entry. Only tasks whose priority inputs changed, and the tasks
+        they depend on (whose critical path and fan-out may have changed), are
+        re-scored. Each tracked
+        task is re-scored again when its time-based factors (age, deadline
+        proximity) have moved its score by score_resolution or cross a
+        boundary, which refresh() takes care of. Unreadable tasks and task
+        dicts without an "id" are skipped.
+        
+        Args:
+            tasks: The tasks to track, as Task objects or dicts in the Task schema.
+            now: The current time as a POSIX timestamp (defaults to time.time()).
+            
+        Returns:
+            List[str]: IDs of the tasks that were (re-)scored, starting with the
+            added or changed ones.
+        """
+        if not tasks:
+            return []
+        features = extract_priority_features(tasks, now)
+        always_rescore = any(factor.vector_fn is None for factor in self.priority_factors)
+        
+        changed = []
+        dependencies: Dict[str, Tuple[str, ...]] = {}
+        for i, task in enumerate(tasks):
+            if i in features["errors"]:
+                self.logger.warning(f"Not tracking unreadable task at index {i}: {features['errors'][i]}")
+                continue
+            if _get_field(task, "id") is None:
+                self.logger.warning(f"Not tracking task without an ID at index {i}")
+                continue
+            task_id = features["task_ids"][i]
+            fingerprint = self._fingerprint(features, i)
+            if not always_rescore and self._fingerprints.get(task_id) == fingerprint:
+                self._tracked[task_id] = task
+                self.tracking_stats["skipped_unchanged"] += 1
+                continue
+            if task_id not in self._track_sequence:
+                self._track_sequence[task_id] = next(self._sequence)
+            self._tracked[task_id] = task
+            self._fingerprints[task_id] = fingerprint
+            dependencies[task_id] = features["dependencies"][i]
+            changed.append(task_id)
+        
+        affected = set(changed)
+        for task_id in changed:
+            try:
+                affected |= self.dependency_graph.set_dependencies(task_id, dependencies[task_id])
+            except ValueError as e:
+                self.logger.warning(f"Ignoring dependencies of task {task_id}: {str(e)}")
+                affected |= self.dependency_graph.set_dependencies(task_id, ())
+        
+        rescored = changed + [task_id for task_id in affected - set(changed) if task_id in self._tracked]
+        self._rescore(rescored, now)
+        return rescored
+
+    def untrack_task(self, task_id: str) -> bool:
+        """
+        Stop tracking a task (e.g. once it has completed).
+        
+        Tasks depending on it are no longer blocked by it, and the tasks it
+        depended on are re-scored.
+        
+        Args:
+            task_id: The ID of the task.
+            
+        Returns:
+            bool: True if the task was tracked, False otherwise.
+        """
+        if self._tracked.pop(task_id, None) is None:
+            return False
+        for cache in (self._scores, self._fingerprints, self._rescore_at, self._track_sequence):
+            cache.pop(task_id, None)
+        
+        affected = self.dependency_graph.remove_task(task_id)
+        self._rescore([t for t in affected if t in self._tracked])
+        return True
+
+    def set_tracking_context(self, context: Dict[str, Any], now: Optional[float] = None) -> None:
+        """
+        Set the context used to score tracked tasks, re-scoring all of them.
+        
+        Args:
+            context: The new context (e.g. vip_users, high_priority_users).
+            now: The current time as a POSIX timestamp (defaults to time.time()).
+        """
+        self.tracking_context = dict(context)
+        self._rescore(list(self._tracked), now)
+
+    def refresh(self, now: Optional[float] = None) -> List[str]:
+        """
+        Re-score the tracked tasks whose time-based factors are due for a change.
+        
+        Args:
+            now: The current time as a POSIX timestamp (defaults to time.time()).
+            
+        Returns:
+            List[str]: IDs of the re-scored tasks.
+        """
+        now = time.time() if now is None else now
+        due = []
+        while self._rescore_heap and self._rescore_heap[0][0] <= now:
+            rescore_at, task_id = heapq.heappop(self._rescore_heap)
+            if self._rescore_at.get(task_id) == rescore_at:
+                del self._rescore_at[task_id]
+                due.append(task_id)
+        
+        self.tracking_stats["time_rescores"] += len(due)
+        self._rescore(due, now)
+        return due
+
+    def get_cached_priority(self, task_id: str) -> Optional[float]:
+        """
+        Get the cached priority of a tracked task.
+        
+        Args:
+            task_id: The ID of the task.
+            
+        Returns:
+            Optional[float]: The priority score, or None if the task is not tracked.
+        """
+        return self._scores.get(task_id)
+
+    def get_ranked_tasks(self, top_k: Optional[int] = None, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Get the tracked tasks ordered by priority, refreshing due scores first.
+        
+        Args:
+            top_k: Optional number of highest priority tasks to return.
+            now: The current time as a POSIX timestamp (defaults to time.time()).
+            
+        Returns:
+            List[Dict[str, Any]]: Entries with "task_id" and "priority", highest
+            priority first (ties in tracking order).
+        """
+        self.refresh(now)
+        
+        def rank_key(task_id: str) -> Tuple[float, int]:
+            return (-self._scores[task_id], self._track_sequence[task_id])
+        
+        if top_k is None:
+            ranked = sorted(self._scores, key=rank_key)
+        else:
+            ranked = heapq.nsmallest(top_k, self._scores, key=rank_key)
+        return [{"task_id": task_id, "priority": self._scores[task_id]} for task_id in ranked]
+
+    @staticmethod
+    def _fingerprint(features: Dict[str, Any], i: int) -> tuple:
+        """Get the priority inputs of one task from extracted features."""
+        values = []
+        for name in ("priority", "created_at", "deadline", "retry_count",
+                     "dependency_count", "owner", "priority_override", "dependencies"):
+            value = features[name][i]
+            # NaN never compares equal, so missing values are normalized to None
+            values.append(None if isinstance(value, float) and value != value else value)
+        return tuple(values)
+
+    def _rescore(self, task_ids: List[str], now: Optional[float] = None) -> None:
+        """Score tracked tasks in one batch and schedule their next time-based re-scoring."""
+        if not task_ids:
+            return
+        now = time.time() if now is None else now
+        batch = self.calculate_priorities([self._tracked[task_id] for task_id in task_ids], self.tracking_context, now)
+        next_times = self._next_rescore_times(batch["features"])
+        
+        for task_id, score, next_time in zip(task_ids, batch["scores"], next_times):
+            self._scores[task_id] = float(score)
+            if np.isfinite(next_time):
+                self._rescore_at[task_id] = float(next_time)
+                heapq.heappush(self._rescore_heap, (float(next_time), task_id))
+            else:
+                self._rescore_at.pop(task_id, None)
+        self.tracking_stats["scored"] += len(task_ids)
+        
+        # Drop stale heap entries once they outnumber live ones
+        if len(self._rescore_heap) > 64 and len(self._rescore_heap) > 2 * len(self._rescore_at):
+            self._rescore_heap = [(t, task_id) for task_id, t in self._rescore_at.items()]
+            heapq.heapify(self._rescore_heap)
+
+    def _next_rescore_times(self, features: Dict[str, Any]) -> np.ndarray:
+        """
+        Compute when each task's time-based factors next change its score.
+        
+        The task_age score grows linearly until the task is MAX_AGE_SECONDS
+        old; the deadline_proximity score is 0 until MAX_LEAD_TIME_SECONDS
+        before the deadline and grows linearly until the deadline. A task is
+        re-scored once its score has grown by score_resolution, or at the next
+        boundary between these phases, whichever comes first.
+        
+        Args:
+            features: Arrays returned by extract_priority_features.
+            
+        Returns:
+            np.ndarray: Re-scoring times (POSIX timestamps), inf where the score
+            no longer changes over time.
+        """
+        now = features["now"]
+        weights = {factor.name: factor.weight for factor in self.priority_factors}
+        n = len(features["task_ids"])
+        total_weight = np.zeros(n)
+        for factor in self.priority_factors:
+            total_weight += factor.weight * self._factor_mask(factor, features["task_ids"])
+        
+        # Score change per second of each time-based factor, and the next phase boundary
+        with np.errstate(invalid="ignore"):
+            age_end = features["created_at"] + MAX_AGE_SECONDS
+            aging = now < age_end
+            age_rate = np.where(aging, weights.get("task_age", 0.0) / MAX_AGE_SECONDS, 0.0)
+            age_boundary = np.where(aging, age_end, np.inf)
+            
+            deadline = features["deadline"]
+            window_start = deadline - MAX_LEAD_TIME_SECONDS
+            before_window = now < window_start
+            in_window = (now >= window_start) & (now < deadline)
+            deadline_rate = np.where(in_window, weights.get("deadline_proximity", 0.0) / MAX_LEAD_TIME_SECONDS, 0.0)
+            deadline_boundary = np.where(before_window, window_start, np.where(in_window, deadline, np.inf))
+        
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rate = np.where(total_weight > 0, (age_rate + deadline_rate) / total_weight * self.priority_scale, 0.0)
+            step = np.where(rate > 0, self.score_resolution / rate, np.inf)
+        
+        next_times = np.minimum(now + step, np.minimum(age_boundary, deadline_boundary))
+        
+        # Overridden and unreadable tasks have fixed scores
+        next_times[~np.isnan(features["priority_override"])] = np.inf
+        if features["errors"]:
+            next_times[list(features["errors"])] = np.inf
+        return np.where(np.isnan(next_times), np.inf, next_times)
+
     def add_priority_factor(self, factor: PriorityFactor) -> None:
         """
         Add a new priority factor to the resolver.
@@ -374,6 +1024,7 @@ class TaskPrioritizationResolver(TaskResolver):
         """
         self.priority_factors.append(factor)
         self.logger.info(f"Added priority factor: {factor.name} (weight: {factor.weight})")
+        self._rescore(list(self._tracked))
 
     def remove_priority_factor(self, factor_name: str) -> bool:
         """
@@ -391,6 +1042,7 @@ class TaskPrioritizationResolver(TaskResolver):
         removed = len(self.priority_factors) < initial_count
         if removed:
             self.logger.info(f"Removed priority factor: {factor_name}")
+            self._rescore(list(self._tracked))
             
         return removed
 
@@ -409,6 +1061,7 @@ class TaskPrioritizationResolver(TaskResolver):
             if factor.name == factor_name:
                 factor.weight = max(0.0, min(1.0, new_weight))  # Clamp between 0 and 1
                 self.logger.info(f"Updated factor '{factor_name}' weight to {factor.weight}")
+                self._rescore(list(self._tracked))
                 return True
                 
         return False
@@ -447,7 +1100,10 @@ class TaskPrioritizationResolver(TaskResolver):
         Returns:
             bool: True if the resolver can handle the task, False otherwise.
         """
-        return task.name in ["prioritize_task", "prioritize_tasks", "get_priority_details"]
+        return task.name in [
+            "prioritize_task", "prioritize_tasks", "get_priority_details",
+            "track_tasks", "untrack_tasks", "get_ranked_tasks"
+        ]
 
     async def _resolve_task(self, task: Task) -> TaskResult:
         """
@@ -516,42 +1172,45 @@ class TaskPrioritizationResolver(TaskResolver):
                         output_data={"error": "Missing or empty required field 'tasks'"}
                     )
                 
-                # Process each task
-                results = []
-                for i, task_data in enumerate(tasks):
-                    # Convert task data to Task object if needed
-                    if isinstance(task_data, dict):
-                        try:
-                            target_task = Task(**task_data)
-                        except Exception as e:
-                            results.append({
-                                "index": i,
-                                "error": f"Could not convert dict to Task: {str(e)}",
-                                "priority": None
-                            })
-                            continue
-                    else:
-                        target_task = task_data
-                    
-                    # Calculate priority
-                    priority = self.calculate_priority(target_task, context)
-                    results.append({
-                        "task_id": target_task.id,
-                        "priority": priority
-                    })
+                # Score all tasks in one vectorized pass, highest priority first
+                sorted_results = self.prioritize_batch(tasks, context, input_data.get("top_k"))
                 
-                # Sort results by priority (highest first)
-                # Use a safe key function that handles None values
-                def priority_key(item: Dict[str, Any]) -> float:
-                    p = item.get("priority")
-                    return float(p) if p is not None else 0.0
+                return TaskResult(
+                    task_id=task.id,
+                    status=TaskStatus.COMPLETED,
+                    output_data={"prioritized_tasks": sorted_results}
+                )
                 
-                sorted_results = sorted(results, key=priority_key, reverse=True)
+            elif task.name == "track_tasks":
+                # Add or update tracked tasks, re-scoring only changed ones
+                tasks = input_data.get("tasks", [])
+                if "context" in input_data and input_data["context"] != self.tracking_context:
+                    self.set_tracking_context(input_data["context"])
+                
+                changed = self.track_tasks(tasks)
                 
                 return TaskResult(
                     task_id=task.id,
                     status=TaskStatus.COMPLETED,
-                    output_data={"prioritized_tasks": sorted_results}
+                    output_data={"rescored_task_ids": changed, "tracked_count": len(self._tracked)}
+                )
+                
+            elif task.name == "untrack_tasks":
+                removed = [task_id for task_id in input_data.get("task_ids", []) if self.untrack_task(task_id)]
+                
+                return TaskResult(
+                    task_id=task.id,
+                    status=TaskStatus.COMPLETED,
+                    output_data={"untracked_task_ids": removed, "tracked_count": len(self._tracked)}
+                )
+                
+            elif task.name == "get_ranked_tasks":
+                ranked = self.get_ranked_tasks(input_data.get("top_k"))
+                
+                return TaskResult(
+                    task_id=task.id,
+                    status=TaskStatus.COMPLETED,
+                    output_data={"prioritized_tasks": ranked, "tracking_stats": dict(self.tracking_stats)}
                 )
                 
             elif task.name == "get_priority_details":
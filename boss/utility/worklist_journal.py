@@ -0,0 +1,313 @@
+"""
+Journaled storage for worklists and work items.
+
+This module provides WorklistJournal, which persists worklist state as an
+append-only journal of mutation records plus a periodically compacted
+snapshot. Both files use the same format (one JSON record per line), so
+recovery replays the snapshot and then the journal through the same code.
+"""
+import json
+import logging
+import mmap
+import os
+import shutil
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+SNAPSHOT_FILE = "worklists.snapshot"
+JOURNAL_FILE = "worklists.journal"
+# Journal records written before a compaction in progress started
+COMPACTING_JOURNAL_FILE = "worklists.journal.compacting"
+
+# Journal record operations
+PUT_WORKLIST = "put_worklist"
+DELETE_WORKLIST = "delete_worklist"
+PUT_ITEM = "put_item"
+DELETE_ITEM = "delete_item"
+
+
+class WorklistJournal:
+    """
+    Append-only journal with compacted snapshots for worklist state.
+    
+    Every mutation is appended to the journal and handed to the operating
+    system immediately, so state survives a process crash. Calls to fsync are
+    batched: the journal is synced once sync_batch_size records are pending or
+    sync_interval seconds after the first unsynced record, whichever comes
+    first, so a power loss can lose at most that window.
+    
+    Once the journal holds snapshot_every records, the owner should call
+    compact() with the full state, which writes a new snapshot atomically and
+    truncates the journal. Compaction can also be split in two, so the
+    snapshot is written off the caller's thread: start_compaction() moves the
+    journal aside and starts a new one, after which the owner takes a copy of
+    its state; finish_compaction() then writes that copy as the new snapshot
+    and drops the old journal, while new records keep being appended.
+    """
+    
+    def __init__(
+        self,
+        storage_dir: str,
+        sync_interval: float = 0.05,
+        sync_batch_size: int = 1000,
+        snapshot_every: int = 10000
+    ) -> None:
+        """
+        Initialize the WorklistJournal.
+        
+        Args:
+            storage_dir: Directory holding the snapshot and journal files
+            sync_interval: Maximum seconds an appended record waits for fsync
+            sync_batch_size: Number of pending records that triggers an immediate fsync
+            snapshot_every: Number of journal records after which compaction is due
+        """
+        self.storage_dir = storage_dir
+        self.sync_interval = sync_interval
+        self.sync_batch_size = sync_batch_size
+        self.snapshot_every = snapshot_every
+        self.logger = logging.getLogger(__name__)
+        
+        os.makedirs(storage_dir, exist_ok=True)
+        self.snapshot_path = os.path.join(storage_dir, SNAPSHOT_FILE)
+        self.journal_path = os.path.join(storage_dir, JOURNAL_FILE)
+        self.compacting_journal_path = os.path.join(storage_dir, COMPACTING_JOURNAL_FILE)
+        
+        self._lock = threading.Lock()
+        self._journal = open(self.journal_path, "ab")
+        self._journal_records = 0
+        self._pending = 0
+        self._compacting = False
+        self._sync_timer: Optional[threading.Timer] = None
+        self.stats: Dict[str, int] = {"appended": 0, "syncs": 0, "compactions": 0}
+    
+    def load(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        Recover state from the snapshot and the journal.
+        
+        A truncated record at the end of the journal (from a crash during a
+        write) is ignored.
+        
+        Returns:
+            The worklists and work items, keyed by ID, in creation order
+        """
+        worklists: Dict[str, Dict[str, Any]] = {}
+        work_items: Dict[str, Dict[str, Any]] = {}
+        
+        for record in self._read_records(self.snapshot_path):
+            self._apply(record, worklists, work_items)
+        
+        # A journal left by an interrupted compaction precedes the current one
+        journal_records = 0
+        for path in (self.compacting_journal_path, self.journal_path):
+            for record in self._read_records(path):
+                self._apply(record, worklists, work_items)
+                journal_records += 1
+        
+        with self._lock:
+            self._journal_records = journal_records
+        return worklists, work_items
+    
+    def _read_records(self, path: str) -> Iterator[Dict[str, Any]]:
+        """Yield the records of a file, reading it through a memory map."""
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return
+        
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b""):
+                    if not line.endswith(b"\n"):
+                        self.logger.warning(f"Ignoring truncated record at the end of {path}")
+                        break
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        self.logger.warning(f"Ignoring corrupt record in {path}")
+    
+    @staticmethod
+    def _apply(
+        record: Dict[str, Any],
+        worklists: Dict[str, Dict[str, Any]],
+        work_items: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Apply a record to the recovered state."""
+        op = record.get("op")
+        if op == PUT_WORKLIST:
+            worklists[record["worklist"]["id"]] = record["worklist"]
+        elif op == DELETE_WORKLIST:
+            worklists.pop(record["id"], None)
+            for item_id in [item_id for item_id, item in work_items.items()
+                            if item["worklist_id"] == record["id"]]:
+                del work_items[item_id]
+        elif op == PUT_ITEM:
+            work_items[record["item"]["id"]] = record["item"]
+        elif op == DELETE_ITEM:
+            work_items.pop(record["id"], None)
+    
+    def put_worklist(self, worklist: Dict[str, Any]) -> None:
+        """Record the current state of a worklist."""
+        self.append({"op": PUT_WORKLIST, "worklist": worklist})
+    
+    def delete_worklist(self, worklist_id: str) -> None:
+        """Record the deletion of a worklist and all its items."""
+        self.append({"op": DELETE_WORKLIST, "id": worklist_id})
+    
+    def put_item(self, item: Dict[str, Any]) -> None:
+        """Record the current state of a work item."""
+        self.append({"op": PUT_ITEM, "item": item})
+    
+    def delete_item(self, item_id: str) -> None:
+        """Record the deletion of a work item."""
+        self.append({"op": DELETE_ITEM, "id": item_id})
+    
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Append a record to the journal.
+        
+        Args:
+            record: The record to append
+        """
+        line = json.dumps(record, default=str).encode("utf-8") + b"\n"
+        with self._lock:
+            self._journal.write(line)
+            self._journal.flush()
+            self._journal_records += 1
+            self._pending += 1
+            self.stats["appended"] += 1
+            
+            if self._pending >= self.sync_batch_size:
+                self._sync_locked()
+            elif self._sync_timer is None:
+                self._sync_timer = threading.Timer(self.sync_interval, self.sync)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+    
+    def sync(self) -> None:
+        """Flush pending records to stable storage."""
+        with self._lock:
+            self._sync_locked()
+    
+    def _sync_locked(self) -> None:
+        """Flush pending records to stable storage (caller holds the lock)."""
+        if self._sync_timer is not None:
+            self._sync_timer.cancel()
+            self._sync_timer = None
+        if self._pending == 0 or self._journal.closed:
+            return
+        os.fsync(self._journal.fileno())
+        self._pending = 0
+        self.stats["syncs"] += 1
+    
+    @property
+    def compaction_due(self) -> bool:
+        """Whether the journal has grown past snapshot_every records (and no compaction is running)."""
+        return not self._compacting and self._journal_records >= self.snapshot_every
+    
+    def compact(self, worklists: Dict[str, Dict[str, Any]], work_items: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Write a snapshot of the full state and truncate the journal.
+        
+        Args:
+            worklists: All worklists, keyed by ID
+            work_items: All work items, keyed by ID
+        """
+        self.start_compaction()
+        self.finish_compaction(worklists, work_items)
+    
+    def start_compaction(self) -> None:
+        """
+        Move the journal aside and continue in a new, empty journal.
+        
+        The state passed to the following finish_compaction() must include
+        every record appended before this call. If a previous compaction did
+        not finish, the current journal is appended to the journal it left.
+        """
+        with self._lock:
+            self._sync_locked()
+            self._journal.close()
+            if os.path.exists(self.compacting_journal_path):
+                with open(self.journal_path, "rb") as src, open(self.compacting_journal_path, "ab") as dst:
+                    shutil.copyfileobj(src, dst)
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                os.remove(self.journal_path)
+            else:
+                os.replace(self.journal_path, self.compacting_journal_path)
+            self._journal = open(self.journal_path, "ab")
+            self._sync_directory()
+            self._journal_records = 0
+            self._compacting = True
+    
+    def finish_compaction(self, worklists: Dict[str, Dict[str, Any]], work_items: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Write a snapshot of the state and drop the journal moved aside by start_compaction().
+        
+        This may run in another thread while records are appended. The
+        snapshot is written to a temporary file, synced and renamed over the
+        previous one, so a crash leaves either the old or the new snapshot in
+        place. Replaying the old journal on top of the new snapshot (if the
+        crash happens before it is removed) yields the same state.
+        
+        Args:
+            worklists: All worklists, keyed by ID, as of start_compaction()
+            work_items: All work items, keyed by ID, as of start_compaction()
+        """
+        start = time.time()
+        temp_path = self.snapshot_path + ".tmp"
+        
+        try:
+            with open(temp_path, "wb") as f:
+                for worklist in worklists.values():
+                    f.write(json.dumps({"op": PUT_WORKLIST, "worklist": worklist}, default=str).encode("utf-8") + b"\n")
+                for item in work_items.values():
+                    f.write(json.dumps({"op": PUT_ITEM, "item": item}, default=str).encode("utf-8") + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.snapshot_path)
+            os.remove(self.compacting_journal_path)
+            self._sync_directory()
+        finally:
+            with self._lock:
+                self._compacting = False
+        
+        with self._lock:
+            self.stats["compactions"] += 1
+        self.logger.debug(
+            f"Compacted {len(worklists)} worklists and {len(work_items)} items "
+            f"in {(time.time() - start) * 1000:.1f}ms"
+        )
+    
+    def _sync_directory(self) -> None:
+        """Make a rename in the storage directory durable (where supported)."""
+        try:
+            fd = os.open(self.storage_dir, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the journal.
+        
+        Returns:
+            Dictionary with the number of journal records, unsynced records,
+            and counts of appends, syncs and compactions
+        """
+        with self._lock:
+            return {
+                "journal_records": self._journal_records,
+                "pending_sync": self._pending,
+                **self.stats
+            }
+    
+    def close(self) -> None:
+        """Sync pending records and close the journal."""
+        with self._lock:
+            self._sync_locked()
+            self._journal.close()
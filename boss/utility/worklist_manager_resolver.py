@@ -8,9 +8,13 @@ This resolver provides functionality for:
 - Tracking work item status and history
 """
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 import json
 import asyncio
+import heapq
+import itertools
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 import uuid
 
@@ -18,6 +22,15 @@ from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
 from boss.core.task_models import Task, TaskResult
 from boss.core.task_status import TaskStatus
 from boss.utility.task_prioritization_resolver import TaskPrioritizationResolver
+from boss.utility.worklist_journal import WorklistJournal
+
+
+def _copy_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a worklist or work item, including the lists and dicts it holds, for a snapshot."""
+    return {
+        key: list(value) if isinstance(value, list) else dict(value) if isinstance(value, dict) else value
+        for key, value in record.items()
+    }
 
 
 class WorklistOperation(str, Enum):
@@ -34,6 +47,9 @@ class WorklistOperation(str, Enum):
     GET_NEXT_ITEM = "GET_NEXT_ITEM"
     MARK_ITEM_COMPLETE = "MARK_ITEM_COMPLETE"
     MARK_ITEM_FAILED = "MARK_ITEM_FAILED"
+    CLAIM_MANY = "CLAIM_MANY"
+    EXTEND_LEASE = "EXTEND_LEASE"
+    RELEASE_ITEM = "RELEASE_ITEM"
 
 
 class WorkItemStatus(str, Enum):
@@ -53,21 +69,37 @@ class WorklistManagerResolver(TaskResolver):
     This resolver allows for creating and managing worklists, adding and removing
     items, updating item details, and prioritizing work items based on various criteria.
     It can also track work item status and history.
+    
+    Consumers claim items with GET_NEXT_ITEM or CLAIM_MANY, which lease them
+    to a worker for a visibility timeout. Workers extend the lease with
+    EXTEND_LEASE while they work on an item; items whose lease expires are
+    returned to the pending queue and can be claimed again. Claims never await
+    between selecting and leasing an item, so concurrent claims on the same
+    event loop cannot return the same item.
     """
     
     def __init__(
         self,
         storage_dir: str,
         prioritization_resolver: Optional[TaskPrioritizationResolver] = None,
-        metadata: Optional[TaskResolverMetadata] = None
+        metadata: Optional[TaskResolverMetadata] = None,
+        sync_interval: float = 0.05,
+        snapshot_every: int = 10000,
+        visibility_timeout: float = 300.0
     ):
         """
         Initialize the WorklistManagerResolver.
         
+        Worklists and items stored in storage_dir by a previous instance are
+        recovered on initialization.
+        
         Args:
             storage_dir: Directory where worklist data will be stored
             prioritization_resolver: Optional TaskPrioritizationResolver for sorting work items
             metadata: Optional metadata for the resolver
+            sync_interval: Maximum seconds a mutation waits to be synced to disk
+            snapshot_every: Number of journaled mutations after which a snapshot is written
+            visibility_timeout: Default seconds a claimed item stays leased to its worker
         """
         super().__init__(metadata or TaskResolverMetadata(
             name="WorklistManagerResolver",
@@ -77,11 +109,279 @@ class WorklistManagerResolver(TaskResolver):
         
         self.storage_dir = storage_dir
         self.prioritization_resolver = prioritization_resolver
+        self.visibility_timeout = visibility_timeout
         
-        # In-memory storage of worklists and items
-        # In a production system, this would be persisted to disk or a database
+        # In-memory storage of worklists and items, persisted through the journal
         self.worklists: Dict[str, Dict[str, Any]] = {}
         self.work_items: Dict[str, Dict[str, Any]] = {}
+        
+        # Secondary indexes: item IDs by worklist, by status, and by both
+        # (dicts used as insertion-ordered sets)
+        self._items_by_worklist: Dict[str, Dict[str, None]] = {}
+        self._items_by_status: Dict[str, Dict[str, None]] = {}
+        self._items_by_worklist_status: Dict[Tuple[str, str], Dict[str, None]] = {}
+        
+        # Per-worklist heaps of pending items, ordered by priority (highest first)
+        # then by creation order. Entries are invalidated lazily: an entry is
+        # only valid while it is the current entry of a pending item.
+        self._pending_heaps: Dict[str, List[Tuple[Any, int, str]]] = {}
+        self._heap_entries: Dict[str, Tuple[Any, int, str]] = {}
+        self._item_sequence: Dict[str, int] = {}
+        self._sequence = itertools.count()
+        
+        # Heap of (lease_expires_at, item_id, lease_id) for leased items,
+        # invalidated lazily like the pending heaps
+        self._lease_heap: List[Tuple[float, str, str]] = []
+        
+        self.journal = WorklistJournal(storage_dir, sync_interval=sync_interval, snapshot_every=snapshot_every)
+        self.worklists, self.work_items = self.journal.load()
+        
+        # Snapshots are written by a background thread from a copy of the state
+        self._compaction_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="worklist-compaction")
+        self._compaction: Optional[Future] = None
+        for item in self.work_items.values():
+            self._index_item(item)
+    
+    def _persist_worklist(self, worklist: Dict[str, Any]) -> None:
+        """Journal the current state of a worklist."""
+        self.journal.put_worklist(worklist)
+        self._maybe_compact()
+    
+    def _persist_item(self, item: Dict[str, Any]) -> None:
+        """Journal the current state of a work item."""
+        self.journal.put_item(item)
+        self._maybe_compact()
+    
+    def _maybe_compact(self) -> None:
+        """
+        Start writing a snapshot once the journal has grown large enough.
+        
+        The journal is switched over and the state copied on the caller's
+        thread; serializing and syncing the snapshot happens in a background
+        thread, so it does not block the event loop.
+        """
+        if not self.journal.compaction_due:
+            return
+        self.journal.start_compaction()
+        worklists = {worklist_id: _copy_record(worklist) for worklist_id, worklist in self.worklists.items()}
+        work_items = {item_id: _copy_record(item) for item_id, item in self.work_items.items()}
+        self._compaction = self._compaction_executor.submit(self.journal.finish_compaction, worklists, work_items)
+        self._compaction.add_done_callback(self._on_compaction_done)
+    
+    def _on_compaction_done(self, compaction: Future) -> None:
+        """Log a failed background compaction (the journal is kept, so no state is lost)."""
+        error = compaction.exception()
+        if error is not None:
+            self.logger.error(f"Worklist compaction failed: {str(error)}")
+    
+    def close(self) -> None:
+        """Wait for a running compaction, sync pending mutations to disk and close the journal."""
+        self._compaction_executor.shutdown(wait=True)
+        self.journal.close()
+    
+    def _index_item(self, item: Dict[str, Any]) -> None:
+        """Add a work item to the secondary indexes and, if pending, to its worklist's heap."""
+        item_id = item["id"]
+        worklist_id = item["worklist_id"]
+        status = item["status"]
+        
+        if item_id not in self._item_sequence:
+            self._item_sequence[item_id] = next(self._sequence)
+        self._items_by_worklist.setdefault(worklist_id, {})[item_id] = None
+        self._items_by_status.setdefault(status, {})[item_id] = None
+        self._items_by_worklist_status.setdefault((worklist_id, status), {})[item_id] = None
+        
+        if status == WorkItemStatus.PENDING.value:
+            self._push_pending(item)
+        elif item.get("lease_id") and item.get("lease_expires_at") is not None:
+            heapq.heappush(self._lease_heap, (item["lease_expires_at"], item_id, item["lease_id"]))
+    
+    def _unindex_item(self, item: Dict[str, Any]) -> None:
+        """Remove a work item from the indexes (its heap entry is dropped lazily)."""
+        item_id = item["id"]
+        worklist_id = item["worklist_id"]
+        status = item["status"]
+        
+        self._items_by_worklist.get(worklist_id, {}).pop(item_id, None)
+        self._items_by_status.get(status, {}).pop(item_id, None)
+        self._items_by_worklist_status.get((worklist_id, status), {}).pop(item_id, None)
+        self._heap_entries.pop(item_id, None)
+        self._item_sequence.pop(item_id, None)
+    
+    def _set_item_status(self, item: Dict[str, Any], status: str) -> None:
+        """Change the status of a work item, keeping the indexes up to date."""
+        item_id = item["id"]
+        worklist_id = item["worklist_id"]
+        old_status = item["status"]
+        if old_status == status:
+            return
+        
+        self._items_by_status.get(old_status, {}).pop(item_id, None)
+        self._items_by_worklist_status.get((worklist_id, old_status), {}).pop(item_id, None)
+        item["status"] = status
+        self._items_by_status.setdefault(status, {})[item_id] = None
+        self._items_by_worklist_status.setdefault((worklist_id, status), {})[item_id] = None
+        
+        if status == WorkItemStatus.PENDING.value:
+            self._push_pending(item)
+        else:
+            self._heap_entries.pop(item_id, None)
+    
+    def _push_pending(self, item: Dict[str, Any]) -> None:
+        """Push a new heap entry for a pending item, superseding any previous entry."""
+        item_id = item["id"]
+        worklist_id = item["worklist_id"]
+        entry = (-item["priority"], self._item_sequence[item_id], item_id)
+        self._heap_entries[item_id] = entry
+        
+        heap = self._pending_heaps.setdefault(worklist_id, [])
+        heapq.heappush(heap, entry)
+        
+        # Rebuild the heap when stale entries dominate it
+        pending = len(self._items_by_worklist_status.get((worklist_id, WorkItemStatus.PENDING.value), ()))
+        if len(heap) > 64 and len(heap) > 2 * pending:
+            self._rebuild_heap(worklist_id)
+    
+    def _rebuild_heap(self, worklist_id: str) -> None:
+        """Rebuild a worklist's heap from the current entries of its pending items."""
+        pending_ids = self._items_by_worklist_status.get((worklist_id, WorkItemStatus.PENDING.value), {})
+        heap = [self._heap_entries[item_id] for item_id in pending_ids if item_id in self._heap_entries]
+        heapq.heapify(heap)
+        self._pending_heaps[worklist_id] = heap
+    
+    def _requeue_expired_leases(self) -> int:
+        """
+        Return items whose lease has expired to the pending queue.
+        
+        Returns:
+            The number of requeued items
+        """
+        now = time.time()
+        requeued = 0
+        while self._lease_heap and self._lease_heap[0][0] <= now:
+            _, item_id, lease_id = heapq.heappop(self._lease_heap)
+            item = self.work_items.get(item_id)
+            if (
+                item is None
+                or item.get("lease_id") != lease_id
+                or item["status"] != WorkItemStatus.IN_PROGRESS.value
+                or item.get("lease_expires_at", now + 1) > now
+            ):
+                continue
+            
+            self._release_lease(item, "Lease expired")
+            requeued += 1
+        return requeued
+    
+    def _release_lease(self, item: Dict[str, Any], reason: str) -> None:
+        """Clear an item's lease and return it to the pending queue."""
+        worker_id = item.get("claimed_by")
+        self._clear_lease(item)
+        self._set_item_status(item, WorkItemStatus.PENDING.value)
+        item["updated_at"] = datetime.now().isoformat()
+        item["history"].append({
+            "timestamp": datetime.now().isoformat(),
+            "field": "status",
+            "old_value": WorkItemStatus.IN_PROGRESS.value,
+            "new_value": WorkItemStatus.PENDING.value,
+            "worker_id": worker_id,
+            "reason": reason
+        })
+        self._persist_item(item)
+    
+    @staticmethod
+    def _clear_lease(item: Dict[str, Any]) -> None:
+        """Remove the lease fields from an item."""
+        for field in ("claimed_by", "lease_id", "lease_expires_at"):
+            item.pop(field, None)
+    
+    def _check_lease(self, item: Dict[str, Any], lease_id: Optional[str]) -> Optional[str]:
+        """
+        Check that a caller holds the lease of an item.
+        
+        Args:
+            item: The work item
+            lease_id: The lease ID presented by the caller (None to skip the check)
+            
+        Returns:
+            An error message if the lease is not held, None otherwise
+        """
+        if lease_id is None:
+            return None
+        self._requeue_expired_leases()
+        if item.get("lease_id") != lease_id:
+            return f"Lease {lease_id} is not held on work item {item['id']}"
+        return None
+    
+    def claim_many(
+        self,
+        worklist_id: str,
+        count: int,
+        worker_id: Optional[str] = None,
+        visibility_timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Claim up to count of the highest priority pending items of a worklist.
+        
+        Claimed items are marked IN_PROGRESS and leased to the worker until
+        the visibility timeout has passed.
+        
+        Args:
+            worklist_id: The ID of the worklist
+            count: Maximum number of items to claim
+            worker_id: Identifier of the claiming worker
+            visibility_timeout: Lease duration in seconds (defaults to the resolver's)
+            
+        Returns:
+            The claimed items, highest priority first
+        """
+        timeout = visibility_timeout if visibility_timeout is not None else self.visibility_timeout
+        self._requeue_expired_leases()
+        
+        claimed = []
+        while len(claimed) < count:
+            item = self._pop_pending(worklist_id)
+            if item is None:
+                break
+            
+            lease_id = str(uuid.uuid4())
+            expires_at = time.time() + timeout
+            self._set_item_status(item, WorkItemStatus.IN_PROGRESS.value)
+            item["claimed_by"] = worker_id
+            item["lease_id"] = lease_id
+            item["lease_expires_at"] = expires_at
+            item["updated_at"] = datetime.now().isoformat()
+            item["history"].append({
+                "timestamp": datetime.now().isoformat(),
+                "field": "status",
+                "old_value": WorkItemStatus.PENDING.value,
+                "new_value": WorkItemStatus.IN_PROGRESS.value,
+                "worker_id": worker_id
+            })
+            heapq.heappush(self._lease_heap, (expires_at, item["id"], lease_id))
+            self._persist_item(item)
+            claimed.append(item)
+        
+        return claimed
+    
+    def _pop_pending(self, worklist_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Pop the highest priority pending item of a worklist.
+        
+        Args:
+            worklist_id: The ID of the worklist
+            
+        Returns:
+            The work item, or None if the worklist has no pending items
+        """
+        heap = self._pending_heaps.get(worklist_id)
+        while heap:
+            entry = heapq.heappop(heap)
+            item_id = entry[2]
+            if self._heap_entries.get(item_id) is entry:
+                del self._heap_entries[item_id]
+                return self.work_items[item_id]
+        return None
     
     async def _create_worklist(self, task: Task) -> Dict[str, Any]:
         """Create a new worklist."""
@@ -114,6 +414,7 @@ class WorklistManagerResolver(TaskResolver):
         }
         
         self.worklists[worklist_id] = worklist
+        self._persist_worklist(worklist)
         
         return {
             "status": "success",
@@ -137,14 +438,19 @@ class WorklistManagerResolver(TaskResolver):
             }
         
         # Delete associated work items
-        items_to_delete = [item_id for item_id, item in self.work_items.items() 
-                           if item.get("worklist_id") == worklist_id]
+        items_to_delete = list(self._items_by_worklist.pop(worklist_id, {}))
         
         for item_id in items_to_delete:
-            del self.work_items[item_id]
+            self._unindex_item(self.work_items.pop(item_id))
+        
+        for status in WorkItemStatus:
+            self._items_by_worklist_status.pop((worklist_id, status.value), None)
+        self._pending_heaps.pop(worklist_id, None)
             
         # Delete the worklist
         del self.worklists[worklist_id]
+        self.journal.delete_worklist(worklist_id)
+        self._maybe_compact()
         
         return {
             "status": "success",
@@ -203,10 +509,13 @@ class WorklistManagerResolver(TaskResolver):
         }
         
         self.work_items[item_id] = work_item
+        self._index_item(work_item)
         
         # Update worklist stats
         self.worklists[worklist_id]["item_count"] += 1
         self.worklists[worklist_id]["updated_at"] = datetime.now().isoformat()
+        self._persist_item(work_item)
+        self._persist_worklist(self.worklists[worklist_id])
         
         return {
             "status": "success",
@@ -242,7 +551,10 @@ class WorklistManagerResolver(TaskResolver):
         self.worklists[worklist_id]["updated_at"] = datetime.now().isoformat()
         
         # Delete the item
+        self._unindex_item(item)
         del self.work_items[item_id]
+        self.journal.delete_item(item_id)
+        self._persist_worklist(self.worklists[worklist_id])
         
         return {
             "status": "success",
@@ -281,8 +593,12 @@ class WorklistManagerResolver(TaskResolver):
                         "new_value": data[field]
                     })
                     item[field] = data[field]
+                    
+                    if field == "priority" and item["status"] == WorkItemStatus.PENDING.value:
+                        self._push_pending(item)
         
         item["updated_at"] = datetime.now().isoformat()
+        self._persist_item(item)
         
         return {
             "status": "success",
@@ -322,16 +638,17 @@ class WorklistManagerResolver(TaskResolver):
         worklist_id = data.get("worklist_id")
         status = data.get("status")
         
-        # Filter items
-        filtered_items = list(self.work_items.values())
+        # Look up matching items in the secondary indexes
+        if worklist_id and status:
+            item_ids = self._items_by_worklist_status.get((worklist_id, status), {})
+        elif worklist_id:
+            item_ids = self._items_by_worklist.get(worklist_id, {})
+        elif status:
+            item_ids = self._items_by_status.get(status, {})
+        else:
+            item_ids = self.work_items
         
-        if worklist_id:
-            filtered_items = [item for item in filtered_items 
-                             if item["worklist_id"] == worklist_id]
-                             
-        if status:
-            filtered_items = [item for item in filtered_items 
-                             if item["status"] == status]
+        filtered_items = [self.work_items[item_id] for item_id in item_ids]
         
         return {
             "status": "success",
@@ -356,8 +673,7 @@ class WorklistManagerResolver(TaskResolver):
             }
             
         # Get items from this worklist
-        items = [item for item in self.work_items.values() 
-                if item["worklist_id"] == worklist_id]
+        items = [self.work_items[item_id] for item_id in self._items_by_worklist.get(worklist_id, {})]
                 
         # Sort by priority field (higher values come first)
         items.sort(key=lambda x: x["priority"], reverse=True)
@@ -388,37 +704,132 @@ class WorklistManagerResolver(TaskResolver):
                 "message": f"Worklist with ID {worklist_id} not found"
             }
             
-        # Get pending items from this worklist
-        pending_items = [item for item in self.work_items.values() 
-                        if item["worklist_id"] == worklist_id and 
-                        item["status"] == WorkItemStatus.PENDING.value]
+        # Claim the highest priority pending item from this worklist
+        claimed = self.claim_many(
+            worklist_id, 1, data.get("worker_id"), data.get("visibility_timeout")
+        )
                         
-        if not pending_items:
+        if not claimed:
             return {
                 "status": "success",
                 "message": "No pending items in this worklist",
                 "work_item": None
             }
+        
+        return {
+            "status": "success",
+            "work_item": claimed[0]
+        }
+    
+    async def _claim_many(self, task: Task) -> Dict[str, Any]:
+        """Claim several of the highest priority work items at once."""
+        data = task.input_data
+        if not isinstance(data, dict):
+            return {
+                "status": "error",
+                "message": "Input data must be a dictionary"
+            }
             
-        # Sort by priority (higher values come first)
-        pending_items.sort(key=lambda x: x["priority"], reverse=True)
+        worklist_id = data.get("worklist_id")
+        if not worklist_id or worklist_id not in self.worklists:
+            return {
+                "status": "error",
+                "message": f"Worklist with ID {worklist_id} not found"
+            }
+            
+        count = data.get("count", 1)
+        if not isinstance(count, int) or count < 1:
+            return {
+                "status": "error",
+                "message": "count must be a positive integer"
+            }
         
-        # Get the highest priority item
-        next_item = pending_items[0]
+        claimed = self.claim_many(
+            worklist_id, count, data.get("worker_id"), data.get("visibility_timeout")
+        )
         
-        # Mark it as in progress
-        next_item["status"] = WorkItemStatus.IN_PROGRESS.value
-        next_item["updated_at"] = datetime.now().isoformat()
-        next_item["history"].append({
-            "timestamp": datetime.now().isoformat(),
-            "field": "status",
-            "old_value": WorkItemStatus.PENDING.value,
-            "new_value": WorkItemStatus.IN_PROGRESS.value
-        })
+        return {
+            "status": "success",
+            "items_count": len(claimed),
+            "work_items": claimed
+        }
+    
+    async def _extend_lease(self, task: Task) -> Dict[str, Any]:
+        """Extend the lease of a claimed work item (worker heartbeat)."""
+        data = task.input_data
+        if not isinstance(data, dict):
+            return {
+                "status": "error",
+                "message": "Input data must be a dictionary"
+            }
+            
+        item_id = data.get("item_id")
+        if not item_id or item_id not in self.work_items:
+            return {
+                "status": "error",
+                "message": f"Work item with ID {item_id} not found"
+            }
+        
+        item = self.work_items[item_id]
+        lease_id = data.get("lease_id")
+        if not lease_id:
+            return {
+                "status": "error",
+                "message": "lease_id is required"
+            }
+        
+        lease_error = self._check_lease(item, lease_id)
+        if lease_error:
+            return {
+                "status": "error",
+                "message": lease_error
+            }
+        
+        timeout = data.get("visibility_timeout", self.visibility_timeout)
+        item["lease_expires_at"] = time.time() + timeout
+        heapq.heappush(self._lease_heap, (item["lease_expires_at"], item_id, lease_id))
+        self._persist_item(item)
+        
+        return {
+            "status": "success",
+            "work_item": item
+        }
+    
+    async def _release_item(self, task: Task) -> Dict[str, Any]:
+        """Return a claimed work item to the pending queue."""
+        data = task.input_data
+        if not isinstance(data, dict):
+            return {
+                "status": "error",
+                "message": "Input data must be a dictionary"
+            }
+            
+        item_id = data.get("item_id")
+        if not item_id or item_id not in self.work_items:
+            return {
+                "status": "error",
+                "message": f"Work item with ID {item_id} not found"
+            }
+        
+        item = self.work_items[item_id]
+        lease_error = self._check_lease(item, data.get("lease_id"))
+        if lease_error:
+            return {
+                "status": "error",
+                "message": lease_error
+            }
+        
+        if item["status"] != WorkItemStatus.IN_PROGRESS.value:
+            return {
+                "status": "error",
+                "message": f"Work item {item_id} is not in progress"
+            }
+        
+        self._release_lease(item, data.get("reason", "Released by worker"))
         
         return {
             "status": "success",
-            "work_item": next_item
+            "work_item": item
         }
         
     async def _mark_item_complete(self, task: Task) -> Dict[str, Any]:
@@ -440,9 +851,17 @@ class WorklistManagerResolver(TaskResolver):
         item = self.work_items[item_id]
         worklist_id = item["worklist_id"]
         
+        lease_error = self._check_lease(item, data.get("lease_id"))
+        if lease_error:
+            return {
+                "status": "error",
+                "message": lease_error
+            }
+        
         # Update item status
         old_status = item["status"]
-        item["status"] = WorkItemStatus.COMPLETED.value
+        self._clear_lease(item)
+        self._set_item_status(item, WorkItemStatus.COMPLETED.value)
         item["updated_at"] = datetime.now().isoformat()
         item["completed_at"] = datetime.now().isoformat()
         item["history"].append({
@@ -455,6 +874,8 @@ class WorklistManagerResolver(TaskResolver):
         # Update worklist stats
         self.worklists[worklist_id]["completed_count"] += 1
         self.worklists[worklist_id]["updated_at"] = datetime.now().isoformat()
+        self._persist_item(item)
+        self._persist_worklist(self.worklists[worklist_id])
         
         return {
             "status": "success",
@@ -482,9 +903,17 @@ class WorklistManagerResolver(TaskResolver):
         item = self.work_items[item_id]
         worklist_id = item["worklist_id"]
         
+        lease_error = self._check_lease(item, data.get("lease_id"))
+        if lease_error:
+            return {
+                "status": "error",
+                "message": lease_error
+            }
+        
         # Update item status
         old_status = item["status"]
-        item["status"] = WorkItemStatus.FAILED.value
+        self._clear_lease(item)
+        self._set_item_status(item, WorkItemStatus.FAILED.value)
         item["updated_at"] = datetime.now().isoformat()
         item["failed_at"] = datetime.now().isoformat()
         item["failure_reason"] = failure_reason
@@ -498,6 +927,8 @@ class WorklistManagerResolver(TaskResolver):
         # Update worklist stats
         self.worklists[worklist_id]["failed_count"] += 1
         self.worklists[worklist_id]["updated_at"] = datetime.now().isoformat()
+        self._persist_item(item)
+        self._persist_worklist(self.worklists[worklist_id])
         
         return {
             "status": "success",
@@ -525,7 +956,9 @@ class WorklistManagerResolver(TaskResolver):
             "status": "healthy",
             "worklists_count": len(self.worklists),
             "work_items_count": len(self.work_items),
-            "prioritization_resolver_available": self.prioritization_resolver is not None
+            "in_progress_count": len(self._items_by_status.get(WorkItemStatus.IN_PROGRESS.value, ())),
+            "prioritization_resolver_available": self.prioritization_resolver is not None,
+            "storage": self.journal.get_stats()
         }
         
     async def resolve(self, task: Task) -> TaskResult:
@@ -594,6 +1027,12 @@ class WorklistManagerResolver(TaskResolver):
                 result = await self._mark_item_complete(task)
             elif operation == WorklistOperation.MARK_ITEM_FAILED:
                 result = await self._mark_item_failed(task)
+            elif operation == WorklistOperation.CLAIM_MANY:
+                result = await self._claim_many(task)
+            elif operation == WorklistOperation.EXTEND_LEASE:
+                result = await self._extend_lease(task)
+            elif operation == WorklistOperation.RELEASE_ITEM:
+                result = await self._release_item(task)
             else:
                 return TaskResult(
                     task_id=task.id,
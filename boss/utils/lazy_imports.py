@@ -0,0 +1,43 @@
+"""
+Lazy attribute loading for packages.
+
+This module provides lazy_attributes, which builds the module-level
+__getattr__ and __dir__ functions (PEP 562) that let a package export names
+from its submodules without importing those submodules until first use.
+"""
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_attributes(
+    package_name: str,
+    exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build __getattr__ and __dir__ for a package with lazily imported exports.
+    
+    On first access, an exported name is imported from its submodule and
+    stored in the package namespace, so later lookups are plain attribute
+    reads. Import errors (e.g. a missing optional dependency) surface when the
+    name is first used, not when the package is imported.
+    
+    Args:
+        package_name: The package's __name__
+        exports: Mapping of exported names to the modules defining them
+        
+    Returns:
+        The package's __getattr__ and __dir__ functions
+    """
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(sys.modules[package_name], name, value)
+        return value
+    
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(exports))
+    
+    return __getattr__, __dir__
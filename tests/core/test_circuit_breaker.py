@@ -0,0 +1,201 @@
+"""
+Tests for the CircuitBreaker class.
+
+This module contains tests for the state transitions of the CircuitBreaker
+and its integration with TaskResolver.__call__.
+"""
+import pytest
+import asyncio
+import pickle
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from boss.core.task_base import Task
+from boss.core.task_status import TaskStatus
+from boss.core.task_result import TaskResult
+from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
+from boss.core.circuit_breaker import CircuitBreaker, CircuitState
+from boss.utility.api_wrapper_resolver import APIWrapperResolver
+
+
+class FlakyResolver(TaskResolver):
+    """A resolver that fails while its `failing` flag is set."""
+    
+    def __init__(self) -> None:
+        super().__init__(TaskResolverMetadata(
+            name="flaky",
+            version="1.0.0",
+            description="Flaky resolver for testing"
+        ))
+        self.failing = True
+        self.calls = 0
+    
+    async def resolve(self, task: Task) -> Dict[str, Any]:
+        """Fail or succeed depending on the failing flag."""
+        self.calls += 1
+        if self.failing:
+            raise ConnectionError("Service unavailable")
+        return {"ok": True}
+
+
+def test_opens_after_consecutive_failures() -> None:
+    """Test that the breaker opens after failure_threshold consecutive failures."""
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+    
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+    
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.allow_request() is False
+    assert breaker.get_state()["rejected"] == 1
+
+
+def test_half_open_trial_closes_or_reopens() -> None:
+    """Test that a trial call after the recovery timeout closes or reopens the breaker."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.01)
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    
+    time.sleep(0.02)
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow_request() is True
+    # Only one trial call at a time
+    assert breaker.allow_request() is False
+    
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.get_state()["times_opened"] == 2
+    
+    time.sleep(0.02)
+    assert breaker.allow_request() is True
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_slow_calls_count_as_failures() -> None:
+    """Test that successful calls above the latency threshold count as failures."""
+    breaker = CircuitBreaker(failure_threshold=2, slow_call_threshold_ms=100)
+    
+    breaker.record_success(latency_ms=50)
+    breaker.record_success(latency_ms=500)
+    breaker.record_success(latency_ms=500)
+    
+    state = breaker.get_state()
+    assert state["state"] == "open"
+    assert state["slow_calls"] == 2
+    assert state["avg_latency_ms"] == pytest.approx(350)
+
+
+def test_breaker_is_picklable() -> None:
+    """Test that a breaker survives pickling, e.g. for process pool resolvers."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure()
+    
+    restored = pickle.loads(pickle.dumps(breaker))
+    assert restored.state == CircuitState.OPEN
+    restored.reset()
+    assert restored.allow_request() is True
+
+
+def _run(coro: Any) -> Any:
+    """Run a coroutine on a private event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_resolver_call_feeds_breaker_and_fails_fast() -> None:
+    """Test that __call__ records outcomes and fails fast while the breaker is open."""
+    resolver = FlakyResolver()
+    resolver.circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+    
+    for _ in range(2):
+        result = _run(resolver(Task(name="call")))
+        assert result.status == TaskStatus.ERROR
+    
+    result = _run(resolver(Task(name="call")))
+    assert result.error["type"] == "CircuitOpen"
+    assert resolver.calls == 2
+    
+    # Once the resolver recovers, a trial call closes the breaker
+    resolver.failing = False
+    time.sleep(0.06)
+    result = _run(resolver(Task(name="call")))
+    assert result.status == TaskStatus.COMPLETED
+    assert resolver.circuit_breaker.state == CircuitState.CLOSED
+
+
+class ValidatingResolver(TaskResolver):
+    """A resolver that rejects tasks without an operation."""
+    
+    def __init__(self) -> None:
+        super().__init__(TaskResolverMetadata(
+            name="validating",
+            version="1.0.0",
+            description="Validating resolver for testing"
+        ))
+    
+    async def resolve(self, task: Task) -> TaskResult:
+        """Return an error result for invalid input."""
+        if "operation" not in task.input_data:
+            return TaskResult(
+                task_id=task.id,
+                status=TaskStatus.ERROR,
+                message="Missing required field: operation"
+            )
+        if task.input_data["operation"] == "slow":
+            await asyncio.sleep(0.5)
+        return TaskResult(task_id=task.id, status=TaskStatus.COMPLETED, output_data={})
+
+
+def test_client_errors_do_not_open_breaker() -> None:
+    """Test that invalid-input results and exceeded deadlines are not counted as failures."""
+    resolver = ValidatingResolver()
+    resolver.circuit_breaker = CircuitBreaker(failure_threshold=2)
+    
+    for _ in range(5):
+        result = _run(resolver(Task(name="invalid")))
+        assert result.status == TaskStatus.ERROR
+    
+    for _ in range(3):
+        task = Task(name="short deadline", input_data={"operation": "slow"})
+        task.metadata.expires_at = datetime.now() + timedelta(seconds=0.02)
+        result = _run(resolver(task))
+        assert result.message.startswith("Task deadline exceeded")
+    
+    state = resolver.circuit_breaker.get_state()
+    assert state["state"] == CircuitState.CLOSED.value
+    assert state["failures"] == 0
+    
+    result = _run(resolver(Task(name="valid", input_data={"operation": "noop"})))
+    assert result.status == TaskStatus.COMPLETED
+
+
+def test_api_request_errors_open_breaker() -> None:
+    """Test that failed API requests returned as error results open the breaker."""
+    resolver = APIWrapperResolver(
+        TaskResolverMetadata(name="api", version="1.0.0", description="API resolver for testing"),
+        base_url="http://api.example.invalid"
+    )
+    resolver.circuit_breaker = CircuitBreaker(failure_threshold=2)
+    
+    def failing_request(**kwargs: Any) -> Dict[str, Any]:
+        raise Exception("API request failed: 503 Service Unavailable")
+    resolver.request = failing_request  # type: ignore[method-assign]
+    
+    for _ in range(2):
+        result = _run(resolver(Task(name="api_request", input_data={"method": "GET", "endpoint": "/status"})))
+        assert result.status == TaskStatus.ERROR
+        assert result.error["error_type"] == "APIRequestError"
+    
+    assert resolver.circuit_breaker.state == CircuitState.OPEN
+    result = _run(resolver(Task(name="api_request", input_data={"method": "GET", "endpoint": "/status"})))
+    assert result.error["type"] == "CircuitOpen"
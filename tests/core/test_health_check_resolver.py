@@ -10,6 +10,7 @@ import unittest
 import asyncio
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timedelta
+from typing import Any, Dict
 
 from boss.core.task_models import Task, TaskResult, TaskStatus, TaskError
 from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
@@ -604,5 +605,62 @@ class TestHealthCheckResolver(unittest.TestCase):
         self.assertEqual(key, "test_resolver@1.0.0")
 
 
+
+class EchoResolver(MockResolver):
+    """Mock resolver that can also resolve tasks."""
+    
+    async def resolve(self, task: Task) -> Dict[str, Any]:
+        """Echo the task input."""
+        return dict(task.input_data)
+
+
+class TestHealthCheckCircuitBreakers(unittest.TestCase):
+    """Tests for circuit breaker reporting in the HealthCheckResolver."""
+    
+    def setUp(self) -> None:
+        """Set up a real registry with one resolver whose breaker is open."""
+        self.registry = TaskResolverRegistry(circuit_breaker_options={"failure_threshold": 1, "recovery_timeout": 60})
+        self.resolver = HealthCheckResolver(
+            metadata=TaskResolverMetadata(name="health_check", version="1.0.0", description="Health check resolver"),
+            registry=self.registry
+        )
+        self.target = EchoResolver(
+            TaskResolverMetadata(name="target", version="1.0.0", description="Target resolver")
+        )
+        self.registry.register(self.target)
+        self.registry.get_circuit_breaker("target").record_failure()
+    
+    def _run(self, coro: Any) -> Any:
+        """Run a coroutine on a private event loop."""
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+    
+    def test_check_resolver_reports_open_circuit(self) -> None:
+        """Test that a resolver with an open breaker is reported as unhealthy."""
+        result = self._run(self.resolver._check_resolver_health("target"))
+        
+        self.assertFalse(result.is_healthy)
+        self.assertEqual(result.error_message, "Circuit breaker open")
+        self.assertEqual(result.details["circuit_breaker"]["state"], "open")
+    
+    def test_get_and_reset_circuit_states(self) -> None:
+        """Test the get_circuit_states and reset_circuit_breaker operations."""
+        task = Task(name="health", input_data={"operation": "get_circuit_states"})
+        result = self._run(self.resolver._resolve_task(task))
+        self.assertEqual(result.output_data["circuit_breakers"]["target@1.0.0"]["state"], "open")
+        
+        task = Task(name="health", input_data={"operation": "reset_circuit_breaker", "resolver_name": "target"})
+        result = self._run(self.resolver._resolve_task(task))
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        self.assertEqual(result.output_data["state"], "closed")
+        
+        task = Task(name="health", input_data={"operation": "get_circuit_states", "resolver_name": "missing"})
+        result = self._run(self.resolver._resolve_task(task))
+        self.assertEqual(result.status, TaskStatus.ERROR)
+
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,259 @@
+"""
+Tests for resolver instrumentation hooks.
+
+This module contains tests for the hook registry run by TaskResolver.__call__
+and for the built-in latency, in-flight, payload size and profiling hooks.
+"""
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from typing import Any, Dict, List, Optional, Union
+
+from boss.core.task_base import Task
+from boss.core.task_result import TaskResult
+from boss.core.task_status import TaskStatus
+from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
+from boss.core.instrumentation import (
+    InFlightGaugeHook,
+    LatencyHistogramHook,
+    PayloadSizeHook,
+    ProfilingHook,
+    ResolverHook,
+    ResolverHookRegistry,
+    resolver_hooks
+)
+
+
+class SleepResolver(TaskResolver):
+    """Resolver that sleeps, then echoes its input or fails on request."""
+    
+    async def resolve(self, task: Task) -> Union[Dict[str, Any], TaskResult]:
+        """Sleep for input_data["delay"] seconds, then echo the input."""
+        await asyncio.sleep(task.input_data.get("delay", 0.0))
+        if task.input_data.get("fail"):
+            raise ValueError("requested failure")
+        return {"echo": task.input_data.get("payload")}
+
+
+class RecordingHook(ResolverHook):
+    """Hook recording the calls it receives."""
+    
+    def __init__(self, name: str, calls: List[str]) -> None:
+        self.name = name
+        self.calls = calls
+        self.errors: List[Optional[BaseException]] = []
+    
+    def before_resolve(self, resolver: TaskResolver, task: Task) -> Any:
+        self.calls.append(f"{self.name}.before")
+        return self.name
+    
+    def after_resolve(self, resolver: TaskResolver, task: Task, result: TaskResult,
+                      duration_ms: float, state: Any) -> None:
+        self.calls.append(f"{state}.after")
+    
+    def on_error(self, resolver: TaskResolver, task: Task, result: Optional[TaskResult],
+                 error: Optional[BaseException], duration_ms: float, state: Any) -> None:
+        self.calls.append(f"{state}.error")
+        self.errors.append(error)
+
+
+class FailingHook(ResolverHook):
+    """Hook raising from every method."""
+    
+    def before_resolve(self, resolver: TaskResolver, task: Task) -> Any:
+        raise RuntimeError("broken hook")
+    
+    def after_resolve(self, resolver: TaskResolver, task: Task, result: TaskResult,
+                      duration_ms: float, state: Any) -> None:
+        raise RuntimeError("broken hook")
+
+
+class TestResolverHooks(unittest.TestCase):
+    """Tests for the hooks run by TaskResolver.__call__."""
+    
+    def setUp(self):
+        """Set up a resolver running the hooks of a private registry."""
+        self.registry = ResolverHookRegistry()
+        self.resolver = SleepResolver(TaskResolverMetadata(name="sleeper", version="1.0.0", description="Sleeps"))
+        self.resolver.hook_registry = self.registry
+    
+    def _run(self, coro: Any) -> Any:
+        """Run a coroutine on a private event loop."""
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+    
+    def _call(self, **input_data: Any) -> TaskResult:
+        """Call the resolver with a task built from the input data."""
+        return self._run(self.resolver(Task(name="instrumented", input_data=input_data)))
+    
+    def test_hooks_run_in_order(self):
+        """Test that before hooks run in order and after hooks in reverse order."""
+        calls: List[str] = []
+        first = self.registry.register(RecordingHook("first", calls))
+        self.registry.register(RecordingHook("second", calls))
+        self.registry.register(first)
+        
+        result = self._call(payload="x")
+        
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        self.assertEqual(len(self.registry), 2)
+        self.assertEqual(calls, ["first.before", "second.before", "second.after", "first.after"])
+        
+        self.assertTrue(self.registry.unregister(first))
+        self.assertFalse(self.registry.unregister(first))
+        calls.clear()
+        self._call()
+        self.assertEqual(calls, ["second.before", "second.after"])
+    
+    def test_error_result_and_exception(self):
+        """Test that error results and escaping exceptions are reported through on_error."""
+        calls: List[str] = []
+        hook = self.registry.register(RecordingHook("hook", calls))
+        
+        result = self._call(fail=True)
+        self.assertEqual(result.status, TaskStatus.ERROR)
+        self.assertEqual(calls, ["hook.before", "hook.error"])
+        self.assertEqual(hook.errors, [None])
+        
+        async def cancel_slow_call() -> None:
+            call = asyncio.create_task(self.resolver(Task(name="slow", input_data={"delay": 5.0})))
+            await asyncio.sleep(0.01)
+            call.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await call
+        self._run(cancel_slow_call())
+        self.assertEqual(calls[-1], "hook.error")
+        self.assertIsInstance(hook.errors[-1], asyncio.CancelledError)
+    
+    def test_failing_hook_is_ignored(self):
+        """Test that a hook raising does not affect the call or the other hooks."""
+        calls: List[str] = []
+        self.registry.register(FailingHook())
+        self.registry.register(RecordingHook("hook", calls))
+        
+        result = self._call()
+        
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        self.assertEqual(calls, ["hook.before", "hook.after"])
+    
+    def test_global_registry_is_default(self):
+        """Test that resolvers run the global hooks unless given their own registry."""
+        resolver = SleepResolver(TaskResolverMetadata(name="global", version="1.0.0", description="Sleeps"))
+        calls: List[str] = []
+        hook = resolver_hooks.register(RecordingHook("global", calls))
+        try:
+            self._run(resolver(Task(name="ok", input_data={})))
+            self._call()
+        finally:
+            resolver_hooks.unregister(hook)
+        
+        self.assertEqual(calls, ["global.before", "global.after"])
+    
+    def test_latency_histogram(self):
+        """Test that latencies are bucketed per resolver version."""
+        hook = self.registry.register(LatencyHistogramHook(buckets_ms=(5, 50, 500)))
+        
+        self._call()
+        self._call(delay=0.06)
+        self._call(fail=True)
+        
+        histogram = hook.get_histogram("sleeper", "1.0.0")
+        self.assertEqual(histogram["count"], 3)
+        self.assertEqual(histogram["errors"], 1)
+        self.assertEqual(histogram["buckets"]["5"], 2)
+        self.assertEqual(histogram["buckets"]["500"], 3)
+        self.assertEqual(histogram["buckets"]["+Inf"], 3)
+        self.assertGreaterEqual(histogram["max_ms"], 60)
+        self.assertLessEqual(histogram["p50_ms"], 5)
+        self.assertTrue(60 <= histogram["p99_ms"] <= 500)
+        
+        self.resolver.metadata.version = "2.0.0"
+        self._call()
+        self.assertEqual(set(hook.get_histograms()), {"sleeper@1.0.0", "sleeper@2.0.0"})
+        self.assertEqual(hook.get_histogram("sleeper")["count"], 4)
+        self.assertIsNone(hook.get_histogram("unknown"))
+    
+    def test_in_flight_gauge(self):
+        """Test that concurrent calls are counted while in progress."""
+        hook = self.registry.register(InFlightGaugeHook())
+        
+        async def concurrent_calls() -> int:
+            calls = [
+                asyncio.create_task(self.resolver(Task(name="slow", input_data={"delay": 0.05})))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            in_flight = hook.get_in_flight("sleeper")
+            await asyncio.gather(*calls)
+            return in_flight
+        
+        self.assertEqual(self._run(concurrent_calls()), 3)
+        self._call(fail=True)
+        self.assertEqual(hook.get_gauges(), {"sleeper@1.0.0": {"in_flight": 0, "peak": 3}})
+    
+    def test_payload_sizes(self):
+        """Test that input and output sizes are accounted, one call in sample_every."""
+        hook = self.registry.register(PayloadSizeHook(sample_every=2))
+        
+        for size in (10, 100, 1000, 10000):
+            self._call(payload="x" * size)
+        
+        totals = hook.get_totals()["sleeper@1.0.0"]
+        self.assertEqual(totals["calls"], 2)
+        self.assertGreater(totals["max_input_bytes"], 10000)
+        self.assertGreater(totals["max_output_bytes"], 10000)
+        self.assertTrue(10100 < totals["input_bytes"] < 10200)
+        
+        with self.assertRaises(ValueError):
+            PayloadSizeHook(sample_every=0)
+    
+    def test_profiling_samples(self):
+        """Test that one call in N is profiled and the stats are dumped."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            hook = self.registry.register(ProfilingHook(sample_every=3, output_dir=temp_dir))
+            
+            for _ in range(7):
+                self._call()
+            
+            self.assertEqual(hook.get_samples(), {"sleeper@1.0.0": 2})
+            hook.flush()
+            self.assertTrue(os.path.exists(os.path.join(temp_dir, "sleeper-1.0.0.prof")))
+            self.assertIn("resolve", hook.format_stats("sleeper", "1.0.0"))
+            self.assertEqual(hook.format_stats("unknown", "1.0.0"), "")
+            
+            other_dir = os.path.join(temp_dir, "other")
+            self.assertEqual(hook.dump_stats(other_dir), [os.path.join(other_dir, "sleeper-1.0.0.prof")])
+            hook.close()
+    
+    def test_profiling_writes_off_the_calling_thread(self):
+        """Test that sampled calls leave writing the profile to the background writer."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            hook = self.registry.register(ProfilingHook(sample_every=1, output_dir=temp_dir))
+            writer_threads = []
+            dump = hook._dump
+            
+            def record_dump(key):
+                writer_threads.append(threading.current_thread())
+                return dump(key)
+            hook._dump = record_dump
+            
+            for _ in range(3):
+                self._call()
+            
+            # Wait for the writes scheduled so far
+            hook._writer.submit(lambda: None).result()
+            self.assertTrue(writer_threads)
+            self.assertTrue(all(thread.name.startswith("profile-writer") for thread in writer_threads))
+            
+            hook.close()
+            self.assertEqual(hook.get_samples(), {"sleeper@1.0.0": 3})
+            self.assertTrue(os.path.exists(os.path.join(temp_dir, "sleeper-1.0.0.prof")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Tests for lazy package exports.
+
+This module contains tests checking that importing boss.core, boss.utility
+and boss.lighthouse.monitoring defers loading their submodules, and that
+importing boss.core stays within an import-time budget.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+# Generous budget for `import boss.core`, measured in a fresh interpreter.
+# Eager imports of all the resolvers took well over 200ms.
+IMPORT_BUDGET_MS = 100.0
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def run_isolated(code: str) -> dict:
+    """Run code in a fresh interpreter and return the JSON it prints."""
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestLazyImports(unittest.TestCase):
+    """Tests for the lazily loaded exports of the BOSS packages."""
+    
+    def test_core_import_is_lazy(self):
+        """Test that importing boss.core loads none of its submodules."""
+        result = run_isolated(
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            "import boss.core\n"
+            "elapsed_ms = (time.perf_counter() - start) * 1000\n"
+            "print(json.dumps({'elapsed_ms': elapsed_ms, 'modules': sorted(sys.modules)}))"
+        )
+        
+        loaded = [name for name in result["modules"] if name.startswith("boss.core.")]
+        self.assertEqual(loaded, [])
+        for heavy in ("numpy", "openai", "anthropic", "pydantic"):
+            self.assertNotIn(heavy, result["modules"])
+        self.assertLess(result["elapsed_ms"], IMPORT_BUDGET_MS)
+    
+    def test_core_exports_load_on_access(self):
+        """Test that exports load only their own submodule, on first access."""
+        result = run_isolated(
+            "import json, sys\n"
+            "from boss.core import Task, TaskStatus\n"
+            "import boss.core\n"
+            "print(json.dumps({\n"
+            "    'modules': sorted(sys.modules),\n"
+            "    'task': Task.__module__,\n"
+            "    'cached': 'Task' in vars(boss.core),\n"
+            "    'has_xai': boss.core.HAS_XAI,\n"
+            "    'dir': 'MasteryExecutor' in dir(boss.core)\n"
+            "}))"
+        )
+        
+        self.assertEqual(result["task"], "boss.core.task_base")
+        self.assertTrue(result["cached"])
+        self.assertIsInstance(result["has_xai"], bool)
+        self.assertTrue(result["dir"])
+        for lazy in ("boss.core.mastery_executor", "boss.core.vector_search_resolver", "boss.core.openai_resolver"):
+            self.assertNotIn(lazy, result["modules"])
+    
+    def test_unknown_attribute(self):
+        """Test that unknown names still raise AttributeError and ImportError."""
+        import boss.core
+        
+        with self.assertRaises(AttributeError):
+            boss.core.NotAComponent
+        with self.assertRaises(ImportError):
+            from boss.core import NotAComponent  # noqa: F401
+    
+    def test_subpackages_are_lazy(self):
+        """Test that boss.utility and boss.lighthouse.monitoring defer their submodules."""
+        result = run_isolated(
+            "import json, sys\n"
+            "import boss.utility, boss.lighthouse.monitoring\n"
+            "before = sorted(sys.modules)\n"
+            "journal = boss.utility.WorklistJournal.__module__\n"
+            "print(json.dumps({'modules': before, 'journal': journal}))"
+        )
+        
+        loaded = [
+            name for name in result["modules"]
+            if name.startswith(("boss.utility.", "boss.lighthouse.monitoring."))
+        ]
+        self.assertEqual(loaded, [])
+        self.assertEqual(result["journal"], "boss.utility.worklist_journal")
+    
+    def test_all_exports_resolve(self):
+        """Test that every name in boss.core.__all__ can be resolved."""
+        import boss.core
+        
+        for name in boss.core.__all__:
+            self.assertIsNotNone(getattr(boss.core, name), name)
+
+
+if __name__ == "__main__":
+    unittest.main()
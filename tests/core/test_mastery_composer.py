@@ -8,6 +8,8 @@ import pytest
 import unittest
 import asyncio
 import logging
+import time
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -16,6 +18,7 @@ from boss.core.task_result import TaskResult
 from boss.core.task_status import TaskStatus
 from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
 from boss.core.mastery_composer import MasteryComposer, MasteryNode
+from boss.core.payload import FrozenPayload
 
 
 class MockTaskResolver(TaskResolver):
@@ -50,6 +53,34 @@ class MockTaskResolver(TaskResolver):
             )
 
 
+class SlowTaskResolver(TaskResolver):
+    """Resolver that sleeps before echoing its input, tracking concurrency."""
+    
+    def __init__(self, name: str, delay: float, tracker: Dict[str, int]):
+        """Initialize with a delay and a shared concurrency tracker."""
+        super().__init__(TaskResolverMetadata(
+            name=name,
+            version="1.0.0",
+            description=f"Slow {name} for testing"
+        ))
+        self.delay = delay
+        self.tracker = tracker
+        self.received_input: Optional[Dict[str, Any]] = None
+    
+    async def resolve(self, task: Task) -> Union[TaskResult, Any]:
+        """Sleep, then return the input plus a marker for this resolver."""
+        self.received_input = dict(task.input_data)
+        self.tracker["running"] += 1
+        self.tracker["peak"] = max(self.tracker["peak"], self.tracker["running"])
+        await asyncio.sleep(self.delay)
+        self.tracker["running"] -= 1
+        return TaskResult(
+            task_id=task.id,
+            status=TaskStatus.COMPLETED,
+            output_data={self.metadata.name: True}
+        )
+
+
 class TestMasteryNode(unittest.TestCase):
     """Tests for the MasteryNode class."""
     
@@ -396,5 +427,255 @@ class TestMasteryComposer(unittest.TestCase):
             self.assertFalse(loop.run_until_complete(self.composer.health_check()))
 
 
+
+class TestMasteryComposerDagMode(unittest.TestCase):
+    """Tests for the DAG execution mode of MasteryComposer."""
+    
+    def setUp(self):
+        """Set up a fan-out/fan-in graph: start -> (a, b, c) -> join."""
+        self.tracker = {"running": 0, "peak": 0}
+        self.metadata = TaskResolverMetadata(
+            name="DagMastery",
+            version="1.0.0",
+            description="DAG mastery for testing"
+        )
+        self.branches = {
+            name: SlowTaskResolver(name, 0.1, self.tracker)
+            for name in ("a", "b", "c")
+        }
+        self.join_resolver = SlowTaskResolver("join", 0.0, self.tracker)
+        self.nodes = {
+            "start": MasteryNode(MockTaskResolver("Start"), "start", ["a", "b", "c"]),
+            "join": MasteryNode(self.join_resolver, "join", [])
+        }
+        for name, resolver in self.branches.items():
+            self.nodes[name] = MasteryNode(resolver, name, ["join"])
+    
+    def _run(self, composer: MasteryComposer) -> TaskResult:
+        task = Task(id="dag_task", name="DAG Task", input_data={"key": "value"})
+        return asyncio.run(composer.resolve(task))
+    
+    def test_fan_out_runs_concurrently(self):
+        """Test that independent branches run in parallel and join at the merge node."""
+        composer = MasteryComposer(
+            metadata=self.metadata,
+            nodes=self.nodes,
+            entry_node="start",
+            exit_nodes=["join"],
+            execution_mode="dag"
+        )
+        
+        loop_start = time.perf_counter()
+        result = self._run(composer)
+        elapsed = time.perf_counter() - loop_start
+        
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        self.assertEqual(result.output_data.get("executed_node"), "join")
+        self.assertEqual(self.tracker["peak"], 3)
+        self.assertLess(elapsed, 0.25)
+        
+        # The merge node sees the outputs of all three branches
+        join_input = self.join_resolver.received_input
+        self.assertTrue(join_input["a"] and join_input["b"] and join_input["c"])
+        self.assertEqual(set(join_input["branch_outputs"]), {"a", "b", "c"})
+    
+    def test_max_concurrency_is_honoured(self):
+        """Test that the concurrency cap limits the number of running nodes."""
+        composer = MasteryComposer(
+            metadata=self.metadata,
+            nodes=self.nodes,
+            entry_node="start",
+            exit_nodes=["join"],
+            execution_mode="dag",
+            max_concurrency=2
+        )
+        
+        result = self._run(composer)
+        
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        self.assertEqual(self.tracker["peak"], 2)
+    
+    def test_failed_branch_stops_execution(self):
+        """Test that a failing branch fails the mastery without running the merge node."""
+        self.nodes["b"] = MasteryNode(MockTaskResolver("b", succeeds=False), "b", ["join"])
+        composer = MasteryComposer(
+            metadata=self.metadata,
+            nodes=self.nodes,
+            entry_node="start",
+            exit_nodes=["join"],
+            execution_mode="dag"
+        )
+        
+        result = self._run(composer)
+        
+        self.assertEqual(result.status, TaskStatus.ERROR)
+        self.assertIn("b failed", result.message)
+        self.assertIsNone(self.join_resolver.received_input)
+    
+    def test_branches_without_merge_are_joined(self):
+        """Test that independent terminal branches are combined into one result."""
+        for name in self.branches:
+            self.nodes[name].next_nodes = []
+        del self.nodes["join"]
+        composer = MasteryComposer(
+            metadata=self.metadata,
+            nodes=self.nodes,
+            entry_node="start",
+            execution_mode="dag"
+        )
+        
+        result = self._run(composer)
+        
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        self.assertEqual(set(result.output_data["branch_outputs"]), {"a", "b", "c"})
+    
+    def test_cycle_is_rejected(self):
+        """Test that DAG mode rejects cyclic graphs."""
+        self.nodes["join"].next_nodes = ["start"]
+        with self.assertRaises(ValueError):
+            MasteryComposer(
+                metadata=self.metadata,
+                nodes=self.nodes,
+                entry_node="start",
+                execution_mode="dag"
+            )
+
+
+
+class RecordingResolver(TaskResolver):
+    """Resolver that records the input it received and optionally mutates it."""
+    
+    def __init__(self, name: str, mutate: bool = False):
+        """Initialize with an optional in-place mutation of the input."""
+        super().__init__(TaskResolverMetadata(
+            name=name,
+            version="1.0.0",
+            description=f"Recording {name} for testing"
+        ))
+        self.mutate = mutate
+        self.received_input: Optional[Dict[str, Any]] = None
+        self.received_expires_at: Optional[datetime] = None
+    
+    async def resolve(self, task: Task) -> Union[TaskResult, Any]:
+        """Record the input, optionally mutate it, and pass a payload on."""
+        self.received_input = task.input_data
+        self.received_expires_at = task.metadata.expires_at
+        if self.mutate:
+            task.input_data["mutated_by"] = self.metadata.name
+        return {"payload": task.input_data.get("payload", [1, 2, 3]), self.metadata.name: True}
+
+
+class TestMasteryComposerReferenceHandoff(unittest.TestCase):
+    """Tests for the reference handoff mode of MasteryComposer."""
+    
+    def _composer(self, resolvers: List[RecordingResolver], mutating: Tuple[str, ...] = ()) -> MasteryComposer:
+        nodes = {}
+        for i, resolver in enumerate(resolvers):
+            name = resolver.metadata.name
+            next_nodes = [resolvers[i + 1].metadata.name] if i < len(resolvers) - 1 else []
+            nodes[name] = MasteryNode(resolver, name, next_nodes, mutates_input=name in mutating)
+        return MasteryComposer(
+            metadata=TaskResolverMetadata(name="RefMastery", version="1.0.0", description="Reference mastery"),
+            nodes=nodes,
+            entry_node=resolvers[0].metadata.name,
+            exit_nodes=[resolvers[-1].metadata.name],
+            handoff_mode="reference"
+        )
+    
+    def test_outputs_are_passed_by_reference(self):
+        """Test that each node receives the previous node's frozen output without copies."""
+        first, second, third = RecordingResolver("first"), RecordingResolver("second"), RecordingResolver("third")
+        composer = self._composer([first, second, third])
+        
+        result = asyncio.run(composer.resolve(Task(name="ref_task", input_data={"payload": ["doc"]})))
+        
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        self.assertIsInstance(second.received_input, FrozenPayload)
+        self.assertEqual(second.received_input["executed_node"], "first")
+        # Payload values are shared across hops, not duplicated
+        self.assertIs(second.received_input["payload"], first.received_input["payload"])
+        self.assertIs(third.received_input["payload"], first.received_input["payload"])
+        
+        # The caller gets a plain, mutable dict
+        self.assertNotIsInstance(result.output_data, FrozenPayload)
+        self.assertEqual(result.output_data["executed_node"], "third")
+        result.output_data["extra"] = True
+    
+    def test_mutating_node_gets_private_copy(self):
+        """Test copy-on-write for nodes marked as mutating their input."""
+        first, second, third = RecordingResolver("first"), RecordingResolver("second", mutate=True), RecordingResolver("third")
+        composer = self._composer([first, second, third], mutating=("second",))
+        
+        result = asyncio.run(composer.resolve(Task(name="ref_task", input_data={})))
+        
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        self.assertEqual(second.received_input["mutated_by"], "second")
+        self.assertNotIn("mutated_by", third.received_input)
+    
+    def test_unmarked_mutation_fails(self):
+        """Test that a node mutating a frozen input fails instead of corrupting other nodes."""
+        first, second = RecordingResolver("first"), RecordingResolver("second", mutate=True)
+        composer = self._composer([first, second])
+        
+        result = asyncio.run(composer.resolve(Task(name="ref_task", input_data={})))
+        
+        self.assertEqual(result.status, TaskStatus.ERROR)
+    
+    def test_invalid_handoff_mode(self):
+        """Test that unknown handoff modes are rejected."""
+        resolver = RecordingResolver("only")
+        with self.assertRaises(ValueError):
+            MasteryComposer(
+                metadata=TaskResolverMetadata(name="Bad", version="1.0.0", description="Bad"),
+                nodes={"only": MasteryNode(resolver, "only")},
+                entry_node="only",
+                handoff_mode="shared"
+            )
+
+
+
+class TestMasteryComposerDeadlines(unittest.TestCase):
+    """Tests for deadline propagation through MasteryComposer."""
+    
+    def _composer(self, first: TaskResolver, second: TaskResolver, execution_mode: str = "sequential") -> MasteryComposer:
+        return MasteryComposer(
+            metadata=TaskResolverMetadata(name="DeadlineMastery", version="1.0.0", description="Deadline mastery"),
+            nodes={
+                "first": MasteryNode(first, "first", ["second"]),
+                "second": MasteryNode(second, "second")
+            },
+            entry_node="first",
+            exit_nodes=["second"],
+            execution_mode=execution_mode
+        )
+    
+    def test_nodes_inherit_task_deadline(self):
+        """Test that every node task carries the deadline of the original task."""
+        for mode in ("sequential", "dag"):
+            first, second = RecordingResolver("first"), RecordingResolver("second")
+            task = Task(name="deadline_task", input_data={})
+            task.metadata.expires_at = datetime.now() + timedelta(seconds=30)
+            
+            result = asyncio.run(self._composer(first, second, mode).resolve(task))
+            
+            self.assertEqual(result.status, TaskStatus.COMPLETED)
+            self.assertEqual(first.received_expires_at, task.metadata.expires_at)
+            self.assertEqual(second.received_expires_at, task.metadata.expires_at)
+    
+    def test_deadline_stops_slow_node(self):
+        """Test that a node running past the task deadline fails the mastery."""
+        slow = SlowTaskResolver("slow", 5.0, {"running": 0, "peak": 0})
+        after = RecordingResolver("after")
+        task = Task(name="deadline_task", input_data={})
+        task.metadata.expires_at = datetime.now() + timedelta(seconds=0.05)
+        
+        start = time.perf_counter()
+        result = asyncio.run(self._composer(slow, after).resolve(task))
+        
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(result.status, TaskStatus.ERROR)
+        self.assertIsNone(after.received_input)
+
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
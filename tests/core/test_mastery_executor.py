@@ -492,7 +492,116 @@ class TestMasteryExecutor(unittest.IsolatedAsyncioTestCase):
         # Calculate success rate for a nonexistent mastery
         rate = self.executor.get_success_rate("nonexistent_mastery")
         self.assertEqual(rate, 0.0)
-
+    
+    def test_history_ring_buffer(self):
+        """Test that evicted states leave the index and success counters."""
+        executor = MasteryExecutor(
+            metadata=self.executor.metadata,
+            registry=self.registry,
+            execution_history_size=3
+        )
+        
+        for i in range(5):
+            state = ExecutionState(
+                mastery_name="even" if i % 2 == 0 else "odd",
+                mastery_version="1.0.0",
+                task_id=f"task{i}"
+            )
+            state.complete(TaskResult(
+                task_id=f"task{i}",
+                status=TaskStatus.COMPLETED if i < 3 else TaskStatus.ERROR
+            ))
+            executor._add_to_history(state)
+        
+        # Only task2, task3 and task4 remain
+        self.assertEqual([state.task_id for state in executor.execution_history], ["task2", "task3", "task4"])
+        self.assertNotIn("task1", executor._states_by_task_id)
+        self.assertIs(executor._states_by_task_id["task4"], executor.execution_history[-1])
+        self.assertAlmostEqual(executor.get_success_rate(), 1 / 3)
+        self.assertEqual(executor.get_success_rate("even"), 0.5)
+        self.assertEqual(executor.get_success_rate("odd"), 0.0)
+        
+        # A repeated task ID resolves to its most recent state
+        state = ExecutionState(mastery_name="odd", mastery_version="1.0.0", task_id="task3")
+        state.complete(TaskResult(task_id="task3", status=TaskStatus.COMPLETED))
+        executor._add_to_history(state)
+        self.assertIs(executor._states_by_task_id["task3"], state)
+        self.assertNotIn("task2", executor._states_by_task_id)
+        self.assertEqual(executor.get_success_rate("odd"), 0.5)
+        
+        executor.clear_history()
+        self.assertEqual(executor.get_success_rate(), 0.0)
+        self.assertEqual(executor._states_by_task_id, {})
+    
+    def test_history_limit_keeps_newest(self):
+        """Test that the history limit returns the most recent matching states."""
+        for i in range(6):
+            state = ExecutionState(mastery_name="test_mastery", mastery_version="1.0.0", task_id=f"task{i}")
+            state.complete(TaskResult(
+                task_id=f"task{i}",
+                status=TaskStatus.COMPLETED if i % 2 == 0 else TaskStatus.ERROR
+            ))
+            self.executor._add_to_history(state)
+        
+        states = self.executor.get_execution_history(status=TaskStatus.COMPLETED, limit=2)
+        
+        self.assertEqual([state.task_id for state in states], ["task2", "task4"])
+        self.assertEqual(len(self.executor.get_execution_history(mastery_name="test_mastery")), 6)
+        self.assertEqual(self.executor.get_execution_history(mastery_name="other"), [])
+    
+    async def test_success_rate_after_history_wraps(self):
+        """Test that runs past the history size keep the success rate within 0..1."""
+        executor = MasteryExecutor(
+            metadata=self.executor.metadata,
+            registry=self.registry,
+            execution_history_size=2
+        )
+        
+        def mastery(success: bool) -> Mock:
+            return Mock(
+                side_effect=lambda task: TaskResult(
+                    task_id=task.id,
+                    status=TaskStatus.COMPLETED if success else TaskStatus.ERROR
+                ),
+                metadata=Mock(version="1.0.0")
+            )
+        self.registry.get_mastery = lambda name, version=None: mastery(name == "existing_mastery")
+        
+        for i in range(4):
+            result = await executor._run_mastery("existing_mastery", None, Task(name=f"run{i}"))
+            self.assertEqual(result.status, TaskStatus.COMPLETED)
+        await executor._run_mastery("failing_mastery", None, Task(name="run4"))
+        
+        self.assertEqual(len(executor.execution_history), 2)
+        self.assertEqual(executor._mastery_counts, {
+            "existing_mastery": {"total": 1, "successful": 1},
+            "failing_mastery": {"total": 1, "successful": 0}
+        })
+        self.assertEqual(executor.get_success_rate(), 0.5)
+        self.assertEqual(executor.get_success_rate("existing_mastery"), 1.0)
+        
+        # A state whose status changes after it was added is still evicted by what was counted
+        executor.execution_history[-1].status = TaskStatus.COMPLETED
+        for i in range(2):
+            await executor._run_mastery("failing_mastery", None, Task(name=f"fail{i}"))
+        self.assertEqual(executor._successful_count, 0)
+        self.assertEqual(executor.get_success_rate(), 0.0)
+    
+    def test_history_size_zero(self):
+        """Test that a history size of 0 disables history instead of failing."""
+        executor = MasteryExecutor(
+            metadata=self.executor.metadata,
+            registry=self.registry,
+            execution_history_size=0
+        )
+        
+        state = ExecutionState(mastery_name="test_mastery", mastery_version="1.0.0", task_id="task0")
+        state.complete(TaskResult(task_id="task0", status=TaskStatus.COMPLETED))
+        executor._add_to_history(state)
+        
+        self.assertEqual(len(executor.execution_history), 0)
+        self.assertEqual(executor._states_by_task_id, {})
+        self.assertEqual(executor.get_success_rate(), 0.0)
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""
+Tests for compiled mastery execution plans.
+
+This module contains tests for ExecutionPlan compilation and for DAG
+execution of fused linear segments.
+"""
+
+import asyncio
+import unittest
+from typing import Any, Dict, List, Union
+
+from boss.core.task_base import Task
+from boss.core.task_result import TaskResult
+from boss.core.task_status import TaskStatus
+from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
+from boss.core.mastery_composer import MasteryComposer, MasteryNode
+from boss.core.mastery_plan import ExecutionPlan
+
+
+class StepResolver(TaskResolver):
+    """Resolver that records its calls and adds a marker to its input."""
+    
+    def __init__(self, name: str, calls: List[str], succeeds: bool = True):
+        """Initialize with a shared call log and predetermined success/failure."""
+        super().__init__(TaskResolverMetadata(name=name, version="1.0.0", description=f"Step {name}"))
+        self.calls = calls
+        self.succeeds = succeeds
+    
+    async def resolve(self, task: Task) -> Union[TaskResult, Any]:
+        """Record the call and return the input plus a marker."""
+        self.calls.append(self.metadata.name)
+        if not self.succeeds:
+            return TaskResult(task_id=task.id, status=TaskStatus.ERROR, message=f"{self.metadata.name} failed")
+        return TaskResult(
+            task_id=task.id,
+            status=TaskStatus.COMPLETED,
+            output_data={**dict(task.input_data), self.metadata.name: True}
+        )
+
+
+def _graph(edges: Dict[str, List[str]]) -> Dict[str, Dict[str, Any]]:
+    """Build node definitions from a successor table."""
+    return {node_id: {"next_nodes": next_nodes} for node_id, next_nodes in edges.items()}
+
+
+class TestExecutionPlan(unittest.TestCase):
+    """Tests for ExecutionPlan compilation."""
+    
+    def test_compile_dag(self):
+        """Test routing tables, merge points and fused segments of a DAG."""
+        # start -> a1 -> a2 -> join -> end, start -> b -> join, plus an unreachable node
+        plan = ExecutionPlan.compile(_graph({
+            "start": ["a1", "b"],
+            "a1": ["a2"],
+            "a2": ["join"],
+            "b": ["join"],
+            "join": ["end"],
+            "end": [],
+            "unused": ["start"]
+        }), "start", ["end"])
+        
+        self.assertTrue(plan.is_acyclic)
+        self.assertEqual(plan.nodes, {"start", "a1", "a2", "b", "join", "end"})
+        self.assertEqual(plan.order[0], "start")
+        for node_id, next_nodes in plan.successors.items():
+            for next_node in next_nodes:
+                self.assertLess(plan.order.index(node_id), plan.order.index(next_node))
+        
+        self.assertEqual(plan.predecessors["join"], ("a2", "b"))
+        self.assertEqual(plan.merge_points, {"join"})
+        self.assertEqual(plan.first_successor["start"], "a1")
+        self.assertIsNone(plan.first_successor["end"])
+        
+        self.assertEqual(plan.fused_next["a1"], "a2")
+        self.assertIsNone(plan.fused_next["a2"])
+        self.assertEqual(plan.fused_next["join"], "end")
+        self.assertEqual(
+            sorted(plan.segments),
+            [("a1", "a2"), ("b",), ("join", "end"), ("start",)]
+        )
+    
+    def test_exit_nodes_end_segments(self):
+        """Test that a segment never continues past an exit node."""
+        plan = ExecutionPlan.compile(_graph({"a": ["b"], "b": ["c"], "c": []}), "a", ["b"])
+        
+        self.assertEqual(plan.segments, (("a", "b"), ("c",)))
+    
+    def test_cyclic_graph(self):
+        """Test that cyclic graphs compile without a topological order."""
+        plan = ExecutionPlan.compile(_graph({"a": ["b"], "b": ["a"]}), "a", [])
+        
+        self.assertFalse(plan.is_acyclic)
+        self.assertIsNone(plan.order)
+        self.assertEqual(plan.first_successor["b"], "a")
+        self.assertEqual(plan.segments, (("a", "b"),))
+    
+    def test_plan_is_immutable(self):
+        """Test that plans cannot be modified."""
+        plan = ExecutionPlan.compile(_graph({"a": []}), "a", ["a"])
+        
+        with self.assertRaises(AttributeError):
+            plan.entry_node = "b"
+        with self.assertRaises(TypeError):
+            plan.successors["a"] = ("b",)
+    
+    def test_unknown_node(self):
+        """Test that references to unknown nodes are rejected."""
+        with self.assertRaises(ValueError):
+            ExecutionPlan.compile(_graph({"a": ["missing"]}), "a", [])
+
+
+class TestFusedExecution(unittest.TestCase):
+    """Tests for DAG execution through fused segments."""
+    
+    def setUp(self):
+        """Set up a call log."""
+        self.calls: List[str] = []
+    
+    def _composer(self, edges: Dict[str, List[str]], failing: str = "", **kwargs: Any) -> MasteryComposer:
+        """Create a DAG mastery from a successor table."""
+        nodes = {
+            node_id: MasteryNode(StepResolver(node_id, self.calls, succeeds=node_id != failing), node_id, next_nodes)
+            for node_id, next_nodes in edges.items()
+        }
+        return MasteryComposer(
+            metadata=TaskResolverMetadata(name="fused", version="1.0.0", description="Fused mastery"),
+            nodes=nodes,
+            entry_node=next(iter(edges)),
+            execution_mode=MasteryComposer.DAG_MODE,
+            **kwargs
+        )
+    
+    def _run(self, composer: MasteryComposer) -> TaskResult:
+        return asyncio.run(composer.resolve(Task(name="fused_task", input_data={})))
+    
+    def test_chain_runs_in_order(self):
+        """Test that a fused chain hands each output to the next node."""
+        composer = self._composer({"a": ["b"], "b": ["c"], "c": ["d", "e"], "d": [], "e": []})
+        
+        result = self._run(composer)
+        
+        self.assertEqual(composer.plan.segments[0], ("a", "b", "c"))
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        self.assertEqual(self.calls[:3], ["a", "b", "c"])
+        self.assertEqual(sorted(self.calls[3:]), ["d", "e"])
+        for branch in ("d", "e"):
+            output = result.output_data["branch_outputs"][branch]
+            self.assertTrue(output["a"] and output["b"] and output["c"])
+    
+    def test_failure_inside_chain(self):
+        """Test that a failing node in a fused chain stops execution."""
+        result = self._run(self._composer({"a": ["b"], "b": ["c"], "c": []}, failing="b"))
+        
+        self.assertEqual(result.status, TaskStatus.ERROR)
+        self.assertEqual(result.message, "b failed")
+        self.assertEqual(self.calls, ["a", "b"])
+    
+    def test_condition_stops_chain(self):
+        """Test that a node whose condition fails ends the chain successfully."""
+        composer = self._composer({"a": ["b"], "b": ["c"], "c": []})
+        composer.nodes["b"].condition = lambda result: False
+        
+        result = self._run(composer)
+        
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        self.assertEqual(result.output_data["executed_node"], "b")
+        self.assertEqual(self.calls, ["a", "b"])
+    
+    def test_max_depth_inside_chain(self):
+        """Test that the depth limit applies inside fused chains."""
+        result = self._run(self._composer({"a": ["b"], "b": ["c"], "c": []}, max_depth=2))
+        
+        self.assertEqual(result.status, TaskStatus.ERROR)
+        self.assertIn("Maximum execution depth", result.message)
+        self.assertEqual(self.calls, ["a", "b"])
+    
+    def test_invalidate_plan(self):
+        """Test that a changed graph is picked up after invalidating the plan."""
+        composer = self._composer({"a": ["b"], "b": [], "c": []})
+        self._run(composer)
+        composer.nodes["b"].next_nodes = ["c"]
+        composer.invalidate_plan()
+        
+        self._run(composer)
+        
+        self.assertEqual(self.calls, ["a", "b", "a", "b", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
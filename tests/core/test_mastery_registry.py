@@ -0,0 +1,100 @@
+"""
+Tests for the MasteryRegistry class.
+
+This module contains tests for registration, versioning and search in the
+MasteryRegistry.
+"""
+import pytest
+from typing import Any, Dict, Optional, Set
+
+from boss.core.task_base import Task
+from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
+from boss.core.mastery_composer import MasteryComposer, MasteryNode
+from boss.core.mastery_registry import MasteryRegistry, MasteryDefinition
+
+
+class EchoResolver(TaskResolver):
+    """A resolver that echoes its input."""
+    
+    async def resolve(self, task: Task) -> Dict[str, Any]:
+        """Echo the input data."""
+        return dict(task.input_data)
+
+
+def _register(registry: MasteryRegistry, name: str, version: str, tags: Optional[Set[str]] = None) -> MasteryComposer:
+    """Register a single-node mastery and return its composer."""
+    metadata = TaskResolverMetadata(name=name, version=version, description=f"{name} mastery")
+    resolver = EchoResolver(TaskResolverMetadata(name="echo", version="1.0.0", description="Echo"))
+    composer = MasteryComposer(
+        metadata=metadata,
+        nodes={"echo": MasteryNode(resolver, "echo")},
+        entry_node="echo",
+        exit_nodes=["echo"]
+    )
+    definition = MasteryDefinition(
+        name=name,
+        version=version,
+        description=f"{name} mastery",
+        nodes={"echo": {"resolver": "echo"}},
+        entry_node="echo",
+        exit_nodes=["echo"],
+        tags=tags
+    )
+    registry.register(composer, definition)
+    return composer
+
+
+@pytest.fixture
+def registry() -> MasteryRegistry:
+    """Create an empty mastery registry."""
+    return MasteryRegistry()
+
+
+def test_get_mastery_latest_version(registry: MasteryRegistry) -> None:
+    """Test that the latest version is tracked across register/unregister."""
+    _register(registry, "enrich", "1.0.0")
+    latest = _register(registry, "enrich", "1.10.0")
+    previous = _register(registry, "enrich", "1.9.0")
+    
+    assert registry.get_mastery("enrich") is latest
+    assert registry.get_definition("enrich").version == "1.10.0"
+    
+    registry.unregister("enrich", "1.10.0")
+    assert registry.get_mastery("enrich") is previous
+    
+    registry.unregister("enrich")
+    assert registry.get_mastery("enrich") is None
+    assert registry.get_all_masteries() == []
+
+
+def test_search_by_tags_and_name(registry: MasteryRegistry) -> None:
+    """Test that search uses tags and name patterns on the latest versions."""
+    enrich = _register(registry, "enrich", "1.0.0", tags={"llm", "batch"})
+    summarize = _register(registry, "summarize", "1.0.0", tags={"llm"})
+    
+    assert registry.search(tags={"llm"}) == [enrich, summarize]
+    assert registry.search(tags={"llm", "batch"}) == [enrich]
+    assert registry.search(name_pattern="sum", tags={"llm"}) == [summarize]
+    assert registry.search(tags={"missing"}) == []
+    
+    # A newer version without the tag drops the mastery from tag searches
+    newer = _register(registry, "enrich", "2.0.0", tags={"llm"})
+    assert registry.search(tags={"batch"}) == []
+    assert registry.search(tags={"llm"}) == [newer, summarize]
+
+
+def test_plans_are_cached_per_version(registry: MasteryRegistry) -> None:
+    """Test that plans are compiled on registration and replaced on re-registration."""
+    first = _register(registry, "enrich", "1.0.0")
+    plan = registry.get_plan("enrich", "1.0.0")
+    
+    assert plan is not None
+    assert first.plan is plan
+    assert plan.segments == (("echo",),)
+    
+    second = _register(registry, "enrich", "1.0.0")
+    assert registry.get_plan("enrich") is second.plan
+    assert registry.get_plan("enrich") is not plan
+    
+    registry.unregister("enrich", "1.0.0")
+    assert registry.get_plan("enrich") is None
@@ -0,0 +1,223 @@
+"""
+Tests for the NodeResultCache and memoized mastery nodes.
+
+This module contains tests for content-addressed caching of deterministic
+node results.
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+from typing import Any, Optional, Union
+
+from boss.core.task_base import Task
+from boss.core.task_result import TaskResult
+from boss.core.task_status import TaskStatus
+from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
+from boss.core.mastery_composer import MasteryComposer, MasteryNode
+from boss.core.mastery_registry import MasteryDefinition, MasteryRegistry
+from boss.core.node_cache import NodeResultCache
+
+
+class CountingResolver(TaskResolver):
+    """Resolver that counts its calls and doubles its input value."""
+    
+    def __init__(self, name: str, version: str = "1.0.0"):
+        """Initialize the call counter."""
+        super().__init__(TaskResolverMetadata(name=name, version=version, description=f"Counting {name}"))
+        self.calls = 0
+    
+    async def resolve(self, task: Task) -> Union[TaskResult, Any]:
+        """Count the call and double the input value."""
+        self.calls += 1
+        value = task.input_data.get("value", 0)
+        if value < 0:
+            return TaskResult(task_id=task.id, status=TaskStatus.ERROR, message="negative value")
+        return TaskResult(task_id=task.id, status=TaskStatus.COMPLETED, output_data={"value": value * 2})
+
+
+class TestNodeResultCache(unittest.TestCase):
+    """Tests for the NodeResultCache."""
+    
+    def test_keys_are_canonical(self):
+        """Test that keys ignore key order and depend on resolver identity."""
+        cache = NodeResultCache()
+        
+        key = cache.make_key("double", "1.0.0", {"a": 1, "b": [1, 2], "tags": {"y", "x"}})
+        self.assertEqual(key, cache.make_key("double", "1.0.0", {"tags": {"x", "y"}, "b": [1, 2], "a": 1}))
+        self.assertNotEqual(key, cache.make_key("double", "1.0.1", {"a": 1, "b": [1, 2], "tags": {"x", "y"}}))
+        self.assertNotEqual(key, cache.make_key("triple", "1.0.0", {"a": 1, "b": [1, 2], "tags": {"x", "y"}}))
+        self.assertIsNotNone(cache.make_key("double", "1.0.0", {"at": datetime(2024, 1, 1)}))
+        
+        self.assertIsNone(cache.make_key("double", "1.0.0", {"callback": object()}))
+        self.assertEqual(cache.get_stats()["uncacheable"], 1)
+    
+    def test_keys_distinguish_types(self):
+        """Test that values of different types never share a key."""
+        cache = NodeResultCache()
+        
+        def key(value: Any) -> Optional[str]:
+            return cache.make_key("double", "1.0.0", {"value": value})
+        
+        self.assertNotEqual(key(date(2024, 1, 1)), key("2024-01-01"))
+        self.assertNotEqual(key(date(2024, 1, 1)), key(datetime(2024, 1, 1)))
+        self.assertNotEqual(key(b"\x01"), key("01"))
+        self.assertNotEqual(key({"a", "b"}), key(["a", "b"]))
+        self.assertNotEqual(key({"$date": "2024-01-01"}), key(date(2024, 1, 1)))
+        
+        # Non-string dict keys and circular references make the input uncacheable
+        self.assertIsNone(key({1: "x"}))
+        self.assertIsNotNone(key({"1": "x"}))
+        cyclic: list = []
+        cyclic.append(cyclic)
+        self.assertIsNone(key(cyclic))
+        self.assertEqual(cache.get_stats()["uncacheable"], 2)
+    
+    def test_hits_return_copies(self):
+        """Test that cached outputs can be modified without affecting the cache."""
+        cache = NodeResultCache()
+        cache.put("k", {"items": [1]}, "done")
+        
+        first = cache.get("k")
+        first["output_data"]["items"].append(2)
+        
+        self.assertEqual(cache.get("k"), {"output_data": {"items": [1]}, "message": "done"})
+        self.assertIsNone(cache.get("missing"))
+        self.assertFalse(cache.put("bad", {"at": datetime(2024, 1, 1)}))
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["stores"]), (2, 1, 1))
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = NodeResultCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+    
+    def test_disk_spill(self):
+        """Test that evicted entries are spilled to disk and found again."""
+        with tempfile.TemporaryDirectory() as spill_dir:
+            cache = NodeResultCache(max_entries=1, spill_dir=spill_dir, max_disk_entries=2)
+            for key in ("a", "b", "c", "d"):
+                cache.put(key, {"key": key})
+            
+            # "a" was dropped from disk, "b" and "c" are on disk, "d" is in memory
+            self.assertEqual(sorted(os.listdir(spill_dir)), ["b.json", "c.json"])
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(cache.get("b")["output_data"], {"key": "b"})
+            self.assertEqual(cache.get_stats()["disk_hits"], 1)
+            
+            # Spilled entries survive a restart
+            restarted = NodeResultCache(max_entries=1, spill_dir=spill_dir)
+            self.assertEqual(restarted.get("c")["output_data"], {"key": "c"})
+            
+            restarted.clear()
+            self.assertEqual(os.listdir(spill_dir), [])
+
+
+class TestMemoizedNodes(unittest.TestCase):
+    """Tests for deterministic nodes in a MasteryComposer."""
+    
+    def setUp(self):
+        """Set up a two-node mastery with a deterministic first node."""
+        self.cache = NodeResultCache()
+        self.pure = CountingResolver("pure")
+        self.impure = CountingResolver("impure")
+        self.composer = self._composer(self.pure, self.impure)
+    
+    def _composer(self, pure: TaskResolver, impure: TaskResolver, **kwargs: Any) -> MasteryComposer:
+        return MasteryComposer(
+            metadata=TaskResolverMetadata(name="memoized", version="1.0.0", description="Memoized"),
+            nodes={
+                "pure": MasteryNode(pure, "pure", ["impure"], deterministic=True),
+                "impure": MasteryNode(impure, "impure")
+            },
+            entry_node="pure",
+            exit_nodes=["impure"],
+            result_cache=self.cache,
+            **kwargs
+        )
+    
+    def _run(self, composer: MasteryComposer, value: int) -> TaskResult:
+        return asyncio.run(composer.resolve(Task(name="memoized_task", input_data={"value": value})))
+    
+    def test_repeated_runs_reuse_results(self):
+        """Test that only deterministic nodes are skipped for repeated inputs."""
+        first = self._run(self.composer, 2)
+        second = self._run(self.composer, 2)
+        
+        self.assertEqual(first.output_data, second.output_data)
+        self.assertEqual(second.output_data["value"], 8)
+        self.assertEqual(self.pure.calls, 1)
+        self.assertEqual(self.impure.calls, 2)
+        self.assertEqual(self.composer.cache_stats, {"hits": 1, "misses": 1})
+        
+        self._run(self.composer, 3)
+        self.assertEqual(self.pure.calls, 2)
+    
+    def test_failures_are_not_cached(self):
+        """Test that failed results are computed again."""
+        self._run(self.composer, -1)
+        self._run(self.composer, -1)
+        
+        self.assertEqual(self.pure.calls, 2)
+        self.assertEqual(self.cache.get_stats()["stores"], 0)
+    
+    def test_reference_handoff(self):
+        """Test that cached outputs are frozen like fresh ones in reference mode."""
+        composer = self._composer(self.pure, self.impure, handoff_mode=MasteryComposer.HANDOFF_REFERENCE)
+        
+        self._run(composer, 2)
+        result = self._run(composer, 2)
+        
+        self.assertEqual(result.output_data, {"value": 8, "executed_node": "impure"})
+        self.assertEqual(self.pure.calls, 1)
+    
+    def test_new_resolver_version_misses(self):
+        """Test that a new resolver version does not reuse old results."""
+        self._run(self.composer, 2)
+        upgraded = CountingResolver("pure", version="2.0.0")
+        
+        self._run(self._composer(upgraded, self.impure), 2)
+        
+        self.assertEqual(upgraded.calls, 1)
+    
+    def test_resolver_without_metadata_is_not_cached(self):
+        """Test that deterministic nodes whose resolver has no metadata bypass the cache."""
+        self.pure.metadata = None
+        
+        self._run(self.composer, 2)
+        self._run(self.composer, 2)
+        
+        self.assertEqual(self.pure.calls, 2)
+        self.assertEqual(self.cache.get_stats()["stores"], 0)
+    
+    def test_registry_reports_cache_statistics(self):
+        """Test that the registry reports the hits and misses of a mastery."""
+        registry = MasteryRegistry()
+        registry.register(self.composer, MasteryDefinition(
+            name="memoized",
+            version="1.0.0",
+            description="Memoized",
+            nodes={"pure": {"next_nodes": ["impure"]}, "impure": {}},
+            entry_node="pure",
+            exit_nodes=["impure"]
+        ))
+        for _ in range(3):
+            self._run(self.composer, 2)
+        
+        stats = registry.get_statistics("memoized", "1.0.0")
+        self.assertEqual((stats["cache_hits"], stats["cache_misses"]), (2, 1))
+        self.assertAlmostEqual(registry.get_statistics("memoized")["cache_hit_rate"], 2 / 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
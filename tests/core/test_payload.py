@@ -0,0 +1,55 @@
+"""
+Tests for the FrozenPayload class.
+
+This module contains tests for the read-only payloads used to hand data
+between resolvers by reference.
+"""
+import copy
+import json
+import pickle
+
+import pytest
+
+from boss.core.payload import FrozenPayload, freeze
+from boss.core.task_result import TaskResult
+
+
+def test_freeze_adds_extra_items() -> None:
+    """Test that freeze copies the data once and adds extra items."""
+    data = {"documents": [1, 2, 3]}
+    payload = freeze(data, executed_node="node1")
+    
+    assert payload == {"documents": [1, 2, 3], "executed_node": "node1"}
+    assert payload["documents"] is data["documents"]
+    assert "executed_node" not in data
+    assert freeze(payload) is payload
+
+
+def test_frozen_payload_is_read_only() -> None:
+    """Test that every mutating method raises TypeError."""
+    payload = FrozenPayload({"key": "value"})
+    
+    with pytest.raises(TypeError):
+        payload["key"] = "other"
+    with pytest.raises(TypeError):
+        del payload["key"]
+    for method, args in (("update", ({},)), ("pop", ("key",)), ("setdefault", ("new",)),
+                         ("clear", ()), ("popitem", ())):
+        with pytest.raises(TypeError):
+            getattr(payload, method)(*args)
+    
+    thawed = payload.thaw()
+    thawed["key"] = "other"
+    assert payload["key"] == "value"
+
+
+def test_frozen_payload_interoperability() -> None:
+    """Test that frozen payloads serialize, pickle, copy and validate like dicts."""
+    payload = FrozenPayload({"key": [1, 2]})
+    
+    assert json.loads(json.dumps(payload)) == {"key": [1, 2]}
+    assert pickle.loads(pickle.dumps(payload)) == payload
+    assert isinstance(pickle.loads(pickle.dumps(payload)), FrozenPayload)
+    assert copy.copy(payload) is payload
+    assert copy.deepcopy(payload)["key"] is not payload["key"]
+    assert TaskResult(task_id="t", output_data=payload).output_data == {"key": [1, 2]}
@@ -0,0 +1,138 @@
+"""
+Tests for the ProcessPoolResolver class.
+
+This module contains tests for running resolvers in a process pool.
+"""
+import os
+import threading
+
+import pytest
+from typing import Any, Dict
+
+from boss.core.task_base import Task
+from boss.core.task_status import TaskStatus
+from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
+from boss.core.process_pool_resolver import ProcessPoolResolver
+from boss.core.registry import TaskResolverRegistry
+
+
+class CpuBoundResolver(TaskResolver):
+    """A resolver doing pure-Python work and reporting the process it ran in."""
+    
+    async def resolve(self, task: Task) -> Dict[str, Any]:
+        """Sum the squares up to the requested bound."""
+        if task.input_data.get("fail"):
+            raise ValueError("requested failure")
+        if task.input_data.get("crash"):
+            os._exit(1)
+        bound = task.input_data.get("n", 1000)
+        return {"total": sum(i * i for i in range(bound)), "pid": os.getpid()}
+
+
+class UnpicklableResolver(CpuBoundResolver):
+    """A resolver holding state that cannot be sent to another process."""
+    
+    def __init__(self, metadata: TaskResolverMetadata) -> None:
+        super().__init__(metadata)
+        self.lock = threading.Lock()
+
+
+@pytest.fixture
+def metadata() -> TaskResolverMetadata:
+    """Create metadata for the CPU-bound resolver."""
+    return TaskResolverMetadata(name="CpuBound", version="1.0.0", description="CPU-bound resolver")
+
+
+@pytest.fixture
+def pool_resolver(metadata: TaskResolverMetadata):
+    """Create a process pool resolver and shut it down afterwards."""
+    resolver = ProcessPoolResolver(CpuBoundResolver(metadata), max_workers=2)
+    yield resolver
+    resolver.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_resolve_in_worker_process(pool_resolver: ProcessPoolResolver) -> None:
+    """Test that tasks are resolved in another process and results come back."""
+    result = await pool_resolver(Task(name="square_sum", input_data={"n": 100}))
+    
+    assert result.status == TaskStatus.COMPLETED
+    assert result.output_data["total"] == sum(i * i for i in range(100))
+    assert result.output_data["pid"] != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_resolve_many_within_worker_limit(pool_resolver: ProcessPoolResolver) -> None:
+    """Test that a batch runs on at most max_workers worker processes."""
+    tasks = [Task(name=f"task_{i}", input_data={"n": 200000}) for i in range(8)]
+    
+    results = [result async for result in pool_resolver.resolve_many(tasks, max_concurrency=4)]
+    
+    assert all(result.status == TaskStatus.COMPLETED for result in results)
+    assert 1 <= len({result.output_data["pid"] for result in results}) <= 2
+
+
+@pytest.mark.asyncio
+async def test_worker_errors_become_error_results(pool_resolver: ProcessPoolResolver) -> None:
+    """Test that exceptions raised in a worker are reported as error results."""
+    result = await pool_resolver(Task(name="failing", input_data={"fail": True}))
+    
+    assert result.status == TaskStatus.ERROR
+    assert "requested failure" in result.message
+
+
+@pytest.mark.asyncio
+async def test_worker_crash_restarts_pool(pool_resolver: ProcessPoolResolver) -> None:
+    """Test that a crashed worker fails its task and the pool is replaced."""
+    result = await pool_resolver(Task(name="crashing", input_data={"crash": True}))
+    
+    assert result.status == TaskStatus.ERROR
+    assert result.error["error_type"] == "WorkerCrashed"
+    
+    result = await pool_resolver(Task(name="square_sum", input_data={"n": 10}))
+    assert result.status == TaskStatus.COMPLETED
+    assert result.output_data["total"] == sum(i * i for i in range(10))
+
+
+@pytest.mark.asyncio
+async def test_pool_restarts_are_bounded(metadata: TaskResolverMetadata) -> None:
+    """Test that the pool is not restarted again after max_pool_restarts consecutive crashes."""
+    resolver = ProcessPoolResolver(CpuBoundResolver(metadata), max_workers=1, max_pool_restarts=1)
+    try:
+        for _ in range(2):
+            result = await resolver(Task(name="crashing", input_data={"crash": True}))
+            assert result.error["error_type"] == "WorkerCrashed"
+        
+        # The pool stays broken
+        result = await resolver(Task(name="square_sum", input_data={"n": 10}))
+        assert result.error["error_type"] == "WorkerCrashed"
+        
+        # Until it is shut down
+        resolver.shutdown()
+        result = await resolver(Task(name="square_sum", input_data={"n": 10}))
+        assert result.status == TaskStatus.COMPLETED
+    finally:
+        resolver.shutdown()
+
+
+def test_unpicklable_resolver_is_rejected(metadata: TaskResolverMetadata) -> None:
+    """Test that resolvers that cannot be pickled are rejected up front."""
+    with pytest.raises(ValueError):
+        ProcessPoolResolver(UnpicklableResolver(metadata))
+
+
+@pytest.mark.asyncio
+async def test_registry_process_workers_flag(metadata: TaskResolverMetadata) -> None:
+    """Test that the registry wraps resolvers registered with process_workers."""
+    registry = TaskResolverRegistry()
+    registry.register(CpuBoundResolver(metadata), process_workers=1)
+    
+    resolver = registry.get_resolver("CpuBound")
+    assert isinstance(resolver, ProcessPoolResolver)
+    assert registry.find_resolver_for_task(Task(name="square_sum")) is resolver
+    
+    result = await resolver(Task(name="square_sum", input_data={"n": 10}))
+    assert result.output_data["total"] == 285
+    
+    registry.unregister("CpuBound")
+    assert resolver._executor is None
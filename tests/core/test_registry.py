@@ -0,0 +1,238 @@
+"""
+Tests for the TaskResolverRegistry class.
+
+This module contains tests for registration, versioning and task dispatch
+in the TaskResolverRegistry.
+"""
+import pytest
+from typing import Any, Dict, Optional, Set
+
+from boss.core.task_base import Task
+from boss.core.task_status import TaskStatus
+from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
+from boss.core.registry import NAME_PATTERN_CACHE_SIZE, TaskResolverRegistry
+
+
+class OperationResolver(TaskResolver):
+    """A resolver that handles a fixed set of operations."""
+    
+    def __init__(self, name: str, version: str = "1.0.0", operations: Optional[Set[str]] = None) -> None:
+        super().__init__(TaskResolverMetadata(
+            name=name,
+            version=version,
+            description=f"{name} for testing"
+        ))
+        self.operations = operations
+        self.can_handle_calls = 0
+    
+    async def resolve(self, task: Task) -> Dict[str, Any]:
+        """Echo the resolver name."""
+        return {"resolver": self.metadata.name}
+    
+    def can_handle(self, task: Task) -> bool:
+        """Handle tasks whose operation is one of this resolver's operations."""
+        self.can_handle_calls += 1
+        if self.operations is None:
+            return True
+        return task.input_data.get("operation") in self.operations
+
+
+@pytest.fixture
+def registry() -> TaskResolverRegistry:
+    """Create a registry with a few operation-routed resolvers."""
+    registry = TaskResolverRegistry()
+    registry.register(OperationResolver("reader", operations={"read"}), operations={"read"})
+    registry.register(OperationResolver("writer", operations={"write"}), operations={"write"})
+    return registry
+
+
+def test_get_resolver_latest_version(registry: TaskResolverRegistry) -> None:
+    """Test that the latest version is returned and updated on register/unregister."""
+    registry.register(OperationResolver("reader", version="1.10.0", operations={"read"}))
+    registry.register(OperationResolver("reader", version="1.2.0", operations={"read"}))
+    
+    assert registry.get_resolver("reader").metadata.version == "1.10.0"
+    assert registry.get_all_versions("reader") == ["1.0.0", "1.2.0", "1.10.0"]
+    
+    registry.unregister("reader", "1.10.0")
+    assert registry.get_resolver("reader").metadata.version == "1.2.0"
+    
+    registry.unregister("reader")
+    assert registry.get_resolver("reader") is None
+    assert len(registry.get_all_resolvers()) == 1
+
+
+def test_find_resolver_by_operation(registry: TaskResolverRegistry) -> None:
+    """Test that dispatch only consults resolvers routed to the task's operation."""
+    reader = registry.get_resolver("reader")
+    writer = registry.get_resolver("writer")
+    
+    task = Task(name="write_task", input_data={"operation": "write"})
+    assert registry.find_resolver_for_task(task) is writer
+    assert reader.can_handle_calls == 0
+    
+    task = Task(name="unknown_task", input_data={"operation": "delete"})
+    assert registry.find_resolver_for_task(task) is None
+
+
+def test_find_resolver_falls_back_to_undeclared(registry: TaskResolverRegistry) -> None:
+    """Test that resolvers without declared operations are still considered."""
+    generic = OperationResolver("generic")
+    registry.register(generic)
+    
+    task = Task(name="delete_task", input_data={"operation": "delete"})
+    assert registry.find_resolver_for_task(task) is generic
+    
+    # Declared resolvers take precedence for their operations
+    task = Task(name="read_task", input_data={"operation": "read"})
+    assert registry.find_resolver_for_task(task) is registry.get_resolver("reader")
+
+
+def test_find_resolver_by_name(registry: TaskResolverRegistry) -> None:
+    """Test that an explicitly requested resolver is used when it can handle the task."""
+    catch_all = OperationResolver("catch_all")
+    registry.register(catch_all)
+    
+    task = Task(name="named_task", input_data={"operation": "read", "resolver_name": "catch_all"})
+    assert registry.find_resolver_for_task(task) is catch_all
+
+
+def test_dispatch_cache_invalidated_on_register(registry: TaskResolverRegistry) -> None:
+    """Test that newly registered resolvers become routable immediately."""
+    task = Task(name="archive_task", input_data={"operation": "archive"})
+    assert registry.find_resolver_for_task(task) is None
+    
+    archiver = OperationResolver("archiver", operations={"archive"})
+    registry.register(archiver, operations={"archive"})
+    assert registry.find_resolver_for_task(task) is archiver
+    
+    registry.unregister("archiver")
+    assert registry.find_resolver_for_task(task) is None
+
+
+def test_dispatch_cache_bounded_by_declared_operations(registry: TaskResolverRegistry) -> None:
+    """Test that undeclared operations share one dispatch cache entry."""
+    generic = OperationResolver("generic")
+    registry.register(generic)
+    
+    for i in range(100):
+        task = Task(name="random_task", input_data={"operation": f"op_{i}"})
+        assert registry.find_resolver_for_task(task) is generic
+    registry.find_resolver_for_task(Task(name="read_task", input_data={"operation": "read"}))
+    
+    assert set(registry._dispatch_cache) == {None, "read"}
+
+
+def test_search_uses_latest_versions(registry: TaskResolverRegistry) -> None:
+    """Test that search matches names, tags and capabilities on the latest versions."""
+    registry.register(OperationResolver("reader", version="2.0.0"), tags={"io"}, capabilities={"fs"})
+    
+    assert [r.metadata.version for r in registry.search(name_pattern="read")] == ["2.0.0"]
+    assert [r.metadata.name for r in registry.search(tags={"io"})] == ["reader"]
+    assert registry.search(capabilities={"fs", "net"}) == []
+
+
+def test_search_index_tracks_latest_version(registry: TaskResolverRegistry) -> None:
+    """Test that the tag/capability index follows the latest version of each resolver."""
+    registry.register(OperationResolver("reader", version="2.0.0"), tags={"io", "fast"})
+    registry.register(OperationResolver("writer", version="2.0.0"), tags={"io"}, capabilities={"fs"})
+    
+    assert [r.metadata.name for r in registry.search(tags={"io"})] == ["reader", "writer"]
+    assert [r.metadata.name for r in registry.search(tags={"io", "fast"})] == ["reader"]
+    assert [r.metadata.name for r in registry.search(name_pattern="w", tags={"io"})] == ["writer"]
+    
+    # Registering a newer version without the tag drops it from the index
+    registry.register(OperationResolver("reader", version="3.0.0"))
+    assert [r.metadata.name for r in registry.search(tags={"io"})] == ["writer"]
+    
+    # Unregistering the latest version restores the previous one
+    registry.unregister("reader", "3.0.0")
+    assert [r.metadata.name for r in registry.search(tags={"fast"})] == ["reader"]
+    
+    registry.unregister("writer")
+    assert registry.search(capabilities={"fs"}) == []
+
+
+def test_search_name_pattern_cache_invalidated(registry: TaskResolverRegistry) -> None:
+    """Test that cached name pattern matches are refreshed when the registry changes."""
+    assert [r.metadata.name for r in registry.search(name_pattern="re")] == ["reader"]
+    
+    registry.register(OperationResolver("renderer"))
+    assert [r.metadata.name for r in registry.search(name_pattern="re")] == ["reader", "renderer"]
+    
+    registry.unregister("reader")
+    assert [r.metadata.name for r in registry.search(name_pattern="re")] == ["renderer"]
+
+
+def test_search_name_pattern_cache_bounded(registry: TaskResolverRegistry) -> None:
+    """Test that only the most recently used name patterns keep cached matches."""
+    index = registry._search_index
+    
+    for i in range(NAME_PATTERN_CACHE_SIZE + 10):
+        registry.search(name_pattern=f"reader_{i}")
+    assert [r.metadata.name for r in registry.search(name_pattern="re")] == ["reader"]
+    
+    assert len(index._name_matches) == NAME_PATTERN_CACHE_SIZE
+    assert "reader_0" not in index._name_matches
+    assert next(reversed(index._name_matches)) == "re"
+
+
+class FailingResolver(OperationResolver):
+    """A resolver that always fails."""
+    
+    async def resolve(self, task: Task) -> Dict[str, Any]:
+        """Always raise."""
+        raise RuntimeError("Backend down")
+
+
+def test_registry_attaches_circuit_breakers() -> None:
+    """Test that registered resolvers share one breaker per name and version."""
+    registry = TaskResolverRegistry(circuit_breaker_options={"failure_threshold": 2})
+    first = OperationResolver("reader")
+    registry.register(first)
+    
+    breaker = registry.get_circuit_breaker("reader")
+    assert breaker is not None
+    assert first.circuit_breaker is breaker
+    assert breaker.failure_threshold == 2
+    
+    # Re-registering the same version keeps the breaker state
+    second = OperationResolver("reader")
+    registry.register(second)
+    assert second.circuit_breaker is breaker
+    assert "reader@1.0.0" in registry.get_circuit_states()
+    
+    registry.unregister("reader")
+    assert registry.get_circuit_breaker("reader") is None
+    assert registry.get_circuit_states() == {}
+
+
+@pytest.mark.asyncio
+async def test_find_resolver_skips_open_circuits() -> None:
+    """Test that routing skips resolvers whose breaker is open."""
+    registry = TaskResolverRegistry(circuit_breaker_options={"failure_threshold": 1, "recovery_timeout": 60})
+    failing = FailingResolver("primary", operations={"read"})
+    fallback = OperationResolver("fallback", operations={"read"})
+    registry.register(failing, operations={"read"})
+    registry.register(fallback, operations={"read"})
+    task = Task(name="read", input_data={"operation": "read"})
+    
+    assert registry.find_resolver_for_task(task) is failing
+    result = await failing(Task(name="read", input_data={"operation": "read"}))
+    assert result.status == TaskStatus.ERROR
+    
+    assert registry.get_circuit_states()["primary@1.0.0"]["state"] == "open"
+    assert registry.find_resolver_for_task(task) is fallback
+    
+    assert registry.reset_circuit_breaker("primary") is True
+    assert registry.find_resolver_for_task(task) is failing
+
+
+def test_circuit_breakers_can_be_disabled() -> None:
+    """Test that no breakers are attached when disabled."""
+    registry = TaskResolverRegistry(enable_circuit_breakers=False)
+    resolver = OperationResolver("reader")
+    registry.register(resolver)
+    
+    assert resolver.circuit_breaker is None
+    assert registry.get_circuit_breaker("reader") is None
@@ -64,6 +64,60 @@ def test_task_creation() -> None:
     assert task2.id == "custom-id-123"
 
 
+def test_task_construct_trusted() -> None:
+    """Test the unvalidated construction path for internal tasks."""
+    input_data = {"key": "value"}
+    task = Task.construct_trusted(name="fast_task", input_data=input_data, id="fast_id")
+    
+    assert task.id == "fast_id"
+    assert task.name == "fast_task"
+    assert task.status == TaskStatus.PENDING
+    assert task.input_data is input_data
+    assert isinstance(task.metadata, TaskMetadata)
+    assert task.metadata.created_at == task.metadata.updated_at
+    assert task.metadata.max_retries == 3
+    assert task.history == []
+    
+    # The initial history entry is recorded on the first status change
+    assert task.update_status(TaskStatus.IN_PROGRESS)
+    assert [entry["to_status"] for entry in task.history] == ["PENDING", "IN_PROGRESS"]
+    assert task.history[0]["from_status"] is None
+    
+    # Serialization matches validated tasks
+    data = task.to_dict()
+    assert data["metadata"] == TaskMetadata(**data["metadata"]).model_dump()
+    assert Task.from_dict(data).id == "fast_id"
+    
+    # Each task gets its own ID, metadata and lists
+    other = Task.construct_trusted(name="fast_task")
+    assert other.id != task.id
+    assert other.metadata is not task.metadata
+    assert other.input_data == {}
+    assert other.metadata.tags is not task.metadata.tags
+
+
+def test_task_construct_trusted_metadata_defaults() -> None:
+    """Test that trusted metadata has every TaskMetadata field with its default."""
+    metadata = Task.construct_trusted(name="fast_task").metadata
+    expected = TaskMetadata().model_dump(exclude={"created_at", "updated_at"})
+    
+    assert set(metadata.__dict__) == set(TaskMetadata.model_fields)
+    assert metadata.model_dump(exclude={"created_at", "updated_at"}) == expected
+
+
+def test_task_construct_trusted_matches_model_construct() -> None:
+    """Test that trusted tasks are equal to the same tasks built by model_construct."""
+    task = Task.construct_trusted(name="fast_task", input_data={"key": "value"}, id="fast_id")
+    metadata = TaskMetadata.model_construct(**task.metadata.model_dump())
+    expected = Task.model_construct(**{**task.model_dump(), "status": task.status, "metadata": metadata})
+    
+    assert task.metadata == metadata
+    assert task == expected
+    assert task.model_fields_set == expected.model_fields_set
+    assert task.model_extra == expected.model_extra
+    assert task.model_copy(update={"name": "copy"}).name == "copy"
+
+
 def test_task_metadata() -> None:
     """Test task metadata functionality."""
     # Test with explicit values
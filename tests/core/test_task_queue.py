@@ -0,0 +1,171 @@
+"""
+Tests for the TaskQueue class.
+
+This module contains tests for enqueueing, leasing, completing and retrying
+tasks in the SQLite-backed TaskQueue.
+"""
+import pytest
+import time
+from pathlib import Path
+
+from boss.core.task_base import Task
+from boss.core.task_result import TaskResult
+from boss.core.task_status import TaskStatus
+from boss.core.task_queue import TaskQueue
+
+
+@pytest.fixture
+def queue(tmp_path: Path) -> TaskQueue:
+    """Create a queue in a temporary directory."""
+    queue = TaskQueue(str(tmp_path / "queue.db"), visibility_timeout=30, retry_delay_seconds=0)
+    yield queue
+    queue.close()
+
+
+def test_lease_orders_by_priority(queue: TaskQueue) -> None:
+    """Test that tasks are leased by priority, then in enqueue order."""
+    low = Task(name="low")
+    first_high = Task(name="first_high")
+    second_high = Task(name="second_high")
+    queue.enqueue(low, priority=1)
+    queue.enqueue(first_high, priority=5)
+    queue.enqueue(second_high, priority=5)
+    
+    leased = queue.lease(limit=10)
+    
+    assert [q.task.id for q in leased] == [first_high.id, second_high.id, low.id]
+    assert all(q.attempts == 1 for q in leased)
+    # Leased tasks are invisible to other consumers
+    assert queue.lease(limit=10) == []
+
+
+def test_complete_stores_result(queue: TaskQueue) -> None:
+    """Test that completing a task stores its result."""
+    task = Task(name="work", input_data={"value": 1})
+    queue.enqueue(task, resolver_name="worker")
+    
+    queued = queue.lease()[0]
+    assert queued.resolver_name == "worker"
+    assert queued.task.input_data == {"value": 1}
+    
+    result = TaskResult(task_id=task.id, status=TaskStatus.COMPLETED, output_data={"doubled": 2})
+    assert queue.complete(queued, result) is True
+    
+    stored = queue.get_result(task.id)
+    assert stored.status == TaskStatus.COMPLETED
+    assert stored.output_data == {"doubled": 2}
+    assert queue.get_state(task.id)["state"] == "completed"
+    assert queue.get_stats()["completed"] == 1
+
+
+def test_failed_tasks_are_retried_until_attempts_exhausted(queue: TaskQueue) -> None:
+    """Test that failed attempts are requeued until max_attempts is reached."""
+    task = Task(name="flaky")
+    queue.enqueue(task, max_attempts=2)
+    
+    queue.fail(queue.lease()[0])
+    assert queue.get_state(task.id)["state"] == "queued"
+    
+    queued = queue.lease()[0]
+    assert queued.attempts == 2
+    queue.fail(queued, TaskResult(task_id=task.id, status=TaskStatus.ERROR, message="boom"))
+    
+    assert queue.get_state(task.id)["state"] == "failed"
+    assert queue.get_result(task.id).message == "boom"
+    assert queue.lease() == []
+
+
+def test_expired_lease_is_redelivered(queue: TaskQueue) -> None:
+    """Test that a task whose lease expired (e.g. after a crash) is delivered again."""
+    task = Task(name="crashy")
+    queue.enqueue(task)
+    
+    stale = queue.lease(visibility_timeout=0.01)[0]
+    time.sleep(0.02)
+    
+    redelivered = queue.lease()[0]
+    assert redelivered.task.id == task.id
+    assert redelivered.attempts == 2
+    
+    # The stale lease can no longer complete the task
+    result = TaskResult(task_id=task.id, status=TaskStatus.COMPLETED)
+    assert queue.complete(stale, result) is False
+    assert queue.complete(redelivered, result) is True
+
+
+def test_enqueue_existing_id_keeps_task(queue: TaskQueue) -> None:
+    """Test that enqueueing a task ID that is already queued leaves the queued task alone."""
+    task = Task(name="work", input_data={"value": 1})
+    queue.enqueue(task)
+    queued = queue.lease()[0]
+    
+    duplicate = Task(name="work", input_data={"value": 2}, id=task.id)
+    queue.enqueue(duplicate, priority=9)
+    
+    state = queue.get_state(task.id)
+    assert state["state"] == "leased"
+    assert state["attempts"] == 1
+    assert queue.lease() == []
+    assert queue.complete(queued, TaskResult(task_id=task.id, status=TaskStatus.COMPLETED)) is True
+    
+    # Completed tasks are not reset either
+    queue.enqueue(duplicate)
+    assert queue.get_state(task.id)["state"] == "completed"
+    assert queue.lease() == []
+
+
+def test_extend_and_release_lease(queue: TaskQueue) -> None:
+    """Test extending a lease and releasing a task back to the queue."""
+    task = Task(name="long")
+    queue.enqueue(task)
+    
+    queued = queue.lease(visibility_timeout=0.01)[0]
+    assert queue.extend_lease(queued, visibility_timeout=30) is True
+    time.sleep(0.02)
+    assert queue.lease() == []
+    
+    assert queue.release(queued) is True
+    again = queue.lease()[0]
+    assert again.attempts == 1
+
+
+def test_exclude_resolvers(queue: TaskQueue) -> None:
+    """Test that tasks for excluded resolvers are not leased."""
+    busy = Task(name="busy")
+    free = Task(name="free")
+    queue.enqueue(busy, resolver_name="busy_resolver", priority=10)
+    queue.enqueue(free, resolver_name="free_resolver")
+    
+    leased = queue.lease(limit=10, exclude_resolvers=["busy_resolver"])
+    
+    assert [q.task.id for q in leased] == [free.id]
+
+
+def test_queue_survives_restart(tmp_path: Path) -> None:
+    """Test that queued tasks persist across queue instances."""
+    path = str(tmp_path / "durable.db")
+    queue = TaskQueue(path)
+    task = Task(name="durable", input_data={"keep": True})
+    queue.enqueue(task)
+    queue.close()
+    
+    reopened = TaskQueue(path)
+    try:
+        leased = reopened.lease()
+        assert leased[0].task.id == task.id
+        assert leased[0].task.input_data == {"keep": True}
+    finally:
+        reopened.close()
+
+
+def test_purge_removes_finished_tasks(queue: TaskQueue) -> None:
+    """Test that purge deletes completed and failed tasks only."""
+    done = Task(name="done")
+    pending = Task(name="pending")
+    queue.enqueue(done)
+    queue.complete(queue.lease()[0], TaskResult(task_id=done.id))
+    queue.enqueue(pending)
+    
+    assert queue.purge() == 1
+    assert queue.get_state(done.id) is None
+    assert queue.get_state(pending.id)["state"] == "queued"
@@ -5,8 +5,10 @@ This module contains tests for the TaskResolver abstract base class and its meth
 """
 import pytest
 import asyncio
-from datetime import datetime
-from typing import Any, Dict, Union
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Union
 
 from boss.core.task_models import Task, TaskResult, TaskError
 from boss.core.task_status import TaskStatus
@@ -175,4 +177,237 @@ async def test_can_handle(resolver: SimpleTaskResolver) -> None:
         description="Test task with non-matching resolver_name",
         input_data={"resolver_name": "OtherResolver"}
     )
-    assert resolver.can_handle(task3) is False 
\ No newline at end of file
+    assert resolver.can_handle(task3) is False 
+
+class SlowTaskResolver(TaskResolver):
+    """A resolver whose latency is taken from the task input."""
+    
+    def __init__(self, metadata: TaskResolverMetadata) -> None:
+        super().__init__(metadata)
+        self.running = 0
+        self.peak = 0
+    
+    async def resolve(self, task: Task) -> Dict[str, Any]:
+        """Sleep for the requested delay and return the task index."""
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(task.input_data["delay"])
+        self.running -= 1
+        return {"index": task.input_data["index"]}
+
+
+def _delayed_tasks(delays: List[float]) -> List[Task]:
+    return [
+        Task(name=f"task_{i}", input_data={"index": i, "delay": delay})
+        for i, delay in enumerate(delays)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_resolve_many_unordered(metadata: TaskResolverMetadata) -> None:
+    """Test that resolve_many yields results as they complete, within the concurrency cap."""
+    resolver = SlowTaskResolver(metadata)
+    tasks = _delayed_tasks([0.05, 0.01, 0.03, 0.0])
+    
+    results = [result async for result in resolver.resolve_many(tasks, max_concurrency=2)]
+    
+    assert [r.status for r in results] == [TaskStatus.COMPLETED] * 4
+    assert sorted(r.output_data["index"] for r in results) == [0, 1, 2, 3]
+    assert results[0].output_data["index"] == 1
+    assert resolver.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_many_ordered(metadata: TaskResolverMetadata) -> None:
+    """Test that ordered mode yields results in input order."""
+    resolver = SlowTaskResolver(metadata)
+    tasks = _delayed_tasks([0.03, 0.0, 0.01, 0.02, 0.0])
+    
+    results = [result async for result in resolver.resolve_many(tasks, max_concurrency=3, ordered=True)]
+    
+    assert [r.output_data["index"] for r in results] == [0, 1, 2, 3, 4]
+    assert resolver.peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_resolve_many_applies_backpressure(metadata: TaskResolverMetadata) -> None:
+    """Test that an async producer is only consumed as slots free up."""
+    resolver = SlowTaskResolver(metadata)
+    produced = 0
+    
+    async def producer() -> AsyncIterator[Task]:
+        nonlocal produced
+        for task in _delayed_tasks([0.01] * 10):
+            produced += 1
+            yield task
+    
+    consumed = 0
+    async for _ in resolver.resolve_many(producer(), max_concurrency=2):
+        consumed += 1
+        # Never more than the concurrency cap ahead of the consumer
+        assert produced - consumed <= 2
+    
+    assert consumed == 10
+    assert resolver.peak <= 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_many_invalid_concurrency(resolver: SimpleTaskResolver, test_task: Task) -> None:
+    """Test that a non-positive concurrency cap is rejected."""
+    with pytest.raises(ValueError):
+        async for _ in resolver.resolve_many([test_task], max_concurrency=0):
+            pass
+
+
+class SyncTaskResolver(TaskResolver):
+    """A resolver with a blocking, synchronous resolve implementation."""
+    
+    thread_pool_size = 2
+    
+    def resolve(self, task: Task) -> Dict[str, Any]:
+        """Block for the requested delay and report the thread used."""
+        time.sleep(task.input_data.get("delay", 0))
+        return {"thread": threading.current_thread().name}
+
+
+class LegacyTaskResolver(TaskResolver):
+    """A resolver that only implements a synchronous _resolve_task."""
+    
+    def _resolve_task(self, task: Task) -> TaskResult:
+        """Return a completed result."""
+        return TaskResult(task_id=task.id, status=TaskStatus.COMPLETED, output_data={"legacy": True})
+
+
+@pytest.mark.asyncio
+async def test_sync_resolve_runs_in_thread_pool(metadata: TaskResolverMetadata) -> None:
+    """Test that synchronous resolve implementations do not block the event loop."""
+    resolver = SyncTaskResolver(metadata)
+    ticks = 0
+    
+    async def heartbeat() -> None:
+        nonlocal ticks
+        for _ in range(5):
+            await asyncio.sleep(0.02)
+            ticks += 1
+    
+    beat = asyncio.ensure_future(heartbeat())
+    result = await resolver(Task(name="blocking", input_data={"delay": 0.15}))
+    await beat
+    
+    assert result.status == TaskStatus.COMPLETED
+    assert result.output_data["thread"].startswith("resolver-SimpleTaskResolver")
+    assert ticks == 5
+    assert resolver.get_thread_pool_stats()["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_resolve_pool_is_bounded(metadata: TaskResolverMetadata) -> None:
+    """Test that the per-resolver pool size bounds concurrency and records queue depth."""
+    resolver = SyncTaskResolver(metadata)
+    tasks = [Task(name=f"blocking_{i}", input_data={"delay": 0.05}) for i in range(4)]
+    
+    results = await asyncio.gather(*(resolver(task) for task in tasks))
+    
+    assert all(result.status == TaskStatus.COMPLETED for result in results)
+    assert len({result.output_data["thread"] for result in results}) <= 2
+    stats = resolver.get_thread_pool_stats()
+    assert stats["pool_size"] == 2
+    assert stats["completed"] == 4
+    assert stats["queued"] == 0 and stats["active"] == 0
+    assert stats["max_queued"] >= 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_task_only_resolver_is_adapted(metadata: TaskResolverMetadata) -> None:
+    """Test that resolvers implementing only _resolve_task can be instantiated and called."""
+    resolver = LegacyTaskResolver(metadata)
+    
+    result = await resolver(Task(name="legacy"))
+    
+    assert result.status == TaskStatus.COMPLETED
+    assert result.output_data == {"legacy": True}
+    assert resolver.get_thread_pool_stats()["completed"] == 1
+
+
+def test_resolver_without_implementation_stays_abstract(metadata: TaskResolverMetadata) -> None:
+    """Test that a resolver implementing neither resolve nor _resolve_task is still abstract."""
+    class IncompleteResolver(TaskResolver):
+        pass
+    
+    with pytest.raises(TypeError):
+        IncompleteResolver(metadata)
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_slow_resolve(metadata: TaskResolverMetadata) -> None:
+    """Test that resolution is cancelled when the task deadline passes."""
+    resolver = SlowTaskResolver(metadata)
+    task = Task(name="slow", input_data={"delay": 5.0, "index": 0})
+    task.metadata.expires_at = datetime.now() + timedelta(seconds=0.05)
+    
+    start = time.perf_counter()
+    result = await resolver(task)
+    
+    assert time.perf_counter() - start < 1.0
+    assert result.status == TaskStatus.ERROR
+    assert result.error["type"] == "DeadlineExceeded"
+    assert task.errors[-1]["message"] == "DeadlineExceeded"
+    assert task.status == TaskStatus.CANCELLED
+
+
+@pytest.mark.asyncio
+async def test_deadline_does_not_depend_on_wall_clock(metadata: TaskResolverMetadata) -> None:
+    """Test that a deadline timeout is reported as such even if the task no longer looks expired."""
+    class ClockSkewResolver(TaskResolver):
+        async def resolve(self, task: Task) -> Dict[str, Any]:
+            # Make is_expired() false when the timer fires, as a wall clock behind the loop clock would
+            task.metadata.expires_at = datetime.now() + timedelta(hours=1)
+            await asyncio.sleep(5.0)
+            return {}
+    
+    task = Task(name="skewed")
+    task.metadata.expires_at = datetime.now() + timedelta(seconds=0.05)
+    result = await ClockSkewResolver(metadata)(task)
+    
+    assert result.error["type"] == "DeadlineExceeded"
+    assert task.status == TaskStatus.CANCELLED
+
+
+@pytest.mark.asyncio
+async def test_resolver_timeout_is_not_deadline(metadata: TaskResolverMetadata) -> None:
+    """Test that a timeout raised by the resolver itself is an unexpected error."""
+    class TimingOutResolver(TaskResolver):
+        async def resolve(self, task: Task) -> Dict[str, Any]:
+            raise asyncio.TimeoutError()
+    
+    task = Task(name="timing_out", metadata={"timeout_seconds": 5})
+    result = await TimingOutResolver(metadata)(task)
+    
+    assert result.error["error_type"] == "UnexpectedError"
+    assert task.status == TaskStatus.ERROR
+
+
+@pytest.mark.asyncio
+async def test_expired_task_is_not_resolved(metadata: TaskResolverMetadata) -> None:
+    """Test that an already expired task is cancelled without being resolved."""
+    resolver = SlowTaskResolver(metadata)
+    task = Task(name="expired", input_data={"delay": 0.0, "index": 0})
+    task.metadata.expires_at = datetime.now() - timedelta(seconds=1)
+    
+    result = await resolver(task)
+    
+    assert result.status == TaskStatus.CANCELLED
+    assert task.status == TaskStatus.CANCELLED
+    assert resolver.peak == 0
+
+
+@pytest.mark.asyncio
+async def test_task_within_deadline_completes(metadata: TaskResolverMetadata) -> None:
+    """Test that a task finishing before its deadline completes normally."""
+    resolver = SlowTaskResolver(metadata)
+    task = Task(name="fast", input_data={"delay": 0.0, "index": 7}, metadata={"timeout_seconds": 5})
+    
+    result = await resolver(task)
+    
+    assert result.status == TaskStatus.COMPLETED
+    assert result.output_data == {"index": 7}
@@ -10,7 +10,10 @@ from typing import Dict, Any, Optional
 
 from boss.core.task_models import Task, TaskResult, TaskError
 from boss.core.task_status import TaskStatus
-from boss.core.task_retry import TaskRetryManager, BackoffStrategy
+from boss.core import task_retry
+from boss.core.task_retry import (
+    RETRY_BUDGET_CACHE_SIZE, TaskRetryManager, BackoffStrategy, RetryBudget, get_retry_budget, reset_retry_budgets
+)
 
 
 @pytest.fixture
@@ -184,4 +187,102 @@ async def test_execute_with_retry() -> None:
     
     assert result.status == TaskStatus.ERROR
     assert result.error is not None
-    assert "Task-specific error" in str(result.error) 
\ No newline at end of file
+    assert "Task-specific error" in str(result.error) 
+
+@pytest.mark.asyncio
+async def test_execute_with_retry_respects_deadline() -> None:
+    """Test that retries stop when the next attempt would start after the task deadline."""
+    retry_manager = TaskRetryManager(
+        max_retries=5,
+        strategy=BackoffStrategy.CONSTANT,
+        base_delay_seconds=1.0
+    )
+    attempt_count = 0
+    
+    async def failure_func(task: Task) -> None:
+        nonlocal attempt_count
+        attempt_count += 1
+        raise ValueError("Permanent failure")
+    
+    task = Task(name="deadline_task", metadata={"timeout_seconds": 1})
+    result = await retry_manager.execute_with_retry(task, failure_func)
+    
+    assert result.error is not None
+    assert "Permanent failure" in str(result.error)
+    assert attempt_count == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_with_retry_uses_retry_budget() -> None:
+    """Test that a shared retry budget limits retries across tasks."""
+    budget = RetryBudget(ratio=0.5, max_tokens=2)
+    retry_manager = TaskRetryManager(
+        max_retries=3,
+        strategy=BackoffStrategy.CONSTANT,
+        base_delay_seconds=0.001,
+        retry_budget=budget
+    )
+    attempt_count = 0
+    
+    async def failure_func(task: Task) -> None:
+        nonlocal attempt_count
+        attempt_count += 1
+        raise ValueError("Service unavailable")
+    
+    # The first task spends both tokens, the second task may not retry at all
+    await retry_manager.execute_with_retry(Task(name="first"), failure_func)
+    assert attempt_count == 3
+    
+    result = await retry_manager.execute_with_retry(Task(name="second"), failure_func)
+    assert attempt_count == 4
+    assert "Retry budget exhausted" in str(result.error)
+    
+    # Successful calls earn tokens back
+    async def success_func(task: Task) -> Dict[str, Any]:
+        return {"success": True}
+    
+    for _ in range(2):
+        await retry_manager.execute_with_retry(Task(name="ok"), success_func)
+    assert budget.tokens == 1
+    assert budget.get_stats()["retries_rejected"] == 2
+
+
+def test_decorrelated_jitter_delay_bounds() -> None:
+    """Test that decorrelated jitter delays stay within the configured bounds."""
+    manager = TaskRetryManager(
+        strategy=BackoffStrategy.DECORRELATED_JITTER,
+        base_delay_seconds=0.5,
+        max_delay_seconds=4.0
+    )
+    delay = None
+    for attempt in range(1, 20):
+        delay = manager._calculate_delay(attempt, delay)
+        assert 0.5 <= delay <= 4.0
+
+
+def test_get_retry_budget_is_shared_per_dependency() -> None:
+    """Test that budgets are shared by dependency name."""
+    reset_retry_budgets()
+    try:
+        assert get_retry_budget("api") is get_retry_budget("api")
+        assert get_retry_budget("api") is not get_retry_budget("db")
+    finally:
+        reset_retry_budgets()
+
+
+def test_retry_budgets_are_bounded() -> None:
+    """Test that only the most recently used budgets are kept."""
+    reset_retry_budgets()
+    try:
+        api = get_retry_budget("api")
+        for i in range(RETRY_BUDGET_CACHE_SIZE - 1):
+            get_retry_budget(f"host-{i}")
+        
+        # Using "api" again keeps it when the oldest budget is evicted
+        assert get_retry_budget("api") is api
+        get_retry_budget("new-host")
+        assert len(task_retry._retry_budgets) == RETRY_BUDGET_CACHE_SIZE
+        assert "host-0" not in task_retry._retry_budgets
+        assert get_retry_budget("api") is api
+    finally:
+        reset_retry_budgets()
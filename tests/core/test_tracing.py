@@ -0,0 +1,277 @@
+"""
+Tests for span tracing.
+
+This module contains tests for the Tracer, its exporters, and the spans
+recorded by the MasteryComposer.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from typing import Any, Dict, Union
+
+from boss.core.task_base import Task
+from boss.core.task_result import TaskResult
+from boss.core.task_status import TaskStatus
+from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
+from boss.core.mastery_composer import MasteryComposer, MasteryNode
+from boss.core.tracing import (
+    STATUS_ERROR,
+    InMemorySpanExporter,
+    JsonlFileSpanExporter,
+    OTLPJsonSpanExporter,
+    SpanExporter,
+    Tracer,
+    get_current_span
+)
+
+
+class EchoResolver(TaskResolver):
+    """Resolver that sleeps, then echoes its input under its name."""
+    
+    def __init__(self, name: str, delay: float = 0.0, succeeds: bool = True):
+        """Initialize with a delay and predetermined success/failure."""
+        super().__init__(TaskResolverMetadata(name=name, version="1.0.0", description=f"Echo {name}"))
+        self.delay = delay
+        self.succeeds = succeeds
+    
+    async def resolve(self, task: Task) -> Union[TaskResult, Any]:
+        """Sleep, then return the input plus a marker for this resolver."""
+        await asyncio.sleep(self.delay)
+        if not self.succeeds:
+            return TaskResult(task_id=task.id, status=TaskStatus.ERROR, message=f"{self.metadata.name} failed")
+        return TaskResult(
+            task_id=task.id,
+            status=TaskStatus.COMPLETED,
+            output_data={**dict(task.input_data), self.metadata.name: True}
+        )
+
+
+class TestTracer(unittest.TestCase):
+    """Tests for the Tracer and its exporters."""
+    
+    def setUp(self):
+        """Set up a tracer exporting to memory."""
+        self.exporter = InMemorySpanExporter()
+        self.tracer = Tracer(exporters=[self.exporter])
+    
+    def test_nested_spans(self):
+        """Test that spans started inside a span become its children."""
+        with self.tracer.span("root", {"a": 1}) as root:
+            self.assertIs(get_current_span(), root)
+            with self.tracer.span("child") as child:
+                child.set_attribute("b", 2)
+        self.assertIsNone(get_current_span())
+        
+        child_span, root_span = self.exporter.get_spans()
+        self.assertEqual(child_span.parent_id, root_span.span_id)
+        self.assertEqual(child_span.trace_id, root_span.trace_id)
+        self.assertIsNone(root_span.parent_id)
+        self.assertEqual(root_span.attributes, {"a": 1})
+        self.assertEqual(child_span.attributes, {"b": 2})
+        self.assertGreaterEqual(root_span.duration_ms, child_span.duration_ms)
+    
+    def test_exception_marks_span(self):
+        """Test that an exception leaving a span sets its error status."""
+        with self.assertRaises(RuntimeError):
+            with self.tracer.span("failing"):
+                raise RuntimeError("boom")
+        
+        span = self.exporter.get_spans()[0]
+        self.assertEqual(span.status, STATUS_ERROR)
+        self.assertIn("boom", span.status_message)
+    
+    def test_sampling_is_per_trace(self):
+        """Test that children follow the sampling decision of their root span."""
+        tracer = Tracer(exporters=[self.exporter], sample_rate=0.0)
+        with tracer.span("root") as root:
+            with tracer.span("child") as child:
+                child.set_attribute("ignored", True)
+        
+        self.assertFalse(root.sampled)
+        self.assertEqual(child.trace_id, root.trace_id)
+        self.assertEqual(child.attributes, {})
+        self.assertEqual(self.exporter.get_spans(), [])
+        self.assertEqual(tracer.stats["dropped_traces"], 1)
+        
+        tracer = Tracer(exporters=[self.exporter], sampler=lambda name, attributes: attributes.get("keep", False))
+        for keep in (True, False):
+            with tracer.span("root", {"keep": keep}):
+                with tracer.span("child"):
+                    pass
+        self.assertEqual(len(self.exporter.get_spans()), 2)
+        
+        with self.assertRaises(ValueError):
+            Tracer(sample_rate=1.5)
+    
+    def test_disabled_tracer(self):
+        """Test that a disabled tracer creates no spans."""
+        tracer = Tracer(exporters=[self.exporter], enabled=False)
+        with tracer.span("root") as span:
+            self.assertIsNone(span)
+        self.assertEqual(self.exporter.get_spans(), [])
+    
+    def test_in_memory_ring(self):
+        """Test that the in-memory exporter keeps only the newest spans."""
+        exporter = InMemorySpanExporter(max_spans=3)
+        tracer = Tracer(exporters=[exporter])
+        for i in range(5):
+            with tracer.span(f"span{i}"):
+                pass
+        
+        self.assertEqual([span.name for span in exporter.get_spans()], ["span2", "span3", "span4"])
+        self.assertEqual(len(exporter.get_spans(name="span3")), 1)
+        exporter.clear()
+        self.assertEqual(exporter.get_spans(), [])
+    
+    def test_exporter_requires_export(self):
+        """Test that an exporter without export() cannot be created."""
+        class IncompleteExporter(SpanExporter):
+            pass
+        
+        with self.assertRaises(TypeError):
+            IncompleteExporter()
+    
+    def test_file_exporters(self):
+        """Test the JSON lines and OTLP/JSON file exporters."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            jsonl_path = os.path.join(temp_dir, "spans.jsonl")
+            otlp_path = os.path.join(temp_dir, "spans.otlp.json")
+            tracer = Tracer(exporters=[
+                JsonlFileSpanExporter(jsonl_path),
+                OTLPJsonSpanExporter(otlp_path, service_name="test", batch_size=2)
+            ])
+            
+            with tracer.span("root", {"count": 3, "ratio": 0.5, "flag": True, "label": "x"}):
+                for _ in range(2):
+                    with tracer.span("child"):
+                        pass
+            tracer.shutdown()
+            
+            with open(jsonl_path) as f:
+                records = [json.loads(line) for line in f]
+            self.assertEqual([r["name"] for r in records], ["child", "child", "root"])
+            self.assertEqual(records[0]["parent_id"], records[2]["span_id"])
+            
+            with open(otlp_path) as f:
+                requests = [json.loads(line) for line in f]
+        
+        # Three spans in batches of two
+        self.assertEqual(len(requests), 2)
+        resource_spans = requests[1]["resourceSpans"][0]
+        self.assertEqual(
+            resource_spans["resource"]["attributes"],
+            [{"key": "service.name", "value": {"stringValue": "test"}}]
+        )
+        root = resource_spans["scopeSpans"][0]["spans"][0]
+        self.assertEqual(len(root["traceId"]), 32)
+        self.assertEqual(len(root["spanId"]), 16)
+        self.assertNotIn("parentSpanId", root)
+        self.assertEqual(root["attributes"], [
+            {"key": "count", "value": {"intValue": "3"}},
+            {"key": "ratio", "value": {"doubleValue": 0.5}},
+            {"key": "flag", "value": {"boolValue": True}},
+            {"key": "label", "value": {"stringValue": "x"}}
+        ])
+        child = requests[0]["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        self.assertEqual(child["parentSpanId"], root["spanId"])
+        self.assertGreaterEqual(int(child["endTimeUnixNano"]), int(child["startTimeUnixNano"]))
+
+
+class TestMasteryTracing(unittest.TestCase):
+    """Tests for the spans recorded by the MasteryComposer."""
+    
+    def setUp(self):
+        """Set up a tracer exporting to memory."""
+        self.exporter = InMemorySpanExporter()
+        self.tracer = Tracer(exporters=[self.exporter])
+    
+    def _composer(self, second_succeeds: bool = True, **kwargs: Any) -> MasteryComposer:
+        """Create a fan-out mastery: first -> (slow, second)."""
+        nodes: Dict[str, MasteryNode] = {
+            "first": MasteryNode(EchoResolver("first"), "first", next_nodes=["slow", "second"]),
+            "slow": MasteryNode(EchoResolver("slow", delay=0.05), "slow"),
+            "second": MasteryNode(EchoResolver("second", succeeds=second_succeeds), "second")
+        }
+        return MasteryComposer(
+            metadata=TaskResolverMetadata(name="traced_mastery", version="1.0.0", description="Traced"),
+            nodes=nodes,
+            entry_node="first",
+            execution_mode=MasteryComposer.DAG_MODE,
+            tracer=self.tracer,
+            **kwargs
+        )
+    
+    def test_node_and_resolver_spans(self):
+        """Test that every node and resolver call gets a span under the resolution."""
+        composer = self._composer(max_concurrency=1)
+        task = Task(name="traced_task", input_data={"payload": "x" * 100})
+        
+        result = asyncio.run(composer.resolve(task))
+        
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        root = self.exporter.get_spans(name="mastery.resolve")[0]
+        self.assertEqual(root.attributes["mastery.name"], "traced_mastery")
+        self.assertEqual(root.attributes["task.id"], task.id)
+        
+        node_spans = {span.attributes["node.id"]: span for span in self.exporter.get_spans(name="mastery.node")}
+        self.assertEqual(set(node_spans), {"first", "slow", "second"})
+        for span in node_spans.values():
+            self.assertEqual(span.parent_id, root.span_id)
+            self.assertEqual(span.trace_id, root.trace_id)
+        self.assertEqual(node_spans["slow"].attributes["node.depth"], 1)
+        self.assertGreater(node_spans["first"].attributes["node.input_bytes"], 100)
+        self.assertGreater(node_spans["slow"].attributes["node.output_bytes"], 100)
+        
+        # With one slot, "second" waits for "slow" (or the other way round)
+        queue_delays = sorted(node_spans[n].attributes["node.queue_delay_ms"] for n in ("slow", "second"))
+        self.assertGreaterEqual(queue_delays[1], 40)
+        
+        resolver_spans = self.exporter.get_spans(name="resolver.call")
+        self.assertEqual(len(resolver_spans), 3)
+        for span in resolver_spans:
+            node_span = node_spans[span.attributes["resolver.name"]]
+            self.assertEqual(span.parent_id, node_span.span_id)
+    
+    def test_failed_node_span(self):
+        """Test that a failing node marks its span and the resolution span."""
+        result = asyncio.run(self._composer(second_succeeds=False).resolve(Task(name="traced_task")))
+        
+        self.assertEqual(result.status, TaskStatus.ERROR)
+        node_span = [
+            span for span in self.exporter.get_spans(name="mastery.node")
+            if span.attributes["node.id"] == "second"
+        ][0]
+        self.assertEqual(node_span.status, STATUS_ERROR)
+        self.assertEqual(node_span.status_message, "second failed")
+        self.assertEqual(self.exporter.get_spans(name="mastery.resolve")[0].status, STATUS_ERROR)
+    
+    def test_nested_mastery_joins_trace(self):
+        """Test that a mastery used as a node records its spans in the same trace."""
+        inner = self._composer()
+        outer = MasteryComposer(
+            metadata=TaskResolverMetadata(name="outer", version="1.0.0", description="Outer"),
+            nodes={"inner": MasteryNode(inner, "inner")},
+            entry_node="inner",
+            tracer=self.tracer
+        )
+        
+        asyncio.run(outer.resolve(Task(name="traced_task")))
+        
+        spans = self.exporter.get_spans()
+        self.assertEqual(len({span.trace_id for span in spans}), 1)
+        outer_call = [
+            span for span in self.exporter.get_spans(name="resolver.call")
+            if span.attributes["resolver.name"] == "traced_mastery"
+        ][0]
+        inner_root = [
+            span for span in self.exporter.get_spans(name="mastery.resolve")
+            if span.attributes["mastery.name"] == "traced_mastery"
+        ][0]
+        self.assertEqual(inner_root.parent_id, outer_call.span_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Tests for the WorkerPool class.
+
+This module contains tests for dispatching queued tasks to resolvers,
+per-resolver concurrency limits and shutdown behaviour of the WorkerPool.
+"""
+import pytest
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict
+
+from boss.core.task_base import Task, TaskMetadata
+from boss.core.task_status import TaskStatus
+from boss.core.task_resolver import TaskResolver, TaskResolverMetadata
+from boss.core.registry import TaskResolverRegistry
+from boss.core.task_queue import TaskQueue
+from boss.core.worker_pool import WorkerPool
+
+
+class CountingResolver(TaskResolver):
+    """A resolver that tracks how many tasks it runs at once."""
+    
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False) -> None:
+        super().__init__(TaskResolverMetadata(
+            name=name,
+            version="1.0.0",
+            description=f"{name} for testing"
+        ))
+        self.delay = delay
+        self.fail = fail
+        self.running = 0
+        self.peak = 0
+        self.calls = 0
+    
+    async def resolve(self, task: Task) -> Dict[str, Any]:
+        """Sleep, then return the task's value or raise."""
+        self.calls += 1
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        if self.fail:
+            raise RuntimeError("resolver failure")
+        return {"value": task.input_data.get("value")}
+    
+    def can_handle(self, task: Task) -> bool:
+        """Handle tasks addressed to this resolver by name."""
+        return task.name == self.metadata.name
+
+
+@pytest.fixture
+def queue(tmp_path: Path) -> TaskQueue:
+    """Create a queue in a temporary directory."""
+    queue = TaskQueue(str(tmp_path / "queue.db"), retry_delay_seconds=0)
+    yield queue
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_run_until_empty_processes_all_tasks(queue: TaskQueue) -> None:
+    """Test that tasks are dispatched by resolver name or through the registry."""
+    registry = TaskResolverRegistry()
+    named = CountingResolver("named")
+    routed = CountingResolver("routed")
+    registry.register(named)
+    registry.register(routed)
+    
+    named_ids = queue.enqueue_many([Task(name="x", input_data={"value": i}) for i in range(20)], resolver_name="named")
+    routed_id = queue.enqueue(Task(name="routed", input_data={"value": "r"}))
+    
+    pool = WorkerPool(queue, registry, concurrency=5)
+    await pool.run_until_empty()
+    
+    assert named.calls == 20
+    assert routed.calls == 1
+    assert queue.get_stats()["completed"] == 21
+    assert queue.get_result(named_ids[3]).output_data == {"value": 3}
+    assert queue.get_result(routed_id).output_data == {"value": "r"}
+    assert pool.get_stats()["completed"] == 21
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limits(queue: TaskQueue) -> None:
+    """Test the pool-wide and per-resolver concurrency limits."""
+    registry = TaskResolverRegistry()
+    limited = CountingResolver("limited", delay=0.01)
+    unlimited = CountingResolver("unlimited", delay=0.01)
+    registry.register(limited)
+    registry.register(unlimited)
+    
+    queue.enqueue_many([Task(name="limited") for _ in range(10)], resolver_name="limited")
+    queue.enqueue_many([Task(name="unlimited") for _ in range(10)])
+    
+    pool = WorkerPool(queue, registry, concurrency=6, resolver_concurrency={"limited": 2})
+    await pool.run_until_empty()
+    
+    assert limited.peak <= 2
+    assert limited.peak + unlimited.peak <= 6
+    assert queue.get_stats()["completed"] == 20
+
+
+@pytest.mark.asyncio
+async def test_failing_tasks_are_retried_then_failed(queue: TaskQueue) -> None:
+    """Test that failed results are retried up to the task's max attempts."""
+    registry = TaskResolverRegistry(enable_circuit_breakers=False)
+    failing = CountingResolver("failing", fail=True)
+    registry.register(failing)
+    
+    task_id = queue.enqueue(Task(name="failing"), max_attempts=3)
+    await WorkerPool(queue, registry).run_until_empty()
+    
+    assert failing.calls == 3
+    assert queue.get_state(task_id)["state"] == "failed"
+    assert queue.get_result(task_id).status == TaskStatus.ERROR
+
+
+@pytest.mark.asyncio
+async def test_unrecoverable_tasks_are_not_retried(queue: TaskQueue) -> None:
+    """Test that tasks without a resolver and expired tasks fail on their first attempt."""
+    registry = TaskResolverRegistry()
+    resolver = CountingResolver("expiring")
+    registry.register(resolver)
+    
+    unroutable_id = queue.enqueue(Task(name="unroutable"), max_attempts=3)
+    expired = Task(name="expiring", metadata=TaskMetadata(expires_at=datetime.now() - timedelta(seconds=1)))
+    expired_id = queue.enqueue(expired, max_attempts=3)
+    await WorkerPool(queue, registry).run_until_empty()
+    
+    assert resolver.calls == 0
+    for task_id in (unroutable_id, expired_id):
+        state = queue.get_state(task_id)
+        assert (state["state"], state["attempts"]) == ("failed", 1)
+    assert queue.get_result(expired_id).status == TaskStatus.CANCELLED
+
+
+@pytest.mark.asyncio
+async def test_stop_without_drain_returns_tasks_to_queue(queue: TaskQueue) -> None:
+    """Test that cancelled tasks are released back to the queue on stop."""
+    registry = TaskResolverRegistry()
+    slow = CountingResolver("slow", delay=10)
+    registry.register(slow)
+    task_id = queue.enqueue(Task(name="slow"))
+    
+    pool = WorkerPool(queue, registry, poll_interval=0.01)
+    pool.start()
+    while slow.calls == 0:
+        await asyncio.sleep(0.01)
+    await pool.stop(drain=False)
+    
+    assert not pool.is_running
+    assert queue.get_state(task_id) == {
+        "state": "queued", "attempts": 0, "max_attempts": 3, "resolver_name": None, "priority": 0
+    }
@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional, cast
 from boss.core.task_models import Task, TaskMetadata, TaskResult
 from boss.core.task_resolver import TaskResolverMetadata
 from boss.core.task_status import TaskStatus
+from boss.core.task_retry import RetryBudget, get_retry_budget, reset_retry_budgets
 from boss.utility.retry_resolver import RetryResolver, BackoffStrategy, RetryCondition
 
 
@@ -398,6 +399,69 @@ class TestRetryResolver(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(self.resolver.default_max_delay, 30.0)
         self.assertEqual(self.resolver.default_retry_condition, RetryCondition.NETWORK.value)
     
+    async def test_retry_budget_caps_retries(self) -> None:
+        """Test that retries stop once the shared retry budget is spent."""
+        self.resolver.retry_budget = RetryBudget(ratio=0.5, max_tokens=1)
+        calls = [0]
+        
+        def test_func():
+            calls[0] += 1
+            raise ValueError("Service unavailable")
+        
+        task = self._create_task({
+            "operation": "retry",
+            "target_operation": "test_func",
+            "func": test_func,
+            "max_retries": 5
+        })
+        
+        result = await self.resolver.resolve(task)
+        
+        # One retry is paid for by the initial token, then the budget is empty
+        self.assertEqual(calls[0], 2)
+        self.assertEqual(result.status, TaskStatus.ERROR)
+        self.assertIn("Retry budget exhausted", result.output_data.get("error", ""))
+        self.assertEqual(self.resolver.retry_stats["budget_exhausted"], 1)
+        
+        # Successes refill the budget
+        for _ in range(2):
+            self.resolver.retry_budget.record_success()
+        self.assertEqual(self.resolver.retry_budget.tokens, 1)
+    
+    async def test_dependency_budget_is_shared(self) -> None:
+        """Test that requests naming the same dependency share one budget."""
+        reset_retry_budgets()
+        self.addCleanup(reset_retry_budgets)
+        get_retry_budget("flaky-api", max_tokens=1)
+        other = RetryResolver(metadata=self.metadata, default_base_delay=0.01)
+        
+        def test_func():
+            raise ValueError("Service unavailable")
+        
+        for resolver in (self.resolver, other):
+            task = self._create_task({
+                "operation": "retry",
+                "target_operation": "test_func",
+                "func": test_func,
+                "max_retries": 3,
+                "dependency": "flaky-api"
+            })
+            await resolver.resolve(task)
+        
+        stats = get_retry_budget("flaky-api").get_stats()
+        self.assertEqual(stats["retries_allowed"], 1)
+        self.assertEqual(stats["retries_rejected"], 2)
+    
+    async def test_decorrelated_jitter_delay(self) -> None:
+        """Test that decorrelated jitter stays between the base delay and the cap."""
+        delay = None
+        for attempt in range(1, 20):
+            delay = self.resolver._calculate_delay(
+                attempt, BackoffStrategy.DECORRELATED_JITTER.value, 0.5, 4.0, delay
+            )
+            self.assertGreaterEqual(delay, 0.5)
+            self.assertLessEqual(delay, 4.0)
+    
     async def test_health_check(self) -> None:
         """Test health check functionality."""
         # Health check should pass
@@ -0,0 +1,78 @@
+"""Tests for the TaskDependencyGraph class."""
+import unittest
+
+from boss.utility.task_dependency_graph import TaskDependencyGraph
+
+
+class TestTaskDependencyGraph(unittest.TestCase):
+    """Tests for the TaskDependencyGraph."""
+    
+    def setUp(self) -> None:
+        """Build a small diamond: d depends on b and c, which depend on a."""
+        self.graph = TaskDependencyGraph()
+        self.graph.set_dependencies("a", [])
+        self.graph.set_dependencies("b", ["a"])
+        self.graph.set_dependencies("c", ["a"])
+        self.graph.set_dependencies("d", ["b", "c"])
+    
+    def test_metrics(self) -> None:
+        """Test critical path length and downstream fan-out."""
+        self.assertEqual(self.graph.critical_path_length("a"), 3)
+        self.assertEqual(self.graph.critical_path_length("b"), 2)
+        self.assertEqual(self.graph.critical_path_length("d"), 1)
+        
+        # d is reachable through b and c but counted once
+        self.assertEqual(self.graph.downstream_count("a"), 3)
+        self.assertEqual(self.graph.downstream_count("d"), 0)
+    
+    def test_incremental_update(self) -> None:
+        """Test that adding a dependent updates cached ancestor metrics."""
+        self.assertEqual(self.graph.critical_path_length("a"), 3)
+        
+        affected = self.graph.set_dependencies("e", ["d"])
+        
+        self.assertEqual(affected, {"a", "b", "c", "d", "e"})
+        self.assertEqual(self.graph.critical_path_length("a"), 4)
+        self.assertEqual(self.graph.downstream_count("b"), 2)
+    
+    def test_forward_reference(self) -> None:
+        """Test that dependencies on tasks added later are linked."""
+        graph = TaskDependencyGraph()
+        graph.set_dependencies("child", ["parent"])
+        self.assertNotIn("parent", graph)
+        
+        graph.set_dependencies("parent", [])
+        
+        self.assertEqual(graph.critical_path_length("parent"), 2)
+        self.assertEqual(graph.get_blockers(), ["parent"])
+    
+    def test_remove_task(self) -> None:
+        """Test removing a completed task."""
+        affected = self.graph.remove_task("a")
+        
+        self.assertEqual(affected, {"b", "c"})
+        self.assertNotIn("a", self.graph)
+        self.assertEqual(self.graph.get_dependencies("b"), set())
+        self.assertEqual(self.graph.get_blockers(), ["b", "c"])
+        
+        self.graph.remove_task("d")
+        self.assertEqual(self.graph.critical_path_length("b"), 1)
+    
+    def test_cycle_rejected(self) -> None:
+        """Test that dependencies creating a cycle are rejected."""
+        with self.assertRaises(ValueError):
+            self.graph.set_dependencies("a", ["d"])
+        
+        self.assertEqual(self.graph.get_dependencies("a"), set())
+    
+    def test_long_chain(self) -> None:
+        """Test that long chains don't hit the recursion limit."""
+        graph = TaskDependencyGraph()
+        for i in range(1500):
+            graph.set_dependencies(str(i), [str(i - 1)] if i else [])
+        
+        self.assertEqual(graph.critical_path_length("0"), 1500)
+
+
+if __name__ == "__main__":
+    unittest.main()
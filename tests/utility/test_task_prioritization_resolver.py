@@ -0,0 +1,307 @@
+"""Tests for the TaskPrioritizationResolver."""
+
+import time
+import unittest
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from boss.core.task_models import Task, TaskMetadata
+from boss.core.task_resolver import TaskResolverMetadata
+from boss.core.task_status import TaskStatus
+from boss.utility.task_prioritization_resolver import (
+    MAX_AGE_SECONDS,
+    MAX_LEAD_TIME_SECONDS,
+    PriorityFactor,
+    TaskPrioritizationResolver
+)
+
+
+class TestTaskPrioritizationResolver(unittest.IsolatedAsyncioTestCase):
+    """Test suite for the TaskPrioritizationResolver."""
+    
+    def setUp(self) -> None:
+        """Set up the test environment."""
+        self.resolver = TaskPrioritizationResolver(
+            metadata=TaskResolverMetadata(
+                name="TaskPrioritizationResolver",
+                description="Test Resolver",
+                version="1.0.0"
+            )
+        )
+        self.context = {"vip_users": {"alice"}, "high_priority_users": {"bob"}}
+    
+    def _create_tasks(self) -> List[Task]:
+        """Create tasks covering the inputs of every default factor."""
+        now = datetime.now()
+        return [
+            Task(name="explicit", metadata=TaskMetadata(priority=9, created_at=now)),
+            Task(name="old", metadata=TaskMetadata(priority=2, created_at=now - timedelta(hours=30))),
+            Task(name="due", metadata=TaskMetadata(priority=5, expires_at=now + timedelta(days=2))),
+            Task(name="overdue", metadata=TaskMetadata(priority=5, expires_at=now - timedelta(hours=1))),
+            Task(name="retried", metadata=TaskMetadata(priority=5, retry_count=4, owner="alice")),
+            Task(name="blocked", metadata=TaskMetadata(priority=5, owner="bob"),
+                 context={"dependencies": ["a", "b", "c"]})
+        ]
+    
+    def test_batch_matches_per_task_scores(self) -> None:
+        """Test that vectorized scores match calculate_priority."""
+        tasks = self._create_tasks()
+        
+        scores = self.resolver.calculate_priorities(tasks, self.context)["scores"]
+        
+        for task, score in zip(tasks, scores):
+            self.assertAlmostEqual(score, self.resolver.calculate_priority(task, self.context), places=4)
+    
+    def test_batch_accepts_dicts(self) -> None:
+        """Test that task dicts are scored like the equivalent Task objects."""
+        tasks = self._create_tasks()
+        dicts = [task.model_dump() for task in tasks]
+        
+        from_tasks = self.resolver.prioritize_batch(tasks, self.context)
+        from_dicts = self.resolver.prioritize_batch(dicts, self.context)
+        
+        self.assertEqual([r["task_id"] for r in from_dicts], [r["task_id"] for r in from_tasks])
+    
+    def test_top_k(self) -> None:
+        """Test that top_k returns the highest priority tasks in order."""
+        tasks = self._create_tasks()
+        
+        full = self.resolver.prioritize_batch(tasks, self.context)
+        top = self.resolver.prioritize_batch(tasks, self.context, top_k=3)
+        
+        self.assertEqual([r["task_id"] for r in top], [r["task_id"] for r in full[:3]])
+        self.assertEqual(self.resolver.prioritize_batch(tasks, self.context, top_k=0), [])
+    
+    def test_ties_keep_input_order(self) -> None:
+        """Test that tasks with equal scores keep their input order."""
+        now = datetime.now()
+        tasks = [Task(id=str(i), name="same", metadata=TaskMetadata(priority=5, created_at=now)) for i in range(5)]
+        
+        results = self.resolver.prioritize_batch(tasks)
+        
+        self.assertEqual([r["task_id"] for r in results], ["0", "1", "2", "3", "4"])
+    
+    def test_custom_factor_without_vector_fn(self) -> None:
+        """Test that factors without a vector_fn are evaluated task by task."""
+        self.resolver.add_priority_factor(PriorityFactor(
+            name="urgent_tag",
+            weight=1.0,
+            evaluation_fn=lambda task, _: 1.0 if "urgent" in task.metadata.tags else 0.0
+        ))
+        tasks = [
+            Task(id="plain", name="plain", metadata=TaskMetadata(priority=5)),
+            Task(id="urgent", name="urgent", metadata=TaskMetadata(priority=5, tags=["urgent"]))
+        ]
+        
+        results = self.resolver.prioritize_batch([task.model_dump() for task in tasks])
+        
+        self.assertEqual(results[0]["task_id"], "urgent")
+        self.assertAlmostEqual(results[0]["priority"], self.resolver.calculate_priority(tasks[1]), places=4)
+    
+    def test_invalid_task_reported(self) -> None:
+        """Test that unreadable tasks are reported after the scored tasks."""
+        results = self.resolver.prioritize_batch([
+            {"id": "bad", "name": "bad", "metadata": {"priority": "high"}},
+            {"id": "good", "name": "good", "metadata": {"priority": 5}}
+        ])
+        
+        self.assertEqual(results[0]["task_id"], "good")
+        self.assertEqual(results[1]["index"], 0)
+        self.assertIsNone(results[1]["priority"])
+    
+    async def test_resolve_reports_invalid_dicts(self) -> None:
+        """Test that dicts missing required fields or with a non-mapping metadata are reported."""
+        task = Task(
+            name="prioritize_tasks",
+            input_data={"tasks": [
+                {"id": "nameless", "metadata": {"priority": 5}},
+                {"id": "good", "name": "good", "metadata": {"priority": 5}},
+                {"id": "bad_metadata", "name": "bad", "metadata": "urgent"}
+            ]}
+        )
+        
+        result = await self.resolver.resolve(task)
+        
+        prioritized = result.output_data["prioritized_tasks"]
+        self.assertEqual([r.get("task_id") for r in prioritized], ["good", None, None])
+        self.assertEqual([r.get("index") for r in prioritized[1:]], [0, 2])
+        self.assertIn("'name'", prioritized[1]["error"])
+        self.assertIsNone(prioritized[2]["priority"])
+    
+    async def test_resolve_prioritize_tasks(self) -> None:
+        """Test the prioritize_tasks operation with top_k."""
+        tasks = [task.model_dump() for task in self._create_tasks()]
+        task = Task(
+            name="prioritize_tasks",
+            input_data={"tasks": tasks, "context": self.context, "top_k": 2}
+        )
+        
+        result = await self.resolver.resolve(task)
+        
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        prioritized = result.output_data["prioritized_tasks"]
+        self.assertEqual(len(prioritized), 2)
+        self.assertGreaterEqual(prioritized[0]["priority"], prioritized[1]["priority"])
+
+    def test_track_tasks_skips_unchanged(self) -> None:
+        """Test that only tasks whose inputs changed are re-scored."""
+        tasks = self._create_tasks()
+        now = time.time()
+        
+        self.assertEqual(len(self.resolver.track_tasks(tasks, now)), len(tasks))
+        self.assertEqual(self.resolver.track_tasks(tasks, now), [])
+        
+        tasks[0].metadata.priority = 1
+        self.assertEqual(self.resolver.track_tasks(tasks, now), [tasks[0].id])
+        self.assertAlmostEqual(
+            self.resolver.get_cached_priority(tasks[0].id),
+            self.resolver.calculate_priorities([tasks[0]], now=now)["scores"][0]
+        )
+    
+    def test_track_tasks_skips_tasks_without_id(self) -> None:
+        """Test that task dicts without an ID are not tracked."""
+        tasks = [{"name": "anonymous", "metadata": {"priority": 5}}, {"id": "known", "name": "known"}]
+        
+        self.assertEqual(self.resolver.track_tasks(tasks), ["known"])
+        self.resolver.track_tasks(tasks)
+        self.assertEqual([r["task_id"] for r in self.resolver.get_ranked_tasks()], ["known"])
+    
+    def test_time_based_rescoring(self) -> None:
+        """Test that tasks are re-scored when their time-based factors change."""
+        now = time.time()
+        created = datetime.fromtimestamp(now)
+        deadline = datetime.fromtimestamp(now + MAX_LEAD_TIME_SECONDS + 6 * 3600)
+        task = Task(id="t", name="t", metadata=TaskMetadata(priority=5, created_at=created, expires_at=deadline))
+        resolver = TaskPrioritizationResolver(
+            metadata=self.resolver.metadata,
+            score_resolution=0.1
+        )
+        
+        resolver.track_tasks([task], now)
+        initial = resolver.get_cached_priority("t")
+        
+        # Nothing is due before the score has moved by the resolution
+        self.assertEqual(resolver.refresh(now + 60), [])
+        
+        # Until the deadline window opens, only ageing moves the 0-10 score
+        total_weight = sum(factor.weight for factor in resolver.priority_factors)
+        age_weight = next(factor.weight for factor in resolver.priority_factors if factor.name == "task_age")
+        rescore_at = resolver._rescore_at["t"]
+        self.assertAlmostEqual(rescore_at - now, 0.1 * total_weight / (age_weight * 10) * MAX_AGE_SECONDS, delta=1)
+        self.assertEqual(resolver.refresh(rescore_at), ["t"])
+        self.assertGreater(resolver.get_cached_priority("t"), initial)
+        
+        # A fully aged task only changes when its deadline window opens
+        aged = Task(id="aged", name="aged", metadata=TaskMetadata(
+            priority=5,
+            created_at=datetime.fromtimestamp(now - 2 * MAX_AGE_SECONDS),
+            expires_at=deadline
+        ))
+        resolver.track_tasks([aged], now)
+        self.assertAlmostEqual(resolver._rescore_at["aged"], now + 6 * 3600, delta=1)
+        
+        # Without a deadline, its score never changes
+        aged.metadata.expires_at = None
+        resolver.track_tasks([aged], now)
+        self.assertNotIn("aged", resolver._rescore_at)
+    
+    def test_get_ranked_tasks(self) -> None:
+        """Test ranking tracked tasks and untracking them."""
+        tasks = self._create_tasks()
+        self.resolver.set_tracking_context(self.context)
+        self.resolver.track_tasks(tasks)
+        
+        ranked = self.resolver.get_ranked_tasks()
+        expected = self.resolver.prioritize_batch(tasks, self.context)
+        self.assertEqual([r["task_id"] for r in ranked], [r["task_id"] for r in expected])
+        self.assertEqual(self.resolver.get_ranked_tasks(top_k=2), ranked[:2])
+        
+        self.assertTrue(self.resolver.untrack_task(ranked[0]["task_id"]))
+        self.assertFalse(self.resolver.untrack_task(ranked[0]["task_id"]))
+        self.assertEqual(self.resolver.get_ranked_tasks(top_k=1)[0]["task_id"], ranked[1]["task_id"])
+    
+    def test_weight_change_rescores_tracked_tasks(self) -> None:
+        """Test that changing factor weights refreshes cached scores."""
+        tasks = self._create_tasks()
+        self.resolver.track_tasks(tasks)
+        
+        self.resolver.update_priority_factor_weight("explicit_priority", 1.0)
+        
+        for task in tasks:
+            self.assertAlmostEqual(self.resolver.get_cached_priority(task.id), self.resolver.calculate_priority(task), places=4)
+    
+    def test_blockers_ranked_first(self) -> None:
+        """Test that tasks heading chains of dependents are prioritized."""
+        now = datetime.now()
+        
+        def make(task_id: str, dependencies: List[str]) -> Task:
+            return Task(id=task_id, name=task_id, metadata=TaskMetadata(priority=5, created_at=now),
+                        context={"dependencies": dependencies})
+        
+        # root <- mid <- leaf_1, leaf_2; lone has nothing waiting on it
+        tasks = [make("lone", []), make("leaf_1", ["mid"]), make("leaf_2", ["mid"]),
+                 make("mid", ["root"]), make("root", [])]
+        self.resolver.track_tasks(tasks)
+        
+        graph = self.resolver.dependency_graph
+        self.assertEqual(graph.critical_path_length("root"), 3)
+        self.assertEqual(graph.downstream_count("root"), 3)
+        self.assertEqual(graph.get_blockers(), ["root", "lone"])
+        
+        ranked = [r["task_id"] for r in self.resolver.get_ranked_tasks()]
+        self.assertEqual(ranked[0], "root")
+        self.assertLess(ranked.index("root"), ranked.index("lone"))
+        
+        # Completing the leaves shrinks root's downstream work
+        before = self.resolver.get_cached_priority("root")
+        self.resolver.untrack_task("leaf_1")
+        self.resolver.untrack_task("leaf_2")
+        self.assertLess(self.resolver.get_cached_priority("root"), before)
+        self.assertEqual(graph.critical_path_length("root"), 2)
+    
+    def test_graph_factors_skip_untracked_tasks(self) -> None:
+        """Test that tasks outside the dependency graph are scored without the graph factors."""
+        tasks = self._create_tasks()
+        without_graph = TaskPrioritizationResolver(metadata=self.resolver.metadata, priority_factors=[
+            factor for factor in self.resolver.priority_factors
+            if factor.name not in ("critical_path", "downstream_fan_out")
+        ])
+        
+        scores = self.resolver.calculate_priorities(tasks, self.context)["scores"]
+        for task, score in zip(tasks, scores):
+            expected = without_graph.calculate_priority(task, self.context)
+            self.assertAlmostEqual(self.resolver.calculate_priority(task, self.context), expected)
+            self.assertAlmostEqual(score, expected)
+        names = [factor["name"] for factor in self.resolver.get_priority_details(tasks[0])["factor_breakdown"]]
+        self.assertNotIn("critical_path", names)
+        
+        # Once tracked, the task is in the graph and the graph factors apply
+        self.resolver.track_tasks([tasks[0]])
+        self.assertLess(self.resolver.calculate_priority(tasks[0], self.context),
+                        without_graph.calculate_priority(tasks[0], self.context))
+    
+    def test_cyclic_dependencies_ignored(self) -> None:
+        """Test that dependencies creating a cycle are ignored."""
+        self.resolver.track_tasks([
+            Task(id="a", name="a", context={"dependencies": ["b"]}),
+            Task(id="b", name="b", context={"dependencies": ["a"]})
+        ])
+        
+        self.assertEqual(self.resolver.dependency_graph.get_dependencies("b"), set())
+        self.assertIsNotNone(self.resolver.get_cached_priority("b"))
+    
+    async def test_resolve_track_and_rank(self) -> None:
+        """Test the track_tasks and get_ranked_tasks operations."""
+        tasks = [task.model_dump() for task in self._create_tasks()]
+        
+        result = await self.resolver.resolve(Task(name="track_tasks", input_data={"tasks": tasks, "context": self.context}))
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        self.assertEqual(result.output_data["tracked_count"], len(tasks))
+        
+        result = await self.resolver.resolve(Task(name="get_ranked_tasks", input_data={"top_k": 3}))
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        self.assertEqual(len(result.output_data["prioritized_tasks"]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""Tests for the WorklistJournal class."""
+import unittest
+import tempfile
+import shutil
+import os
+import time
+
+from boss.utility.worklist_journal import WorklistJournal, JOURNAL_FILE, SNAPSHOT_FILE
+
+
+class TestWorklistJournal(unittest.TestCase):
+    """Tests for the WorklistJournal."""
+    
+    def setUp(self) -> None:
+        """Set up the test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self) -> None:
+        """Clean up after each test."""
+        shutil.rmtree(self.temp_dir)
+    
+    def _item(self, item_id: str, worklist_id: str = "wl-1", priority: int = 5) -> dict:
+        """Create a minimal work item."""
+        return {"id": item_id, "worklist_id": worklist_id, "priority": priority, "status": "PENDING"}
+    
+    def test_load_empty(self) -> None:
+        """Test loading from an empty storage directory."""
+        journal = WorklistJournal(self.temp_dir)
+        worklists, work_items = journal.load()
+        journal.close()
+        
+        self.assertEqual(worklists, {})
+        self.assertEqual(work_items, {})
+    
+    def test_replay_journal(self) -> None:
+        """Test that mutations are recovered by replaying the journal."""
+        journal = WorklistJournal(self.temp_dir)
+        journal.put_worklist({"id": "wl-1", "name": "First"})
+        journal.put_worklist({"id": "wl-2", "name": "Second"})
+        journal.put_item(self._item("a"))
+        journal.put_item(self._item("b"))
+        journal.put_item(self._item("c", worklist_id="wl-2"))
+        journal.put_item(self._item("a", priority=9))
+        journal.delete_item("b")
+        journal.delete_worklist("wl-2")
+        journal.close()
+        
+        recovered = WorklistJournal(self.temp_dir)
+        worklists, work_items = recovered.load()
+        recovered.close()
+        
+        self.assertEqual(list(worklists), ["wl-1"])
+        self.assertEqual(list(work_items), ["a"])
+        self.assertEqual(work_items["a"]["priority"], 9)
+    
+    def test_compaction(self) -> None:
+        """Test that compaction writes a snapshot and truncates the journal."""
+        journal = WorklistJournal(self.temp_dir, snapshot_every=3)
+        journal.put_worklist({"id": "wl-1", "name": "First"})
+        journal.put_item(self._item("a"))
+        journal.put_item(self._item("b"))
+        self.assertTrue(journal.compaction_due)
+        
+        journal.compact({"wl-1": {"id": "wl-1", "name": "First"}}, {"a": self._item("a"), "b": self._item("b")})
+        self.assertFalse(journal.compaction_due)
+        self.assertEqual(os.path.getsize(os.path.join(self.temp_dir, JOURNAL_FILE)), 0)
+        self.assertGreater(os.path.getsize(os.path.join(self.temp_dir, SNAPSHOT_FILE)), 0)
+        
+        # Mutations after the snapshot are replayed on top of it
+        journal.delete_item("a")
+        journal.close()
+        
+        recovered = WorklistJournal(self.temp_dir)
+        worklists, work_items = recovered.load()
+        recovered.close()
+        
+        self.assertEqual(list(worklists), ["wl-1"])
+        self.assertEqual(list(work_items), ["b"])
+    
+    def test_split_compaction(self) -> None:
+        """Test that records appended while a snapshot is written are kept."""
+        journal = WorklistJournal(self.temp_dir, snapshot_every=2)
+        journal.put_worklist({"id": "wl-1", "name": "First"})
+        journal.put_item(self._item("a"))
+        
+        journal.start_compaction()
+        self.assertFalse(journal.compaction_due)
+        journal.put_item(self._item("b"))
+        journal.finish_compaction({"wl-1": {"id": "wl-1", "name": "First"}}, {"a": self._item("a")})
+        journal.close()
+        
+        self.assertFalse(os.path.exists(journal.compacting_journal_path))
+        recovered = WorklistJournal(self.temp_dir)
+        worklists, work_items = recovered.load()
+        recovered.close()
+        
+        self.assertEqual(list(worklists), ["wl-1"])
+        self.assertEqual(list(work_items), ["a", "b"])
+    
+    def test_unfinished_compaction_recovered(self) -> None:
+        """Test recovery when a compaction did not finish."""
+        journal = WorklistJournal(self.temp_dir, snapshot_every=2)
+        journal.put_worklist({"id": "wl-1", "name": "First"})
+        journal.put_item(self._item("a"))
+        journal.start_compaction()
+        journal.put_item(self._item("b"))
+        journal.close()
+        
+        recovered = WorklistJournal(self.temp_dir, snapshot_every=2)
+        worklists, work_items = recovered.load()
+        self.assertEqual(list(work_items), ["a", "b"])
+        
+        # The next compaction takes over the journal left behind
+        recovered.put_item(self._item("c"))
+        recovered.start_compaction()
+        recovered.finish_compaction(worklists, {**work_items, "c": self._item("c")})
+        recovered.close()
+        
+        final = WorklistJournal(self.temp_dir)
+        worklists, work_items = final.load()
+        final.close()
+        self.assertEqual(list(work_items), ["a", "b", "c"])
+    
+    def test_truncated_record_ignored(self) -> None:
+        """Test that a partially written final record is ignored on recovery."""
+        journal = WorklistJournal(self.temp_dir)
+        journal.put_item(self._item("a"))
+        journal.close()
+        
+        with open(os.path.join(self.temp_dir, JOURNAL_FILE), "ab") as f:
+            f.write(b'{"op": "put_item", "item": {"id": "b"')
+        
+        recovered = WorklistJournal(self.temp_dir)
+        _, work_items = recovered.load()
+        recovered.close()
+        
+        self.assertEqual(list(work_items), ["a"])
+    
+    def test_batched_sync(self) -> None:
+        """Test that fsync is batched by size and by interval."""
+        journal = WorklistJournal(self.temp_dir, sync_interval=0.05, sync_batch_size=10)
+        
+        for i in range(25):
+            journal.put_item(self._item(str(i)))
+        self.assertEqual(journal.stats["syncs"], 2)
+        self.assertEqual(journal.get_stats()["pending_sync"], 5)
+        
+        time.sleep(0.2)
+        self.assertEqual(journal.stats["syncs"], 3)
+        self.assertEqual(journal.get_stats()["pending_sync"], 0)
+        journal.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
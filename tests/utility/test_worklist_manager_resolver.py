@@ -7,6 +7,7 @@ import uuid
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import os
+import time
 import shutil
 from pathlib import Path
 
@@ -29,6 +30,7 @@ class TestWorklistManagerResolver(unittest.IsolatedAsyncioTestCase):
 
     def tearDown(self) -> None:
         """Clean up after each test."""
+        self.resolver.close()
         shutil.rmtree(self.temp_dir)
 
     def _create_task(self, input_data: Dict[str, Any]) -> Task:
@@ -535,4 +537,262 @@ class TestWorklistManagerResolver(unittest.IsolatedAsyncioTestCase):
         result = await self.resolver.resolve(task)
         
         self.assertEqual(result.status, TaskStatus.ERROR)
-        self.assertIn("not found", result.output_data["message"]) 
\ No newline at end of file
+        self.assertIn("not found", result.output_data["message"])
+
+    async def _create_worklist_with_items(self, priorities: List[int]) -> tuple:
+        """Create a worklist with one item per priority and return its ID and the item IDs."""
+        create_result = await self.resolver.resolve(self._create_task({
+            "operation": WorklistOperation.CREATE_WORKLIST.value,
+            "name": "Test Worklist"
+        }))
+        worklist_id = create_result.output_data["worklist"]["id"]
+        
+        item_ids = []
+        for i, priority in enumerate(priorities):
+            add_result = await self.resolver.resolve(self._create_task({
+                "operation": WorklistOperation.ADD_ITEM.value,
+                "worklist_id": worklist_id,
+                "title": f"Item {i+1}",
+                "priority": priority
+            }))
+            item_ids.append(add_result.output_data["work_item"]["id"])
+        return worklist_id, item_ids
+
+    async def _next_item(self, worklist_id: str) -> Optional[Dict[str, Any]]:
+        """Dequeue the next item of a worklist."""
+        result = await self.resolver.resolve(self._create_task({
+            "operation": WorklistOperation.GET_NEXT_ITEM.value,
+            "worklist_id": worklist_id
+        }))
+        return result.output_data["work_item"]
+
+    async def test_get_next_item_order(self) -> None:
+        """Test that items are dequeued by priority, then in insertion order."""
+        worklist_id, item_ids = await self._create_worklist_with_items([5, 9, 5, 1, 9])
+        
+        dequeued = []
+        while True:
+            item = await self._next_item(worklist_id)
+            if item is None:
+                break
+            dequeued.append(item["id"])
+        
+        expected = [item_ids[1], item_ids[4], item_ids[0], item_ids[2], item_ids[3]]
+        self.assertEqual(dequeued, expected)
+
+    async def test_get_next_item_after_update_and_remove(self) -> None:
+        """Test that priority updates and removals are reflected in dequeue order."""
+        worklist_id, item_ids = await self._create_worklist_with_items([3, 9, 5])
+        
+        # Raise the lowest priority item to the top and remove the highest
+        await self.resolver.resolve(self._create_task({
+            "operation": WorklistOperation.UPDATE_ITEM.value,
+            "item_id": item_ids[0],
+            "priority": 10
+        }))
+        await self.resolver.resolve(self._create_task({
+            "operation": WorklistOperation.REMOVE_ITEM.value,
+            "item_id": item_ids[1]
+        }))
+        
+        self.assertEqual((await self._next_item(worklist_id))["id"], item_ids[0])
+        self.assertEqual((await self._next_item(worklist_id))["id"], item_ids[2])
+        self.assertIsNone(await self._next_item(worklist_id))
+
+    async def test_get_next_item_isolated_per_worklist(self) -> None:
+        """Test that dequeuing only returns items of the requested worklist."""
+        first_id, first_items = await self._create_worklist_with_items([1])
+        second_id, second_items = await self._create_worklist_with_items([9])
+        
+        self.assertEqual((await self._next_item(first_id))["id"], first_items[0])
+        self.assertIsNone(await self._next_item(first_id))
+        self.assertEqual((await self._next_item(second_id))["id"], second_items[0])
+
+    async def test_list_items_by_status(self) -> None:
+        """Test listing items filtered by status after status changes."""
+        worklist_id, item_ids = await self._create_worklist_with_items([1, 2, 3])
+        
+        next_item = await self._next_item(worklist_id)
+        await self.resolver.resolve(self._create_task({
+            "operation": WorklistOperation.MARK_ITEM_COMPLETE.value,
+            "item_id": next_item["id"]
+        }))
+        
+        async def list_ids(**filters: Any) -> List[str]:
+            result = await self.resolver.resolve(self._create_task({
+                "operation": WorklistOperation.LIST_ITEMS.value,
+                **filters
+            }))
+            return [item["id"] for item in result.output_data["work_items"]]
+        
+        self.assertEqual(
+            await list_ids(worklist_id=worklist_id, status=WorkItemStatus.PENDING.value),
+            [item_ids[0], item_ids[1]]
+        )
+        self.assertEqual(await list_ids(status=WorkItemStatus.COMPLETED.value), [item_ids[2]])
+        self.assertEqual(len(await list_ids(worklist_id=worklist_id)), 3)
+
+    async def test_heap_compaction(self) -> None:
+        """Test that stale heap entries are compacted after many priority updates."""
+        worklist_id, item_ids = await self._create_worklist_with_items([1, 2])
+        
+        for priority in range(200):
+            await self.resolver.resolve(self._create_task({
+                "operation": WorklistOperation.UPDATE_ITEM.value,
+                "item_id": item_ids[0],
+                "priority": priority
+            }))
+        
+        self.assertLessEqual(len(self.resolver._pending_heaps[worklist_id]), 65)
+        self.assertEqual((await self._next_item(worklist_id))["id"], item_ids[0])
+        self.assertEqual((await self._next_item(worklist_id))["id"], item_ids[1])
+
+    async def test_state_recovered_after_restart(self) -> None:
+        """Test that worklists and items are recovered from storage_dir."""
+        worklist_id, item_ids = await self._create_worklist_with_items([3, 9, 5])
+        next_item = await self._next_item(worklist_id)
+        await self.resolver.resolve(self._create_task({
+            "operation": WorklistOperation.REMOVE_ITEM.value,
+            "item_id": item_ids[0]
+        }))
+        self.resolver.close()
+        
+        self.resolver = WorklistManagerResolver(storage_dir=self.temp_dir)
+        
+        self.assertEqual(list(self.resolver.worklists), [worklist_id])
+        self.assertEqual(self.resolver.worklists[worklist_id]["item_count"], 2)
+        self.assertEqual(set(self.resolver.work_items), {item_ids[1], item_ids[2]})
+        self.assertEqual(self.resolver.work_items[next_item["id"]]["status"], WorkItemStatus.IN_PROGRESS.value)
+        
+        # The pending index is rebuilt from the recovered items
+        self.assertEqual((await self._next_item(worklist_id))["id"], item_ids[2])
+        self.assertIsNone(await self._next_item(worklist_id))
+
+    async def test_recovery_after_compaction(self) -> None:
+        """Test recovery when part of the state is in a snapshot."""
+        self.resolver.close()
+        self.resolver = WorklistManagerResolver(storage_dir=self.temp_dir, snapshot_every=5)
+        worklist_id, item_ids = await self._create_worklist_with_items([1, 2, 3, 4])
+        
+        # Snapshots are written in the background; close() waits for them
+        self.resolver.close()
+        self.assertGreater(self.resolver.journal.stats["compactions"], 0)
+        
+        self.resolver = WorklistManagerResolver(storage_dir=self.temp_dir)
+        self.assertEqual(list(self.resolver.work_items), item_ids)
+        self.assertEqual(self.resolver.worklists[worklist_id]["item_count"], 4)
+    
+    async def test_compaction_uses_copy_of_state(self) -> None:
+        """Test that a background snapshot is not affected by later mutations."""
+        self.resolver.close()
+        self.resolver = WorklistManagerResolver(storage_dir=self.temp_dir, snapshot_every=5)
+        worklist_id, item_ids = await self._create_worklist_with_items([1, 2, 3, 4])
+        snapshot = self.resolver._compaction
+        self.assertIsNotNone(snapshot)
+        snapshot.result()
+        
+        # Changing an item after the snapshot does not leak into it
+        self.resolver.work_items[item_ids[0]]["history"].append({"action": "local"})
+        with open(self.resolver.journal.snapshot_path) as f:
+            self.assertNotIn('"local"', f.read())
+
+    async def _claim(self, worklist_id: str, count: int, worker_id: str, **options: Any) -> List[Dict[str, Any]]:
+        """Claim items of a worklist for a worker."""
+        result = await self.resolver.resolve(self._create_task({
+            "operation": WorklistOperation.CLAIM_MANY.value,
+            "worklist_id": worklist_id,
+            "count": count,
+            "worker_id": worker_id,
+            **options
+        }))
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        return result.output_data["work_items"]
+
+    async def test_claim_many(self) -> None:
+        """Test claiming a batch of items with leases."""
+        worklist_id, item_ids = await self._create_worklist_with_items([1, 7, 4, 9])
+        
+        first = await self._claim(worklist_id, 2, "worker-1")
+        second = await self._claim(worklist_id, 5, "worker-2")
+        
+        self.assertEqual([item["id"] for item in first], [item_ids[3], item_ids[1]])
+        self.assertEqual([item["id"] for item in second], [item_ids[2], item_ids[0]])
+        for item in first:
+            self.assertEqual(item["status"], WorkItemStatus.IN_PROGRESS.value)
+            self.assertEqual(item["claimed_by"], "worker-1")
+            self.assertIsNotNone(item["lease_id"])
+            self.assertGreater(item["lease_expires_at"], time.time())
+        self.assertEqual(await self._claim(worklist_id, 1, "worker-3"), [])
+
+    async def test_expired_lease_requeued(self) -> None:
+        """Test that an item whose lease expires can be claimed again."""
+        worklist_id, item_ids = await self._create_worklist_with_items([5])
+        
+        claimed = await self._claim(worklist_id, 1, "worker-1", visibility_timeout=0.05)
+        stale_lease = claimed[0]["lease_id"]
+        await asyncio.sleep(0.1)
+        
+        reclaimed = await self._claim(worklist_id, 1, "worker-2")
+        self.assertEqual([item["id"] for item in reclaimed], [item_ids[0]])
+        self.assertEqual(reclaimed[0]["claimed_by"], "worker-2")
+        self.assertEqual(reclaimed[0]["history"][1]["reason"], "Lease expired")
+        
+        # The first worker lost its lease and cannot complete the item
+        result = await self.resolver.resolve(self._create_task({
+            "operation": WorklistOperation.MARK_ITEM_COMPLETE.value,
+            "item_id": item_ids[0],
+            "lease_id": stale_lease
+        }))
+        self.assertEqual(result.status, TaskStatus.ERROR)
+        self.assertIn("not held", result.output_data["message"])
+        
+        result = await self.resolver.resolve(self._create_task({
+            "operation": WorklistOperation.MARK_ITEM_COMPLETE.value,
+            "item_id": item_ids[0],
+            "lease_id": reclaimed[0]["lease_id"]
+        }))
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        self.assertNotIn("lease_id", result.output_data["work_item"])
+
+    async def test_extend_lease(self) -> None:
+        """Test that extending a lease keeps the item claimed."""
+        worklist_id, item_ids = await self._create_worklist_with_items([5])
+        claimed = await self._claim(worklist_id, 1, "worker-1", visibility_timeout=0.05)
+        
+        result = await self.resolver.resolve(self._create_task({
+            "operation": WorklistOperation.EXTEND_LEASE.value,
+            "item_id": item_ids[0],
+            "lease_id": claimed[0]["lease_id"],
+            "visibility_timeout": 60
+        }))
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        
+        await asyncio.sleep(0.1)
+        self.assertEqual(await self._claim(worklist_id, 1, "worker-2"), [])
+        self.assertEqual(self.resolver.work_items[item_ids[0]]["claimed_by"], "worker-1")
+
+    async def test_release_item(self) -> None:
+        """Test that a released item returns to the pending queue."""
+        worklist_id, item_ids = await self._create_worklist_with_items([5])
+        claimed = await self._claim(worklist_id, 1, "worker-1")
+        
+        result = await self.resolver.resolve(self._create_task({
+            "operation": WorklistOperation.RELEASE_ITEM.value,
+            "item_id": item_ids[0],
+            "lease_id": claimed[0]["lease_id"]
+        }))
+        self.assertEqual(result.status, TaskStatus.COMPLETED)
+        self.assertEqual(result.output_data["work_item"]["status"], WorkItemStatus.PENDING.value)
+        
+        self.assertEqual([item["id"] for item in await self._claim(worklist_id, 1, "worker-2")], [item_ids[0]])
+
+    async def test_expired_lease_requeued_after_restart(self) -> None:
+        """Test that leases are recovered from storage and expire after a restart."""
+        worklist_id, item_ids = await self._create_worklist_with_items([5])
+        await self._claim(worklist_id, 1, "worker-1", visibility_timeout=0.05)
+        self.resolver.close()
+        
+        self.resolver = WorklistManagerResolver(storage_dir=self.temp_dir)
+        await asyncio.sleep(0.1)
+        
+        self.assertEqual([item["id"] for item in await self._claim(worklist_id, 1, "worker-2")], [item_ids[0]])